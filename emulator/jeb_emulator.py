@@ -518,31 +518,6 @@ class MockNeopixelModule:
 
 sys.modules['neopixel'] = MockNeopixelModule()
 
-# --- PIXEL FRAMEBUF MOCK ---
-class MockPixelFramebuffer:
-    """Mocks adafruit_pixel_framebuf to suppress warnings and allow text scrolling paths to execute."""
-    def __init__(self, pixels, width, height, **kwargs):
-        self.pixels = pixels
-        self.width = width
-        self.height = height
-
-    def text(self, string, x, y, color, font_name=None):
-        JEBLogger.emulator("MOCK", f"[FRAMEBUF] text('{string}', x={x}, y={y}, color={color}, font={font_name})")
-        pass
-
-    def display(self):
-        pass
-
-    def fill(self, color):
-        pass
-
-    def scroll(self, dx, dy):
-        pass
-
-sys.modules['adafruit_pixel_framebuf'] = type(
-    'MockPixelFramebufModule', (), {'PixelFramebuffer': MockPixelFramebuffer}
-)
-
 # --- AUDIOBUSIO / AUDIOPWMIO MOCKS (Direct Playback Fallbacks) ---
 class MockDirectAudioOut:
     """Handles cases where audio.play() is called without a mixer."""
@@ -1,3 +1,17 @@
+"""
+Batch-convert emoji PNGs into .bin icons and/or pack every icon into the
+SD card atlas.
+
+Usage:
+    python icon_batch_convert_bin.py            # PNGs in source_emojis/ -> .bin
+    python icon_batch_convert_bin.py --atlas    # ...then pack ../sd/icons/atlas.bin
+
+The atlas holds the built-in IconLibrary (static icons, animations and
+their timing tables), every loose .bin in ../sd/icons/ and every converted
+.bin in source_emojis/. Rebuild it whenever src/utilities/icon_library.py
+or an icon file changes.
+"""
+
 import os
 import glob
 import subprocess
@@ -5,8 +19,62 @@ import sys
 
 # Configuration
 SOURCE_DIR = "source_emojis"
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SD_ICON_DIR = os.path.join(SCRIPT_DIR, "..", "sd", "icons")
+ATLAS_PATH = os.path.join(SD_ICON_DIR, "atlas.bin")
+
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "src"))
+
+
+def collect_bin_icons(directories):
+    """Return (icons, anims) dicts from loose .bin files.
+
+    A file with a matching "<name>_timing.bin" (one byte per frame) or more
+    than one 16x16 frame is packed as an animation.
+    """
+    icons = {}
+    anims = {}
+    for directory in directories:
+        for path in sorted(glob.glob(os.path.join(directory, "*.bin"))):
+            stem = os.path.splitext(os.path.basename(path))[0]
+            if stem == "atlas" or stem.endswith("_timing"):
+                continue
+            name = stem.upper()
+            with open(path, "rb") as f:
+                data = f.read()
+            timing_path = os.path.join(directory, f"{stem}_timing.bin")
+            if os.path.exists(timing_path):
+                with open(timing_path, "rb") as f:
+                    anims[name] = (data, tuple(f.read()))
+            elif len(data) > 256:
+                anims[name] = (data, (150,))
+            else:
+                icons[name] = data
+    return icons, anims
+
+
+def build_atlas(out_path=ATLAS_PATH, directories=(SD_ICON_DIR, SOURCE_DIR)):
+    """Pack the built-in library plus loose .bin icons into one atlas file."""
+    from utilities.icon_atlas import pack_atlas
+    from utilities.icon_library import IconLibrary
+
+    icons = dict(IconLibrary.ICON_LIBRARY)
+    anims = dict(IconLibrary.ANIM_LIBRARY)
+    extra_icons, extra_anims = collect_bin_icons(directories)
+    icons.update(extra_icons)
+    anims.update(extra_anims)
+
+    atlas = pack_atlas(icons, anims)
+    with open(out_path, "wb") as f:
+        f.write(atlas)
+    print(f"🗂️ Packed {len(icons)} icons and {len(anims)} animations into {out_path} ({len(atlas)} bytes)")
+
 
 def main():
+    if "--atlas" in sys.argv[1:] and not os.path.exists(SOURCE_DIR):
+        build_atlas()
+        return
+
     # 1. Ensure the source directory exists
     if not os.path.exists(SOURCE_DIR):
         os.makedirs(SOURCE_DIR)
@@ -19,6 +87,8 @@ def main():
 
     if not png_files:
         print(f"⚠️ No PNG files found in '{SOURCE_DIR}'.")
+        if "--atlas" in sys.argv[1:]:
+            build_atlas()
         sys.exit(0)
 
     print(f"🚀 Found {len(png_files)} images. Starting batch conversion to .bin files...\n")
@@ -55,5 +125,8 @@ def main():
 
     print(f"\n✅ Done! All binary icons are ready in your '{SOURCE_DIR}' folder.")
 
+    if "--atlas" in sys.argv[1:]:
+        build_atlas()
+
 if __name__ == "__main__":
     main()
@@ -3,6 +3,8 @@
 PROJECT: JEB - JADNET Electronics Box
 """
 
+from utilities.boot_timeline import BOOT  # First, so the timeline starts at power-on
+
 import asyncio
 import json
 import os
@@ -68,7 +70,9 @@ def load_config():
         "log_level": "INFO",  # Default log level
         "web_server_enabled": False,  # Web server disabled by default
         "web_server_port": 80,  # Default HTTP port
-        "hardware_features": {}  # Empty dict means all hardware enabled
+        "hardware_features": {},  # Empty dict means all hardware enabled
+        "lazy_managers": [],  # "synth" and/or "web_server": build on first use
+        "boot_report": None,  # "console", "sd" or "both": boot timeline report
     }
     try:
         if file_exists("config.json"):
@@ -148,7 +152,10 @@ def _inject_hardware_dummies(features):
 # --- ENTRY POINT ---
 JEBLogger.info("CODE", "*** BOOTING JEB SYSTEM ***")
 JEBLogger.info("CODE", f"SD Card mounted: {SD_MOUNTED}")
-config = load_config()
+with BOOT.span("config"):
+    config = load_config()
+BOOT.report_to = config.get("boot_report")
+BOOT.report_dir = ROOT_DATA_DIR
 
 # Visual indicator: rapidly flash the onboard LED when test_mode is active
 if config.get("test_mode", False):
@@ -168,7 +175,8 @@ if config.get("test_mode", False):
 
 # Inject dummy modules for any disabled hardware features before any
 # manager imports occur (including the CoreManager module-level imports).
-_inject_hardware_dummies(config.get("hardware_features", {}))
+with BOOT.span("dummies"):
+    _inject_hardware_dummies(config.get("hardware_features", {}))
 
 # --- APPLICATION RUN ---
 app = None
@@ -209,8 +217,9 @@ if config.get("wifi_ssid") and config.get("wifi_password"):
     JEBLogger.info("CODE", "Wi-Fi credentials provided in config")
 
     try:
-        from managers.wifi_manager import WiFiManager
-        wifi_manager = WiFiManager(config)
+        with BOOT.span("init:wifi"):
+            from managers.wifi_manager import WiFiManager
+            wifi_manager = WiFiManager(config)
         JEBLogger.info("CODE", "WiFi Manager initialized")
 
     except ImportError:
@@ -219,8 +228,10 @@ else:
     JEBLogger.info("CODE", "No WiFi config")
 
 if role == "CORE" and type_id == "00":
-    from core.core_manager import CoreManager
-    app = CoreManager(config=config, wifi_manager=wifi_manager)
+    with BOOT.span("import:core_manager"):
+        from core.core_manager import CoreManager
+    with BOOT.span("init:core_manager"):
+        app = CoreManager(config=config, wifi_manager=wifi_manager)
 
 elif role == "SAT" and type_id == "01":
     from satellites.sat_01_firmware import IndustrialSatelliteFirmware
@@ -233,26 +244,50 @@ else:
 
 if test_mode:
     JEBLogger.warning("CODE", "⚠️ Test Mode: Console Manager loading")
-    from managers.console_manager import ConsoleManager
-    CONSOLE = ConsoleManager(role, type_id, app=app)
+    with BOOT.span("init:console"):
+        from managers.console_manager import ConsoleManager
+        CONSOLE = ConsoleManager(role, type_id, app=app)
 
 # WEB SERVER CHECK
-if wifi_manager and config.get("web_server_enabled", False):
+def _build_web_server():
+    """Construct the WebServerManager, or return None if it is unavailable."""
     try:
-        from managers.web_server_manager import WebServerManager
-        JEBLogger.info("CODE", " --- WEB SERVER INITIALIZATION --- ")
-        WEB_SERVER = WebServerManager(
-            config,
-            wifi_manager=wifi_manager,
-            app=app,
-            console_buffer=CONSOLE if CONSOLE else None,
-        )
+        with BOOT.span("init:web_server"):
+            from managers.web_server_manager import WebServerManager
+            JEBLogger.info("CODE", " --- WEB SERVER INITIALIZATION --- ")
+            server = WebServerManager(
+                config,
+                wifi_manager=wifi_manager,
+                app=app,
+                console_buffer=CONSOLE if CONSOLE else None,
+            )
         JEBLogger.info("CODE", "Web server manager initialized - will start with app")
+        return server
     except ImportError as e:
         JEBLogger.warning("CODE", "⚠️ WebServerManager not available - check dependencies")
         JEBLogger.error("CODE", f"Web server initialization error: {e}")
     except Exception as e:
         JEBLogger.error("CODE", f"⚠️ Web server initialization error: {e}")
+    return None
+
+async def _start_web_server_after_boot():
+    """Lazy web server: build and start it once the first menu frame is up."""
+    global WEB_SERVER
+    while not BOOT.finished:
+        await asyncio.sleep(0.25)
+    WEB_SERVER = _build_web_server()
+    if WEB_SERVER is not None:
+        try:
+            await WEB_SERVER.start()
+        except Exception as e:
+            JEBLogger.error("CODE", f"⚠️ Web server stopped: {e}")
+
+WEB_SERVER_LAZY = "web_server" in config.get("lazy_managers", [])
+WEB_SERVER_WANTED = bool(wifi_manager and config.get("web_server_enabled", False))
+if WEB_SERVER_WANTED and not WEB_SERVER_LAZY:
+    WEB_SERVER = _build_web_server()
+elif WEB_SERVER_WANTED:
+    JEBLogger.info("CODE", "Web server deferred until the menu is up (lazy_managers)")
 else:
     JEBLogger.info("CODE", "Skipping web server initialization (Wi-Fi or config disabled)")
 
@@ -271,6 +306,9 @@ async def main():
 
             if WEB_SERVER is not None:
                 tasks.append(asyncio.create_task(WEB_SERVER.start()))
+            elif WEB_SERVER_WANTED and WEB_SERVER_LAZY:
+                # Not in tasks: a web server failure must not stop the app
+                web_task = asyncio.create_task(_start_web_server_after_boot())
 
             if CONSOLE is not None:
                 tasks.append(asyncio.create_task(CONSOLE.start()))
@@ -34,7 +34,8 @@ class BootSequence:
         Args:
             matrix: MatrixManager instance (16×16 NeoPixel array).
             display: DisplayManager instance (128×64 OLED).
-            synth: SynthManager instance (I2S synthesiser).
+            synth: SynthManager instance (I2S synthesiser), or None to skip
+                the swell (e.g. when the synth is constructed lazily).
             buzzer: BuzzerManager instance (piezo buzzer).
         """
         self.matrix = matrix
@@ -87,7 +88,7 @@ class BootSequence:
             await asyncio.sleep(0.03)
 
         # Phase 2 — logo reveal (left → right column wipe)
-        icon = Icons.DEFAULT
+        icon = Icons.get("DEFAULT")
         # Calculate max steps for a 16x16 matrix from bottom-center
         # Max row dist (15) + Max col dist (7) = 22. Range is 0 to 22 (23 steps).
         for step in range(23):
@@ -139,6 +140,8 @@ class BootSequence:
         Uses the PAD patch (slow 0.5 s attack) for a gradually building
         textural effect that swells alongside the visual curtain drop.
         """
+        if self.synth is None:
+            return
         await self.synth.play_sequence(tones.CONSOLE_BOOT_SWELL)
 
     def _buzzer_ping(self):
@@ -8,7 +8,6 @@ import asyncio
 import busio
 import gc
 import neopixel
-import sys
 from adafruit_ticks import ticks_ms, ticks_diff
 
 from managers import PowerManager, ResourceManager, WatchdogManager
@@ -22,7 +21,6 @@ from managers.led_manager import LEDManager
 from managers.matrix_manager import MatrixManager, PanelLayout
 from managers.render_manager import RenderManager
 from managers.satellite_network_manager import SatelliteNetworkManager
-from managers.synth_manager import SynthManager
 
 from modes.manifest import MODE_REGISTRY
 
@@ -35,13 +33,16 @@ from transport.protocol import (
     PAYLOAD_SCHEMAS,
 )
 
-from utilities.jeb_pixel import JEBPixel
+from utilities.boot_timeline import BOOT
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
 from utilities.logger import JEBLogger
 from utilities.palette import Palette
 from utilities.pins import Pins
 from utilities import tones
 
 from core.boot_sequence import BootSequence
+from core.mode_cache import ModeCache
+from core.mode_prefetch import ModePrefetcher
 
 # Dim blue used as low-power breathing colour during sleep
 SLEEP_LED_COLOR = (0, 0, 32)
@@ -145,109 +146,138 @@ class CoreManager:
         self.watchdog = None
 
         # Init Data Manager for persistent storage of scores and settings
-        self.data = DataManager(root_dir=self.root_data_dir)
+        with BOOT.span("init:data"):
+            self.data = DataManager(root_dir=self.root_data_dir)
 
         # Init Resource Manager for system metrics (memory, CPU proxy, temperature)
-        self.resources = ResourceManager(interval=self.resource_monitor_interval)
+        with BOOT.span("init:resources"):
+            self.resources = ResourceManager(interval=self.resource_monitor_interval)
 
         # Init Pins
-        Pins.initialize(profile="CORE", type_id="00")
+        with BOOT.span("init:pins"):
+            Pins.initialize(profile="CORE", type_id="00")
 
         # Init I2C bus
-        self.i2c = busio.I2C(Pins.I2C_SCL, Pins.I2C_SDA)
+        with BOOT.span("init:i2c"):
+            self.i2c = busio.I2C(Pins.I2C_SCL, Pins.I2C_SDA)
 
         # Init power manager with PowerBus dependencies
-        self.power = PowerManager(
-            Pins.POWER_SENSORS,
-            Pins.MOSFET_CONTROL,
-            Pins.SATBUS_DETECT,
-            i2c_bus = self.i2c
-        )
+        with BOOT.span("init:power"):
+            self.power = PowerManager(
+                Pins.POWER_SENSORS,
+                Pins.MOSFET_CONTROL,
+                Pins.SATBUS_DETECT,
+                i2c_bus = self.i2c
+            )
 
-        self._pow_input = self.power.get_input_bus()
-        self._pow_satbus = self.power.get_satbus_bus()
-        self._pow_main = self.power.get_main_bus()
-        self._pow_others = self.power.get_other_buses()
+            self._pow_input = self.power.get_input_bus()
+            self._pow_satbus = self.power.get_satbus_bus()
+            self._pow_main = self.power.get_main_bus()
+            self._pow_others = self.power.get_other_buses()
 
         # UART for satellite communication
-        uart_hw = busio.UART(
-            Pins.UART_TX,
-            Pins.UART_RX,
-            baudrate=config.get("uart_baudrate", 921600),
-            receiver_buffer_size=config.get("uart_buffer_size", 4096),
-            timeout=0.01,
-        )
+        with BOOT.span("init:transport"):
+            uart_hw = busio.UART(
+                Pins.UART_TX,
+                Pins.UART_RX,
+                baudrate=config.get("uart_baudrate", 921600),
+                receiver_buffer_size=config.get("uart_buffer_size", 4096),
+                timeout=0.01,
+            )
 
-        # Wrap with transport layer for protocol handling
-        self.transport = UARTTransport(
-            uart_hw, COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
-        )
+            # Wrap with transport layer for protocol handling
+            self.transport = UARTTransport(
+                uart_hw, COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+            )
 
         # Init Basic Audio (Buzzer)
-        self.buzzer = BuzzerManager(Pins.BUZZER)
+        with BOOT.span("init:buzzer"):
+            self.buzzer = BuzzerManager(Pins.BUZZER)
 
-        # Init Primary Audio (I2S) and Synthesizer
-        self.audio = AudioManager(
-            Pins.I2S_SCK, Pins.I2S_WS, Pins.I2S_SD, root_data_dir=self.root_data_dir
-        )
-        self.audio.preload(
-            [
-                "audio/menu/tick.wav",
-                "audio/menu/select.wav",
-            ]
-        )
-        self.synth = SynthManager(sample_rate=22050, channel_count=1)
-        self.audio.attach_synth(self.synth.source)  # Connect synth to audio mixer
+        # Init Primary Audio (I2S)
+        with BOOT.span("init:audio"):
+            self.audio = AudioManager(
+                Pins.I2S_SCK, Pins.I2S_WS, Pins.I2S_SD, root_data_dir=self.root_data_dir
+            )
+            self.audio.preload(
+                [
+                    "audio/menu/tick.wav",
+                    "audio/menu/select.wav",
+                ]
+            )
+
+        # Init Synthesizer, or defer it to first use. Listed in "lazy_managers",
+        # or with the audio feature disabled, it is built the first time a
+        # mode touches self.synth (and the boot swell is skipped).
+        self.lazy_managers = set(self.config.get("lazy_managers", []))
+        if not self.config.get("hardware_features", {}).get("audio", True):
+            self.lazy_managers.add("synth")
+        self._synth = None
+        if "synth" not in self.lazy_managers:
+            self._build_synth()
 
         # Init Display (OLED)
-        self.display = DisplayManager(self.i2c, device_address=Pins.I2C_ADDRESSES["OLED"])
+        with BOOT.span("init:display"):
+            self.display = DisplayManager(self.i2c, device_address=Pins.I2C_ADDRESSES["OLED"])
 
         # Init HID Manager for buttons and encoders
-        for cfg in Pins.EXPANDER_CONFIGS:
-            cfg["i2c"] = self.i2c
-        self.hid = HIDManager(
-            encoders=Pins.ENCODERS,
-            expander_configs=Pins.EXPANDER_CONFIGS,
-        )
+        with BOOT.span("init:hid"):
+            for cfg in Pins.EXPANDER_CONFIGS:
+                cfg["i2c"] = self.i2c
+            self.hid = HIDManager(
+                encoders=Pins.ENCODERS,
+                expander_configs=Pins.EXPANDER_CONFIGS,
+            )
 
         # Initialize Satellite Network Manager
-        self.sat_network = SatelliteNetworkManager(
-            self.transport,
-            self.display,
-            self.audio,
-            self.abort_event,
-            config=config,
-        )
-        if self.debug_mode:
-            self.sat_network.set_debug_mode(True)
-        # Register remote wake callback so satellites can wake the Core
-        self.sat_network.set_wake_callback(self._wake_system)
+        with BOOT.span("init:sat_network"):
+            self.sat_network = SatelliteNetworkManager(
+                self.transport,
+                self.display,
+                self.audio,
+                self.abort_event,
+                config=config,
+            )
+            if self.debug_mode:
+                self.sat_network.set_debug_mode(True)
+            # Register remote wake callback so satellites can wake the Core
+            self.sat_network.set_wake_callback(self._wake_system)
 
         # Init LEDs
-        self.root_pixels = neopixel.NeoPixel(
-            Pins.LED_CONTROL, 260, brightness=self.config.get("led_brightness", 0.3), auto_write=False
-        )
+        with BOOT.span("init:leds"):
+            # All segments share one wire-order framebuffer, sent in a single transfer per frame
+            self.root_pixels = PixelBuffer(neopixel.NeoPixel(
+                Pins.LED_CONTROL, 260, brightness=self.config.get("led_brightness", 0.3), auto_write=False
+            ))
 
-        # Button LED Manager (first 4 pixels)
-        self.led_jeb_pixel = JEBPixel(self.root_pixels, start_idx=0, num_pixels=4)
-        self.leds = LEDManager(self.led_jeb_pixel)
+            # Button LED Manager (first 4 pixels)
+            self.led_jeb_pixel = JEBPixel(self.root_pixels, start_idx=0, num_pixels=4)
+            self.leds = LEDManager(self.led_jeb_pixel)
 
-        # LED Matrix Manager (4 x 8x8 matrices = 256 pixels starting at index 4)
-        self.matrix_jeb_pixel = JEBPixel(self.root_pixels, start_idx=4, num_pixels=256)
-        self.matrix = MatrixManager(self.matrix_jeb_pixel, width=16, height=16, panel_width=8, panel_height=8, chain_layout=PanelLayout.SERPENTINE)  # 4 matrices in a 16x16 configuration
+            # LED Matrix Manager (4 x 8x8 matrices = 256 pixels starting at index 4)
+            self.matrix_jeb_pixel = JEBPixel(self.root_pixels, start_idx=4, num_pixels=256)
+            self.matrix = MatrixManager(self.matrix_jeb_pixel, width=16, height=16, panel_width=8, panel_height=8, chain_layout=PanelLayout.SERPENTINE)  # 4 matrices in a 16x16 configuration
 
         # Setup Render Manager to coordinate LED animations
-        self.renderer = RenderManager(
-            self.root_pixels,
-            sync_role="MASTER",
-            network_manager=self.sat_network
-        )
-        self.renderer.add_animator(self.leds)
-        self.renderer.add_animator(self.matrix)
+        with BOOT.span("init:renderer"):
+            self.renderer = RenderManager(
+                self.root_pixels,
+                sync_role="MASTER",
+                network_manager=self.sat_network
+            )
+            self.renderer.add_animator(self.leds)
+            self.renderer.add_animator(self.matrix)
 
         # System Modes
         self.mode_registry = MODE_REGISTRY
-        self.loaded_modes = {} # Cache for instantiated mode classes
+        # Mode classes stay resident while free heap is above the watermark
+        self.mode_cache = ModeCache(
+            self.mode_registry,
+            min_free_kb=self.config.get("mode_cache", {}).get("min_free_kb", ModeCache.DEFAULT_MIN_FREE_KB),
+        )
+        self.loaded_modes = self.mode_cache.classes
+        # Warms the mode highlighted in the menu during idle frames
+        self.prefetch = ModePrefetcher(self.mode_cache, audio=self.audio)
         self.mode = "DASHBOARD" # Start in main menu mode
 
         # --- Console Injection Tracking ---
@@ -265,6 +295,20 @@ class CoreManager:
         self._sleeping = False
         self._sleep_timeout_ms = 5 * 60 * 1000  # 5 minutes in milliseconds
 
+    @property
+    def synth(self):
+        """SynthManager; built on first access when it is a lazy manager."""
+        if self._synth is None:
+            self._build_synth()
+        return self._synth
+
+    def _build_synth(self):
+        """Import and construct the SynthManager and connect it to the audio mixer."""
+        with BOOT.span("init:synth"):
+            from managers.synth_manager import SynthManager
+            self._synth = SynthManager(sample_rate=22050, channel_count=1)
+            self.audio.attach_synth(self._synth.source)  # Connect synth to audio mixer
+
     def _read_version(self):
         """Read version string from the VERSION file.
 
@@ -324,52 +368,16 @@ class CoreManager:
             ImportError: If the module or class cannot be imported
             KeyError: If the mode_id is not in the registry
         """
-        if mode_id in self.loaded_modes:
-            return self.loaded_modes[mode_id]
-
-        if mode_id not in self.mode_registry:
-            available = ", ".join(sorted(self.mode_registry.keys()))
-            raise KeyError(
-                f"Mode ID '{mode_id}' not found in registry. Available modes: {available}"
-            )
-
-        meta = self.mode_registry[mode_id]
-        module_path = meta["module_path"]
-        class_name = meta["class_name"]
-
-        try:
-            # Dynamic Import
-            module = __import__(module_path, None, None, [class_name])
-            mode_class = getattr(module, class_name)
-            self.loaded_modes[mode_id] = mode_class
-            return mode_class
-        except ImportError as e:
-            raise ImportError(f"Failed to import module '{module_path}' for mode '{mode_id}': {e}") from e
-        except AttributeError as e:
-            raise ImportError(f"Module '{module_path}' does not have class '{class_name}' for mode '{mode_id}': {e}") from e
+        return self.mode_cache.load(mode_id)
 
     def _unload_mode(self, mode_id):
-        """Ruthlessly purge a mode's class and module from SRAM to prevent OOM crashes."""
-        # 1. Remove from local class cache (prevents permanent RAM locking)
-        if mode_id in self.loaded_modes:
-            del self.loaded_modes[mode_id]
-
-        # 2. Delete from Python's internal module cache
-        meta = self.mode_registry.get(mode_id)
-        if meta and "module_path" in meta:
-            module_path = meta["module_path"]
-            if module_path in sys.modules:
-                del sys.modules[module_path]
-
-        # 3. Force garbage collection sweep
+        """Purge a mode's class and module from SRAM regardless of the cache policy."""
+        self.mode_cache.evict(mode_id)
         gc.collect()
 
-        # Try to log the free RAM if possible
-        try:
-            free_kb = gc.mem_free() / 1024
-            JEBLogger.debug("CORE", f"Purged '{mode_id}' from RAM. Free SRAM: {free_kb:.1f} KB")
-        except AttributeError:
-            pass # CPython emulator doesn't have mem_free
+        free = self.mode_cache.mem_free()
+        if free is not None:
+            JEBLogger.debug("CORE", f"Purged '{mode_id}' from RAM. Free SRAM: {free / 1024:.1f} KB")
 
     # Satellite Network Delegation Properties
     @property
@@ -697,6 +705,7 @@ class CoreManager:
         if await self.power.check_power_integrity():
             self.buzzer.play_sequence(tones.POWER_UP)
             JEBLogger.info("CORE", "Power integrity check passed")
+            BOOT.mark("power_ok")
             self.display.update_status("POWER OK", "STARTING SYSTEM...")
             await asyncio.sleep(1)
 
@@ -770,10 +779,14 @@ class CoreManager:
         #asyncio.create_task(self.monitor_estop())  # E-Stop Button (Gameplay)
         #asyncio.create_task(self.synth.start_generative_drone())  # Background Music Drone
 
+        BOOT.mark("services_started")
+
         # --- Boot Animation ---
         # Run the console power-on sequence: matrix curtain + OLED splash + synth swell + ping
         version_str = self._read_version()
-        await BootSequence(self.matrix, self.display, self.synth, self.buzzer).play(version_str)
+        with BOOT.span("boot_sequence"):
+            # A lazy synth stays unbuilt through boot; the swell is skipped
+            await BootSequence(self.matrix, self.display, self._synth, self.buzzer).play(version_str)
 
         # If DEBUG_MODE, check PIO state machine count
         if self.debug_mode:
@@ -849,6 +862,7 @@ class CoreManager:
                     current_mode_id = self.mode
 
                     # LAZY LOAD THE MODE CLASS
+                    self.prefetch.note_launch(current_mode_id)
                     try:
                         mode_class = self._load_mode_class(current_mode_id)
                     except (ImportError, KeyError) as e:
@@ -965,15 +979,15 @@ class CoreManager:
                         self.mode = "DASHBOARD"  # Return to dashboard after mode exit or error
 
                     # ==========================================
-                    # --- AGGRESSIVE RAM PURGE ---
+                    # --- RAM RECLAIM ---
                     # ==========================================
                     # Sever all local references to the instance and class
                     self.active_mode = None
                     mode_instance = None
                     mode_class = None
-                    # Unload from sys.modules and force GC
+                    # Collect, and evict cached modes only if the heap is short
                     if self.mode != current_mode_id:
-                        self._unload_mode(current_mode_id)
+                        self.mode_cache.release(current_mode_id)
 
                 else:
                     JEBLogger.warning("CORE", f"Cannot start {self.mode}: Missing Dependency")
@@ -0,0 +1,188 @@
+# File: src/core/mode_cache.py
+"""Memory-aware cache of lazily imported mode classes.
+
+CoreManager used to purge a mode's module from ``sys.modules`` every time
+the mode ended, so bouncing between the menus and a game re-imported large
+modules on every visit. ModeCache keeps recently used modes resident while
+``gc.mem_free()`` stays above a watermark and only then evicts, least
+recently used first. Menu modes are pinned and never evicted by the policy.
+
+Each import is measured (time and heap drop), and the heap drop is kept as
+the mode's import-cost estimate so room can be made *before* importing a
+mode that is known not to fit.
+"""
+
+import gc
+import sys
+
+from adafruit_ticks import ticks_ms, ticks_diff
+
+from utilities.logger import JEBLogger
+
+
+class ModeCache:
+    """LRU cache of mode classes keyed by mode id.
+
+    ``classes`` maps mode id to the imported class (CoreManager exposes it as
+    ``loaded_modes``). ``stats`` maps mode id to a dict with ``imports``,
+    ``hits``, ``evictions``, ``import_ms``, ``gc_ms`` and ``cost`` (bytes of
+    heap the last import consumed, None where ``gc.mem_free`` is missing).
+    """
+
+    DEFAULT_MIN_FREE_KB = 96
+    DEFAULT_PINNED = ("MAINMENU", "DASHBOARD", "ZERO_PLAYER_MENU")
+
+    def __init__(self, registry, min_free_kb=DEFAULT_MIN_FREE_KB, pinned=DEFAULT_PINNED):
+        """
+        Args:
+            registry: MODE_REGISTRY dict of mode id -> metadata.
+            min_free_kb: Free-heap watermark. Modes stay resident while
+                gc.mem_free() is above it.
+            pinned: Mode ids that are never evicted by the policy.
+        """
+        self.registry = registry
+        self.min_free = min_free_kb * 1024
+        self.pinned = set(pinned)
+        self.classes = {}
+        self.stats = {}
+        self._order = []  # Resident mode ids, least recently used first
+
+    @staticmethod
+    def mem_free():
+        """Free heap in bytes, or None on ports without gc.mem_free (CPython)."""
+        try:
+            return gc.mem_free()
+        except AttributeError:
+            return None
+
+    def _stat(self, mode_id):
+        stat = self.stats.get(mode_id)
+        if stat is None:
+            stat = self.stats[mode_id] = {
+                "imports": 0, "hits": 0, "evictions": 0,
+                "import_ms": 0, "gc_ms": 0, "cost": None,
+            }
+        return stat
+
+    def _touch(self, mode_id):
+        order = self._order
+        if mode_id in order:
+            order.remove(mode_id)
+        order.append(mode_id)
+
+    def get(self, mode_id):
+        """Return the resident class for mode_id (marking it recently used), or None."""
+        mode_class = self.classes.get(mode_id)
+        if mode_class is not None:
+            self._stat(mode_id)["hits"] += 1
+            self._touch(mode_id)
+        return mode_class
+
+    def load(self, mode_id):
+        """Return the class for mode_id, importing it if it is not resident.
+
+        Raises:
+            KeyError: If mode_id is not in the registry.
+            ImportError: If the module or class cannot be imported.
+        """
+        mode_class = self.get(mode_id)
+        if mode_class is not None:
+            return mode_class
+
+        if mode_id not in self.registry:
+            available = ", ".join(sorted(self.registry.keys()))
+            raise KeyError(
+                f"Mode ID '{mode_id}' not found in registry. Available modes: {available}"
+            )
+
+        meta = self.registry[mode_id]
+        module_path = meta["module_path"]
+        class_name = meta["class_name"]
+        stat = self._stat(mode_id)
+
+        # Make room up front when a previous import tells us what this costs
+        if stat["cost"]:
+            self.trim(stat["cost"])
+
+        before = self.mem_free()
+        start = ticks_ms()
+        try:
+            module = __import__(module_path, None, None, [class_name])
+            mode_class = getattr(module, class_name)
+        except ImportError as e:
+            raise ImportError(f"Failed to import module '{module_path}' for mode '{mode_id}': {e}") from e
+        except AttributeError as e:
+            raise ImportError(f"Module '{module_path}' does not have class '{class_name}' for mode '{mode_id}': {e}") from e
+
+        stat["import_ms"] = ticks_diff(ticks_ms(), start)
+        stat["imports"] += 1
+        after = self.mem_free()
+        if before is not None and after is not None:
+            stat["cost"] = max(0, before - after)
+
+        self.classes[mode_id] = mode_class
+        self._touch(mode_id)
+        JEBLogger.debug("MODE", f"Imported '{mode_id}' in {stat['import_ms']} ms (cost: {stat['cost']} B)")
+        return mode_class
+
+    def release(self, mode_id):
+        """Called when a mode ends: collect garbage, then evict only if the heap is short."""
+        start = ticks_ms()
+        gc.collect()
+        self._stat(mode_id)["gc_ms"] = ticks_diff(ticks_ms(), start)
+        self.trim()
+
+        free = self.mem_free()
+        if free is not None:
+            JEBLogger.debug("MODE", f"Released '{mode_id}'. Resident: {len(self.classes)}, free SRAM: {free / 1024:.1f} KB")
+
+    def trim(self, needed=0):
+        """Evict least recently used, unpinned modes until needed bytes fit above the watermark.
+
+        Returns:
+            int: Number of modes evicted.
+        """
+        free = self.mem_free()
+        if free is None:
+            return 0
+
+        evicted = 0
+        while free - needed < self.min_free:
+            victim = None
+            for mode_id in self._order:
+                if mode_id not in self.pinned:
+                    victim = mode_id
+                    break
+            if victim is None:
+                break
+            self.evict(victim)
+            evicted += 1
+            gc.collect()
+            free = self.mem_free()
+        return evicted
+
+    def evict(self, mode_id):
+        """Drop mode_id's class and, if no resident mode shares it, its module."""
+        if mode_id in self.classes:
+            del self.classes[mode_id]
+            self._stat(mode_id)["evictions"] += 1
+        if mode_id in self._order:
+            self._order.remove(mode_id)
+
+        meta = self.registry.get(mode_id)
+        if meta and "module_path" in meta:
+            module_path = meta["module_path"]
+            for other in self.classes:
+                if self.registry.get(other, {}).get("module_path") == module_path:
+                    return
+            if module_path in sys.modules:
+                del sys.modules[module_path]
+
+    def get_stats(self):
+        """Return resident mode ids (LRU first), free heap and per-mode stats."""
+        return {
+            "resident": list(self._order),
+            "mem_free": self.mem_free(),
+            "min_free": self.min_free,
+            "modes": self.stats,
+        }
@@ -0,0 +1,175 @@
+# File: src/core/mode_prefetch.py
+"""Predictive prefetch of the mode highlighted in the menu.
+
+Once a menu item has stayed highlighted for ``idle_ms``, the prefetcher
+warms it in small stages, one per idle menu frame: the icon (through
+``Icons.get``), the mode's module (through the ModeCache) and any small
+audio listed under ``"preload"`` in its manifest entry (through
+``AudioManager.preload``). Moving the highlight cancels whatever stages
+are left. The module is only imported, and audio only preloaded (preloaded
+sounds stay in RAM), while free heap, minus the mode's known import cost,
+stays ``headroom_kb`` above the ModeCache watermark, so a prefetch never
+forces an eviction.
+
+Launch metrics: a launch is a prefetch *hit* when the prefetcher imported
+the class, and a *miss* when the class had to be imported at launch time.
+Modes that were already resident for other reasons count as neither.
+Time-to-first-frame runs from the launch to the end of the mode's
+``enter()``, when its first frame is drawn.
+"""
+
+from adafruit_ticks import ticks_ms, ticks_diff
+
+from utilities.icons import Icons
+from utilities.logger import JEBLogger
+
+
+class ModePrefetcher:
+    """Prefetches the highlighted mode during idle menu frames."""
+
+    DEFAULT_IDLE_MS = 350
+    DEFAULT_HEADROOM_KB = 32
+
+    # Stages, run in order, one per poll()
+    STAGE_ICON = 0
+    STAGE_MODULE = 1
+    STAGE_AUDIO = 2
+    STAGE_DONE = 3
+
+    def __init__(self, mode_cache, audio=None, idle_ms=DEFAULT_IDLE_MS, headroom_kb=DEFAULT_HEADROOM_KB):
+        """
+        Args:
+            mode_cache: The core's ModeCache.
+            audio: Optional AudioManager used to preload small mode sounds.
+            idle_ms: How long a highlight must be held before prefetching.
+            headroom_kb: Free heap required above the ModeCache watermark,
+                after the mode's import cost, before its module is imported.
+        """
+        self.cache = mode_cache
+        self.audio = audio
+        self.idle_ms = idle_ms
+        self.headroom = headroom_kb * 1024
+
+        self._target = None
+        self._since = 0
+        self._stage = self.STAGE_DONE
+        self._launch = None  # (mode_id, start tick) until note_ready()
+
+        self.prefetched = set()  # Imported by prefetch, not yet launched
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.skipped = 0  # Module and audio stages skipped for lack of heap
+        self.modes = {}  # mode_id -> {"launches", "hits", "ttff_ms"}
+
+    def highlight(self, mode_id):
+        """Tell the prefetcher which mode is highlighted; a change restarts the idle timer."""
+        if mode_id == self._target:
+            return
+        self.cancel()
+        self._target = mode_id
+        self._since = ticks_ms()
+        self._stage = self.STAGE_ICON
+
+    def cancel(self):
+        """Abandon any stages left for the current highlight."""
+        if self._target is not None and self.STAGE_ICON < self._stage < self.STAGE_DONE:
+            self.cancelled += 1
+        self._target = None
+        self._stage = self.STAGE_DONE
+
+    def _has_room(self, mode_id):
+        free = self.cache.mem_free()
+        if free is None:
+            return True
+        cost = self.cache.stats.get(mode_id, {}).get("cost") or 0
+        return free - cost >= self.cache.min_free + self.headroom
+
+    def poll(self):
+        """Run the next prefetch stage if the highlight has been idle long enough.
+
+        Call once per idle menu frame. Returns True if a stage ran.
+        """
+        mode_id = self._target
+        if mode_id is None or self._stage >= self.STAGE_DONE:
+            return False
+        if ticks_diff(ticks_ms(), self._since) < self.idle_ms:
+            return False
+
+        meta = self.cache.registry.get(mode_id)
+        if meta is None:
+            self._stage = self.STAGE_DONE
+            return False
+
+        stage = self._stage
+        self._stage = stage + 1
+        try:
+            if stage == self.STAGE_ICON:
+                Icons.get(meta.get("icon", "DEFAULT"))
+            elif stage == self.STAGE_MODULE:
+                if mode_id in self.cache.classes:
+                    pass
+                elif self._has_room(mode_id):
+                    self.cache.load(mode_id)
+                    self.prefetched.add(mode_id)
+                    JEBLogger.debug("PREF", f"Prefetched '{mode_id}'")
+                else:
+                    self.skipped += 1
+            elif stage == self.STAGE_AUDIO:
+                files = meta.get("preload")
+                if files and self.audio is not None:
+                    if self._has_room(mode_id):
+                        self.audio.preload(files)
+                    else:
+                        self.skipped += 1
+        except (ImportError, KeyError, OSError) as e:
+            # A broken mode fails properly when launched; stop prefetching it
+            JEBLogger.warning("PREF", f"Prefetch of '{mode_id}' failed: {e}")
+            self._stage = self.STAGE_DONE
+        return True
+
+    def note_launch(self, mode_id):
+        """Record a launch, before CoreManager loads the mode class."""
+        self.cancel()
+        stat = self.modes.get(mode_id)
+        if stat is None:
+            stat = self.modes[mode_id] = {"launches": 0, "hits": 0, "ttff_ms": None}
+        stat["launches"] += 1
+
+        if mode_id in self.prefetched:
+            self.prefetched.discard(mode_id)
+            if mode_id in self.cache.classes:
+                self.hits += 1
+                stat["hits"] += 1
+            else:
+                self.misses += 1  # Prefetched, then evicted before use
+        elif mode_id not in self.cache.classes and mode_id not in self.cache.pinned:
+            self.misses += 1
+        self._launch = (mode_id, ticks_ms())
+
+    def note_ready(self):
+        """Record time-to-first-frame for the pending launch (end of the mode's enter())."""
+        launch = self._launch
+        if launch is None:
+            return
+        self._launch = None
+        mode_id, start = launch
+        ttff = ticks_diff(ticks_ms(), start)
+        self.modes[mode_id]["ttff_ms"] = ttff
+        JEBLogger.debug("PREF", f"'{mode_id}' first frame after {ttff} ms")
+
+    def hit_rate(self):
+        """Fraction of cold launches served by a prefetch, or None before any."""
+        total = self.hits + self.misses
+        return self.hits / total if total else None
+
+    def get_stats(self):
+        """Return prefetch counters and per-mode launch metrics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "cancelled": self.cancelled,
+            "skipped": self.skipped,
+            "modes": self.modes,
+        }
@@ -9,6 +9,9 @@ class BasePixelManager:
     def __init__(self, *args, **kwargs):
         JEBLogger.info("PXLM", f"[INIT] DummyBasePixelManager")
 
+    def is_animating(self, *args, **kwargs):
+        return False
+
     def get_layout_type(self, *args, **kwargs):
         return "custom"  # Default to CUSTOM for dummy
 
@@ -51,6 +51,12 @@ class HIDManager:
     def get_status_bytes(self, order=None):
         return b''
 
+    def get_status_packet(self, full=True, flush=False):
+        return b''
+
+    def apply_status_packet(self, data, sid=None):
+        return False
+
     def get_status_string(self, order=None):
         return ''
 
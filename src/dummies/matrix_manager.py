@@ -47,7 +47,7 @@ class MatrixManager(BasePixelManager):
     def draw_wedge(self, quad_idx, color, anim_mode=None, speed=1.0, duration=None):
         pass
 
-    def display_text(self, text, color=(255, 255, 255), scroll_speed=0.05):
+    def display_text(self, text, color=(255, 255, 255), scroll_speed=0.05, loop=True):
         pass
 
     def stop_text(self):
@@ -106,9 +106,12 @@ class AudioManager:
         """
         Loads small WAV files into memory permanently.
         Call this during boot for UI sounds (ticks, clicks, beeps).
+        Files that are already preloaded are skipped.
         """
         for filename in files:
             filepath = self.root_data_dir + filename
+            if filepath in self._cache:
+                continue
 
             try:
                 file_size = os.stat(filepath).st_size
@@ -16,6 +16,33 @@ class PixelLayout:
     CIRCLE = "circle"           # Circular/ring arrangement
     CUSTOM = "custom"           # Custom/irregular layout
 
+# Animation type codes. The frame loop evaluates one group of pixels per code
+# instead of comparing type strings per pixel. Unknown types are kept in
+# ANIM_OTHER and left untouched, as before.
+ANIM_NONE = 0
+ANIM_SOLID = 1
+ANIM_BLINK = 2
+ANIM_PULSE = 3
+ANIM_RAINBOW = 4
+ANIM_GLITCH = 5
+ANIM_SCANNER = 6
+ANIM_CHASER = 7
+ANIM_DECAY = 8
+ANIM_OTHER = 9
+
+ANIM_CODES = {
+    "SOLID": ANIM_SOLID,
+    "BLINK": ANIM_BLINK,
+    "PULSE": ANIM_PULSE,
+    "RAINBOW": ANIM_RAINBOW,
+    "GLITCH": ANIM_GLITCH,
+    "SCANNER": ANIM_SCANNER,
+    "CHASER": ANIM_CHASER,
+    "DECAY": ANIM_DECAY,
+}
+
+_BLACK = (0, 0, 0)
+
 class AnimationSlot:
     """Reusable animation slot to avoid object churn."""
     __slots__ = ('active', 'type', 'color', 'speed', 'start', 'duration', 'priority')
@@ -86,8 +113,26 @@ class BasePixelManager:
         # Track active animation count to avoid O(n) checks
         self._active_count = 0
 
+        # Parallel per-pixel arrays mirroring the slots, read by animate_loop
+        self._anim_codes = bytearray(self.num_pixels)
+        self._anim_starts = [0.0] * self.num_pixels
+        self._anim_speeds = [1.0] * self.num_pixels
+        self._anim_colors = [None] * self.num_pixels
+        self._anim_ends = [None] * self.num_pixels  # start + duration for timed slots
+        self._timed_indices = set()
+
+        # Active indices grouped by type code, rebuilt lazily when types change
+        self._anim_groups = [[] for _ in range(ANIM_OTHER + 1)]
+        self._groups_dirty = False
+        # SOLID pixels are static, so they are only rewritten after a slot changes
+        self._solid_dirty = False
+
         self._bg_tasks = []  # List to track background tasks for clean shutdown
 
+    def is_animating(self):
+        """Returns True while any animation slot is active."""
+        return self._active_count > 0
+
     def get_layout_type(self):
         """Returns the layout type (PixelLayout enum)."""
         return self._layout_type
@@ -118,6 +163,14 @@ class BasePixelManager:
             slot.clear()
         self._active_count = 0
         self._active_indices.clear()
+        self._anim_codes = bytearray(self.num_pixels)
+        for idx in self._timed_indices:
+            self._anim_ends[idx] = None
+        self._timed_indices.clear()
+        for group in self._anim_groups:
+            group.clear()
+        self._groups_dirty = False
+        self._solid_dirty = False
         self.pixels.fill((0, 0, 0))
 
     def clear_animation(self, idx, priority=0):
@@ -135,12 +188,56 @@ class BasePixelManager:
             # Only clear if priority is sufficient
             if priority < slot.priority:
                 return False
-            slot.clear()
-            self._active_count -= 1
-            self._active_indices.discard(idx)
+            self._release_slot(idx)
             return True
         return False
 
+    def _assign_slot(self, idx, anim_type, color, speed, start, duration, priority):
+        """Set slot idx and mirror it into the parallel animation arrays."""
+        slot = self.active_animations[idx]
+        slot.set(anim_type, color, speed, start, duration, priority)
+
+        code = ANIM_CODES.get(anim_type, ANIM_OTHER)
+        if self._anim_codes[idx] != code:
+            self._anim_codes[idx] = code
+            self._groups_dirty = True
+        if code == ANIM_SOLID:
+            self._solid_dirty = True
+        self._anim_starts[idx] = start
+        self._anim_speeds[idx] = speed
+        self._anim_colors[idx] = slot.color
+        if duration:
+            self._anim_ends[idx] = start + duration
+            self._timed_indices.add(idx)
+        elif self._anim_ends[idx] is not None:
+            self._anim_ends[idx] = None
+            self._timed_indices.discard(idx)
+        self._active_indices.add(idx)
+
+    def _release_slot(self, idx):
+        """Deactivate slot idx and drop it from its animation group."""
+        self.active_animations[idx].clear()
+        self._active_count -= 1
+        self._active_indices.discard(idx)
+        self._anim_codes[idx] = ANIM_NONE
+        self._anim_colors[idx] = None
+        if self._anim_ends[idx] is not None:
+            self._anim_ends[idx] = None
+            self._timed_indices.discard(idx)
+        self._groups_dirty = True
+
+    def _rebuild_groups(self):
+        """Regroup active indices by animation type code."""
+        groups = self._anim_groups
+        for group in groups:
+            group.clear()
+        codes = self._anim_codes
+        for idx in self._active_indices:
+            groups[codes[idx]].append(idx)
+        for group in groups:
+            group.sort()
+        self._groups_dirty = False
+
     def set_animation(self, idx, anim_type, color, speed=1.0, duration=None, priority=0):
         """
         Registers an animation for a specific pixel index.
@@ -160,8 +257,7 @@ class BasePixelManager:
             # Adding a new animation
             self._active_count += 1
 
-        slot.set(anim_type, color, speed, time.monotonic(), duration, priority)
-        self._active_indices.add(idx)
+        self._assign_slot(idx, anim_type, color, speed, time.monotonic(), duration, priority)
 
     def fill_animation(self, anim_type, color, speed=1.0, duration=None, priority=0):
         """Applies an animation to ALL pixels."""
@@ -176,8 +272,7 @@ class BasePixelManager:
                 # Increment counter when adding to empty slot
                 self._active_count += 1
 
-            slot.set(anim_type, color, speed, start_t, duration, priority)
-            self._active_indices.add(i)
+            self._assign_slot(i, anim_type, color, speed, start_t, duration, priority)
 
     def _apply_brightness(self, base_color, brightness):
         """
@@ -323,121 +418,166 @@ class BasePixelManager:
                 await asyncio.sleep(0.05)
                 continue
 
-            now = time.monotonic()
-
-            for idx in tuple(self._active_indices):
-                slot = self.active_animations[idx]
-                if not slot.active:
-                    continue
-
-                # 1. Duration Check
-                if slot.duration:
-                    elapsed = now - slot.start
-                    if elapsed >= slot.duration:
-                        self.pixels[idx] = (0, 0, 0)
-                        slot.clear()
-                        self._active_count -= 1
-                        continue
-
-                # 2. Animation Logic
-                elapsed = now - slot.start
-
-                # --- SOLID ---
-                if slot.type == "SOLID":
-                    self.pixels[idx] = slot.color
-
-                # --- BLINK ---
-                elif slot.type == "BLINK":
-                    period = 1.0 / slot.speed
-                    phase = elapsed % period
-                    if phase < (period / 2):
-                        self.pixels[idx] = slot.color
-                    else:
-                        self.pixels[idx] = (0, 0, 0)
-
-                # --- PULSE (Breathing) ---
-                elif slot.type == "PULSE":
-                    t = elapsed * slot.speed
-                    factor = 0.5 + 0.5 * math.sin(t * 2 * math.pi)
-                    factor = max(0.1, factor)
-                    base = slot.color
-                    self.pixels[idx] = (
-                        int(base[0] * factor),
-                        int(base[1] * factor),
-                        int(base[2] * factor)
-                    )
-
-                # --- RAINBOW ---
-                elif slot.type == "RAINBOW":
-                    hue = (elapsed * slot.speed * 360 + (idx / self.num_pixels) * 360) % 360
-                    self.pixels[idx] = Palette.hsv_to_rgb(hue, 1.0, 1.0)
-
-                # --- GLITCH ---
-                elif slot.type == "GLITCH":
-                    # TODO: GLITCH animation may have a bug - if slot.color is a list/tuple of colors,
-                    # line 183 assigns the entire collection to the pixel instead of randomly selecting
-                    # one color. This should probably be: self.pixels[idx] = random.choice(slot.color)
-                    # For now, this works when slot.color is a single color tuple.
-                    if random.random() > 0.9:
-                        if random.random() > 0.5:
-                             self.pixels[idx] = (255, 255, 255)
-                        else:
-                             self.pixels[idx] = (0, 0, 0)
-                    else:
-                        self.pixels[idx] = slot.color
-
-                # --- SCANNER (Cylon) ---
-                elif slot.type == "SCANNER":
-                    # Moves back and forth across the strip
-                    cycle = (elapsed * slot.speed) % 2.0
-                    if cycle < 1.0:
-                        pos = cycle * (self.num_pixels - 1)
-                    else:
-                        pos = (2.0 - cycle) * (self.num_pixels - 1)
-
-                    dist = abs(idx - pos)
-                    brightness = max(0, 1.0 - dist) # Tail length of 1.0
-                    base = slot.color
-                    self.pixels[idx] = (
-                        int(base[0] * brightness),
-                        int(base[1] * brightness),
-                        int(base[2] * brightness)
-                    )
-
-                # --- CHASER (Centrifuge) ---
-                elif slot.type == "CHASER":
-                    # Spins in one direction
-                    pos = (elapsed * slot.speed * self.num_pixels) % self.num_pixels
-                    # Calculate circular distance
-                    dist = (idx - pos) % self.num_pixels
-                    if dist > (self.num_pixels / 2): dist -= self.num_pixels
-                    dist = abs(dist)
-
-                    brightness = max(0, 1.0 - (dist / 2.0)) # Broader tail
-                    base = slot.color
-                    self.pixels[idx] = (
-                        int(base[0] * brightness),
-                        int(base[1] * brightness),
-                        int(base[2] * brightness)
-                    )
-
-                # --- DECAY ---
-                elif slot.type == "DECAY":
-                    duration = 1.0 / slot.speed
-                    if elapsed >= duration:
-                        self.pixels[idx] = (0, 0, 0)
-                        slot.clear()
-                        self._active_count -= 1
-                    else:
-                        factor = 1.0 - (elapsed / duration)
-                        base = slot.color
-                        self.pixels[idx] = (
-                        int(base[0] * factor),
-                        int(base[1] * factor),
-                        int(base[2] * factor)
-                    )
+            self._render_frame(time.monotonic())
 
             if step:
                 return
 
             await asyncio.sleep(0.05)
+
+    def _render_frame(self, now):
+        """Evaluate every active animation for one frame at time now.
+
+        Pixels are processed one type group at a time. Values that only
+        depend on a slot's start and speed (blink phase, pulse factor,
+        scanner and chaser position) are computed once per run of pixels
+        sharing them, which is every pixel after fill_animation().
+        """
+        pixels = self.pixels
+        starts = self._anim_starts
+        speeds = self._anim_speeds
+        colors = self._anim_colors
+        n = self.num_pixels
+        # The render loop clears .dirty after each push, so a segment that is
+        # dirty here was written outside the slot path (fill, show_frame,
+        # global animations). Segments without dirty tracking always count.
+        overwritten = getattr(pixels, "dirty", True)
+
+        # 1. Duration Check
+        if self._timed_indices:
+            ends = self._anim_ends
+            for idx in [i for i in self._timed_indices if now >= ends[i]]:
+                pixels[idx] = _BLACK
+                self._release_slot(idx)
+
+        if self._groups_dirty:
+            self._rebuild_groups()
+        groups = self._anim_groups
+
+        # 2. Animation Logic, one pass per type
+
+        # --- SOLID ---
+        # Static: written after a slot changes, or after something else wrote
+        # the segment, so idle frames stay clean
+        if self._solid_dirty or overwritten:
+            self._solid_dirty = False
+            for idx in groups[ANIM_SOLID]:
+                pixels[idx] = colors[idx]
+
+        # --- BLINK ---
+        last_start = last_speed = None
+        on = False
+        for idx in groups[ANIM_BLINK]:
+            start = starts[idx]
+            speed = speeds[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed = start, speed
+                period = 1.0 / speed
+                on = (now - start) % period < (period / 2)
+            pixels[idx] = colors[idx] if on else _BLACK
+
+        # --- PULSE (Breathing) ---
+        last_start = last_speed = last_base = None
+        factor = 0.0
+        color = _BLACK
+        for idx in groups[ANIM_PULSE]:
+            start = starts[idx]
+            speed = speeds[idx]
+            base = colors[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed, last_base = start, speed, None
+                t = (now - start) * speed
+                factor = max(0.1, 0.5 + 0.5 * math.sin(t * 2 * math.pi))
+            if base is not last_base:
+                last_base = base
+                color = (int(base[0] * factor), int(base[1] * factor), int(base[2] * factor))
+            pixels[idx] = color
+
+        # --- RAINBOW ---
+        wheel = Palette.hue_wheel()
+        hue_step = 360 / n
+        last_start = last_speed = None
+        offset = 0.0
+        for idx in groups[ANIM_RAINBOW]:
+            start = starts[idx]
+            speed = speeds[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed = start, speed
+                offset = (now - start) * speed * 360
+            pixels[idx] = wheel[int(offset + idx * hue_step) % 360]
+
+        # --- GLITCH ---
+        # TODO: GLITCH animation may have a bug - if the color is a list/tuple of colors,
+        # the entire collection is assigned to the pixel instead of randomly selecting
+        # one color. This should probably be: pixels[idx] = random.choice(colors[idx])
+        # For now, this works when the color is a single color tuple.
+        rand = random.random
+        for idx in groups[ANIM_GLITCH]:
+            if rand() > 0.9:
+                pixels[idx] = (255, 255, 255) if rand() > 0.5 else _BLACK
+            else:
+                pixels[idx] = colors[idx]
+
+        # --- SCANNER (Cylon) ---
+        # Moves back and forth across the strip with a tail length of 1.0
+        last_start = last_speed = None
+        pos = 0.0
+        for idx in groups[ANIM_SCANNER]:
+            start = starts[idx]
+            speed = speeds[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed = start, speed
+                cycle = ((now - start) * speed) % 2.0
+                pos = (cycle if cycle < 1.0 else 2.0 - cycle) * (n - 1)
+            dist = abs(idx - pos)
+            if dist < 1.0:
+                brightness = 1.0 - dist
+                base = colors[idx]
+                pixels[idx] = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+            else:
+                pixels[idx] = _BLACK
+
+        # --- CHASER (Centrifuge) ---
+        # Spins in one direction with a broader tail, using circular distance
+        last_start = last_speed = None
+        half = n / 2
+        for idx in groups[ANIM_CHASER]:
+            start = starts[idx]
+            speed = speeds[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed = start, speed
+                pos = ((now - start) * speed * n) % n
+            dist = (idx - pos) % n
+            if dist > half:
+                dist -= n
+            dist = abs(dist)
+            if dist < 2.0:
+                brightness = 1.0 - (dist / 2.0)
+                base = colors[idx]
+                pixels[idx] = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+            else:
+                pixels[idx] = _BLACK
+
+        # --- DECAY ---
+        last_start = last_speed = last_base = None
+        factor = 0.0
+        expired = False
+        for idx in groups[ANIM_DECAY]:
+            start = starts[idx]
+            speed = speeds[idx]
+            base = colors[idx]
+            if start != last_start or speed != last_speed:
+                last_start, last_speed, last_base = start, speed, None
+                elapsed = now - start
+                duration = 1.0 / speed
+                expired = elapsed >= duration
+                if not expired:
+                    factor = 1.0 - (elapsed / duration)
+            if expired:
+                pixels[idx] = _BLACK
+                self._release_slot(idx)
+                continue
+            if base is not last_base:
+                last_base = base
+                color = (int(base[0] * factor), int(base[1] * factor), int(base[2] * factor))
+            pixels[idx] = color
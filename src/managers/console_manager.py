@@ -738,6 +738,16 @@ class ConsoleManager():
             sat tog <index> <0|1>        – set first satellite latching toggle *index*
             sat mom <index> <U|D|C>      – set first satellite momentary toggle *index*
 
+        **Render profiling** – inspect the render loop's per-stage frame timings:
+
+            render                       – show frame stats and profiler timings
+            render on|off|reset          – enable, disable or clear the profiler
+
+        **UART latency** – inspect how long received packets wait before dispatch:
+
+            uart                         – show the RX latency histogram
+            uart reset                   – clear the histogram
+
         **God Mode** – directly modify attributes on the active mode instance:
 
             <attr> = <value>             – set *attr* on the active mode; value is
@@ -746,7 +756,7 @@ class ConsoleManager():
         Type ``exit`` to return to the main diagnostic menu.
         """
         self._print("\n--- LIVE DEBUG CONSOLE ---")
-        self._print("Commands: enc/btn/tog/mom, sat enc/btn/tog/mom, <attr>=<value>, exit")
+        self._print("Commands: enc/btn/tog/mom, sat enc/btn/tog/mom, render, uart, <attr>=<value>, exit")
         self._print("Type 'help' for command reference.")
 
         if self.app is None:
@@ -773,6 +783,8 @@ class ConsoleManager():
                 self._print("  sat btn <i>             - satellite button tap")
                 self._print("  sat tog <i> <0|1>       - satellite latching toggle")
                 self._print("  sat mom <i> <U|D|C>     - satellite momentary toggle")
+                self._print("  render [on|off|reset]   - render loop frame timings")
+                self._print("  uart [reset]            - UART RX latency histogram")
                 self._print("  <attr> = <value>        - set attribute on active mode")
                 self._print("  exit                    - return to main menu")
                 continue
@@ -811,13 +823,71 @@ class ConsoleManager():
             # ------------------------------------------------------------------
             tokens = cmd.split()
 
-            if tokens[0].lower() == "sat":
+            if tokens[0].lower() == "render":
+                self._debug_cmd_render(tokens[1:])
+            elif tokens[0].lower() == "uart":
+                self._debug_cmd_uart(tokens[1:])
+            elif tokens[0].lower() == "sat":
                 # Satellite HID commands
                 await self._debug_cmd_sat(tokens[1:])
             else:
                 # Core HID commands
                 await self._debug_cmd_core(tokens)
 
+    def _debug_cmd_render(self, tokens):
+        """Control the render loop profiler and print its timings."""
+        renderer = getattr(self.app, 'renderer', None)
+        if renderer is None:
+            self._print("No render loop available.")
+            return
+
+        action = tokens[0].lower() if tokens else ""
+        if action == "on":
+            renderer.enable_profiler()
+            self._print("Render profiler enabled.")
+            return
+        if action == "off":
+            renderer.disable_profiler()
+            self._print("Render profiler disabled.")
+            return
+        if action == "reset":
+            if renderer.profiler is not None:
+                renderer.profiler.reset()
+            self._print("Render profiler reset.")
+            return
+
+        stats = renderer.get_frame_stats()
+        self._print(
+            f"Target {renderer.target_frame_rate:.1f} Hz | pushed {stats['pushed']} "
+            f"skipped {stats['skipped']} ({stats['skip_ratio'] * 100:.0f}%) | idle {stats['idle']}"
+        )
+        if renderer.profiler is None:
+            self._print("Profiler off. Use 'render on' to collect per-stage timings.")
+            return
+        for line in renderer.profiler.format():
+            self._print(line)
+
+    def _debug_cmd_uart(self, tokens):
+        """Print or clear the upstream UART's RX latency histogram."""
+        transport = getattr(self.app, 'transport', None)
+        if transport is None or not hasattr(transport, 'rx_latency'):
+            self._print("No UART transport available.")
+            return
+
+        if tokens and tokens[0].lower() == "reset":
+            transport.rx_latency.reset()
+            self._print("UART latency histogram reset.")
+            return
+
+        stats = transport.get_rx_telemetry()
+        latency = stats["rx_latency"]
+        self._print(
+            f"RX {latency['count']} packets | mean {latency['mean_ms']:.2f} ms "
+            f"p50 {latency['p50_ms']} ms p99 {latency['p99_ms']} ms max {latency['max_ms']:.2f} ms"
+        )
+        self._print(f"Poll delay {stats['poll_delay_ms']:.2f} ms | RX errors {stats['rx_errors']}")
+        self._print(transport.rx_latency.format())
+
     async def _debug_cmd_core(self, tokens):
         """Parse and apply a core HID debug command."""
         hid = getattr(self.app, 'hid', None)
@@ -11,6 +11,7 @@ waves and falling rain effects.
 import asyncio
 import time
 import random
+from array import array
 
 from utilities.logger import JEBLogger
 from utilities.palette import Palette
@@ -35,8 +36,26 @@ class GlobalAnimationController:
         """Initialize an empty global animation controller."""
         JEBLogger.info("GANC", "[INIT] GlobalAnimationController")
         self._components = []   # list of component dicts
-        self._pixel_map = {}    # (global_x, global_y) -> (manager, pixel_idx)
-        self._pixel_list = []   # flat list of (gx, gy, manager, pixel_idx) for efficient iteration
+
+        # Dense canvas storage: one entry ("slot") per mapped pixel, in
+        # registration order. Later registrations on an occupied coordinate
+        # replace that slot's target in place.
+        self._slot_managers = []     # component id -> manager
+        self._pix_x = array('h')     # slot -> global x
+        self._pix_y = array('h')     # slot -> global y
+        self._pix_idx = array('H')   # slot -> pixel index within its manager
+        self._pix_comp = bytearray() # slot -> component id
+        self._grid = array('h')      # (gy - y0) * grid_w + (gx - x0) -> slot, -1 if unmapped
+        self._grid_x0 = 0
+        self._grid_y0 = 0
+        self._grid_w = 0
+        self._grid_h = 0
+        self._columns = []           # gx - x0 -> array('H') of slots sorted by gy
+
+        # Tuple-based views, built on first access (see _pixel_map/_pixel_list)
+        self._map_view = None
+        self._list_view = None
+
         self._canvas_width = 0
         self._canvas_height = 0
         self._frame_counter = 0  # Synchronized frame counter (updated via sync_frame())
@@ -54,7 +73,28 @@ class GlobalAnimationController:
     @property
     def pixel_count(self):
         """Total number of mapped pixels across all registered components."""
-        return len(self._pixel_list)
+        return len(self._pix_idx)
+
+    @property
+    def _pixel_map(self):
+        """Dict view of the canvas: (global_x, global_y) -> (manager, pixel_idx)."""
+        if self._map_view is None:
+            self._map_view = {(gx, gy): (mgr, idx) for gx, gy, mgr, idx in self._pixel_list}
+        return self._map_view
+
+    @property
+    def _pixel_list(self):
+        """List view of the canvas: (gx, gy, manager, pixel_idx) per slot."""
+        if self._list_view is None:
+            managers = self._slot_managers
+            comps = self._pix_comp
+            idxs = self._pix_idx
+            xs = self._pix_x
+            ys = self._pix_y
+            self._list_view = [
+                (xs[s], ys[s], managers[comps[s]], idxs[s]) for s in range(len(idxs))
+            ]
+        return self._list_view
 
     def sync_frame(self, frame):
         """Update the synchronized frame counter used by deterministic animations.
@@ -151,60 +191,111 @@ class GlobalAnimationController:
 
     def _rebuild_pixel_map(self):
         """
-        Rebuilds the global pixel coordinate map from all registered components.
+        Rebuilds the dense canvas arrays from all registered components.
 
-        Maps each (global_x, global_y) coordinate to (manager, pixel_index).
+        Every pixel gets a slot holding its global (x, y), component id and
+        manager pixel index. A dense grid maps coordinates to slots and a
+        per-column index lists each column's slots top to bottom.
         Recalculates canvas dimensions after each rebuild.
         """
-        self._pixel_map = {}
-        max_x = -1
-        max_y = -1
-
-        for component in self._components:
+        # Gather (gx, gy, component id, pixel index) in registration order
+        entries = []
+        managers = []
+        for comp_id, component in enumerate(self._components):
             manager = component['manager']
+            managers.append(manager)
             ox = component.get('offset_x', 0)
             oy = component.get('offset_y', 0)
 
             if component['type'] == 'matrix':
-                width = manager.width
-                height = manager.height
-                for y in range(height):
-                    for x in range(width):
-                        gx = ox + x
-                        gy = oy + y
-                        pixel_idx = manager._get_idx(x, y)
-                        self._pixel_map[(gx, gy)] = (manager, pixel_idx)
-                        if gx > max_x:
-                            max_x = gx
-                        if gy > max_y:
-                            max_y = gy
+                for y in range(manager.height):
+                    for x in range(manager.width):
+                        entries.append((ox + x, oy + y, comp_id, manager._get_idx(x, y)))
 
             elif component['type'] == 'led_strip':
-                orientation = component['orientation']
+                horizontal = component['orientation'] == 'horizontal'
                 for i in range(manager.num_pixels):
-                    if orientation == 'horizontal':
-                        gx = ox + i
-                        gy = oy
+                    if horizontal:
+                        entries.append((ox + i, oy, comp_id, i))
                     else:  # vertical
-                        gx = ox
-                        gy = oy + i
-                    self._pixel_map[(gx, gy)] = (manager, i)
-                    if gx > max_x:
-                        max_x = gx
-                    if gy > max_y:
-                        max_y = gy
+                        entries.append((ox, oy + i, comp_id, i))
 
             elif component['type'] == 'custom_leds':
                 for i, (gx, gy) in enumerate(component['coordinates']):
-                    self._pixel_map[(gx, gy)] = (manager, i)
-                    if gx > max_x:
-                        max_x = gx
-                    if gy > max_y:
-                        max_y = gy
+                    entries.append((gx, gy, comp_id, i))
+
+        self._slot_managers = managers
+        self._map_view = None
+        self._list_view = None
+
+        if not entries:
+            self._pix_x = array('h')
+            self._pix_y = array('h')
+            self._pix_idx = array('H')
+            self._pix_comp = bytearray()
+            self._grid = array('h')
+            self._grid_x0 = self._grid_y0 = self._grid_w = self._grid_h = 0
+            self._columns = []
+            self._canvas_width = 0
+            self._canvas_height = 0
+            return
 
-        self._canvas_width = max_x + 1 if self._pixel_map else 0
-        self._canvas_height = max_y + 1 if self._pixel_map else 0
-        self._pixel_list = [(gx, gy, mgr, idx) for (gx, gy), (mgr, idx) in self._pixel_map.items()]
+        min_x = min(e[0] for e in entries)
+        min_y = min(e[1] for e in entries)
+        max_x = max(e[0] for e in entries)
+        max_y = max(e[1] for e in entries)
+        grid_w = max_x - min_x + 1
+        grid_h = max_y - min_y + 1
+        grid = array('h', [-1]) * (grid_w * grid_h)
+
+        xs = array('h')
+        ys = array('h')
+        idxs = array('H')
+        comps = bytearray()
+        for gx, gy, comp_id, pixel_idx in entries:
+            cell = (gy - min_y) * grid_w + (gx - min_x)
+            slot = grid[cell]
+            if slot >= 0:
+                # Coordinate already mapped: the later component wins
+                comps[slot] = comp_id
+                idxs[slot] = pixel_idx
+                continue
+            grid[cell] = len(idxs)
+            xs.append(gx)
+            ys.append(gy)
+            idxs.append(pixel_idx)
+            comps.append(comp_id)
+
+        # Column index: slots per global x, ordered top to bottom
+        columns = []
+        for col in range(grid_w):
+            slots = array('H')
+            for row in range(grid_h):
+                slot = grid[row * grid_w + col]
+                if slot >= 0:
+                    slots.append(slot)
+            columns.append(slots)
+
+        self._pix_x = xs
+        self._pix_y = ys
+        self._pix_idx = idxs
+        self._pix_comp = comps
+        self._grid = grid
+        self._grid_x0 = min_x
+        self._grid_y0 = min_y
+        self._grid_w = grid_w
+        self._grid_h = grid_h
+        self._columns = columns
+        self._canvas_width = max_x + 1
+        self._canvas_height = max_y + 1
+
+    def _slot_at(self, global_x, global_y):
+        """Return the slot mapped at a global coordinate, or -1."""
+        x = global_x - self._grid_x0
+        y = global_y - self._grid_y0
+        if 0 <= x < self._grid_w and 0 <= y < self._grid_h:
+            return self._grid[y * self._grid_w + x]
+        return -1
 
     def set_pixel(self, global_x, global_y, color):
         """
@@ -217,10 +308,13 @@ class GlobalAnimationController:
             global_y: Global Y coordinate.
             color: RGB tuple (r, g, b).
         """
-        entry = self._pixel_map.get((global_x, global_y))
-        if entry is not None:
-            manager, idx = entry
-            manager.pixels[idx] = color
+        x = global_x - self._grid_x0
+        y = global_y - self._grid_y0
+        w = self._grid_w
+        if 0 <= x < w and 0 <= y < self._grid_h:
+            slot = self._grid[y * w + x]
+            if slot >= 0:
+                self._slot_managers[self._pix_comp[slot]].pixels[self._pix_idx[slot]] = color
 
     def clear(self):
         """Clears all pixels across all registered managers."""
@@ -255,10 +349,11 @@ class GlobalAnimationController:
             duration: Optional duration in seconds. Runs indefinitely if None.
             priority: Animation priority level passed to set_animation().
         """
-        if not self._pixel_list:
+        if not self.pixel_count:
             return
 
         canvas_w = max(self._canvas_width, 1)
+        hue_step = 360.0 / canvas_w
         _FRAME_RATE = 60.0  # Assumed frame rate for frame-counter-to-seconds conversion
         start_t = time.monotonic()
 
@@ -276,12 +371,22 @@ class GlobalAnimationController:
             else:
                 t = elapsed
 
-            for gx, gy, manager, idx in self._pixel_list:
-                # Hue = time-driven offset + spatial offset based on global X.
-                # Produces a rainbow band that sweeps left → right across the canvas.
-                hue = (t * speed + gx * (360.0 / canvas_w)) % 360.0
-                color = Palette.hsv_to_rgb(hue, 1.0, 1.0)
-                manager.set_animation(idx, "SOLID", color, priority=priority)
+            # Re-read each frame in case components are registered mid-animation
+            managers = self._slot_managers
+            comps = self._pix_comp
+            idxs = self._pix_idx
+            x0 = self._grid_x0
+
+            # Hue = time-driven offset + spatial offset based on global X.
+            # Produces a rainbow band that sweeps left → right across the canvas,
+            # so one colour is computed per column.
+            offset = t * speed
+            for col, slots in enumerate(self._columns):
+                if not slots:
+                    continue
+                color = Palette.hue_to_rgb((offset + (col + x0) * hue_step) % 360.0)
+                for slot in slots:
+                    managers[comps[slot]].set_animation(idxs[slot], "SOLID", color, priority=priority)
 
             await asyncio.sleep(0.05)
 
@@ -308,22 +413,21 @@ class GlobalAnimationController:
             density: Probability [0.0, 1.0] of a new drop spawning per column
                      per tick (default: 0.3).
         """
-        if not self._pixel_list:
+        if not self.pixel_count:
             return
 
         if color is None:
             color = (0, 180, 255)  # Cyan-blue default
 
-        # Build column structures: gx -> sorted list of gy values present in map
-        columns = {}
-        for gx, gy, _, _ in self._pixel_list:
-            if gx not in columns:
-                columns[gx] = []
-            columns[gx].append(gy)
-        for gx in columns:
-            columns[gx].sort()
+        managers = self._slot_managers
+        comps = self._pix_comp
+        idxs = self._pix_idx
+        slot_count = len(idxs)
+
+        # Columns that hold at least one pixel, each a list of slots top to bottom
+        columns = [slots for slots in self._columns if slots]
 
-        # Track active drop positions: {gx: current_gy}
+        # Track active drop positions: {column: position within that column}
         active_drops = {}
 
         _FRAME_RATE = 60.0
@@ -360,28 +464,24 @@ class GlobalAnimationController:
                     last_step_t = now
 
                 # Clear all pixels for this frame
-                for gx, gy, manager, idx in self._pixel_list:
-                    manager.pixels[idx] = (0, 0, 0)
+                for slot in range(slot_count):
+                    managers[comps[slot]].pixels[idxs[slot]] = (0, 0, 0)
 
                 # Advance existing drops one row down
                 new_drops = {}
-                for gx, drop_gy in active_drops.items():
-                    col = columns.get(gx, [])
-                    next_rows = [gy for gy in col if gy > drop_gy]
-                    if next_rows:
-                        new_drops[gx] = min(next_rows)
+                for col, pos in active_drops.items():
+                    if pos + 1 < len(columns[col]):
+                        new_drops[col] = pos + 1
                 active_drops = new_drops
 
                 # Spawn new drops at the top of each column
-                for gx, col_rows in columns.items():
-                    if gx not in active_drops and col_rows and random.random() < density:
-                        active_drops[gx] = col_rows[0]
+                for col in range(len(columns)):
+                    if col not in active_drops and random.random() < density:
+                        active_drops[col] = 0
 
                 # Render active drops
-                for gx, drop_gy in active_drops.items():
-                    entry = self._pixel_map.get((gx, drop_gy))
-                    if entry is not None:
-                        manager, idx = entry
-                        manager.pixels[idx] = color
+                for col, pos in active_drops.items():
+                    slot = columns[col][pos]
+                    managers[comps[slot]].pixels[idxs[slot]] = color
 
             await asyncio.sleep(0.016)  # ~60 Hz yield to keep event loop responsive
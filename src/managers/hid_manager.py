@@ -1,9 +1,42 @@
 """Class to manage Master Box hardware inputs."""
 
+import struct
+
 from adafruit_ticks import ticks_ms, ticks_diff
 import keypad
 from utilities.logger import JEBLogger, LogLevel
 
+
+def _pack_flags(values):
+    """Pack a list of booleans into an int, element i at bit i."""
+    bits = 0
+    for i, value in enumerate(values):
+        if value:
+            bits |= 1 << i
+    return bits
+
+
+def _pack_momentary(values):
+    """Pack [[up, down], ...] into an int, toggle i at bits 2i (up) and 2i+1 (down)."""
+    bits = 0
+    for i, (up, down) in enumerate(values):
+        if up:
+            bits |= 1 << (2 * i)
+        if down:
+            bits |= 2 << (2 * i)
+    return bits
+
+
+def _write_flags(buf, offset, count, bits, nbits):
+    """Write ``[count][bitfield]`` to buf at offset. Returns new offset."""
+    buf[offset] = count
+    offset += 1
+    for _ in range((nbits + 7) >> 3):
+        buf[offset] = bits & 0xFF
+        bits >>= 8
+        offset += 1
+    return offset
+
 class HIDManager:
     """
     Unified Input Manager.
@@ -40,6 +73,22 @@ class HIDManager:
     # Total estimate: ~808 bytes; using 1024 for safety margin
     _STATUS_BUFFER_SIZE = 1024
 
+    # Binary STATUS packet (see get_status_packet).  The header's high nibble
+    # is the frame kind and its low nibble the format version; both kinds are
+    # >= 0x80 so they can never be mistaken for the ASCII format.
+    STATUS_VERSION = 1
+    STATUS_FULL = 0xB0 | STATUS_VERSION
+    STATUS_DELTA = 0xD0 | STATUS_VERSION
+
+    # Field mask bits, in the default get_status_bytes() order
+    FIELD_BUTTONS = 0x01
+    FIELD_TOGGLES = 0x02
+    FIELD_MOMENTARY = 0x04
+    FIELD_KEYPADS = 0x08
+    FIELD_ENCODERS = 0x10
+    FIELD_ENCODER_BTNS = 0x20
+    FIELD_ESTOP = 0x40
+
     def __init__(self,
                  buttons=None,
                  latching_toggles=None,
@@ -98,6 +147,14 @@ class HIDManager:
         # Pre-allocated buffer for get_status_string to reduce heap fragmentation
         self._status_buffer = bytearray(self._STATUS_BUFFER_SIZE)
 
+        # Last values sent in a binary STATUS packet, for delta frames
+        self._sent_buttons = None
+        self._sent_latching = None
+        self._sent_momentary = None
+        self._sent_encoders = [0] * len(self.encoder_positions)
+        self._sent_encoder_buttons = None
+        self._sent_estop = None
+
         # Idle tracking: timestamp (ms) of last detected hardware interaction
         self.last_interaction_time = ticks_ms()
         #endregion
@@ -270,22 +327,27 @@ class HIDManager:
         dirty = False
         now = ticks_ms()
         for i, char in enumerate(buttons):
-            val = char == "1"
-            if val != self.buttons_values[i]:
-                self.buttons_values[i] = val
-                if val:  # Button pressed - record timestamp
-                    JEBLogger.info("HIDM", f"SW set button[{i}] PRESSED.")
-                    self.buttons_timestamps[i] = now
-                else:  # Button released - detect tap
-                    start_time = self.buttons_timestamps[i]
-                    elapsed = ticks_diff(now, start_time)
-                    JEBLogger.info("HIDM", f"SW set button[{i}] RELEASED after {elapsed} ms.")
-                    if start_time > 0 and elapsed < 500:
-                        JEBLogger.info("HIDM", f"SW set button[{i}] TAPPED.")
-                        self.buttons_tapped[i] = True
+            if self._sw_set_button(i, char == "1", now):
                 dirty = True
         return dirty
 
+    def _sw_set_button(self, i, val, now):
+        """Apply one remote button state. Returns True if it changed."""
+        if val == self.buttons_values[i]:
+            return False
+        self.buttons_values[i] = val
+        if val:  # Button pressed - record timestamp
+            JEBLogger.info("HIDM", f"SW set button[{i}] PRESSED.")
+            self.buttons_timestamps[i] = now
+        else:  # Button released - detect tap
+            start_time = self.buttons_timestamps[i]
+            elapsed = ticks_diff(now, start_time)
+            JEBLogger.info("HIDM", f"SW set button[{i}] RELEASED after {elapsed} ms.")
+            if start_time > 0 and elapsed < 500:
+                JEBLogger.info("HIDM", f"SW set button[{i}] TAPPED.")
+                self.buttons_tapped[i] = True
+        return True
+
     def _hw_poll_buttons(self):
         """Poll hardware buttons and update states."""
         if self.monitor_only or not self._buttons:
@@ -346,21 +408,26 @@ class HIDManager:
         dirty = False
         now = ticks_ms()
         for i, char in enumerate(latching_toggles):
-            val = char == "1"
-            if val != self.latching_values[i]:
-                self.latching_values[i] = val
-                if val:  # Toggle turned on - record timestamp
-                    JEBLogger.info("HIDM", f"SW set latching toggle[{i}] ON.")
-                    self.latching_timestamps[i] = now
-                else:  # Toggle turned off - detect tap
-                    JEBLogger.info("HIDM", f"SW set latching toggle[{i}] OFF.")
-                    start_time = self.latching_timestamps[i]
-                    if start_time > 0 and ticks_diff(now, start_time) < 500:
-                        JEBLogger.info("HIDM", f"SW set latching toggle[{i}] TAPPED.")
-                        self.latching_tapped[i] = True
+            if self._sw_set_latching(i, char == "1", now):
                 dirty = True
         return dirty
 
+    def _sw_set_latching(self, i, val, now):
+        """Apply one remote latching toggle state. Returns True if it changed."""
+        if val == self.latching_values[i]:
+            return False
+        self.latching_values[i] = val
+        if val:  # Toggle turned on - record timestamp
+            JEBLogger.info("HIDM", f"SW set latching toggle[{i}] ON.")
+            self.latching_timestamps[i] = now
+        else:  # Toggle turned off - detect tap
+            JEBLogger.info("HIDM", f"SW set latching toggle[{i}] OFF.")
+            start_time = self.latching_timestamps[i]
+            if start_time > 0 and ticks_diff(now, start_time) < 500:
+                JEBLogger.info("HIDM", f"SW set latching toggle[{i}] TAPPED.")
+                self.latching_tapped[i] = True
+        return True
+
     def _hw_poll_latching_toggles(self):
         """Poll hardware latching toggles and update states."""
         if self.monitor_only or not self._latching_toggles:
@@ -431,39 +498,42 @@ class HIDManager:
         dirty = False
         now = ticks_ms()
         for i, char in enumerate(momentary_toggles):
-            up_val = char == "U"
-            down_val = char == "D"
-
-            # Check if the momentary toggle state has changed in either direction
-            if (up_val != self.momentary_values[i][0]) or (down_val != self.momentary_values[i][1]):
+            if self._sw_set_momentary(i, char == "U", char == "D", now):
                 dirty = True
-
-                # Up Direction
-                if up_val != self.momentary_values[i][0]:
-                    self.momentary_values[i][0] = up_val
-                    if up_val:  # Pressed up - record timestamp
-                        JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP.")
-                        self.momentary_timestamps[i][0] = now
-                    else:  # Released up - detect tap
-                        JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP released.")
-                        start_time = self.momentary_timestamps[i][0]
-                        if start_time > 0 and ticks_diff(now, start_time) < 500:
-                            JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP TAPPED.")
-                            self.momentary_tapped[i][0] = True
-                # Down Direction
-                if down_val != self.momentary_values[i][1]:
-                    self.momentary_values[i][1] = down_val
-                    if down_val:  # Pressed down - record timestamp
-                        JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN.")
-                        self.momentary_timestamps[i][1] = now
-                    else:  # Released down - detect tap
-                        JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN released.")
-                        start_time = self.momentary_timestamps[i][1]
-                        if start_time > 0 and ticks_diff(now, start_time) < 500:
-                            JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN TAPPED.")
-                            self.momentary_tapped[i][1] = True
         return dirty
 
+    def _sw_set_momentary(self, i, up_val, down_val, now):
+        """Apply one remote momentary toggle state. Returns True if it changed."""
+        # Check if the momentary toggle state has changed in either direction
+        if (up_val == self.momentary_values[i][0]) and (down_val == self.momentary_values[i][1]):
+            return False
+
+        # Up Direction
+        if up_val != self.momentary_values[i][0]:
+            self.momentary_values[i][0] = up_val
+            if up_val:  # Pressed up - record timestamp
+                JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP.")
+                self.momentary_timestamps[i][0] = now
+            else:  # Released up - detect tap
+                JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP released.")
+                start_time = self.momentary_timestamps[i][0]
+                if start_time > 0 and ticks_diff(now, start_time) < 500:
+                    JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] UP TAPPED.")
+                    self.momentary_tapped[i][0] = True
+        # Down Direction
+        if down_val != self.momentary_values[i][1]:
+            self.momentary_values[i][1] = down_val
+            if down_val:  # Pressed down - record timestamp
+                JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN.")
+                self.momentary_timestamps[i][1] = now
+            else:  # Released down - detect tap
+                JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN released.")
+                start_time = self.momentary_timestamps[i][1]
+                if start_time > 0 and ticks_diff(now, start_time) < 500:
+                    JEBLogger.info("HIDM", f"SW set momentary toggle[{i}] DOWN TAPPED.")
+                    self.momentary_tapped[i][1] = True
+        return True
+
     def _hw_poll_momentary_toggles(self):
         """Poll hardware momentary toggles and update states."""
         if self.monitor_only or not self._momentary_toggles:
@@ -626,21 +696,26 @@ class HIDManager:
         dirty = False
         now = ticks_ms()
         for i, char in enumerate(encoder_buttons):
-            val = char == "1"
-            if val != self.encoder_buttons_values[i]:
-                self.encoder_buttons_values[i] = val
-                if val:  # Button pressed - record timestamp
-                    JEBLogger.info("HIDM", f"SW set encoder button[{i}] PRESSED.")
-                    self.encoder_buttons_timestamps[i] = now
-                else:  # Button released - detect tap
-                    JEBLogger.info("HIDM", f"SW set encoder button[{i}] RELEASED.")
-                    start_time = self.encoder_buttons_timestamps[i]
-                    if start_time > 0 and ticks_diff(now, start_time) < 500:
-                        JEBLogger.info("HIDM", f"SW set encoder button[{i}] TAPPED.")
-                        self.encoder_buttons_tapped[i] = True
+            if self._sw_set_encoder_button(i, char == "1", now):
                 dirty = True
         return dirty
 
+    def _sw_set_encoder_button(self, i, val, now):
+        """Apply one remote encoder button state. Returns True if it changed."""
+        if val == self.encoder_buttons_values[i]:
+            return False
+        self.encoder_buttons_values[i] = val
+        if val:  # Button pressed - record timestamp
+            JEBLogger.info("HIDM", f"SW set encoder button[{i}] PRESSED.")
+            self.encoder_buttons_timestamps[i] = now
+        else:  # Button released - detect tap
+            JEBLogger.info("HIDM", f"SW set encoder button[{i}] RELEASED.")
+            start_time = self.encoder_buttons_timestamps[i]
+            if start_time > 0 and ticks_diff(now, start_time) < 500:
+                JEBLogger.info("HIDM", f"SW set encoder button[{i}] TAPPED.")
+                self.encoder_buttons_tapped[i] = True
+        return True
+
 
 
     def _hw_poll_encoder_buttons(self):
@@ -1056,6 +1131,222 @@ class HIDManager:
         # This avoids the string allocation that occurs with decode()
         return bytes(self._status_buffer[:offset])
 
+    def get_status_packet(self, full=True, flush=False):
+        """
+        Read inputs and format a binary STATUS packet.
+
+        Layout: ``[header][field mask][fields...]`` where the header is
+        STATUS_FULL or STATUS_DELTA and each set mask bit (FIELD_*) is
+        followed by that field, in mask-bit order:
+
+        - buttons / toggles / encoder_btns: ``[count][bitfield]``, LSB first
+        - momentary: ``[count][bitfield]``, bit 2i = up, bit 2i+1 = down
+        - keypads: ``[count]`` then ``[len][chars]`` per keypad event queue
+        - encoders: ``[count]`` then an int32 position per encoder in full
+          frames, or the int16 change since the previous packet in delta frames
+        - estop: ``[0|1]``
+
+        A full frame carries every field.  A delta frame carries only the
+        fields that changed since the previous packet (keypads whenever
+        events are queued), so a lost delta is corrected by the next full
+        frame.  Written into the pre-allocated status buffer.
+
+        :param full: Send every field with absolute encoder positions.
+        :param flush: Clear states after reading (see flush()).
+        :return: bytes object containing the packet
+        """
+        buf = self._status_buffer
+        mask = 0
+        offset = 2
+
+        bits = _pack_flags(self.buttons_values)
+        if full or bits != self._sent_buttons:
+            mask |= self.FIELD_BUTTONS
+            count = len(self.buttons_values)
+            offset = _write_flags(buf, offset, count, bits, count)
+            self._sent_buttons = bits
+
+        bits = _pack_flags(self.latching_values)
+        if full or bits != self._sent_latching:
+            mask |= self.FIELD_TOGGLES
+            count = len(self.latching_values)
+            offset = _write_flags(buf, offset, count, bits, count)
+            self._sent_latching = bits
+
+        bits = _pack_momentary(self.momentary_values)
+        if full or bits != self._sent_momentary:
+            mask |= self.FIELD_MOMENTARY
+            count = len(self.momentary_values)
+            offset = _write_flags(buf, offset, count, bits, 2 * count)
+            self._sent_momentary = bits
+
+        queues = self.matrix_keypads_queues
+        if full or any(queues):
+            mask |= self.FIELD_KEYPADS
+            buf[offset] = len(queues)
+            offset += 1
+            for queue in queues:
+                buf[offset] = len(queue)
+                offset += 1
+                for ch in queue:
+                    buf[offset] = ord(ch)
+                    offset += 1
+
+        positions = self.encoder_positions
+        sent = self._sent_encoders
+        changed = full
+        for i, pos in enumerate(positions):
+            if pos != sent[i]:
+                changed = True
+        if changed:
+            mask |= self.FIELD_ENCODERS
+            buf[offset] = len(positions)
+            offset += 1
+            for i, pos in enumerate(positions):
+                if full:
+                    struct.pack_into("<i", buf, offset, pos)
+                    offset += 4
+                    sent[i] = pos
+                else:
+                    delta = max(-32768, min(32767, pos - sent[i]))
+                    struct.pack_into("<h", buf, offset, delta)
+                    offset += 2
+                    sent[i] += delta
+
+        bits = _pack_flags(self.encoder_buttons_values)
+        if full or bits != self._sent_encoder_buttons:
+            mask |= self.FIELD_ENCODER_BTNS
+            count = len(self.encoder_buttons_values)
+            offset = _write_flags(buf, offset, count, bits, count)
+            self._sent_encoder_buttons = bits
+
+        estop = bool(self.estop_value)
+        if full or estop != self._sent_estop:
+            mask |= self.FIELD_ESTOP
+            buf[offset] = 1 if estop else 0
+            offset += 1
+            self._sent_estop = estop
+
+        buf[0] = self.STATUS_FULL if full else self.STATUS_DELTA
+        buf[1] = mask
+
+        if flush:
+            self.flush()  # Clear states after reading if flush is requested
+
+        return bytes(buf[:offset])
+
+    def apply_status_packet(self, data, sid=None):
+        """
+        Update remote HID states in place from a binary STATUS packet (monitor-only mode).
+
+        Fields are read straight from *data* into the state arrays with the
+        same press/release/tap handling as set_remote_state(), without
+        building intermediate strings.
+
+        :param data: Packet from get_status_packet() as bytes or a tuple of ints.
+        :param sid: Satellite ID used in debug logging.
+        :return: True if any state changed.
+        :raises ValueError: If the header is not a supported STATUS frame
+            or the packet is truncated.
+        """
+        if not self.monitor_only:
+            return False
+        header = data[0]
+        if header == self.STATUS_FULL:
+            full = True
+        elif header == self.STATUS_DELTA:
+            full = False
+        else:
+            raise ValueError(f"Unsupported STATUS header 0x{header:02X}")
+
+        try:
+            mask = data[1]
+            pos = 2
+            now = ticks_ms()
+            dirty = False
+
+            if mask & self.FIELD_BUTTONS:
+                count = data[pos]
+                pos += 1
+                for i in range(min(count, len(self.buttons_values))):
+                    if self._sw_set_button(i, bool((data[pos + (i >> 3)] >> (i & 7)) & 1), now):
+                        dirty = True
+                pos += (count + 7) >> 3
+
+            if mask & self.FIELD_TOGGLES:
+                count = data[pos]
+                pos += 1
+                for i in range(min(count, len(self.latching_values))):
+                    if self._sw_set_latching(i, bool((data[pos + (i >> 3)] >> (i & 7)) & 1), now):
+                        dirty = True
+                pos += (count + 7) >> 3
+
+            if mask & self.FIELD_MOMENTARY:
+                count = data[pos]
+                pos += 1
+                for i in range(min(count, len(self.momentary_values))):
+                    bit = 2 * i
+                    pair = (data[pos + (bit >> 3)] >> (bit & 7)) & 3
+                    if self._sw_set_momentary(i, bool(pair & 1), bool(pair & 2), now):
+                        dirty = True
+                pos += (2 * count + 7) >> 3
+
+            if mask & self.FIELD_KEYPADS:
+                count = data[pos]
+                pos += 1
+                for k in range(count):
+                    length = data[pos]
+                    pos += 1
+                    if k < len(self.matrix_keypads_queues):
+                        queue = self.matrix_keypads_queues[k]
+                        for j in range(length):
+                            if len(queue) > 16:
+                                queue.pop(0)  # Prevent unbounded growth
+                            queue.append(chr(data[pos + j]))
+                            dirty = True
+                    pos += length
+
+            if mask & self.FIELD_ENCODERS:
+                count = data[pos]
+                pos += 1
+                for i in range(count):
+                    if full:
+                        value = data[pos] | (data[pos + 1] << 8) | (data[pos + 2] << 16) | (data[pos + 3] << 24)
+                        if value & 0x80000000:
+                            value -= 0x100000000
+                        pos += 4
+                    else:
+                        value = data[pos] | (data[pos + 1] << 8)
+                        if value & 0x8000:
+                            value -= 0x10000
+                        pos += 2
+                    if i < len(self.encoder_positions):
+                        new_val = value if full else self.encoder_positions[i] + value
+                        if new_val != self.encoder_positions[i]:
+                            self.encoder_positions[i] = new_val
+                            dirty = True
+
+            if mask & self.FIELD_ENCODER_BTNS:
+                count = data[pos]
+                pos += 1
+                for i in range(min(count, len(self.encoder_buttons_values))):
+                    if self._sw_set_encoder_button(i, bool((data[pos + (i >> 3)] >> (i & 7)) & 1), now):
+                        dirty = True
+                pos += (count + 7) >> 3
+
+            if mask & self.FIELD_ESTOP:
+                estop = data[pos] != 0
+                pos += 1
+                if estop != self.estop_value:
+                    self.estop_value = estop
+                    dirty = True
+        except IndexError:
+            raise ValueError("Truncated STATUS packet")
+
+        if dirty:
+            JEBLogger.debug("HIDM", f"Driver - STATUS packet mask 0x{mask:02X}", src=sid)
+        return dirty
+
     def get_status_string(self, order=None):
         """
         Read inputs and format status packet with custom ordering and selection.
@@ -1,6 +1,7 @@
 # File: src/core/managers/led_manager.py
 """Manages simple LED arrays, such as individual button LEDs, sticks and strings."""
 
+from utilities.led_batch import iter_led_batch
 from utilities.logger import JEBLogger
 from utilities.payload_parser import parse_values, get_int, get_float, get_str
 from utilities.palette import Palette
@@ -44,6 +45,10 @@ class LEDManager(BasePixelManager):
         Handles both text (CSV string) and binary (Tuple) payloads.
         """
         JEBLogger.debug("LEDM", f"Applying command '{cmd}' with value: {val}")
+        if cmd == "LEDBATCH":
+            self.apply_batch(val)
+            return
+
         # robustly handle val whether it's a string, bytes, or tuple
         if isinstance(val, (list, tuple)):
             values = val
@@ -128,6 +133,12 @@ class LEDManager(BasePixelManager):
                 speed=get_float(values, 2, 0.08)
             )
 
+    def apply_batch(self, payload):
+        """Applies a packed LEDBATCH payload (see utilities.led_batch) in one pass."""
+        get_color = Palette.get_color
+        for index, palette_index, duration, brightness, priority in iter_led_batch(payload):
+            self.solid(index, get_color(palette_index), brightness=brightness, duration=duration, priority=priority)
+
     # --- SIMPLE ANIMATION TRIGGERS ---
     def solid_led(self, index, color, brightness=0.2, duration=None, priority=2):
         """Sets a SOLID animation (static color) to a specific LED (or all LEDs)."""
@@ -3,12 +3,15 @@
 
 import asyncio
 import math
+from array import array
 import sys
 import time
 
 from utilities.logger import JEBLogger
 from utilities.palette import Palette
 from utilities.icons import Icons
+from utilities.glyphs import COLUMN_BITS, GlyphCache
+from utilities.lru import LRUCache
 from utilities import matrix_animations
 
 from .base_pixel_manager import BasePixelManager, PixelLayout
@@ -31,6 +34,10 @@ class MatrixManager(BasePixelManager):
     the manager handles the physical panel layout correctly, where each panel has
     its own pixel range due to how they are chained together.
     """
+    COLOR_LUT_CACHE_SIZE = 4  # Compiled palette LUTs kept per (palette, colour, brightness, gamma)
+    ICON_CACHE_SIZE = 8       # Resolved wire-order icon frames
+    SPRITE_CACHE_SIZE = 2     # Compiled sprite-sheet deltas per (sprite, colour, brightness)
+
     def __init__(self, jeb_pixel, width=8, height=8, panel_width=None, panel_height=None, chain_layout=PanelLayout.Z_PATTERN, custom_chain_map=None):
         """Initialize MatrixManager with configurable dimensions.
 
@@ -58,6 +65,13 @@ class MatrixManager(BasePixelManager):
         self.panel_height = panel_height if panel_height is not None else height
 
         self.palette = Palette.LIBRARY
+        self.gamma = 1.0  # Applied to palette-indexed frames and icons; 1.0 = linear
+
+        # Compiled palette -> wire LUTs and pre-resolved icon frames.
+        # Keys include id(self.palette), so swapping the palette misses naturally.
+        self._color_luts = LRUCache(self.COLOR_LUT_CACHE_SIZE)
+        self._icon_frames = LRUCache(self.ICON_CACHE_SIZE)
+        self._sprite_deltas = LRUCache(self.SPRITE_CACHE_SIZE)
 
         self.chain_layout = chain_layout
         self.custom_chain_map = custom_chain_map
@@ -71,17 +85,16 @@ class MatrixManager(BasePixelManager):
         self._text_mode_active = False
         self._text_last_scroll = 0.0
         self._text_scroll_delay = 0.05  # Default scroll interval in seconds
-        self._framebuf = None
-        try:
-            import adafruit_pixel_framebuf
-            self._framebuf = adafruit_pixel_framebuf.PixelFramebuffer(
-                self.pixels,
-                self.width,
-                self.height,
-                alternating=(chain_layout == PanelLayout.SERPENTINE)
-            )
-        except ImportError:
-            JEBLogger.warning("MATM", "adafruit_pixel_framebuf not available. Text scrolling features will not be available.")
+        self._glyphs = None             # GlyphCache, created on first display_text()
+        self._text_lines = []           # (first window row, column strip) per line
+        self._text_len = 0              # Columns in the longest strip
+        self._text_pos = 0              # Strip column shown at x=0 (negative while entering)
+        self._text_loop = True
+        self._text_rows = 0             # Matrix rows covered by the text window
+        self._text_window = None        # Column-major 0/1 palette indices for the visible window
+        self._text_map = None           # Window position -> segment pixel
+        self._text_colors = None        # [off, on] colours
+        self._text_table = None         # palette_table() of _text_colors, if supported
 
     def _get_panel_chain_index(self, panel_x, panel_y, panels_per_row):
         """Determines the hardware wiring index for a physical panel position."""
@@ -190,56 +203,122 @@ class MatrixManager(BasePixelManager):
 
     # TODO draw_line, draw_rect, draw_circle, etc.
 
-    def display_text(self, text, color=(255, 255, 255), scroll_speed=0.05):
-        """Display scrolling text on the matrix using adafruit_pixel_framebuf.
+    def display_text(self, text, color=(255, 255, 255), scroll_speed=0.05, loop=True):
+        """Display scrolling text on the matrix.
 
         Enables Text Mode, which bypasses standard animation slots until
         stop_text() is called. Supports multiline text via newlines or a list.
 
+        Each line is rasterised once into a column strip (see GlyphCache), so
+        message length is bounded by the strip (6 bytes per character), not
+        by a matrix-sized framebuffer. The text enters from the right edge.
+
         Args:
             text: String (use '\\n' for two lines) or list of up to 2 strings.
             color: RGB tuple (r, g, b), default white.
             scroll_speed: Seconds between each 1-pixel left scroll step.
+            loop: If True, the text re-enters from the right once it has
+                scrolled off; otherwise the matrix stays blank.
         """
-        if not self._framebuf:
-            return
-
         self.clear()
-        self._text_scroll_delay = scroll_speed
-        self._text_mode_active = True
+        if self._glyphs is None:
+            self._glyphs = GlyphCache()
 
         # Support either a string with newlines, or a list of strings
         lines = text.split('\n') if isinstance(text, str) else text
 
-        # Draw each line, offsetting Y by 8 pixels per row
+        # One strip per line, offsetting Y by 8 pixels per row
+        self._text_lines = []
         for i, line in enumerate(lines[:2]):  # Limit to 2 rows to fit 16x16
             y_offset = i * 8
-            # The .text() signature takes string, x, y, and color
-            self._framebuf.text(line, self.width, y_offset, color, font_name="font5x8.bin")
+            if y_offset >= self.height:
+                break
+            self._text_lines.append((y_offset, self._glyphs.render(line)))
 
-        self._framebuf.display()
+        self._text_len = max((len(strip) for _, strip in self._text_lines), default=0)
+        self._text_pos = -self.width
+        self._text_loop = loop
+        self._text_scroll_delay = scroll_speed
+
+        rows = min(self.height, len(self._text_lines) * 8)
+        if rows != self._text_rows or self._text_map is None:
+            self._text_rows = rows
+            self._text_window = bytearray(self.width * rows)
+            idx_map = self._idx_map
+            self._text_map = tuple(
+                idx_map[y * self.width + x] for x in range(self.width) for y in range(rows)
+            )
+
+        self._text_colors = [Palette.OFF, color]
+        self._text_table = self.pixels.palette_table(self._text_colors) if hasattr(self.pixels, "blit_mapped") else None
+
+        self._text_mode_active = True
+        self._draw_text_window()
         self._text_last_scroll = time.monotonic()
 
+    def _draw_text_window(self):
+        """Write the visible window of the text strips to the pixels.
+
+        Only the text rows are touched; each column is expanded from its
+        strip byte with a single slice copy out of COLUMN_BITS.
+        """
+        window = self._text_window
+        rows = self._text_rows
+        pos = self._text_pos
+        width = self.width
+
+        for y_offset, strip in self._text_lines:
+            n = min(8, rows - y_offset)
+            length = len(strip)
+            o = y_offset
+            for x in range(width):
+                c = pos + x
+                b = strip[c] if 0 <= c < length else 0
+                window[o:o + n] = COLUMN_BITS[b * 8:b * 8 + n]
+                o += rows
+
+        if self._text_table is not None:
+            self.pixels.blit_mapped(window, self._text_map, self._text_table)
+            return
+
+        pixels = self.pixels
+        colors = self._text_colors
+        for i, p in enumerate(window):
+            pixels[self._text_map[i]] = colors[p]
+
+    def _scroll_text(self):
+        """Advance the text one column left and redraw the window."""
+        if self._text_pos >= self._text_len:
+            if not self._text_loop:
+                return  # Already blank; nothing changes
+            self._text_pos = -self.width
+        self._text_pos += 1
+        self._draw_text_window()
+
     def stop_text(self):
         """Stop text mode and return control to the standard animation slots."""
+        was_active = self._text_mode_active
         self._text_mode_active = False
-        if self._framebuf:
-            self._framebuf.fill(0)
-            self._framebuf.display()
+        self._text_lines = []
+        if was_active:
+            self.pixels.fill(Palette.OFF)
+
+    def is_animating(self):
+        """Returns True while text is scrolling or any animation slot is active."""
+        return self._text_mode_active or self._active_count > 0
 
     async def animate_loop(self, step=True):
         """Unified background task with text mode bypass.
 
-        When text mode is active, autonomously scrolls the frame buffer at a
+        When text mode is active, autonomously scrolls the text window at a
         deterministic speed and bypasses the standard animation slot evaluation.
         """
         while True:
             # Text Mode Bypass — skip standard slot evaluation
-            if self._text_mode_active and self._framebuf:
+            if self._text_mode_active:
                 now = time.monotonic()
                 if now - self._text_last_scroll >= self._text_scroll_delay:
-                    self._framebuf.scroll(-1, 0)  # Shift left 1 pixel
-                    self._framebuf.display()       # Push to self.pixels
+                    self._scroll_text()  # Shift left 1 pixel
                     self._text_last_scroll = now
                 if step:
                     return
@@ -280,6 +359,13 @@ class MatrixManager(BasePixelManager):
         icons displayed on a 16x16 matrix where the 1px padding on each side
         becomes the border frame.
         """
+        # Static icons are resolved once into a full wire-order frame and
+        # replayed with a single span copy
+        if clear and anim_mode is None and hasattr(self.pixels, "write_span"):
+            self.clear()
+            self.pixels.write_span(0, self._get_icon_frame(icon_name, color, brightness, border_color))
+            return
+
         if clear:
             self.clear()
 
@@ -287,7 +373,10 @@ class MatrixManager(BasePixelManager):
         if anim_mode == "ANIMATED":
             icon_data, timing_data = Icons.get_anim(icon_name)
             task = asyncio.create_task(
-                matrix_animations.animate_sprite_sheet(self, icon_data, timing_data=timing_data, loop=True, color=color, brightness=brightness)
+                matrix_animations.animate_sprite_sheet(
+                    self, icon_data, timing_data=timing_data, loop=True,
+                    color=color, brightness=brightness, cache_key=icon_name
+                )
             )
             self._bg_tasks.append(task)  # Track the task for potential cancellation
             return
@@ -370,6 +459,106 @@ class MatrixManager(BasePixelManager):
                         else:
                             self.draw_pixel(bx1, by, border_color, brightness=brightness)
 
+    def _get_icon_frame(self, icon_name, color, brightness, border_color):
+        """Return the cached wire-order frame for a static icon, building it on a miss.
+
+        The frame covers the whole matrix in hardware order, with the icon
+        centred, palette/brightness/gamma resolved and the optional border
+        drawn, exactly as the slot-based show_icon path would render it.
+        """
+        key = (icon_name, color, brightness, border_color, id(self.palette), self.gamma)
+        wire = self._icon_frames.get(key)
+        if wire is not None:
+            return wire
+
+        icon_data = Icons.get(icon_name)
+        colors, _ = self.get_color_lut(color, brightness)
+        encode = self.pixels.encode
+        idx_map = self._idx_map
+        width = self.width
+        height = self.height
+
+        wire = bytearray(self.num_pixels * 3)
+        icon_dim = int(math.sqrt(len(icon_data)))
+        offset_x = (width - icon_dim) // 2
+        offset_y = (height - icon_dim) // 2
+
+        for y in range(icon_dim):
+            target_y = y + offset_y
+            if not 0 <= target_y < height:
+                continue
+            for x in range(icon_dim):
+                target_x = x + offset_x
+                pixel_value = icon_data[y * icon_dim + x]
+                if pixel_value != 0 and 0 <= target_x < width:
+                    o = idx_map[target_y * width + target_x] * 3
+                    wire[o:o + 3] = encode(colors[pixel_value])
+
+        if border_color is not None:
+            border = encode(self._resolve_color(border_color, brightness))
+            bx0 = offset_x - 1
+            by0 = offset_y - 1
+            bx1 = offset_x + icon_dim
+            by1 = offset_y + icon_dim
+            for by in range(by0, by1 + 1):
+                for bx in range(bx0, bx1 + 1):
+                    on_edge = by in (by0, by1) or bx in (bx0, bx1)
+                    if on_edge and 0 <= bx < width and 0 <= by < height:
+                        o = idx_map[by * width + bx] * 3
+                        wire[o:o + 3] = border
+
+        self._icon_frames.put(key, wire)
+        return wire
+
+    def _resolve_color(self, color, brightness):
+        """Apply brightness and the matrix gamma to an (r, g, b) colour."""
+        color = self._apply_brightness(color, brightness)
+        gamma = self.gamma
+        if gamma == 1.0:
+            return color
+        return (
+            int(255 * (color[0] / 255) ** gamma),
+            int(255 * (color[1] / 255) ** gamma),
+            int(255 * (color[2] / 255) ** gamma)
+        )
+
+    def get_color_lut(self, color=None, brightness=1.0):
+        """Return the compiled 256-entry colour LUT for palette-indexed frames.
+
+        Entry 0 is None (transparent/off). Every other entry is the palette
+        colour (or the override color) with brightness and gamma applied;
+        indices missing from the palette resolve to Palette.OFF.
+
+        Args:
+            color: Optional RGB tuple that replaces every non-zero palette colour.
+            brightness: Brightness multiplier (0.0-1.0).
+
+        Returns:
+            Tuple of (colors, table). colors is the list of 256 resolved RGB
+            tuples; table is the matching pixels.palette_table() in the
+            segment's wire order, or None if the pixel object has no
+            palette_table().
+        """
+        key = (id(self.palette), color, brightness, self.gamma)
+        entry = self._color_luts.get(key)
+        if entry is not None:
+            return entry
+
+        palette = self.palette
+        resolved = {}
+        colors = [None] * 256
+        for p in range(1, 256):
+            base = color if color else palette.get(p, Palette.OFF)
+            rgb = resolved.get(base)
+            if rgb is None:
+                rgb = resolved[base] = self._resolve_color(base, brightness)
+            colors[p] = rgb
+
+        table = self.pixels.palette_table(colors) if hasattr(self.pixels, "palette_table") else None
+        entry = (colors, table)
+        self._color_luts.put(key, entry)
+        return entry
+
     def show_frame(self, frame, clear=True, color=None, brightness=1.0):
         """Renders a palette-encoded frame buffer directly to the matrix.
 
@@ -378,24 +567,108 @@ class MatrixManager(BasePixelManager):
         from self.palette.  This makes the method generic and reusable
         for any mode that wants to push a full frame to the display.
 
+        Colours come from a compiled LUT (see get_color_lut), so a frame
+        costs one table lookup and index-map write per lit pixel.
+
         Args:
             frame: bytearray or bytes of length width*height, palette indices.
             clear: If True, clears all animation slots first. Default True.
+            color: Optional RGB tuple that replaces every non-zero palette colour.
+            brightness: Brightness multiplier (0.0-1.0).
         """
         if clear:
             self.clear()
 
-        # Cache references to avoid global/instance lookups in the loop
+        colors, table = self.get_color_lut(color, brightness)
         pixels = self.pixels
+
+        if table is not None and hasattr(pixels, "blit_mapped"):
+            pixels.blit_mapped(frame, self._idx_map, table, transparent=0)
+            return
+
+        # Cache references to avoid global/instance lookups in the loop
         lut = self._idx_map
-        palette = self.palette
 
         # Iterate in 1D directly over the frame buffer
         for idx, pixel_value in enumerate(frame):
             if pixel_value != 0:
                 # Map logical 1D index directly to hardware index via LUT
-                hw_idx = lut[idx]
-                pixels[hw_idx] = palette[pixel_value]
+                pixels[lut[idx]] = colors[pixel_value]
+
+    def get_sprite_deltas(self, sprite, color=None, brightness=1.0, key=None):
+        """Return a sprite sheet compiled into per-frame changed-pixel lists.
+
+        Entry 0 lights every non-zero pixel of the first frame; entry i
+        (1 <= i < frame_count) holds the pixels whose resolved colour differs
+        from frame i-1, including pixels that went dark. The final entry
+        wraps from the last frame back to frame 0 for looping playback.
+        Each entry is (hw_indices, palette_values), ready for
+        show_sprite_delta().
+
+        Args:
+            sprite: bytes/bytearray of concatenated width*height palette frames.
+            color: Optional RGB tuple that replaces every non-zero palette colour.
+            brightness: Brightness multiplier (0.0-1.0).
+            key: Stable name for the sprite (e.g. the icon name). When None
+                the result is compiled but not cached.
+
+        Returns:
+            Tuple of (deltas, colors, table) where colors/table are the
+            matching get_color_lut() entry.
+        """
+        cache_key = None
+        if key is not None:
+            cache_key = (key, color, brightness, id(self.palette), self.gamma)
+            entry = self._sprite_deltas.get(cache_key)
+            if entry is not None:
+                return entry
+
+        colors, table = self.get_color_lut(color, brightness)
+        frame_size = self.width * self.height
+        frame_count = len(sprite) // frame_size
+        idx_map = self._idx_map
+        sprite_mv = memoryview(sprite)
+        blank = bytes(frame_size)
+
+        deltas = []
+        prev = blank
+        for f in range(frame_count + 1):
+            start = (f % frame_count) * frame_size
+            frame = sprite_mv[start:start + frame_size]
+            indices = array("H")
+            values = bytearray()
+            for i in range(frame_size):
+                p = frame[i]
+                if colors[p] != colors[prev[i]]:
+                    indices.append(idx_map[i])
+                    values.append(p)
+            deltas.append((indices, bytes(values)))
+            prev = frame
+
+        entry = (deltas, colors, table)
+        if cache_key is not None:
+            self._sprite_deltas.put(cache_key, entry)
+        return entry
+
+    def show_sprite_delta(self, compiled, step):
+        """Write one changed-pixel list from get_sprite_deltas() to the matrix.
+
+        Args:
+            compiled: Tuple returned by get_sprite_deltas().
+            step: Delta entry to apply (0 = first frame, frame_count = wrap).
+        """
+        deltas, colors, table = compiled
+        indices, values = deltas[step]
+        if not indices:
+            return
+        pixels = self.pixels
+
+        if table is not None and hasattr(pixels, "blit_mapped"):
+            pixels.blit_mapped(values, indices, table)
+            return
+
+        for i, p in enumerate(values):
+            pixels[indices[i]] = colors[p] or Palette.OFF
 
     # TODO Refactor progress grid to use animations
     def show_progress_grid(self, iterations, total=10, color=(100, 0, 200)):
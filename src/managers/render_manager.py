@@ -16,13 +16,18 @@ class RenderManager:
     BACKOFF_FACTOR = 0.9  # Reduce frame rate by 10% when backing off
     RECOVERY_THRESHOLD = 20  # Number of consecutive good frames before recovering
     RECOVERY_FACTOR = 1.05  # Increase frame rate by 5% when recovering
+    IDLE_FRAME_RATE = 15  # Tick rate (Hz) when nothing is animating or changing
+    IDLE_AFTER_FRAMES = 30  # Consecutive unchanged frames before dropping to the idle rate
+    DEFAULT_KEEPALIVE = 1.0  # Seconds between forced pushes of an unchanged frame
 
-    def __init__(self, pixel_object, sync_role="NONE", network_manager=None):
+    def __init__(self, pixel_object, sync_role="NONE", network_manager=None, keepalive_interval=DEFAULT_KEEPALIVE):
         """
         Args:
             pixel_object: The NeoPixel object to call .show() on.
             sync_role: "MASTER" (broadcasts sync), "SLAVE" (tracks drift), or "NONE".
             network_manager: Reference to sat_network (if MASTER) to send broadcasts.
+            keepalive_interval: Seconds after which an unchanged frame is pushed
+                anyway, or None to only push changed frames.
         """
         JEBLogger.info("REND", f"[INIT] RenderManager - sync_role: {sync_role}")
         self.pixels = pixel_object
@@ -34,6 +39,10 @@ class RenderManager:
 
         # List of managers to step() every frame (e.g., LEDManager, MatrixManager)
         self._animators = []
+        self._animator_stages = []  # Profiler stage name per animator
+
+        # Optional per-stage frame profiler (see enable_profiler); None = disabled
+        self.profiler = None
 
         # List of GlobalAnimationControllers to receive frame counter updates
         self._global_anim_controllers = []
@@ -47,10 +56,90 @@ class RenderManager:
         self.consecutive_lag_frames = 0
         self.consecutive_good_frames = 0
 
+        # Dirty tracking: pixel segments whose writes set a .dirty flag
+        self.keepalive_interval = keepalive_interval
+        self._dirty_sources = []
+        self._untracked_writers = False  # An animator whose writes can't be tracked
+        self._force_push = True
+        self._last_push = 0.0
+        self._clean_frames = 0
+        self.frames_pushed = 0
+        self.frames_skipped = 0
+
     def add_animator(self, manager):
         """Register a manager that needs its .animate_loop(step=True) called."""
         JEBLogger.debug("REND", f"Adding animator: {manager.__class__.__name__}")
         self._animators.append(manager)
+        stage = "anim:" + manager.__class__.__name__
+        if stage in self._animator_stages:
+            stage = f"{stage}#{len(self._animators) - 1}"
+        self._animator_stages.append(stage)
+        pixels = getattr(manager, "pixels", None)
+        if pixels is None or not hasattr(pixels, "dirty"):
+            self._untracked_writers = True
+        elif all(pixels is not src for src in self._dirty_sources):
+            self._dirty_sources.append(pixels)
+
+    def mark_dirty(self):
+        """Force the next frame to be pushed, for writes made outside tracked segments."""
+        self._force_push = True
+
+    def get_frame_stats(self):
+        """Return pushed vs skipped frame counts since boot."""
+        total = self.frames_pushed + self.frames_skipped
+        return {
+            "pushed": self.frames_pushed,
+            "skipped": self.frames_skipped,
+            "skip_ratio": self.frames_skipped / total if total else 0.0,
+            "idle": self._clean_frames >= self.IDLE_AFTER_FRAMES,
+        }
+
+    def enable_profiler(self, window=None):
+        """Start recording per-stage frame timings.
+
+        Args:
+            window: Samples kept per stage (default RenderProfiler.DEFAULT_WINDOW).
+
+        Returns:
+            The RenderProfiler instance.
+        """
+        if self.profiler is None:
+            from utilities.render_profiler import RenderProfiler
+            self.profiler = RenderProfiler(window) if window else RenderProfiler()
+            JEBLogger.info("REND", "Frame profiler enabled")
+        return self.profiler
+
+    def disable_profiler(self):
+        """Stop recording frame timings and free the sample buffers."""
+        if self.profiler is not None:
+            self.profiler = None
+            JEBLogger.info("REND", "Frame profiler disabled")
+
+    def get_render_telemetry(self):
+        """Return frame rate, push/skip counts and profiler data (None when disabled)."""
+        telemetry = self.get_frame_stats()
+        telemetry["target_frame_rate"] = self.target_frame_rate
+        telemetry["frame_counter"] = self.frame_counter
+        telemetry["profiler"] = self.profiler.snapshot() if self.profiler is not None else None
+        return telemetry
+
+    def _frame_dirty(self):
+        """Check whether any tracked segment changed, clearing the flags."""
+        dirty = self._force_push or self._untracked_writers or not self._dirty_sources
+        self._force_push = False
+        for src in self._dirty_sources:
+            if src.dirty:
+                src.dirty = False
+                dirty = True
+        return dirty
+
+    def _is_animating(self):
+        """True if any animator has running animations (or can't tell)."""
+        for mgr in self._animators:
+            check = getattr(mgr, "is_animating", None)
+            if check is None or check():
+                return True
+        return False
 
     def add_global_animation_controller(self, controller):
         """Register a GlobalAnimationController to receive frame counter updates.
@@ -73,24 +162,64 @@ class RenderManager:
         next_frame_time = time.monotonic()
 
         while True:
+            # Sampled once per frame; every timing call below is skipped when None
+            prof = self.profiler
+            if prof is not None:
+                frame_start = prof.now_us()
+
             if heartbeat_callback:
                 heartbeat_callback()
 
             # 2. Update Animation Logic (No IO)
-            for mgr in self._animators:
-                # Assuming animate_loop is async; if regular method, remove await
-                await mgr.animate_loop(step=True)
+            if prof is None:
+                for mgr in self._animators:
+                    # Assuming animate_loop is async; if regular method, remove await
+                    await mgr.animate_loop(step=True)
+            else:
+                for mgr, stage in zip(self._animators, self._animator_stages):
+                    t0 = prof.now_us()
+                    await mgr.animate_loop(step=True)
+                    prof.record(stage, prof.now_us() - t0)
 
-            # 3. Hardware Write (IO)
-            self.pixels.show()
+            # 3. Hardware Write (IO) - only when a pixel changed or keep-alive is due
+            now = time.monotonic()
+            dirty = self._frame_dirty()
+            if dirty or (
+                self.keepalive_interval is not None and now - self._last_push >= self.keepalive_interval
+            ):
+                if prof is None:
+                    self.pixels.show()
+                else:
+                    t0 = prof.now_us()
+                    self.pixels.show()
+                    prof.record("show", prof.now_us() - t0)
+                self._last_push = now
+                self.frames_pushed += 1
+                # Keep-alive pushes don't count as changes for the idle check
+                self._clean_frames = 0 if dirty else self._clean_frames + 1
+            else:
+                self.frames_skipped += 1
+                self._clean_frames += 1
+
+            # Nothing changing and nothing animating: tick at the idle rate but
+            # advance the frame counter as if every frame had run
+            ticks = 1
+            if self._clean_frames >= self.IDLE_AFTER_FRAMES and not self._is_animating():
+                ticks = max(1, int(self.target_frame_rate / self.IDLE_FRAME_RATE))
 
             # 4. Sync Logic
-            self.frame_counter += 1
+            if prof is not None:
+                t0 = prof.now_us()
+            self.frame_counter += ticks
 
             # Update all registered GlobalAnimationControllers with the new frame
             for ctrl in self._global_anim_controllers:
                 ctrl.sync_frame(self.frame_counter)
 
+            if self.network is not None:
+                # Satellite LED changes made this frame go out as one packet each
+                self.network.flush_leds()
+
             if self.sync_role == "MASTER" and self.network:
                 # Broadcast every 1 second
                 now = time.monotonic()
@@ -98,12 +227,27 @@ class RenderManager:
                     self.network.send_all("SYNC_FRAME", (float(self.frame_counter), now))
                     self.last_sync_broadcast = now
 
+            if prof is not None:
+                end = prof.now_us()
+                prof.record("sync", end - t0)
+                prof.record("frame", end - frame_start)
+                prof.frames += 1
+
             # 5. Fixed Time Step Timing
             frame_time = 1.0 / self.target_frame_rate
-            next_frame_time += frame_time
+            next_frame_time += frame_time * ticks
             now = time.monotonic()
             sleep_duration = next_frame_time - now
 
+            if ticks > 1:
+                # Idle frames don't feed the adaptive frame rate tracking
+                if sleep_duration > 0:
+                    await asyncio.sleep(sleep_duration)
+                else:
+                    next_frame_time = now
+                    await asyncio.sleep(self.MIN_SLEEP_DURATION)
+                continue
+
             # Apply drift correction adjustment if set
             if self.sleep_adjustment != 0.0:
                 sleep_duration += self.sleep_adjustment
@@ -122,6 +266,8 @@ class RenderManager:
                             self.target_frame_rate * self.RECOVERY_FACTOR,
                             self.DEFAULT_FRAME_RATE
                         )
+                        if prof is not None:
+                            prof.count("recover")
                         # Reset both counters after adjustment for clean slate
                         self.consecutive_good_frames = 0
                         self.consecutive_lag_frames = 0
@@ -133,6 +279,8 @@ class RenderManager:
                 # Track lag frames for potential backoff
                 self.consecutive_lag_frames += 1
                 self.consecutive_good_frames = 0
+                if prof is not None:
+                    prof.count("lag")
 
                 # Gradually reduce frame rate if consistently lagging
                 if self.consecutive_lag_frames >= self.BACKOFF_THRESHOLD:
@@ -141,6 +289,8 @@ class RenderManager:
                             self.target_frame_rate * self.BACKOFF_FACTOR,
                             self.MIN_FRAME_RATE
                         )
+                        if prof is not None:
+                            prof.count("backoff")
                         # Reset both counters after adjustment for clean slate
                         self.consecutive_lag_frames = 0
                         self.consecutive_good_frames = 0
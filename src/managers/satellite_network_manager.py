@@ -12,9 +12,11 @@ except AttributeError:
 from adafruit_ticks import ticks_ms, ticks_diff
 
 from transport import Message
+from transport.file_transfer import HashCache, ReplyQueue, file_fingerprint, parse_version_check
 
 from transport.protocol import (
     CMD_ACK,
+    CMD_FILE_STATUS,
     CMD_MODE,
     CMD_NACK,
     CMD_SET_OFFSET,
@@ -66,8 +68,17 @@ class SatelliteNetworkManager:
         self.satellites = {}
         self.sat_telemetry = {}
 
-        # Firmware update state: only one satellite is updated at a time
+        # Firmware update state: one update session at a time.  A session
+        # collects every satellite of one type that reports a stale version
+        # within update_collect_ms and pushes the files to all of them at once.
+        # The window closes early once no satellite of that type that has
+        # said HELLO is still due to send VERSION_CHECK.
         self._update_in_progress = None
+        self._update_targets = []
+        self._update_fingerprints = {}
+        self._update_collecting = False
+        self._update_collect_ms = int(_cfg.get("update_collect_ms", 2000))
+        self._version_pending = set()
 
         # Debug state
         self.last_message_debug = ""
@@ -88,6 +99,19 @@ class SatelliteNetworkManager:
         # Watchdog timeout in milliseconds (configurable via config["watchdog_timeout_ms"])
         self._watchdog_timeout_ms = int(_cfg.get("watchdog_timeout_ms", 5000))
 
+        # Sliding-window size offered to satellites during firmware pushes.
+        # Satellites running older firmware fall back to stop-and-wait.
+        self._transfer_window = int(_cfg.get("file_transfer_window", 8))
+        # Per-chunk LZ compression offered during firmware pushes; satellites
+        # that do not echo the codec receive raw chunks.
+        self._transfer_compress = bool(_cfg.get("file_transfer_compress", True))
+
+        # SHA-256 digests of firmware files on the SD card, reused for every
+        # satellite pushed the same file until the file changes.  Persisted
+        # next to the firmware tree so unchanged files are not re-hashed
+        # after a reboot.
+        self._hash_cache = HashCache(_cfg.get("hash_cache_path", "/sd/satellites/hash_cache.json"))
+
         # Optional path for a dedicated hotplug event log file.
         # When set, connect/disconnect events are always written here regardless
         # of the global JEBLogger.WRITE_TO_FILE setting.
@@ -106,10 +130,11 @@ class SatelliteNetworkManager:
             CMD_VERSION_CHECK: self._handle_version_check_command,
             CMD_ACK: self._handle_ack_command,
             CMD_NACK: self._handle_nack_command,
+            CMD_FILE_STATUS: self._handle_file_status_command,
         }
 
-        self.transfer_ack_event = asyncio.Event()
-        self.last_ack_status = False
+        # Replies to an update session's file transfers, queued per satellite
+        self.transfer_replies = ReplyQueue()
 
     def set_debug_mode(self, debug_mode):
         """Enable or disable debug mode for message logging."""
@@ -273,6 +298,19 @@ class SatelliteNetworkManager:
         for sid in self.satellites:
             self.get_sat(sid).send(cmd, val)
 
+    def flush_leds(self):
+        """Send each satellite's queued LED changes as one LEDBATCH packet.
+
+        Called by the RenderManager once per render tick.
+
+        Returns:
+            int: Total LED records sent.
+        """
+        sent = 0
+        for sat in self.satellites.values():
+            sent += sat.flush_leds()
+        return sent
+
     async def _process_inbound_cmd(self, sid, cmd, val):
         """
         Process a command received from a physical satellite into driver logic.
@@ -354,6 +392,8 @@ class SatelliteNetworkManager:
         Handle HELLO command from satellite,
         which indicates a new satellite has come online and is announcing itself.
         """
+        # A satellite says HELLO once per boot, right before its VERSION_CHECK
+        self._version_pending.add(sid)
         if sid in self.satellites:
             sat = self.satellites[sid]
             was_inactive = not sat.is_active
@@ -462,29 +502,40 @@ class SatelliteNetworkManager:
 
         Compares the satellite's reported firmware version against the version
         in the satellite manifest stored on the Core's SD card.  Sends an
-        ACK if the versions match (or no manifest is available), or sends
-        UPDATE_START followed by all firmware files when an update is needed.
+        ACK if the versions match (or no manifest is available), or opens an
+        update session that sends UPDATE_START followed by the firmware files.
 
-        Only one satellite is updated at a time.  If an update is already in
-        progress for a different satellite, UPDATE_WAIT is sent so the
-        requesting satellite can retry later.
+        Satellites may append short per-file fingerprints to the version
+        string (see :func:`transport.file_transfer.format_version_check`);
+        these are kept with the session so only changed files are sent.
+
+        Only one update session runs at a time.  While a session is still
+        collecting targets, other satellites of the same type that need the
+        same update join it so the files are broadcast once to all of them.
+        Any other satellite is sent UPDATE_WAIT so it can retry later.
 
         Parameters:
             sid (str): Satellite ID (e.g. ``"0101"``).
-            val: VERSION_CHECK payload — the satellite's firmware version string.
+            val: VERSION_CHECK payload — ``"version[,fingerprints]"``.
         """
-        if isinstance(val, bytes):
-            sat_version = val.decode('utf-8').strip()
-        elif isinstance(val, str):
-            sat_version = val.strip()
-        else:
-            sat_version = "0.0.0"
+        sat_version, fingerprints = parse_version_check(val)
+        self._version_pending.discard(sid)
 
         sat_type_id = sid[:2]
         JEBLogger.info("NETM", f"VERSION_CHECK: sat={sat_version}", src=sid)
 
-        # Only one satellite update at a time
-        if self._update_in_progress and self._update_in_progress != sid:
+        expected_version = self._get_satellite_expected_version(sat_type_id)
+        needs_update = expected_version is not None and sat_version != expected_version
+
+        if self._update_in_progress:
+            if (needs_update
+                    and self._update_collecting
+                    and sid not in self._update_targets
+                    and sat_type_id == self._update_in_progress[:2]):
+                JEBLogger.info("NETM", f"{sid} joins update session of {self._update_in_progress}")
+                self._update_targets.append(sid)
+                self._update_fingerprints[sid] = fingerprints
+                return
             JEBLogger.info(
                 "NETM",
                 f"Update in progress for {self._update_in_progress}, sending UPDATE_WAIT to {sid}"
@@ -492,9 +543,7 @@ class SatelliteNetworkManager:
             self.transport.send(Message("CORE", sid, CMD_UPDATE_WAIT, ""))
             return
 
-        expected_version = self._get_satellite_expected_version(sat_type_id)
-
-        if expected_version is None or sat_version == expected_version:
+        if not needs_update:
             # No manifest available or versions already match — proceed normally
             JEBLogger.info("NETM", f"Version OK ({sat_version}), allowing {sid} to proceed")
             self.transport.send(Message("CORE", sid, CMD_ACK, ""))
@@ -506,15 +555,25 @@ class SatelliteNetworkManager:
                 f"Starting update for {sid}"
             )
             self._update_in_progress = sid
+            self._update_targets = [sid]
+            self._update_fingerprints = {sid: fingerprints}
+            self._update_collecting = True
             self._spawn_update_task(self._initiate_satellite_update, sid, sat_type_id)
 
+    def _queue_transfer_reply(self, sid, status, val):
+        """Queue a file transfer reply, ignoring satellites outside the update session."""
+        if sid in self._update_targets:
+            self.transfer_replies.put(sid, status, val)
+
     async def _handle_ack_command(self, sid, val):
-        self.last_ack_status = True
-        self.transfer_ack_event.set()
+        self._queue_transfer_reply(sid, True, val)
 
     async def _handle_nack_command(self, sid, val):
-        self.last_ack_status = False
-        self.transfer_ack_event.set()
+        self._queue_transfer_reply(sid, False, val)
+
+    async def _handle_file_status_command(self, sid, val):
+        # Chunk bitmap reply during a broadcast update; completes the sender's wait
+        self._queue_transfer_reply(sid, True, val)
 
     def _get_satellite_expected_version(self, sat_type_id):
         """Return the expected firmware version for a satellite type.
@@ -538,13 +597,56 @@ class SatelliteNetworkManager:
         except (OSError, ValueError):
             return None
 
-    async def _initiate_satellite_update(self, sid, sat_type_id):
-        """Stream firmware files to a satellite that needs an update.
+    def _select_update_files(self, files, targets):
+        """Return the manifest entries that at least one target needs.
 
-        Sends UPDATE_START with the file count and total byte size, then
-        transfers the satellite manifest (``manifest.json``) followed by every
-        file listed in that manifest using the existing chunked file-transfer
-        protocol.
+        An entry is skipped only when every target reported a fingerprint
+        matching the entry's ``"sha256"``.  Targets that reported no
+        fingerprints (older firmware) need every file.
+
+        Parameters:
+            files (list): ``"files"`` entries of the satellite manifest.
+            targets (list): Satellite IDs in the update session.
+
+        Returns:
+            list: Entries to transfer, in manifest order.
+        """
+        reported = [self._update_fingerprints.get(target) for target in targets]
+        if any(tags is None for tags in reported):
+            return list(files)
+        selected = []
+        for entry in files:
+            digest = entry.get("sha256")
+            if digest is None:
+                selected.append(entry)
+                continue
+            tag = file_fingerprint(entry["path"], digest)
+            if any(tag not in tags for tags in reported):
+                selected.append(entry)
+        return selected
+
+    def _update_peers_pending(self, sat_type_id):
+        """Return True while a satellite of *sat_type_id* may still join the update session."""
+        return any(sid[:2] == sat_type_id for sid in self._version_pending)
+
+    async def _initiate_satellite_update(self, sid, sat_type_id):
+        """Stream firmware files to the satellites of an update session.
+
+        Waits up to ``update_collect_ms`` so other satellites of the same
+        type can join the session, stopping as soon as none that has said
+        HELLO is still due to send VERSION_CHECK, then sends UPDATE_START with the file count and
+        total byte size to every target and transfers the satellite manifest
+        (``manifest.json``) followed by the files listed in that manifest
+        using the existing chunked file-transfer protocol.  Files whose
+        hash matches the fingerprint every target reported are skipped,
+        so a release that touches one module only sends that module.
+
+        A single target is served with a unicast (windowed) transfer.  With
+        several targets each file is broadcast once to ``"SAT"`` and every
+        satellite's gaps are repaired individually, so a chain of identical
+        satellites takes little longer to update than one.  A target that
+        fails a file is dropped from the session; its receiver times out and
+        it retries the version handshake later.
 
         Files are sourced from ``/sd/satellites/<type_id>/``.  The target path
         on the satellite (taken from the manifest ``"path"`` field) is used as
@@ -552,55 +654,78 @@ class SatelliteNetworkManager:
         stage files under the correct sub-directory inside ``/update/``.
 
         Parameters:
-            sid (str): Satellite ID to update.
+            sid (str): Satellite ID that opened the session.
             sat_type_id (str): Two-character type identifier (e.g. ``"01"``).
         """
         base_path = f"/sd/satellites/{sat_type_id}"
         manifest_path = f"{base_path}/manifest.json"
 
         try:
+            start = ticks_ms()
+            while (self._update_peers_pending(sat_type_id)
+                   and ticks_diff(ticks_ms(), start) < self._update_collect_ms):
+                await asyncio.sleep(0.05)
+            self._update_collecting = False
+            targets = list(self._update_targets)
+
             try:
                 import json
                 with open(manifest_path, 'r') as f:
                     manifest = json.load(f)
             except (OSError, ValueError):
-                JEBLogger.warning("NETM", f"No satellite manifest at {manifest_path}, skipping update for {sid}")
-                self.transport.send(Message("CORE", sid, CMD_ACK, ""))
+                JEBLogger.warning("NETM", f"No satellite manifest at {manifest_path}, skipping update for {targets}")
+                for target in targets:
+                    self.transport.send(Message("CORE", target, CMD_ACK, ""))
                 return
 
-            files = manifest.get("files", [])
+            all_files = manifest.get("files", [])
+            files = self._select_update_files(all_files, targets)
+            JEBLogger.info("NETM", f"Update sends {len(files)} of {len(all_files)} files")
             # +1 for manifest.json itself
             file_count = len(files) + 1
             total_bytes = sum(f.get("size", 0) for f in files)
 
-            self.transport.send(Message("CORE", sid, CMD_UPDATE_START, f"{file_count},{total_bytes}"))
+            for target in targets:
+                self.transport.send(Message("CORE", target, CMD_UPDATE_START, f"{file_count},{total_bytes}"))
 
             from transport.file_transfer import FileTransferSender
+            self.transfer_replies.discard()
             sender = FileTransferSender(
                 self.transport,
                 "CORE",
-                ack_event=self.transfer_ack_event,
-                ack_status_callback=lambda: self.last_ack_status
+                window_size=self._transfer_window,
+                hash_cache=self._hash_cache,
+                compress=self._transfer_compress,
+                replies=self.transfer_replies
             )
 
-            # Send manifest.json first so the satellite can parse it when applying
-            success = await sender.send_file(sid, manifest_path, remote_filename="manifest.json")
-            if not success:
-                JEBLogger.error("NETM", f"Failed to send manifest to {sid}")
-                return
-
-            # Send each firmware file with its full target path as the remote filename
-            for file_entry in files:
-                filepath = f"{base_path}/{file_entry['path']}"
-                remote_filename = file_entry['path']
-                success = await sender.send_file(sid, filepath, remote_filename=remote_filename)
-                if not success:
-                    JEBLogger.error("NETM", f"Failed to send {filepath} to {sid}")
+            # Send manifest.json first so the satellite can parse it when applying,
+            # then each firmware file with its full target path as the remote filename
+            transfers = [(manifest_path, "manifest.json")]
+            transfers.extend((f"{base_path}/{e['path']}", e['path']) for e in files)
+
+            for filepath, remote_filename in transfers:
+                if len(targets) == 1:
+                    ok = targets if await sender.send_file(
+                        targets[0], filepath, remote_filename=remote_filename
+                    ) else []
+                else:
+                    ok = await sender.broadcast_file(targets, filepath, remote_filename=remote_filename)
+                for target in targets:
+                    if target not in ok:
+                        JEBLogger.error("NETM", f"Failed to send {filepath} to {target}")
+                targets = ok
+                if not targets:
                     return
 
-            JEBLogger.info("NETM", f"Firmware update files sent to {sid}")
+            JEBLogger.info("NETM", f"Firmware update files sent to {', '.join(targets)}")
         finally:
+            self._hash_cache.save()
             self._update_in_progress = None
+            self._update_targets = []
+            self._update_fingerprints = {}
+            self.transfer_replies.discard()
+            self._update_collecting = False
 
     async def monitor_messages(self, heartbeat_callback=None):
         """
@@ -636,6 +761,9 @@ class SatelliteNetworkManager:
                 await self._process_inbound_cmd(src, cmd, payload)
             except (ValueError, IndexError) as e:
                 JEBLogger.error("NETM", f"Error handling message: {e}")
+            finally:
+                # Fields have been consumed; let the transport reuse the object
+                self.transport.release(message)
 
     async def monitor_satellites(self, heartbeat_callback=None):
         """
@@ -96,6 +96,14 @@ class WebServerManager:
     def matrix_manager(self):
         return getattr(self.app, 'matrix', None) if self.app else None
 
+    @property
+    def render_manager(self):
+        return getattr(self.app, 'renderer', None) if self.app else None
+
+    @property
+    def uart_transport(self):
+        return getattr(self.app, 'transport', None) if self.app else None
+
     @property
     def synth_manager(self):
         return getattr(self.app, 'synth', None) if self.app else None
@@ -932,6 +940,60 @@ class WebServerManager:
                 return Response(request, f'{{"error": "{str(e)}"}}',
                               content_type="application/json", status=500)
 
+        # API: Render loop timing (frame profiler)
+        @self.server.route("/api/telemetry/render", GET)
+        def telemetry_render(request: Request):
+            """Return render loop frame stats and per-stage profiler timings.
+
+            Query params:
+                profile: "1" enables the frame profiler, "0" disables it.
+                reset: "1" clears the collected samples.
+            """
+            try:
+                renderer = self.render_manager
+                if renderer is None:
+                    return Response(request, '{"error": "Render loop not available"}',
+                                  content_type="application/json", status=503)
+
+                profile = request.query_params.get("profile")
+                if profile == "1":
+                    renderer.enable_profiler()
+                elif profile == "0":
+                    renderer.disable_profiler()
+                if request.query_params.get("reset") == "1" and renderer.profiler is not None:
+                    renderer.profiler.reset()
+
+                payload = renderer.get_render_telemetry()
+                payload["ts"] = time.monotonic()
+                return Response(request, json.dumps(payload), content_type="application/json")
+            except Exception as e:
+                return Response(request, f'{{"error": "{str(e)}"}}',
+                              content_type="application/json", status=500)
+
+        # API: UART receive latency (arrival-to-dispatch histogram)
+        @self.server.route("/api/telemetry/uart", GET)
+        def telemetry_uart(request: Request):
+            """Return the upstream UART's RX latency histogram and poll delay.
+
+            Query params:
+                reset: "1" clears the latency histogram.
+            """
+            try:
+                transport = self.uart_transport
+                if transport is None or not hasattr(transport, "get_rx_telemetry"):
+                    return Response(request, '{"error": "UART transport not available"}',
+                                  content_type="application/json", status=503)
+
+                if request.query_params.get("reset") == "1":
+                    transport.rx_latency.reset()
+
+                payload = transport.get_rx_telemetry()
+                payload["ts"] = time.monotonic()
+                return Response(request, json.dumps(payload), content_type="application/json")
+            except Exception as e:
+                return Response(request, f'{{"error": "{str(e)}"}}',
+                              content_type="application/json", status=500)
+
         # API: Get pixel art palette
         @self.server.route("/api/pixel-art/palette", GET)
         def get_pixel_art_palette(request: Request):
@@ -23,6 +23,7 @@ class BaseMode:
         self.description = description
         self.variant = "DEFAULT"
         self.exitable = exitable
+        self.sim = None  # SimScheduler while a fixed-timestep simulation is running
 
     async def enter(self):
         """Standard setup routine."""
@@ -45,6 +46,29 @@ class BaseMode:
         """Override this method in subclasses."""
         raise NotImplementedError("Subclasses must implement the run_tutorial() method.")
 
+    async def run_simulation(self, step, render, interval_ms, poll=None, **kwargs):
+        """Run a fixed-timestep simulation until poll() returns a result.
+
+        Wraps SimScheduler with the core's RenderManager, so renders happen
+        at most once per render frame. The scheduler stays on self.sim while
+        running; change self.sim.interval_ms to change the step rate.
+
+        Args:
+            step: Callable advancing the simulation one step.
+            render: Callable pushing the current state to the display.
+            interval_ms: Initial step interval in milliseconds.
+            poll: Input handler called on every wake; a non-None return ends
+                the simulation and is returned.
+            **kwargs: Passed through to SimScheduler (poll_ms, max_catchup).
+        """
+        from utilities.sim_scheduler import SimScheduler
+
+        self.sim = SimScheduler(
+            step, render, interval_ms, poll=poll,
+            renderer=getattr(self.core, "renderer", None), **kwargs
+        )
+        return await self.sim.run()
+
     async def _monitor_exit(self, main_task):
         """
         Monitors for a global exit command (long press Button 3)
@@ -71,6 +95,10 @@ class BaseMode:
         try:
             await self.enter()
 
+            prefetch = getattr(self.core, "prefetch", None)
+            if prefetch is not None:
+                prefetch.note_ready()  # Time-to-first-frame for this launch
+
             if getattr(self, "variant", None) == "TUTORIAL" and self.__class__.run_tutorial is not BaseMode.run_tutorial:
                 JEBLogger.info("MODE", f"Running tutorial variant of mode: {self.name}")
                 run_task = asyncio.create_task(self.run_tutorial())
@@ -100,6 +100,7 @@ class BoidsMode(BaseMode):
         self._color_idx = 0      # index into _BOID_COLOR_INDICES
         self._speed_idx = 2      # default NORM (50 ms)
         self._tick = 0
+        self._last_enc = 0       # Encoder position at the last poll
 
     async def run_tutorial(self):
         """
@@ -368,49 +369,49 @@ class BoidsMode(BaseMode):
 
         self.core.hid.flush()
         self.core.hid.reset_encoder(self._speed_idx)
-        last_enc = self.core.hid.encoder_position()
-        last_step_tick = ticks_ms()
-
-        while True:
-            now = ticks_ms()
-
-            # --- Encoder: adjust simulation speed ---
-            enc = self.core.hid.encoder_position()
-            diff = enc - last_enc
-            if diff != 0:
-                delta = 1 if diff > 0 else -1
-                new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
-                self._speed_idx = new_idx
-                self.core.hid.reset_encoder(self._speed_idx)
-                last_enc = self._speed_idx
-                line1, line2 = self._status_line()
-                self.core.display.update_status(line1, line2)
-                self.core.buzzer.play_sequence(tones.UI_TICK)
+        self._last_enc = self.core.hid.encoder_position()
 
-            # --- Button 1: cycle boid colour ---
-            if self.core.hid.is_button_pressed(0, action="tap"):
-                self._color_idx = (self._color_idx + 1) % len(_BOID_COLOR_INDICES)
-                self.core.buzzer.play_sequence(tones.UI_TICK)
+        return await self.run_simulation(
+            self._step, self._render, _SPEED_LEVELS_MS[self._speed_idx], poll=self._handle_input,
+            max_catchup=1,  # Compute-bound step: never replay a backlog back to back
+        )
+
+    def _render(self):
+        """Rasterise the flock and push it to the matrix."""
+        self._build_frame()
+        self.core.matrix.show_frame(self._frame)
+
+    def _handle_input(self):
+        """Poll controls; returns "SUCCESS" to exit, otherwise None."""
+        # --- Encoder: adjust simulation speed ---
+        enc = self.core.hid.encoder_position()
+        diff = enc - self._last_enc
+        if diff != 0:
+            delta = 1 if diff > 0 else -1
+            new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
+            self._speed_idx = new_idx
+            self.sim.interval_ms = _SPEED_LEVELS_MS[new_idx]
+            self.core.hid.reset_encoder(self._speed_idx)
+            self._last_enc = self._speed_idx
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Button 1: cycle boid colour ---
+        if self.core.hid.is_button_pressed(0, action="tap"):
+            self._color_idx = (self._color_idx + 1) % len(_BOID_COLOR_INDICES)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Button 2: scatter / reset the flock ---
+        if self.core.hid.is_button_pressed(1, action="tap"):
+            self._reset()
+            line1, _ = self._status_line()
+            self.core.display.update_status(line1, "SCATTERED!")
+            self.core.buzzer.play_sequence(tones.UI_CONFIRM)
 
-            # --- Button 2: scatter / reset the flock ---
-            if self.core.hid.is_button_pressed(1, action="tap"):
-                self._reset()
-                line1, _ = self._status_line()
-                self.core.display.update_status(line1, "SCATTERED!")
-                self.core.buzzer.play_sequence(tones.UI_CONFIRM)
-
-            # --- Encoder long press (2 s): exit to Zero Player menu ---
-            if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
-                JEBLogger.info("BOIDS", "[EXIT] Returning to Zero Player menu")
-                gc.collect()
-                return "SUCCESS"
-
-            # --- Simulation step on interval ---
-            interval = _SPEED_LEVELS_MS[self._speed_idx]
-            if ticks_diff(now, last_step_tick) >= interval:
-                self._step()
-                self._build_frame()
-                self.core.matrix.show_frame(self._frame)
-                last_step_tick = now
-
-            await asyncio.sleep(0.01)
+        # --- Encoder long press (2 s): exit to Zero Player menu ---
+        if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
+            JEBLogger.info("BOIDS", "[EXIT] Returning to Zero Player menu")
+            gc.collect()
+            return "SUCCESS"
+        return None
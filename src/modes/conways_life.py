@@ -45,6 +45,7 @@ class ConwaysLife(BaseMode):
         self._color_idx = 0
         self._speed_idx = 2   # Default: NORM (300 ms)
         self._generation = 0
+        self._last_enc = 0
 
     async def run_tutorial(self):
         """
@@ -303,49 +304,48 @@ class ConwaysLife(BaseMode):
 
         self.core.hid.flush()
         self.core.hid.reset_encoder(self._speed_idx)
-        last_enc = self.core.hid.encoder_position()
-        last_gen_tick = ticks_ms()
-
-        while True:
-            now = ticks_ms()
-
-            # --- Encoder: adjust generation speed ---
-            enc = self.core.hid.encoder_position()
-            diff = enc - last_enc
-            if diff != 0:
-                delta = 1 if diff > 0 else -1
-                new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
-                self._speed_idx = new_idx
-                self.core.hid.reset_encoder(self._speed_idx)
-                last_enc = self._speed_idx
-                line1, line2 = self._status_line()
-                self.core.display.update_status(line1, line2)
-                self.core.buzzer.play_sequence(tones.UI_TICK)
+        self._last_enc = self.core.hid.encoder_position()
 
-            # --- Button 1: cycle alive colour ---
-            if self.core.hid.is_button_pressed(0, action="tap"):
-                self._color_idx = (self._color_idx + 1) % len(_ALIVE_COLOR_INDICES)
-                self._apply_color()
-                self.core.buzzer.play_sequence(tones.UI_TICK)
+        return await self.run_simulation(
+            self._step, self._render, _SPEED_LEVELS_MS[self._speed_idx], poll=self._handle_input
+        )
 
-            # --- Button 2: reset / randomise ---
-            if self.core.hid.is_button_pressed(1, action="tap"):
-                self._randomize()
-                line1, _ = self._status_line()
-                self.core.display.update_status(line1, "RANDOMIZED!")
-                self.core.buzzer.play_sequence(tones.UI_CONFIRM)
-
-            # --- Encoder long press (2 s): exit back to menu ---
-            if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
-                JEBLogger.info("LIFE", "[EXIT] Returning to Zero Player menu")
-                return "SUCCESS"
-
-            # --- Game logic: step on interval ---
-            interval = _SPEED_LEVELS_MS[self._speed_idx]
-            if ticks_diff(now, last_gen_tick) >= interval:
-                self._step()
-                self.core.matrix.show_frame(self._grid)
-                self.core.display.update_status(*self._status_line()) # Update GEN count
-                last_gen_tick = now
+    def _render(self):
+        """Push the grid and the generation count."""
+        self.core.matrix.show_frame(self._grid)
+        self.core.display.update_status(*self._status_line()) # Update GEN count
+
+    def _handle_input(self):
+        """Poll controls; returns "SUCCESS" to exit, otherwise None."""
+        # --- Encoder: adjust generation speed ---
+        enc = self.core.hid.encoder_position()
+        diff = enc - self._last_enc
+        if diff != 0:
+            delta = 1 if diff > 0 else -1
+            new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
+            self._speed_idx = new_idx
+            self.sim.interval_ms = _SPEED_LEVELS_MS[new_idx]
+            self.core.hid.reset_encoder(self._speed_idx)
+            self._last_enc = self._speed_idx
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Button 1: cycle alive colour ---
+        if self.core.hid.is_button_pressed(0, action="tap"):
+            self._color_idx = (self._color_idx + 1) % len(_ALIVE_COLOR_INDICES)
+            self._apply_color()
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Button 2: reset / randomise ---
+        if self.core.hid.is_button_pressed(1, action="tap"):
+            self._randomize()
+            line1, _ = self._status_line()
+            self.core.display.update_status(line1, "RANDOMIZED!")
+            self.core.buzzer.play_sequence(tones.UI_CONFIRM)
 
-            await asyncio.sleep(0.01)
+        # --- Encoder long press (2 s): exit back to menu ---
+        if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
+            JEBLogger.info("LIFE", "[EXIT] Returning to Zero Player menu")
+            return "SUCCESS"
+        return None
@@ -136,7 +136,7 @@ class DigitalRainMode(BaseMode):
                     # Square the fraction for an exponential fade (looks more natural)
                     brightness = fraction * fraction
 
-                    r, g, b = Palette.hsv_to_rgb(base_hue, 1.0, brightness)
+                    r, g, b = Palette.hsv_fast(base_hue, brightness)
 
                     cell = self._buf[ty * w + x]
                     # Use max() to blend overlapping tails
@@ -63,6 +63,7 @@ class LavaLampMode(BaseMode):
         self._blobs = []         # List of [x, y, vx, vy, radius_sq]
         self._theme_idx = 0      # Default to THERMAL
         self._speed_idx = 2      # Default to NORM
+        self._last_enc = 0       # Encoder position at the last poll
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -147,7 +148,7 @@ class LavaLampMode(BaseMode):
                     # Brightness curve: sharp ramp up
                     val = math.pow(intensity, 0.5)
 
-                    r, g, b = Palette.hsv_to_rgb(hue, 1.0, val)
+                    r, g, b = Palette.hsv_fast(hue, val)
 
                 cell = self._buf[idx]
                 cell[0] = r
@@ -320,53 +321,49 @@ class LavaLampMode(BaseMode):
 
         self.core.hid.flush()
         self.core.hid.reset_encoder(self._speed_idx)
-        last_enc = self.core.hid.encoder_position()
-        last_tick = ticks_ms()
-
-        while True:
-            now = ticks_ms()
-
-            # --- Encoder: adjust simulation speed ---
-            enc = self.core.hid.encoder_position()
-            diff = enc - last_enc
-            if diff != 0:
-                delta = 1 if diff > 0 else -1
-                new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
-                self._speed_idx = new_idx
-                self.core.hid.reset_encoder(self._speed_idx)
-                last_enc = self._speed_idx
-                line1, line2 = self._status_line()
-                self.core.display.update_status(line1, line2)
-                self.core.buzzer.play_sequence(tones.UI_TICK)
-
-            # --- Button 1: cycle color theme ---
-            if self.core.hid.is_button_pressed(0, action="tap"):
-                self._theme_idx = (self._theme_idx + 1) % len(_THEMES)
-                line1, line2 = self._status_line()
-                self.core.display.update_status(line1, line2)
-                self.core.buzzer.play_sequence(tones.UI_TICK)
-
-            # --- Button 2: randomise blobs ---
-            if self.core.hid.is_button_pressed(1, action="tap"):
-                self._reset_blobs()
-                line1, _ = self._status_line()
-                self.core.display.update_status(line1, "RANDOMIZED!")
-                self.core.buzzer.play_sequence(tones.UI_CONFIRM)
+        self._last_enc = self.core.hid.encoder_position()
 
-            # --- Encoder long press (2 s): exit to menu ---
-            if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
-                JEBLogger.info("LAVA", "[EXIT] Returning to Zero Player menu")
-                return "SUCCESS"
+        return await self.run_simulation(
+            self._step_physics, self._render, _SPEED_LEVELS_MS[self._speed_idx], poll=self._handle_input
+        )
 
-            # --- Physics & Render step ---
-            dt_ms = ticks_diff(now, last_tick)
-            interval = _SPEED_LEVELS_MS[self._speed_idx]
+    def _render(self):
+        """Evaluate the metaball field and push it to the matrix."""
+        self._compute_frame()
+        self._render_to_matrix()
+
+    def _handle_input(self):
+        """Poll controls; returns "SUCCESS" to exit, otherwise None."""
+        # --- Encoder: adjust simulation speed ---
+        enc = self.core.hid.encoder_position()
+        diff = enc - self._last_enc
+        if diff != 0:
+            delta = 1 if diff > 0 else -1
+            new_idx = max(0, min(len(_SPEED_LEVELS_MS) - 1, self._speed_idx + delta))
+            self._speed_idx = new_idx
+            self.sim.interval_ms = _SPEED_LEVELS_MS[new_idx]
+            self.core.hid.reset_encoder(self._speed_idx)
+            self._last_enc = self._speed_idx
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
 
-            if dt_ms >= interval:
-                self._step_physics()
-                self._compute_frame()
-                self._render_to_matrix()
+        # --- Button 1: cycle color theme ---
+        if self.core.hid.is_button_pressed(0, action="tap"):
+            self._theme_idx = (self._theme_idx + 1) % len(_THEMES)
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
 
-                last_tick = now
+        # --- Button 2: randomise blobs ---
+        if self.core.hid.is_button_pressed(1, action="tap"):
+            self._reset_blobs()
+            line1, _ = self._status_line()
+            self.core.display.update_status(line1, "RANDOMIZED!")
+            self.core.buzzer.play_sequence(tones.UI_CONFIRM)
 
-            await asyncio.sleep(0.01)
+        # --- Encoder long press (2 s): exit to menu ---
+        if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
+            JEBLogger.info("LAVA", "[EXIT] Returning to Zero Player menu")
+            return "SUCCESS"
+        return None
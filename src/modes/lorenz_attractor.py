@@ -206,7 +206,7 @@ class LorenzAttractor(BaseMode):
 
                         # Map Z-depth to Hue for 3D color mapping (0-50 maps to 0-360)
                         hue = (self._z / 50.0) * 360.0
-                        r, g, b = Palette.hsv_to_rgb(hue % 360.0, 1.0, 1.0)
+                        r, g, b = Palette.hue_to_rgb(hue)
 
                         fx, fy = project_func(self._x, self._y, self._z)
                         self._plot(fx, fy, r, g, b)
@@ -354,7 +354,7 @@ class LorenzAttractor(BaseMode):
                     self._z += dz
 
                     hue = (self._z / 50.0) * 360.0
-                    r, g, b = Palette.hsv_to_rgb(hue % 360.0, 1.0, 1.0)
+                    r, g, b = Palette.hue_to_rgb(hue)
 
                     fx, fy = project_func(self._x, self._y, self._z)
                     self._plot(fx, fy, r, g, b)
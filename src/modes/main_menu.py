@@ -3,6 +3,7 @@
 
 import asyncio
 
+from utilities.boot_timeline import BOOT
 from utilities.palette import Palette
 from utilities import tones
 from utilities.logger import JEBLogger
@@ -184,6 +185,9 @@ class MainMenu(UtilityMode):
 
         last_pos = self.core.hid.encoder_position()
 
+        # Warms the highlighted mode while the menu is idle
+        prefetch = getattr(self.core, "prefetch", None)
+
         while True:
             # --- CONSOLE INTERRUPT CHECK ---
             if getattr(self, "_exit_requested", False):
@@ -488,6 +492,7 @@ class MainMenu(UtilityMode):
             # =========================================
             # 3. RENDER STAGE
             # =========================================
+            frame_idle = encoder_diff == 0
             # Only push updates to hardware if something visually changed!
             if needs_render or self.state != last_rendered_state or focus_mode != last_rendered_focus or selected_setting_idx != last_rendered_setting or current_category != last_rendered_category:
                 JEBLogger.debug("MENU", f"Rendering... needs={needs_render}, state={self.state}, focus={focus_mode}, sett={selected_setting_idx}")
@@ -590,13 +595,34 @@ class MainMenu(UtilityMode):
                         self.core.display.update_settings_menu(settings_strings, selected_setting_idx)
                         self.core.display.update_footer("B4:EXIT")
 
+                if not BOOT.finished:
+                    BOOT.finish()  # First menu frame ends the boot timeline
+
                 # Update tracking variables
+                frame_idle = False
                 needs_render = False
                 last_rendered_state = self.state
                 last_rendered_focus = focus_mode
                 last_rendered_setting = selected_setting_idx
                 last_rendered_category = current_category
 
+            # =========================================
+            # 4. IDLE PREFETCH
+            # =========================================
+            if prefetch is not None:
+                highlighted = None
+                if self.state == "MENU" and focus_mode == "GAME" and menu_items:
+                    highlighted = menu_items[selected_game_idx]
+                elif self.state == "ZERO_PLAYER" and zero_player_items:
+                    highlighted = zero_player_items[zero_player_idx]
+
+                if highlighted is None or self.core.mode_registry[highlighted].get("submenu"):
+                    prefetch.cancel()
+                else:
+                    prefetch.highlight(highlighted)  # A new highlight cancels the old prefetch
+                    if frame_idle:
+                        prefetch.poll()
+
             last_pos = curr_pos
 
             await asyncio.sleep(0.01)
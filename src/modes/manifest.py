@@ -8,6 +8,9 @@ direct imports, avoiding circular dependencies and tight coupling.
 To add a new mode:
 1. Create your mode class in a new file in the modes/ directory
 2. Add its details to the MODE_REGISTRY dictionary below, following the existing structure.
+
+Optional "preload" lists small WAV files that the menu prefetcher loads
+into RAM while the mode is highlighted (see core/mode_prefetch.py).
 """
 
 # Mode Registry
@@ -170,7 +173,8 @@ MODE_REGISTRY |= {
         "has_tutorial": True,
         "order": 30,
         "requires": ["CORE"],
-        "settings": []
+        "settings": [],
+        "preload": ["audio/safe/sfx/crash.wav"]
     },
     "PONG": {
         "id": "PONG",
@@ -656,7 +660,12 @@ MODE_REGISTRY |= {
         "has_tutorial": True,
         "order": 1,
         "requires": ["INDUSTRIAL"],
-        "settings": []
+        "settings": [],
+        "preload": [
+            "audio/ind/sfx/keypad_click.wav",
+            "audio/ind/sfx/toggle_confirm.wav",
+            "audio/ind/sfx/toggle_error.wav",
+        ]
     },
     "ABYSSAL_ROVER": {
         "id": "ABYSSAL_ROVER",
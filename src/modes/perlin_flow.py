@@ -232,7 +232,7 @@ class VectorFlowMode(BaseMode):
 
                         # Fade out smoothly as they near max age
                         brightness = 1.0 - (age / max_age)
-                        r, g, b = Palette.hsv_to_rgb(hue, 1.0, brightness)
+                        r, g, b = Palette.hsv_fast(hue, brightness)
 
                         self._plot(nx, ny, r, g, b)
 
@@ -388,7 +388,7 @@ class VectorFlowMode(BaseMode):
                     hue = (base_hue + normalized_angle * hue_range) % 360.0
 
                     brightness = 1.0 - (age / max_age)
-                    r, g, b = Palette.hsv_to_rgb(hue, 1.0, brightness)
+                    r, g, b = Palette.hsv_fast(hue, brightness)
 
                     self._plot(nx, ny, r, g, b)
 
@@ -82,6 +82,7 @@ class PlasmaMode(BaseMode):
         self._hue_speed_idx = 0  # Default: DRIFT
         self._time = 0.0         # Animation clock (seconds)
         self._hue_offset = 0.0   # Palette hue shift driven by encoder (degrees)
+        self._last_enc = 0       # Encoder position at the last poll
 
     async def run_tutorial(self):
         """
@@ -222,6 +223,7 @@ class PlasmaMode(BaseMode):
         freq = _FREQ_LEVELS[self._freq_idx]
         t = self._time
         hue_off = self._hue_offset
+        wheel = Palette.hue_wheel()
         w = self.width
         h = self.height
         idx = 0
@@ -236,7 +238,7 @@ class PlasmaMode(BaseMode):
                 v = (v + 4.0) * 0.125
                 # Map to hue (0–360 degrees) with palette offset applied.
                 hue = (v * 360.0 + hue_off) % 360.0
-                r, g, b = Palette.hsv_to_rgb(hue, 1.0, 1.0)
+                r, g, b = wheel[int(hue)]
                 cell = self._buf[idx]
                 cell[0] = r
                 cell[1] = g
@@ -290,56 +292,52 @@ class PlasmaMode(BaseMode):
 
         self.core.hid.flush()
         self.core.hid.reset_encoder(0)
-        last_enc = self.core.hid.encoder_position()
-        last_tick = ticks_ms()
+        self._last_enc = self.core.hid.encoder_position()
 
-        try:
-            while True:
-                now = ticks_ms()
-                dt_ms = ticks_diff(now, last_tick)
-                if dt_ms < _FRAME_MS:
-                    await asyncio.sleep(0.01)
-                    continue
-                last_tick = now
-                dt_s = dt_ms / 1000.0
-
-                # --- Encoder: shift hue palette offset ---
-                enc = self.core.hid.encoder_position()
-                diff = enc - last_enc
-                if diff != 0:
-                    self._hue_offset = (self._hue_offset + diff * 5.0) % 360.0
-                    self.core.hid.reset_encoder(0)
-                    last_enc = 0
-
-                # --- Button 1: cycle wave frequency ---
-                if self.core.hid.is_button_pressed(0, action="tap"):
-                    self._freq_idx = (self._freq_idx + 1) % len(_FREQ_LEVELS)
-                    line1, line2 = self._status_line()
-                    self.core.display.update_status(line1, line2)
-                    self.core.buzzer.play_sequence(tones.UI_TICK)
-
-                # --- Button 2: toggle colour speed ---
-                if self.core.hid.is_button_pressed(1, action="tap"):
-                    self._hue_speed_idx = (self._hue_speed_idx + 1) % len(_HUE_SPEEDS)
-                    line1, line2 = self._status_line()
-                    self.core.display.update_status(line1, line2)
-                    self.core.buzzer.play_sequence(tones.UI_TICK)
-
-                # --- Encoder long press (2 s): exit to Zero Player menu ---
-                if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
-                    JEBLogger.info("PLASMA", "[EXIT] Returning to Zero Player menu")
-                    return "SUCCESS"
-
-                # --- Advance animation clock ---
-                self._time += dt_s * _TIME_SCALE
-
-                # --- Advance hue offset for automatic colour cycling ---
-                hue_speed = _HUE_SPEEDS[self._hue_speed_idx]
-                self._hue_offset = (self._hue_offset + hue_speed * dt_s) % 360.0
-
-                # --- Evaluate plasma and push to matrix ---
-                self._compute_frame()
-                self._render_to_matrix()
+        return await self.run_simulation(
+            self._advance_clock, self._render, _FRAME_MS, poll=self._handle_input
+        )
 
-        finally:
-            pass
+    def _advance_clock(self):
+        """Advance the animation clock and hue cycle by one fixed frame step."""
+        dt_s = _FRAME_MS / 1000.0
+        self._time += dt_s * _TIME_SCALE
+
+        # --- Advance hue offset for automatic colour cycling ---
+        hue_speed = _HUE_SPEEDS[self._hue_speed_idx]
+        self._hue_offset = (self._hue_offset + hue_speed * dt_s) % 360.0
+
+    def _render(self):
+        """Evaluate the plasma and push it to the matrix."""
+        self._compute_frame()
+        self._render_to_matrix()
+
+    def _handle_input(self):
+        """Poll controls; returns "SUCCESS" to exit, otherwise None."""
+        # --- Encoder: shift hue palette offset ---
+        enc = self.core.hid.encoder_position()
+        diff = enc - self._last_enc
+        if diff != 0:
+            self._hue_offset = (self._hue_offset + diff * 5.0) % 360.0
+            self.core.hid.reset_encoder(0)
+            self._last_enc = 0
+
+        # --- Button 1: cycle wave frequency ---
+        if self.core.hid.is_button_pressed(0, action="tap"):
+            self._freq_idx = (self._freq_idx + 1) % len(_FREQ_LEVELS)
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Button 2: toggle colour speed ---
+        if self.core.hid.is_button_pressed(1, action="tap"):
+            self._hue_speed_idx = (self._hue_speed_idx + 1) % len(_HUE_SPEEDS)
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
+
+        # --- Encoder long press (2 s): exit to Zero Player menu ---
+        if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
+            JEBLogger.info("PLASMA", "[EXIT] Returning to Zero Player menu")
+            return "SUCCESS"
+        return None
@@ -41,6 +41,9 @@ _DB = 0.5
 _SPEED_LEVELS = [1, 2, 4, 8, 15]
 _SPEED_NAMES  = ["SLOW", "MED", "NORM", "FAST", "TURBO"]
 
+# Visual frame (solver tick) interval in milliseconds (~30 FPS)
+_FRAME_MS = 33
+
 # Parameter presets: (Display Name, Feed Rate, Kill Rate)
 _PRESETS = [
     ("BRAIN CORAL", 0.0545, 0.0620),
@@ -78,6 +81,7 @@ class ReactionDiffusion(BaseMode):
         self._preset_idx = 0
         self._speed_idx = 2
         self._theme_idx = 0
+        self._last_enc = 0
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -191,7 +195,7 @@ class ReactionDiffusion(BaseMode):
                 else:
                     hue = base_hue + intensity * (peak_hue - base_hue)
                     val = math.pow(intensity, 0.7) # Gamma curve for visual pop
-                    r, g, b = Palette.hsv_to_rgb(hue % 360.0, 1.0, val)
+                    r, g, b = Palette.hsv_fast(hue, val)
                     self.core.matrix.draw_pixel(x, y, (r, g, b))
 
     def _status_line(self):
@@ -348,62 +352,62 @@ class ReactionDiffusion(BaseMode):
 
         self.core.hid.flush()
         self.core.hid.reset_encoder(self._speed_idx)
-        last_enc = self.core.hid.encoder_position()
-
-        last_frame_tick = ticks_ms()
-
-        while True:
-            now = ticks_ms()
-
-            # --- Encoder: adjust simulation speed (iterations per frame) ---
-            enc = self.core.hid.encoder_position()
-            diff = enc - last_enc
-            if diff != 0:
-                # Cycle theme when pushing past the edge, or adjust speed
-                delta = 1 if diff > 0 else -1
-
-                # Hidden feature: Using encoder to cycle themes if holding Button 1
-                if self.core.hid.is_button_pressed(0):
-                    self._theme_idx = (self._theme_idx + delta) % len(_THEMES)
-                    self.core.hid.reset_encoder(self._speed_idx)
-                    last_enc = self._speed_idx
-                    self.core.buzzer.play_sequence(tones.UI_TICK)
-                else:
-                    new_idx = max(0, min(len(_SPEED_LEVELS) - 1, self._speed_idx + delta))
-                    self._speed_idx = new_idx
-                    self.core.hid.reset_encoder(self._speed_idx)
-                    last_enc = self._speed_idx
-                    line1, line2 = self._status_line()
-                    self.core.display.update_status(line1, line2)
-                    self.core.buzzer.play_sequence(tones.UI_TICK)
-
-            # --- Button 1: cycle parameter preset ---
-            if self.core.hid.is_button_pressed(0, action="tap"):
-                self._preset_idx = (self._preset_idx + 1) % len(_PRESETS)
+        self._last_enc = self.core.hid.encoder_position()
+
+        return await self.run_simulation(
+            self._step_frame, self._render, _FRAME_MS, poll=self._handle_input,
+            max_catchup=1,  # Compute-bound step: never replay a backlog back to back
+        )
+
+    def _step_frame(self):
+        """Run one frame tick worth of solver iterations (speed = iterations per tick)."""
+        for _ in range(_SPEED_LEVELS[self._speed_idx]):
+            self._step()
+
+    def _render(self):
+        """Push the chemical field to the matrix."""
+        self._render_to_matrix()
+
+    def _handle_input(self):
+        """Poll controls; returns "SUCCESS" to exit, otherwise None."""
+        # --- Encoder: adjust simulation speed (iterations per frame) ---
+        enc = self.core.hid.encoder_position()
+        diff = enc - self._last_enc
+        if diff != 0:
+            # Cycle theme when pushing past the edge, or adjust speed
+            delta = 1 if diff > 0 else -1
+
+            # Hidden feature: Using encoder to cycle themes if holding Button 1
+            if self.core.hid.is_button_pressed(0):
+                self._theme_idx = (self._theme_idx + delta) % len(_THEMES)
+                self.core.hid.reset_encoder(self._speed_idx)
+                self._last_enc = self._speed_idx
+                self.core.buzzer.play_sequence(tones.UI_TICK)
+            else:
+                new_idx = max(0, min(len(_SPEED_LEVELS) - 1, self._speed_idx + delta))
+                self._speed_idx = new_idx
+                self.core.hid.reset_encoder(self._speed_idx)
+                self._last_enc = self._speed_idx
                 line1, line2 = self._status_line()
                 self.core.display.update_status(line1, line2)
                 self.core.buzzer.play_sequence(tones.UI_TICK)
 
-            # --- Button 2: re-seed the grid ---
-            if self.core.hid.is_button_pressed(1, action="tap"):
-                self._reset(mode="SCATTER")
-                line1, _ = self._status_line()
-                self.core.display.update_status(line1, "RE-SEEDED!")
-                self.core.buzzer.play_sequence(tones.UI_CONFIRM)
-
-            # --- Encoder long press (2 s): exit to menu ---
-            if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
-                JEBLogger.info("REACT", "[EXIT] Returning to Zero Player menu")
-                return "SUCCESS"
-
-            # --- Physics & Render step (~30 FPS) ---
-            if ticks_diff(now, last_frame_tick) >= 33:
-                iters = _SPEED_LEVELS[self._speed_idx]
-                for _ in range(iters):
-                    self._step()
-
-                self._render_to_matrix()
+        # --- Button 1: cycle parameter preset ---
+        if self.core.hid.is_button_pressed(0, action="tap"):
+            self._preset_idx = (self._preset_idx + 1) % len(_PRESETS)
+            line1, line2 = self._status_line()
+            self.core.display.update_status(line1, line2)
+            self.core.buzzer.play_sequence(tones.UI_TICK)
 
-                last_frame_tick = now
+        # --- Button 2: re-seed the grid ---
+        if self.core.hid.is_button_pressed(1, action="tap"):
+            self._reset(mode="SCATTER")
+            line1, _ = self._status_line()
+            self.core.display.update_status(line1, "RE-SEEDED!")
+            self.core.buzzer.play_sequence(tones.UI_CONFIRM)
 
-            await asyncio.sleep(0.01)
+        # --- Encoder long press (2 s): exit to menu ---
+        if self.core.hid.is_encoder_button_pressed(long=True, duration=2000):
+            JEBLogger.info("REACT", "[EXIT] Returning to Zero Player menu")
+            return "SUCCESS"
+        return None
@@ -11,6 +11,8 @@ import asyncio
 from adafruit_ticks import ticks_ms
 
 from transport import Message
+from utilities.led_batch import LEDBatch
+from utilities.payload_parser import parse_values, get_int, get_float
 
 class SatelliteDriver:
     """
@@ -40,6 +42,9 @@ class SatelliteDriver:
         self.was_offline = False
         self._retry_tasks = []
         self._retry_task_max = 5
+        # LED changes gathered during a frame, sent as one LEDBATCH by flush_leds()
+        self.batch_leds = True
+        self._led_batch = LEDBatch()
 
     @property
     def sid(self):
@@ -80,11 +85,22 @@ class SatelliteDriver:
         Send a formatted command via the transport layer,
         targetting this satellite's real hardware via self.id.
 
+        Single-LED "LED" commands are queued with queue_led() and go out
+        with the next flush_leds(). Any other LED command flushes the queue
+        first so the satellite sees the changes in order.
+
          Parameters:
             cmd (str): Command type - LED | DSP.
             val (str): Command value.
         """
-        message = Message("DRIV", self.id, cmd, val)
+        if cmd.startswith("LED"):
+            if cmd == "LED" and self.batch_leds and self._queue_led_payload(val):
+                return
+            self.flush_leds(retry_count, retry_delay)
+        self._send_message(Message("DRIV", self.id, cmd, val), retry_count, retry_delay)
+
+    def _send_message(self, message, retry_count, retry_delay):
+        """Send a message, handing it to a retry task if the transport is busy."""
         if not self.transport.send(message):
             if len(self._retry_tasks) < self._retry_task_max:
                 task = asyncio.create_task(
@@ -94,3 +110,53 @@ class SatelliteDriver:
                 self._retry_tasks.append(task)
             else:
                 print(f"Warning: Max retry tasks reached for {self.id}. Dropping message: {message}")
+
+    def _queue_led_payload(self, val):
+        """Queue an "LED" payload (CSV string or sequence); False if it can't be batched."""
+        values = parse_values(val)
+        if not values or isinstance(values[0], str):
+            return False  # "ALL" or malformed: send as-is
+        return self.queue_led(
+            get_int(values, 0),
+            get_int(values, 1),
+            duration=get_float(values, 2),
+            brightness=get_float(values, 3, 1.0),
+            priority=get_int(values, 4, 2),
+        )
+
+    def queue_led(self, index, palette_index, duration=0.0, brightness=1.0, priority=2):
+        """Queue a solid LED change for the next flush_leds().
+
+        Parameters:
+            index (int): LED index on the satellite.
+            palette_index (int): Palette colour index.
+            duration (float): Seconds before the LED reverts (0 = hold).
+                Clamped, with a warning, above 6553.5 s.
+            brightness (float): 0.0-1.0.
+            priority (int): Animation priority.
+
+        Returns:
+            bool: False if the change does not fit a batch record; the caller
+                then sends it as a plain "LED" command.
+        """
+        if not (0 <= index <= 255 and 0 <= palette_index <= 255 and 0 <= priority <= 255):
+            return False
+        if not self._led_batch.add(index, palette_index, duration, brightness, priority):
+            # Batch full: send what we have and start a new one
+            self.flush_leds()
+            self._led_batch.add(index, palette_index, duration, brightness, priority)
+        return True
+
+    def flush_leds(self, retry_count=5, retry_delay=0.05):
+        """Send queued LED changes as one LEDBATCH packet. Called once per render tick.
+
+        Returns:
+            int: Number of LED records sent.
+        """
+        batch = self._led_batch
+        count = batch.count
+        if count:
+            message = Message("DRIV", self.id, "LEDBATCH", batch.payload())
+            batch.clear()
+            self._send_message(message, retry_count, retry_delay)
+        return count
@@ -8,6 +8,13 @@ including hardware init and functions.
 import asyncio
 import time
 
+try:
+    wait_for_ms = asyncio.wait_for_ms
+except AttributeError:
+    # We are on standard CPython (desktop emulator)
+    async def wait_for_ms(aw, timeout_ms):
+        return await asyncio.wait_for(aw, timeout_ms / 1000.0)
+
 from adafruit_ticks import ticks_ms
 import busio
 
@@ -30,6 +37,7 @@ from transport.protocol import (
     FILE_COMMANDS,
     CMD_FILE_START,
     CMD_FILE_END,
+    BROADCAST_DESTINATIONS,
     COMMAND_MAP,
     DEST_MAP,
     MAX_INDEX_VALUE,
@@ -45,6 +53,8 @@ class SatelliteFirmware:
     A class representing a satellite expansion box
     including hardware init and functions.
     """
+    RX_UPSTREAM_TIMEOUT_MS = 500  # Longest wait for an upstream message between watchdog check-ins
+
     def __init__(self, sid, sat_type_id, sat_type_name, config=None):
         """
         Initialize a Satellite object.
@@ -67,7 +77,9 @@ class SatelliteFirmware:
 
         # State Variables
         self._status_event = asyncio.Event()  # Event to signal status updates for efficient waiting
+        self._status_resync = True  # Next STATUS must be a full keyframe
         self.last_tx = 0
+        self.last_keyframe = 0  # Last full STATUS sent; deltas alone can't repair a lost packet
         self.last_seen = 0
         self.is_active = True
         # Frame sync state for coordinated animations with Core
@@ -130,11 +142,14 @@ class SatelliteFirmware:
         self._version_check_sent = False      # True after VERSION_CHECK sent to core
         self._version_confirmed = False       # True after core ACK'd our version or update complete
         self._version_check_retry_after = 0   # monotonic time after which to retry version check
+        self._version_payload = None          # Cached VERSION_CHECK payload (version + file fingerprints)
         self._update_mode = False             # True when receiving a firmware update
         self._update_file_count = 0           # Total number of files to receive in update
         self._update_files_received = 0       # Number of files successfully received so far
         self._update_current_filename = None  # Filename being received in current transfer
+        self._update_staged = set()           # Files staged under /update/ in this update session
         self._update_receiver = None          # FileTransferReceiver for staged files
+        self._rx_destination = None           # Destination of the upstream message being processed
 
         self.watchdog = WatchdogManager(
             task_names=[],
@@ -285,6 +300,48 @@ class SatelliteFirmware:
         except (OSError, ValueError, KeyError):
             return '0.0.0'
 
+    def _read_local_fingerprints(self):
+        """Fingerprint the installed firmware files for a delta update.
+
+        Reads ``/manifest.json`` (installed by the last update) and hashes
+        every listed file.  Digests go through a persistent hash cache in
+        ``/hash_cache.json`` so unchanged files are not re-read on every
+        boot.
+
+        Returns:
+            list | None: One fingerprint per installed file, or ``None`` if
+            no manifest is installed (the Core then sends every file).
+        """
+        import json
+        from transport.file_transfer import HashCache, file_fingerprint
+
+        try:
+            with open('/manifest.json', 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        cache = HashCache('/hash_cache.json')
+        tags = []
+        for file_entry in manifest.get('files', []):
+            path = file_entry.get('path')
+            if not path:
+                continue
+            digest = cache.get(f"/{path}")
+            if digest is not None:
+                tags.append(file_fingerprint(path, digest))
+        cache.save()
+        return tags
+
+    def _build_version_payload(self):
+        """Return the VERSION_CHECK payload, computing it once per boot."""
+        if self._version_payload is None:
+            from transport.file_transfer import format_version_check
+            self._version_payload = format_version_check(
+                self._read_local_version(), self._read_local_fingerprints()
+            )
+        return self._version_payload
+
     async def _handle_ack_command(self, val):
         """Handle ACK from core.
 
@@ -418,6 +475,7 @@ class SatelliteFirmware:
         self._version_confirmed = True   # Stop retrying version check
         self._update_files_received = 0
         self._update_current_filename = None
+        self._update_staged = set()
 
         from transport.file_transfer import FileTransferReceiver
         self._update_receiver = FileTransferReceiver(
@@ -458,6 +516,7 @@ class SatelliteFirmware:
             pass  # File doesn't exist yet
         try:
             os.rename(self._update_receiver.staging_path, dest)
+            self._update_staged.add(filename)
         except OSError as e:
             print(f"{self.sat_type_id}-{self.id}: Failed to stage {filename}: {e}")
 
@@ -467,6 +526,10 @@ class SatelliteFirmware:
         Reads ``/update/manifest.json`` (the first file always transferred)
         to determine the final destination for each staged file, then renames
         them into place and triggers a reboot so the new firmware takes effect.
+        Only files staged during this update session are installed; files the
+        Core skipped because they were unchanged are left as they are, even if
+        an earlier aborted update left a copy under ``/update/``.  The manifest itself is installed as
+        ``/manifest.json`` so the next VERSION_CHECK can report fingerprints.
         """
         import json
         import os
@@ -477,6 +540,8 @@ class SatelliteFirmware:
                 manifest = json.load(f)
 
             for file_entry in manifest.get('files', []):
+                if file_entry['path'] not in self._update_staged:
+                    continue  # Unchanged file, not part of this delta
                 src = f"/update/{file_entry['path']}"
                 dst = f"/{file_entry['path']}"
                 dst_dir = "/".join(dst.split("/")[:-1])
@@ -491,6 +556,15 @@ class SatelliteFirmware:
                 except OSError as e:
                     print(f"{self.sat_type_id}-{self.id}: Update apply failed for {src}: {e}")
 
+            try:
+                os.remove('/manifest.json')
+            except OSError:
+                pass  # No manifest installed yet
+            try:
+                os.rename('/update/manifest.json', '/manifest.json')
+            except OSError as e:
+                print(f"{self.sat_type_id}-{self.id}: Failed to install manifest: {e}")
+
             if not self.transport_up.send(Message(self.id, "CORE", "LOG", "UPDATE_APPLIED")):
                 print(f"{self.sat_type_id}-{self.id}: Failed to send UPDATE_APPLIED log")
         except (OSError, ValueError, KeyError) as e:
@@ -638,8 +712,13 @@ class SatelliteFirmware:
         """Trigger an immediate status update to be sent upstream."""
         self._status_event.set()  # Signal that a status update is needed
 
-    def _get_status_bytes(self):
-        """Return a compact byte representation of the satellite's status for efficient transmission."""
+    def _get_status_bytes(self, flush=False, full=True):
+        """Return a compact byte representation of the satellite's status for efficient transmission.
+
+        :param flush: Clear input states after reading.
+        :param full: Send a complete keyframe; when False the subclass may
+            send only what changed since the previous STATUS.
+        """
         raise NotImplementedError("_get_status_bytes() must be implemented by satellite subclasses.")
 
     async def _process_local_cmd(self, cmd, val):
@@ -667,7 +746,9 @@ class SatelliteFirmware:
                 except (ValueError, AttributeError):
                     self._update_current_filename = "unknown.tmp"
 
-            msg = Message("CORE", self.id, cmd, val)
+            # Keep the original destination so broadcast ("SAT") transfers
+            # are written silently instead of being ACKed by every satellite.
+            msg = Message("CORE", self._rx_destination or self.id, cmd, val)
             handled = await self._update_receiver.handle_message(msg)
 
             if cmd == CMD_FILE_END and handled:
@@ -702,8 +783,7 @@ class SatelliteFirmware:
             elif not self._version_confirmed:
                 now = time.monotonic()
                 if not self._version_check_sent and now >= self._version_check_retry_after:
-                    version = self._read_local_version()
-                    msg_out = Message(self.id, "CORE", CMD_VERSION_CHECK, version)
+                    msg_out = Message(self.id, "CORE", CMD_VERSION_CHECK, self._build_version_payload())
                     if self.transport_up.send(msg_out):
                         self._version_check_sent = True
                         self.last_tx = now
@@ -733,15 +813,29 @@ class SatelliteFirmware:
                             self.last_tx = time.monotonic()
                             self._status_event.clear()
                 else:
-                    # Check if update needed (event trigger or timeout)
-                    if self._status_event.is_set() or time.monotonic() - self.last_tx > 3.0:
-                        # Use get_status_bytes() to avoid string allocation overhead
-                        msg_out = Message(self.id, "CORE", "STATUS", self._get_status_bytes(flush=True))
+                    # Check if update needed (event trigger or keyframe due)
+                    now = time.monotonic()
+                    keyframe_due = now - self.last_keyframe > 3.0
+                    if self._status_event.is_set() or keyframe_due:
+                        # Event-triggered updates send deltas; a full keyframe goes out at
+                        # least every 3s, even under continuous input, so a delta lost
+                        # after a successful send() cannot desync the Core for long
+                        full = (
+                            self._status_resync
+                            or keyframe_due
+                            or not self.config.get("status_delta", True)
+                        )
+                        msg_out = Message(self.id, "CORE", "STATUS", self._get_status_bytes(flush=True, full=full))
 
                         if self.transport_up.send(msg_out):
-                            self.last_tx = time.monotonic()
+                            self.last_tx = now
+                            if full:
+                                self.last_keyframe = now
                             self._status_event.clear()
+                            self._status_resync = False
                         elif self._status_event.is_set():
+                            # A dropped delta would desync the Core; resend everything
+                            self._status_resync = True
                             # If triggered by event but failed, retry quickly
                             await asyncio.sleep(0.05)
                             continue
@@ -760,21 +854,27 @@ class SatelliteFirmware:
         while True:
             self.watchdog.check_in("rx_upstream")
             try:
-                message = self.transport_up.receive_nowait()
+                # Wake as soon as the RX worker queues a message; the timeout
+                # only bounds the gap between watchdog check-ins
+                message = await wait_for_ms(self.transport_up.receive(), self.RX_UPSTREAM_TIMEOUT_MS)
 
                 if message:
-                    # Process if addressed to us (ID match) or broadcast (ALL)
-                    if message.destination == self.id or message.destination == "ALL":
+                    # Process if addressed to us (ID match) or broadcast (ALL / SAT)
+                    if message.destination == self.id or message.destination in BROADCAST_DESTINATIONS:
+                        self._rx_destination = message.destination
                         await self._process_local_cmd(message.command, message.payload)
+                        self._rx_destination = None
 
                     if not message.destination == self.id:
                         # Forward Downstream (Application-level Relay)
                         if not self.transport_down.send(message):
                             await asyncio.sleep(0.01)
-                else:
-                    # No message, wait briefly before checking again
-                    await asyncio.sleep(0.05)
 
+                    # Fields have been consumed; let the transport reuse the object
+                    self.transport_up.release(message)
+
+            except asyncio.TimeoutError:
+                continue
             except ValueError as e:
                 # Buffer overflow or CRC error
                 print(f"Transport Error: {e}")
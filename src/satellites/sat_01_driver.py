@@ -86,7 +86,12 @@ class IndustrialSatelliteDriver(SatelliteDriver):
         try:
             self.update_heartbeat()
 
-            # 1. Safely unwrap the binary optimization (handles tuples, bytes, or strings)
+            # Binary STATUS packets are applied in place without string parsing
+            if val and not isinstance(val, str) and val[0] in (HIDManager.STATUS_FULL, HIDManager.STATUS_DELTA):
+                self.hid.apply_status_packet(val, sid=self.sid)
+                return
+
+            # 1. Legacy ASCII format: safely unwrap the binary optimization (handles tuples, bytes, or strings)
             if isinstance(val, tuple):
                 val_str = bytes(val).decode('utf-8')
             elif isinstance(val, (bytes, bytearray)):
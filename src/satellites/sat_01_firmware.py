@@ -27,7 +27,7 @@ import time
 import busio
 import neopixel
 
-from utilities.jeb_pixel import JEBPixel
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
 from utilities.logger import JEBLogger
 from utilities.pins import Pins
 from utilities.palette import Palette
@@ -95,12 +95,12 @@ class IndustrialSatelliteFirmware(SatelliteFirmware):
         )
 
         # Init LED Hardware
-        self.root_pixels = neopixel.NeoPixel(
+        self.root_pixels = PixelBuffer(neopixel.NeoPixel(
             Pins.LED_CONTROL,
             8,
             brightness= self.config.get("led_brightness", 0.3),
             auto_write=False
-        )
+        ))
 
         # Init LEDManager with JEBPixel wrapper for the 8 onboard LEDs
         self.led_jeb_pixel = JEBPixel(self.root_pixels, start_idx=0, num_pixels=8, pixel_order="RGB")
@@ -179,8 +179,8 @@ class IndustrialSatelliteFirmware(SatelliteFirmware):
             orientation='horizontal',
         )
 
-    def _get_status_bytes(self, flush=False):
-        return self.hid.get_status_bytes(flush=flush)
+    def _get_status_bytes(self, flush=False, full=True):
+        return self.hid.get_status_packet(full=full, flush=flush)
 
     async def on_mode_change(self, new_mode):
         """React to mode changes by cleaning up local hardware state."""
@@ -9,12 +9,13 @@ For backward compatibility and convenience, the protocol definitions are
 also exported from this module so existing code can import them easily.
 """
 
-from .message import Message
+from .message import Message, MessagePool
 from .uart_transport import UARTTransport
 from .file_transfer import FileTransferSender, FileTransferReceiver
 
 __all__ = [
     'Message',
+    'MessagePool',
     'UARTTransport',
     'FileTransferSender',
     'FileTransferReceiver',
@@ -46,6 +46,16 @@ class BaseTransport:
         """
         raise NotImplementedError("Subclass must implement receive_nowait()")
 
+    def release(self, message):
+        """Hand a received message back to the transport once it is no longer needed.
+
+        Transports that pool Message objects reuse it for a later receive.
+        The default implementation does nothing.
+
+        Parameters:
+            message (Message): A message previously returned by receive().
+        """
+
     def clear_buffer(self):
         """Clear any buffered data.
 
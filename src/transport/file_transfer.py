@@ -31,6 +31,70 @@ chunk with the same offset.  The receiver will seek to that offset and
 overwrite the data it already wrote rather than appending it a second
 time.  Without this guard a single lost ACK corrupts the file.
 
+Windowed (pipelined) mode
+-------------------------
+Stop-and-wait spends most of each chunk's time waiting for the ACK round
+trip rather than on the wire.  A sender created with ``window_size > 1``
+offers a sliding window in FILE_START::
+
+    filename,size,window,chunk_size
+
+A receiver that understands the extension ACKs FILE_START with the
+accepted ``"window,chunk_size"`` (each clamped to its own limits) and
+then answers every FILE_CHUNK with:
+
+- ``ACK "<offset>"``  — cumulative: every byte below *offset* is written.
+- ``NACK "<offset>"`` — selective: a chunk arrived beyond a gap, please
+  retransmit the chunk starting at *offset*.
+
+Up to *window* chunks are kept in flight.  Because chunks carry their
+offset, out-of-order arrivals are simply written in place and duplicate
+retransmissions are harmless.  A receiver that predates the extension
+fails to parse the four-field FILE_START and NACKs it; the sender then
+repeats FILE_START in the original ``filename,size`` form and falls back
+to stop-and-wait, so old satellites keep working.
+
+Broadcast mode
+--------------
+To update several satellites of the same type at once the sender streams
+FILE_START and every FILE_CHUNK once to a broadcast destination (``"SAT"``).
+Each satellite in the daisy chain writes the chunks as they pass through
+its relay and stays silent, so the chain is not flooded with ACKs.  The
+FILE_START payload uses the four-field form so receivers know the chunk
+size, and each receiver records which chunk indices it has written.
+
+Afterwards the sender repairs each satellite individually::
+
+    Sender                                Receiver (one satellite)
+      |-- FILE_STATUS (empty) -----------> |
+      |<-- FILE_STATUS (chunk bitmap) ---- |  bit i set = chunk i written
+      |-- FILE_CHUNK (missing only) -----> |  written silently
+      |   (repeat until the bitmap is full)|
+      |-- FILE_END (SHA-256 hex) --------> |
+      |<-- ACK / NACK -------------------- |
+
+A satellite that missed the broadcast FILE_START answers FILE_STATUS with
+a NACK and is served with an ordinary unicast transfer instead.
+
+Compressed mode
+---------------
+A sender created with ``compress=True`` appends a codec name to the
+four-field FILE_START offer::
+
+    filename,size,window,chunk_size,lz
+
+A receiver that supports the codec echoes it in its FILE_START ACK
+(``"window,chunk_size,lz"``).  Every FILE_CHUNK of the transfer then
+carries one method byte after the offset::
+
+    [offset: 4 bytes] [method: 0 = stored, 1 = lz] [data]
+
+Each chunk is compressed on its own with :mod:`utilities.lz`, so offsets,
+windows, retransmissions and broadcast repair work exactly as for raw
+chunks, and the receiver decompresses at most one chunk into RAM before
+writing it to the staging file.  Chunks that do not shrink are sent
+stored.  A receiver that does not echo the codec gets raw chunks.
+
 The sender/receiver roles are deliberately agnostic: either side can
 initiate a transfer so that future Sat → Core log uploads work without
 any protocol changes.
@@ -50,8 +114,18 @@ import hashlib
 import os
 import struct
 
+from utilities.lz import lz_compress, lz_decompress
+
 from .message import Message
-from .protocol import CMD_ACK, CMD_NACK, CMD_FILE_START, CMD_FILE_CHUNK, CMD_FILE_END
+from .protocol import (
+    CMD_ACK,
+    CMD_NACK,
+    CMD_FILE_START,
+    CMD_FILE_CHUNK,
+    CMD_FILE_END,
+    CMD_FILE_STATUS,
+    BROADCAST_DESTINATIONS,
+)
 
 # Transfer defaults
 DEFAULT_CHUNK_SIZE = 128
@@ -59,10 +133,22 @@ DEFAULT_STAGING_PATH = "/temp/pending.tmp"
 DEFAULT_TIMEOUT = 5.0
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_TRANSFER_TIMEOUT_MS = 10000  # 10 seconds without a chunk → abort
+DEFAULT_WINDOW_SIZE = 1  # 1 = classic stop-and-wait
+DEFAULT_MAX_WINDOW = 8   # Largest window a receiver will accept
+MAX_CHUNK_SIZE = 256     # Keeps a COBS-framed chunk inside UARTTransport.MAX_PACKET_SIZE
+DEFAULT_BROADCAST_INTERVAL = 0.002  # Seconds between broadcast chunks so relays keep up
+CODEC_LZ = "lz"          # Per-chunk LZ compression (see utilities.lz)
+SUPPORTED_CODECS = (CODEC_LZ,)
+FINGERPRINT_LENGTH = 8   # Hex characters per file tag in VERSION_CHECK
+MAX_FINGERPRINTS = 48    # Keeps a VERSION_CHECK inside UARTTransport.MAX_PACKET_SIZE
 
 # Number of bytes used to encode the chunk offset in a FILE_CHUNK payload
 _OFFSET_SIZE = 4  # uint32 little-endian
 
+# Method byte following the offset in a compressed-mode FILE_CHUNK
+_CHUNK_STORED = 0
+_CHUNK_LZ = 1
+
 
 def _makedirs(path):
     """Recursively create *path* and all missing parent directories.
@@ -120,6 +206,197 @@ def calculate_sha256(filepath):
         return None
 
 
+class HashCache:
+    """Memoise :func:`calculate_sha256` results keyed on file size and mtime.
+
+    Hashing a firmware tree means streaming every file through SHA-256,
+    which is slow on flash and SD storage.  Each digest is stored together
+    with the ``st_size`` and ``st_mtime`` the file had when it was hashed;
+    as long as both are unchanged the cached digest is returned without
+    opening the file.  With a *cache_path* the table is persisted as JSON
+    so unchanged files are not re-read on the next boot either.
+
+    Only use the cache for files that are replaced rather than edited in
+    place within the filesystem's mtime resolution (firmware files,
+    manifests).  Transfer staging files must always be hashed directly.
+    """
+
+    def __init__(self, cache_path=None):
+        """Initialise the cache.
+
+        Parameters:
+            cache_path (str | None): JSON file the table is loaded from and
+                saved to.  ``None`` keeps the cache in memory only.
+        """
+        self.cache_path = cache_path
+        self._entries = {}
+        self._dirty = False
+        if cache_path is not None:
+            try:
+                import json
+                with open(cache_path, "r") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+
+    def get(self, filepath):
+        """Return the SHA-256 hex digest of *filepath*, hashing only if it changed.
+
+        Returns:
+            str | None: Hex digest, or ``None`` if the file cannot be read.
+        """
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        size, mtime = st[6], st[8]
+        entry = self._entries.get(filepath)
+        if entry is not None and entry[0] == size and entry[1] == mtime:
+            return entry[2]
+        digest = calculate_sha256(filepath)
+        if digest is not None:
+            self._entries[filepath] = [size, mtime, digest]
+            self._dirty = True
+        return digest
+
+    def save(self):
+        """Write the table to *cache_path* if any entry changed since loading."""
+        if self.cache_path is None or not self._dirty:
+            return
+        try:
+            import json
+            with open(self.cache_path, "w") as f:
+                json.dump(self._entries, f)
+            self._dirty = False
+        except OSError:
+            pass  # Read-only filesystem — cache stays in memory
+
+
+def file_fingerprint(path, digest):
+    """Return the short tag identifying *digest* installed at *path*.
+
+    Satellites report one tag per installed file in VERSION_CHECK.  The tag
+    binds the content hash to the file's path, so identical files at two
+    locations (e.g. empty ``__init__.py``) are told apart.
+
+    Parameters:
+        path (str): Manifest-relative path (e.g. ``"managers/led_manager.mpy"``).
+        digest (str): Lowercase hex SHA-256 of the file contents.
+
+    Returns:
+        str: ``FINGERPRINT_LENGTH`` lowercase hex characters.
+    """
+    return hashlib.sha256(f"{path}:{digest}".encode()).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def format_version_check(version, fingerprints=None):
+    """Build a VERSION_CHECK payload.
+
+    The payload is ``"version"`` or ``"version,<tags>"`` where ``<tags>`` is
+    the concatenation of :func:`file_fingerprint` tags.  Tags are dropped
+    when there are more than ``MAX_FINGERPRINTS`` of them, which makes the
+    Core fall back to a full update.
+    """
+    if not fingerprints or len(fingerprints) > MAX_FINGERPRINTS:
+        return version
+    return f"{version},{''.join(fingerprints)}"
+
+
+def parse_version_check(payload):
+    """Split a VERSION_CHECK payload into ``(version, fingerprints)``.
+
+    Returns:
+        tuple: ``(version, fingerprints)`` where *fingerprints* is a set of
+        tags, or ``None`` if the satellite did not report any (legacy
+        firmware or too many files).
+    """
+    if isinstance(payload, bytes):
+        payload = payload.decode("utf-8")
+    elif not isinstance(payload, str):
+        return "0.0.0", None
+    version, _, tags = payload.strip().partition(",")
+    if not tags or len(tags) % FINGERPRINT_LENGTH:
+        return version, None
+    return version, {
+        tags[i:i + FINGERPRINT_LENGTH] for i in range(0, len(tags), FINGERPRINT_LENGTH)
+    }
+
+
+def _parse_offset(payload):
+    """Parse the byte offset carried by a windowed-mode ACK/NACK payload.
+
+    Returns:
+        int | None: The offset, or ``None`` if the payload is empty or not
+        a decimal integer (e.g. a legacy empty ACK).
+    """
+    if isinstance(payload, (bytes, bytearray)):
+        payload = payload.decode("utf-8")
+    try:
+        return int(payload)
+    except (TypeError, ValueError):
+        return None
+
+
+def _missing_offsets(bitmap, file_size, chunk_size):
+    """Return the byte offsets of chunks not set in a FILE_STATUS bitmap.
+
+    Bit ``i`` (LSB first within each byte) covers the chunk at offset
+    ``i * chunk_size``.  Bits beyond the end of a short bitmap count as
+    missing.
+    """
+    if isinstance(bitmap, str):
+        bitmap = bitmap.encode("latin-1")
+    elif bitmap is None:
+        bitmap = b""
+    missing = []
+    bitmap_len = len(bitmap)
+    index = 0
+    for offset in range(0, file_size, chunk_size):
+        byte_index = index >> 3
+        if byte_index >= bitmap_len or not bitmap[byte_index] & (1 << (index & 7)):
+            missing.append(offset)
+        index += 1
+    return missing
+
+
+class ReplyQueue:
+    """ACK/NACK/FILE_STATUS replies for a sender, queued per source device.
+
+    The owner's dispatch loop calls :meth:`put` for every reply it routes
+    to a transfer and the sender takes them with :meth:`get` in arrival
+    order.  Unlike a single "last reply" slot, a NACK cannot be replaced
+    by a later cumulative ACK before the sender wakes, and a reply from a
+    device other than the one being served never completes its wait.
+    """
+
+    def __init__(self, max_pending=16):
+        self.event = asyncio.Event()
+        self.max_pending = max_pending
+        self._pending = {}
+
+    def put(self, source, status, payload):
+        """Queue a reply from *source*; ``status`` is ``True`` for ACK/FILE_STATUS."""
+        pending = self._pending.setdefault(source, [])
+        if len(pending) >= self.max_pending:
+            pending.pop(0)
+        pending.append((status, payload))
+        self.event.set()
+
+    def get(self, source):
+        """Pop the oldest ``(status, payload)`` from *source*, or ``None``."""
+        pending = self._pending.get(source)
+        if not pending:
+            return None
+        return pending.pop(0)
+
+    def discard(self, source=None):
+        """Drop queued replies from *source*, or from every device."""
+        if source is None:
+            self._pending.clear()
+        else:
+            self._pending.pop(source, None)
+
+
 class FileTransferSender:
     """Sends a file to a remote device in chunks over a transport.
 
@@ -128,9 +405,14 @@ class FileTransferSender:
         sender = FileTransferSender(transport, source_id="CORE")
         success = await sender.send_file("0101", "/sd/firmware.bin")
 
-    Each FILE_CHUNK is acknowledged before the next is sent.  A NACK
-    or timeout causes up to *max_retries* retransmissions before the
-    entire transfer is aborted.
+    With the default ``window_size=1`` each FILE_CHUNK is acknowledged
+    before the next is sent.  A NACK or timeout causes up to *max_retries*
+    retransmissions before the entire transfer is aborted.
+
+    With ``window_size > 1`` the sender negotiates a sliding window in
+    FILE_START and keeps up to that many chunks in flight (see the module
+    docstring).  Receivers that do not support windowing are detected and
+    served with stop-and-wait.
     """
 
     def __init__(
@@ -142,6 +424,12 @@ class FileTransferSender:
         max_retries=DEFAULT_MAX_RETRIES,
         ack_event=None,
         ack_status_callback=None,
+        window_size=DEFAULT_WINDOW_SIZE,
+        ack_payload_callback=None,
+        broadcast_interval=DEFAULT_BROADCAST_INTERVAL,
+        hash_cache=None,
+        compress=False,
+        replies=None,
     ):
         """Initialise the sender.
 
@@ -152,14 +440,48 @@ class FileTransferSender:
             chunk_size (int): Number of bytes per FILE_CHUNK payload.
             timeout (float): Seconds to wait for an ACK before timing out.
             max_retries (int): Maximum retransmission attempts per chunk.
+            ack_event (asyncio.Event | None): Event set by the owner's
+                dispatch loop whenever an ACK/NACK arrives.  When ``None``
+                replies are read directly from ``transport.receive()``.
+            ack_status_callback (callable | None): Returns ``True`` if the
+                reply that set *ack_event* was an ACK, ``False`` for NACK.
+            window_size (int): Chunks kept in flight.  ``1`` selects
+                stop-and-wait and sends the legacy FILE_START payload.
+            ack_payload_callback (callable | None): Returns the payload of
+                the reply that set *ack_event*.  Required for windowed mode
+                when *ack_event* is used, since the payload carries the
+                acknowledged offset.
+            broadcast_interval (float): Pause in seconds between chunks in
+                :meth:`broadcast_file`, giving each relay time to write and
+                forward the previous chunk.
+            hash_cache (HashCache | None): Cache used for the FILE_END
+                digest of source files, so a file sent to several devices
+                in turn is only hashed once.
+            compress (bool): Offer per-chunk LZ compression in FILE_START.
+                Used only if the receiver accepts it.
+            replies (ReplyQueue | None): Per-device reply queue filled by
+                the owner's dispatch loop.  Takes precedence over
+                *ack_event* and its callbacks.
         """
         self.transport = transport
         self.source_id = source_id
-        self.chunk_size = chunk_size
+        self.chunk_size = min(chunk_size, MAX_CHUNK_SIZE)
         self.timeout = timeout
         self.max_retries = max_retries
         self.ack_event = ack_event
         self.ack_status_callback = ack_status_callback
+        self.window_size = max(1, window_size)
+        self.ack_payload_callback = ack_payload_callback
+        self.broadcast_interval = broadcast_interval
+        self.hash_cache = hash_cache
+        self.compress = compress
+        self.replies = replies
+
+    def _file_digest(self, filepath):
+        """Return the SHA-256 of a source file, via the hash cache if set."""
+        if self.hash_cache is not None:
+            return self.hash_cache.get(filepath)
+        return calculate_sha256(filepath)
 
     async def send_file(self, destination, filepath, remote_filename=None):
         """Transfer *filepath* to *destination*.
@@ -184,67 +506,332 @@ class FileTransferSender:
         file_size = file_stat[6]
         filename = remote_filename if remote_filename is not None else filepath.replace("\\", "/").split("/")[-1]
 
-        # --- FILE_START ---
-        start_payload = f"{filename},{file_size}"
-        self.transport.send(Message(self.source_id, destination, CMD_FILE_START, start_payload))
-        if not await self._wait_for_ack():
+        # --- FILE_START (window negotiation) ---
+        window, chunk_size, codec = await self._send_start(destination, filename, file_size)
+        if window is None:
             return False
 
         # --- FILE_CHUNK stream ---
         with open(filepath, "rb") as f:
-            offset = 0
-            while True:
-                chunk = f.read(self.chunk_size)
-                if not chunk:
-                    break
-                # Prepend 4-byte little-endian offset so the receiver can
-                # seek to the correct position and retransmissions are safe.
-                chunk_payload = struct.pack("<I", offset) + bytes(chunk)
-                success = False
-                for _ in range(self.max_retries):
-                    self.transport.send(
-                        Message(self.source_id, destination, CMD_FILE_CHUNK, chunk_payload)
-                    )
-                    if await self._wait_for_ack():
-                        success = True
-                        break
-                if not success:
-                    return False
-                offset += len(chunk)
+            if window > 1:
+                success = await self._send_windowed(destination, f, file_size, window, chunk_size, codec)
+            else:
+                success = await self._send_stop_and_wait(destination, f, chunk_size, codec)
+        if not success:
+            return False
 
         # --- FILE_END with SHA-256 ---
-        sha256 = calculate_sha256(filepath)
+        sha256 = self._file_digest(filepath)
         if sha256 is None:
             return False
+        self._expect_reply(destination)
         self.transport.send(Message(self.source_id, destination, CMD_FILE_END, sha256))
-        return await self._wait_for_ack()
+        return await self._wait_for_ack(destination)
+
+    async def broadcast_file(self, destinations, filepath, remote_filename=None, group="SAT"):
+        """Stream *filepath* once to *group* and repair each destination.
+
+        FILE_START and all chunks are sent to the broadcast *group* with no
+        per-chunk acknowledgement.  Each device in *destinations* is then
+        asked for its chunk bitmap, sent only the chunks it is missing and
+        finally sent FILE_END for hash verification.  A destination that
+        did not join the broadcast falls back to :meth:`send_file`.
+
+        Parameters:
+            destinations (list): Device IDs expected to receive the file.
+            filepath (str): Absolute path to the local file to send.
+            remote_filename (str | None): See :meth:`send_file`.
+            group (str): Broadcast destination the stream is addressed to.
+
+        Returns:
+            list: The subset of *destinations* that confirmed a matching
+            SHA-256 hash, in the original order.
+
+        Raises:
+            OSError: If *filepath* cannot be opened or read.
+        """
+        file_stat = os.stat(filepath)
+        file_size = file_stat[6]
+        filename = remote_filename if remote_filename is not None else filepath.replace("\\", "/").split("/")[-1]
+        chunk_size = self.chunk_size
+        codec = CODEC_LZ if self.compress else None
+
+        sha256 = self._file_digest(filepath)
+        if sha256 is None:
+            return []
+
+        start_payload = f"{filename},{file_size},1,{chunk_size}"
+        if codec is not None:
+            # Receivers without the codec ignore the session and are
+            # caught by the FILE_STATUS NACK → unicast fallback below.
+            start_payload += f",{codec}"
+        await self._send_paced(Message(self.source_id, group, CMD_FILE_START, start_payload))
 
-    async def _wait_for_ack(self):
+        confirmed = []
+        with open(filepath, "rb") as f:
+            offset = 0
+            while offset < file_size:
+                f.seek(offset)
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                chunk_payload = self._chunk_payload(offset, chunk, codec)
+                await self._send_paced(Message(self.source_id, group, CMD_FILE_CHUNK, chunk_payload))
+                offset += len(chunk)
+
+            for destination in destinations:
+                # Group-wide FILE_STATUS is unanswered but keeps every other
+                # receiver's inactivity timer alive while this one is repaired.
+                await self._send_paced(Message(self.source_id, group, CMD_FILE_STATUS, ""))
+                if await self._repair(destination, f, file_size, chunk_size, codec):
+                    self._expect_reply(destination)
+                    self.transport.send(Message(self.source_id, destination, CMD_FILE_END, sha256))
+                    if await self._wait_for_ack(destination):
+                        confirmed.append(destination)
+                        continue
+                # Missed the broadcast (or failed verification): unicast it
+                if await self.send_file(destination, filepath, remote_filename=filename):
+                    confirmed.append(destination)
+
+        return confirmed
+
+    async def _repair(self, destination, f, file_size, chunk_size, codec=None):
+        """Fill the gaps in one destination's broadcast copy.
+
+        Returns:
+            bool: ``True`` once the destination reports every chunk, or
+            ``False`` if it is not part of the broadcast session or is
+            still incomplete after *max_retries* repair rounds.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._expect_reply(destination)
+            self.transport.send(Message(self.source_id, destination, CMD_FILE_STATUS, ""))
+            status, bitmap = await self._wait_for_reply(destination)
+            if not status:
+                return False
+            missing = _missing_offsets(bitmap, file_size, chunk_size)
+            if not missing:
+                return True
+            if attempt == self.max_retries:
+                break
+            for offset in missing:
+                f.seek(offset)
+                chunk = f.read(chunk_size)
+                chunk_payload = self._chunk_payload(offset, chunk, codec)
+                await self._send_paced(Message(self.source_id, destination, CMD_FILE_CHUNK, chunk_payload))
+        return False
+
+    async def _send_paced(self, message):
+        """Send an unacknowledged message, waiting out a full TX buffer."""
+        while self.transport.send(message) is False:
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(self.broadcast_interval)
+
+    async def _send_start(self, destination, filename, file_size):
+        """Send FILE_START and agree on the window, chunk size and codec.
+
+        Returns:
+            tuple: ``(window, chunk_size, codec)`` to use for the chunk
+            stream (*codec* is ``None`` for raw chunks), or
+            ``(None, None, None)`` if the receiver rejected the transfer.
+        """
+        legacy_payload = f"{filename},{file_size}"
+
+        if self.window_size > 1 or self.compress:
+            payload = f"{legacy_payload},{self.window_size},{self.chunk_size}"
+            if self.compress:
+                payload += f",{CODEC_LZ}"
+            self._expect_reply(destination)
+            self.transport.send(Message(self.source_id, destination, CMD_FILE_START, payload))
+            status, reply = await self._wait_for_reply(destination)
+            if status:
+                return self._parse_window_reply(reply)
+            if status is None:
+                return None, None, None
+            # NACK: receiver predates windowing — retry in the legacy form
+
+        self._expect_reply(destination)
+        self.transport.send(Message(self.source_id, destination, CMD_FILE_START, legacy_payload))
+        if not await self._wait_for_ack(destination):
+            return None, None, None
+        return 1, self.chunk_size, None
+
+    def _parse_window_reply(self, reply):
+        """Parse the ``"window,chunk_size[,codec]"`` FILE_START ACK payload.
+
+        Values are clamped to what this sender offered.  An empty or
+        malformed reply selects stop-and-wait with raw chunks.
+        """
+        if isinstance(reply, (bytes, bytearray)):
+            reply = reply.decode("utf-8")
+        try:
+            parts = reply.split(",")
+            window = int(parts[0])
+            chunk_size = int(parts[1])
+        except (AttributeError, ValueError, IndexError):
+            return 1, self.chunk_size, None
+        window = max(1, min(window, self.window_size))
+        chunk_size = max(1, min(chunk_size, self.chunk_size))
+        codec = parts[2] if len(parts) > 2 and self.compress and parts[2] == CODEC_LZ else None
+        return window, chunk_size, codec
+
+    def _chunk_payload(self, offset, chunk, codec=None):
+        """Build a FILE_CHUNK payload for the data *chunk* read at *offset*.
+
+        With a *codec* the chunk is compressed and prefixed with a method
+        byte; chunks that would not shrink are sent stored.
+        """
+        # Prepend 4-byte little-endian offset so the receiver can
+        # seek to the correct position and retransmissions are safe.
+        header = struct.pack("<I", offset)
+        if codec is None:
+            return header + bytes(chunk)
+        packed = lz_compress(chunk)
+        if len(packed) < len(chunk):
+            return header + bytes((_CHUNK_LZ,)) + packed
+        return header + bytes((_CHUNK_STORED,)) + bytes(chunk)
+
+    def _send_chunk_at(self, destination, f, offset, chunk_size, codec=None):
+        """Read the chunk at *offset* from *f* and transmit it.
+
+        Returns:
+            int: Number of data bytes sent (0 at end of file).
+        """
+        f.seek(offset)
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return 0
+        chunk_payload = self._chunk_payload(offset, chunk, codec)
+        self.transport.send(Message(self.source_id, destination, CMD_FILE_CHUNK, chunk_payload))
+        return len(chunk)
+
+    async def _send_stop_and_wait(self, destination, f, chunk_size, codec=None):
+        """Send every chunk and wait for its ACK before sending the next."""
+        offset = 0
+        while True:
+            sent = 0
+            success = False
+            for _ in range(self.max_retries):
+                self._expect_reply(destination)
+                sent = self._send_chunk_at(destination, f, offset, chunk_size, codec)
+                if not sent:
+                    return True
+                if await self._wait_for_ack(destination):
+                    success = True
+                    break
+            if not success:
+                return False
+            offset += sent
+
+    async def _send_windowed(self, destination, f, file_size, window, chunk_size, codec=None):
+        """Send chunks with up to *window* outstanding at once.
+
+        ``base`` is the lowest unacknowledged offset and only advances on a
+        cumulative ACK.  A NACK names a missing offset which is resent once
+        until the window makes progress again.  A timeout resends the chunk
+        at ``base``; *max_retries* consecutive timeouts abort the transfer.
+        """
+        base = 0
+        next_offset = 0
+        span = window * chunk_size
+        retries = 0
+        resent = None
+
+        while base < file_size:
+            while next_offset < file_size and next_offset - base < span:
+                sent = self._send_chunk_at(destination, f, next_offset, chunk_size, codec)
+                if not sent:
+                    break
+                next_offset += sent
+
+            status, reply = await self._wait_for_reply(destination)
+            offset = _parse_offset(reply) if status is not None else None
+
+            if offset is None:
+                retries += 1
+                if retries >= self.max_retries:
+                    return False
+                self._send_chunk_at(destination, f, base, chunk_size, codec)
+                continue
+
+            if status:
+                if offset > base:
+                    base = min(offset, file_size)
+                    retries = 0
+                    resent = None
+            elif offset >= base and offset != resent:
+                self._send_chunk_at(destination, f, offset, chunk_size, codec)
+                resent = offset
+
+        return True
+
+    def _expect_reply(self, destination):
+        """Drop stale replies from *destination* before a request that starts a new exchange.
+
+        Windowed chunk replies are not dropped between waits: they are
+        cumulative and a queued NACK must still be acted on.
+        """
+        if self.replies is not None:
+            self.replies.discard(destination)
+
+    async def _wait_for_ack(self, source=None):
         """Wait for an ACK message within *self.timeout* seconds.
 
         Returns:
             bool: ``True`` if ACK received, ``False`` on NACK or timeout.
         """
+        status, _ = await self._wait_for_reply(source)
+        return status is True
+
+    async def _wait_for_reply(self, source=None):
+        """Wait for an ACK or NACK within *self.timeout* seconds.
+
+        Parameters:
+            source (str | None): Device the reply must come from.  Only
+                used with a :class:`ReplyQueue`.
+
+        Returns:
+            tuple: ``(status, payload)`` where *status* is ``True`` for ACK
+            (or a FILE_STATUS report), ``False`` for NACK and ``None`` on
+            timeout.
+        """
+        if self.replies is not None:
+            deadline = time.monotonic() + self.timeout
+            while True:
+                reply = self.replies.get(source)
+                if reply is not None:
+                    return reply
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, None
+                self.replies.event.clear()
+                try:
+                    await wait_for_ms(self.replies.event.wait(), 1000 * remaining)
+                except asyncio.TimeoutError:
+                    return None, None
+
         # --- NEW EVENT-DRIVEN LOGIC ---
         if self.ack_event is not None:
             try:
                 self.ack_event.clear()
                 # Use wait_for_ms to match CircuitPython compatibility
                 await wait_for_ms(self.ack_event.wait(), 1000 * self.timeout)
-
-                # Check the boolean status provided by the manager
-                if self.ack_status_callback:
-                    return self.ack_status_callback()
-                return False
             except asyncio.TimeoutError:
-                return False
+                return None, None
+
+            # Check the boolean status provided by the manager
+            status = bool(self.ack_status_callback()) if self.ack_status_callback else False
+            payload = self.ack_payload_callback() if self.ack_payload_callback else ""
+            return status, payload
 
         # --- OLD DIRECT-READ LOGIC (Fallback) ---
         try:
             msg = await wait_for_ms(self.transport.receive(), 1000 * self.timeout)
-            return msg is not None and msg.command == CMD_ACK
         except asyncio.TimeoutError:
-            return False
+            return None, None
+        if msg is None:
+            return False, None
+        return msg.command in (CMD_ACK, CMD_FILE_STATUS), msg.payload
 
 
 class FileTransferReceiver:
@@ -279,6 +866,8 @@ class FileTransferReceiver:
         source_id,
         staging_path=DEFAULT_STAGING_PATH,
         transfer_timeout_ms=DEFAULT_TRANSFER_TIMEOUT_MS,
+        max_window=DEFAULT_MAX_WINDOW,
+        max_chunk_size=MAX_CHUNK_SIZE,
     ):
         """Initialise the receiver.
 
@@ -290,11 +879,18 @@ class FileTransferReceiver:
             transfer_timeout_ms (int): Milliseconds of inactivity after which
                 an in-progress transfer is considered stale and aborted.
                 Pass 0 to disable the timeout.
+            max_window (int): Largest sliding window accepted from a sender
+                that offers windowed mode.  ``1`` still answers windowed
+                senders but keeps them at one chunk in flight.
+            max_chunk_size (int): Largest chunk size accepted in windowed
+                mode.
         """
         self.transport = transport
         self.source_id = source_id
         self.staging_path = staging_path
         self.transfer_timeout_ms = transfer_timeout_ms
+        self.max_window = max(1, max_window)
+        self.max_chunk_size = max_chunk_size
 
         self._state = self.IDLE
         self._expected_filename = None
@@ -304,26 +900,48 @@ class FileTransferReceiver:
         self._last_chunk_time = None
         self.last_transfer_ok = False  # True after a successful FILE_END hash verification
 
+        # Windowed-mode state (see module docstring)
+        self._windowed = False
+        self._chunk_limit = None
+        self._codec = None    # Negotiated chunk codec, None for raw chunks
+        self._contiguous = 0  # Every byte below this offset has been written
+        self._pending = {}    # offset -> length of chunks written beyond a gap
+
+        # Broadcast-session state: chunks are written silently and tracked
+        # in a bitmap that the sender polls with FILE_STATUS.
+        self._broadcast = False
+        self._chunk_map = None
+        self._muted = False
+
     async def handle_message(self, msg):
         """Process an incoming file-transfer protocol message.
 
         Call :meth:`tick` regularly (e.g. from the main application loop)
         to expire stale in-progress transfers when the sender goes silent.
 
+        Messages addressed to a broadcast destination, and every chunk of
+        a broadcast session, are processed without an ACK/NACK reply.
+
         Parameters:
             msg (Message): A message whose command is FILE_START, FILE_CHUNK,
-                or FILE_END.
+                FILE_END or FILE_STATUS.
 
         Returns:
             bool: ``True`` if the message was handled (regardless of outcome),
             ``False`` if the command is not a file-transfer command.
         """
+        self._muted = (
+            msg.destination in BROADCAST_DESTINATIONS
+            or (self._broadcast and msg.command == CMD_FILE_CHUNK)
+        )
         if msg.command == CMD_FILE_START:
             return await self._handle_start(msg)
         if msg.command == CMD_FILE_CHUNK:
             return await self._handle_chunk(msg)
         if msg.command == CMD_FILE_END:
             return await self._handle_end(msg)
+        if msg.command == CMD_FILE_STATUS:
+            return await self._handle_status(msg)
         return False
 
     def tick(self, current_time_ms):
@@ -360,13 +978,28 @@ class FileTransferReceiver:
         self.last_transfer_ok = False  # Reset for the new transfer
 
         try:
-            parts = msg.payload.split(",", 1)
+            parts = msg.payload.split(",")
             self._expected_filename = parts[0]
             self._expected_size = int(parts[1])
+            # Optional windowed-mode offer: "filename,size,window,chunk_size[,codec]"
+            if len(parts) >= 4:
+                window = max(1, min(int(parts[2]), self.max_window))
+                chunk_limit = max(1, min(int(parts[3]), self.max_chunk_size))
+            else:
+                window = None
+                chunk_limit = None
+            offered_codec = parts[4] if len(parts) >= 5 else None
         except (ValueError, IndexError, AttributeError):
             self._send_nack(msg.source)
             return True
 
+        codec = offered_codec if offered_codec in SUPPORTED_CODECS else None
+        if offered_codec is not None and codec is None and msg.destination in BROADCAST_DESTINATIONS:
+            # Cannot decode the broadcast stream; stay out of the session
+            # so the sender's FILE_STATUS query falls back to unicast.
+            self._state = self.IDLE
+            return True
+
         # Ensure the full staging directory tree exists
         staging_dir = "/".join(self.staging_path.split("/")[:-1])
         _makedirs(staging_dir)
@@ -378,8 +1011,24 @@ class FileTransferReceiver:
             self._staging_file = open(self.staging_path, "w+b")
             self._bytes_received = 0
             self._last_chunk_time = None
+            self._broadcast = msg.destination in BROADCAST_DESTINATIONS
+            self._windowed = window is not None and not self._broadcast
+            self._chunk_limit = chunk_limit
+            self._codec = codec
+            self._contiguous = 0
+            self._pending = {}
+            self._chunk_map = None
+            if self._broadcast:
+                self._chunk_limit = chunk_limit or DEFAULT_CHUNK_SIZE
+                chunk_count = (self._expected_size + self._chunk_limit - 1) // self._chunk_limit
+                self._chunk_map = bytearray((chunk_count + 7) // 8)
             self._state = self.RECEIVING
-            self._send_ack(msg.source)
+            if self._windowed and codec is not None:
+                self._send_ack(msg.source, f"{window},{chunk_limit},{codec}")
+            elif self._windowed:
+                self._send_ack(msg.source, f"{window},{chunk_limit}")
+            else:
+                self._send_ack(msg.source)
         except OSError:
             self._state = self.IDLE
             self._send_nack(msg.source)
@@ -407,28 +1056,100 @@ class FileTransferReceiver:
         offset = struct.unpack("<I", chunk_data[:_OFFSET_SIZE])[0]
         data = chunk_data[_OFFSET_SIZE:]
 
+        if self._codec is not None:
+            try:
+                data = self._decode_chunk(data)
+            except ValueError:
+                self._send_nack(msg.source)
+                return True
+
         # Reject writes that would extend the file beyond the declared size.
         if self._expected_size is not None and offset + len(data) > self._expected_size:
             self._send_nack(msg.source)
             return True
 
+        if self._chunk_limit is not None and len(data) > self._chunk_limit:
+            self._send_nack(msg.source)
+            return True
+
         try:
             self._staging_file.seek(offset)
             self._staging_file.write(data)
             self._bytes_received = max(self._bytes_received, offset + len(data))
             self._last_chunk_time = self._monotonic_ms()
-            self._send_ack(msg.source)
         except OSError:
             self._send_nack(msg.source)
+            return True
+
+        if self._broadcast:
+            if offset % self._chunk_limit == 0:
+                index = offset // self._chunk_limit
+                self._chunk_map[index >> 3] |= 1 << (index & 7)
+        elif self._windowed:
+            self._acknowledge_window(msg.source, offset, len(data))
+        else:
+            self._send_ack(msg.source)
 
         return True
 
+    def _decode_chunk(self, data):
+        """Strip the method byte of a compressed-mode chunk and expand it.
+
+        Raises:
+            ValueError: If the method is unknown or the data is corrupt.
+        """
+        if not data:
+            raise ValueError("Missing chunk method")
+        method = data[0]
+        if method == _CHUNK_STORED:
+            return data[1:]
+        if method == _CHUNK_LZ:
+            return lz_decompress(data[1:], self._chunk_limit)
+        raise ValueError("Unknown chunk method")
+
+    async def _handle_status(self, msg):
+        """Reply to FILE_STATUS with the broadcast session's chunk bitmap."""
+        if self._state != self.RECEIVING or not self._broadcast:
+            self._send_nack(msg.source)
+            return True
+        self._last_chunk_time = self._monotonic_ms()
+        if not self._muted:
+            self.transport.send(
+                Message(self.source_id, msg.source, CMD_FILE_STATUS, bytes(self._chunk_map))
+            )
+        return True
+
+    def _acknowledge_window(self, destination, offset, length):
+        """Reply to a windowed-mode chunk that has been written.
+
+        Chunks that leave a gap are remembered and answered with a NACK
+        naming the first missing offset; otherwise the contiguous mark is
+        advanced across any remembered chunks and ACKed cumulatively.
+        """
+        if offset > self._contiguous:
+            self._pending[offset] = length
+            self._send_nack(destination, str(self._contiguous))
+            return
+
+        end = offset + length
+        if end > self._contiguous:
+            self._contiguous = end
+        pending = self._pending
+        while self._contiguous in pending:
+            self._contiguous += pending.pop(self._contiguous)
+        if pending:
+            for stale in [k for k in pending if k < self._contiguous]:
+                del pending[stale]
+        self._send_ack(destination, str(self._contiguous))
+
     async def _handle_end(self, msg):
         if self._state != self.RECEIVING:
             self._send_nack(msg.source)
             return True
 
         self._close_staging_file()
+        self._broadcast = False
+        self._chunk_map = None
 
         expected_hash = msg.payload
         if isinstance(expected_hash, (bytes, bytearray)):
@@ -466,11 +1187,13 @@ class FileTransferReceiver:
             def get_monotonic_ms(): return int(_time_func() * 1000)
         return get_monotonic_ms()
 
-    def _send_ack(self, destination):
-        self.transport.send(Message(self.source_id, destination, CMD_ACK, ""))
+    def _send_ack(self, destination, payload=""):
+        if not self._muted:
+            self.transport.send(Message(self.source_id, destination, CMD_ACK, payload))
 
-    def _send_nack(self, destination):
-        self.transport.send(Message(self.source_id, destination, CMD_NACK, ""))
+    def _send_nack(self, destination, payload=""):
+        if not self._muted:
+            self.transport.send(Message(self.source_id, destination, CMD_NACK, payload))
 
     def _close_staging_file(self):
         if self._staging_file is not None:
@@ -16,8 +16,13 @@ class Message:
     - str: Text data or text-encoded values (e.g., "0100", "HELLO")
     - bytes: Binary packed data (e.g., struct-packed values for performance)
     - tuple/list: Numeric values (optimization to reduce string allocations)
+
+    Uses __slots__ so each instance is a fixed-size object without a
+    per-instance dict.
     """
 
+    __slots__ = ("source", "destination", "command", "payload")
+
     def __init__(self, source, destination, command, payload=""):
         """Initialize a Message.
 
@@ -49,3 +54,44 @@ class Message:
         return (self.destination == other.destination and
                 self.command == other.command and
                 self.payload == other.payload)
+
+
+class MessagePool:
+    """Free list of Message objects for the receive path.
+
+    Transports draw decoded messages from the pool instead of constructing
+    new ones; consumers hand them back with ``release()`` once they have
+    finished with the fields. Messages that are never released are simply
+    garbage collected, so releasing is optional.
+    """
+
+    def __init__(self, size=16):
+        """Initialize an empty pool.
+
+        Parameters:
+            size (int): Maximum number of idle messages kept for reuse.
+                0 disables pooling.
+        """
+        self.size = size
+        self._free = []
+
+    def acquire(self, source, destination, command, payload=""):
+        """Return a Message with the given fields, reusing an idle one if available."""
+        if self._free:
+            msg = self._free.pop()
+            msg.source = source
+            msg.destination = destination
+            msg.command = command
+            msg.payload = payload
+            return msg
+        return Message(source, destination, command, payload)
+
+    def release(self, msg):
+        """Return a message to the pool.
+
+        The caller must not use *msg* afterwards; it will be handed out
+        again by a later ``acquire()``.
+        """
+        if len(self._free) < self.size:
+            msg.payload = None  # Drop the payload reference while idle
+            self._free.append(msg)
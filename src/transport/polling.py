@@ -0,0 +1,183 @@
+"""Adaptive polling and latency measurement for UART workers.
+
+CircuitPython's ``busio.UART`` cannot wake a task when bytes arrive, so the
+transport workers have to poll ``in_waiting``.  ``AdaptivePoller`` chooses
+how long each worker sleeps between polls:
+
+- Bytes already waiting: yield only (0 s) and read them immediately.
+- A frame partially received: poll again after the time the next few bytes
+  take on the wire at the configured baud rate, never less than
+  ``min_delay``.
+- Traffic just handled: snap back to ``min_delay``.
+- Idle: back off exponentially up to ``max_delay``, but wake in time for
+  the next frame when frames have been arriving at a steady interval
+  (periodic STATUS / heartbeat traffic).
+
+``LatencyHistogram`` is a fixed-bucket histogram used to report how long
+messages wait between arriving and being dispatched.
+"""
+
+import time
+
+
+def monotonic_us():
+    """Return a monotonic timestamp in microseconds.
+
+    Uses ``time.monotonic_ns()`` where available and falls back to
+    ``time.monotonic()`` for builds without nanosecond resolution.
+    """
+    try:
+        return time.monotonic_ns() // 1000
+    except AttributeError:
+        return int(time.monotonic() * 1000000)
+
+
+class AdaptivePoller:
+    """Chooses the sleep between polls of a UART from recent traffic."""
+
+    PARTIAL_FRAME_BYTES = 8  # Bytes to wait for while a frame is incomplete
+
+    def __init__(self, baudrate=None, min_delay=0.001, max_delay=0.02, backoff=2):
+        """Initialize the poller.
+
+        Parameters:
+            baudrate (int, optional): Line rate used to estimate when the rest
+                of a partial frame arrives. None uses ``min_delay`` instead.
+            min_delay (float): Shortest sleep in seconds while traffic flows.
+            max_delay (float): Longest sleep in seconds when the link is idle.
+            backoff (float): Factor the idle sleep grows by on each empty poll.
+        """
+        self.byte_time = 10.0 / baudrate if baudrate else 0.0  # 8N1: 10 bits per byte
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.delay = min_delay
+        self._last_arrival = None
+        self._interval = None
+
+    def next_delay(self, progress, in_waiting=0, partial=False, now=None):
+        """Return how many seconds to sleep before the next poll.
+
+        Parameters:
+            progress (bool): A complete frame was handled on this pass.
+            in_waiting (int): Bytes still waiting in the UART.
+            partial (bool): A frame is partially received.
+            now (int, optional): Current time from monotonic_us().
+        """
+        if now is None:
+            now = monotonic_us()
+
+        if progress:
+            self._note_arrival(now)
+
+        if in_waiting:
+            self.delay = self.min_delay
+            return 0
+
+        if partial:
+            self.delay = self.min_delay
+            return max(self.min_delay, min(self.max_delay, self.byte_time * self.PARTIAL_FRAME_BYTES))
+
+        if progress:
+            self.delay = self.min_delay
+            return self.delay
+
+        # Idle: exponential backoff
+        self.delay = min(self.delay * self.backoff, self.max_delay)
+        delay = self.delay
+
+        # Wake for the next frame of a steady stream instead of sleeping past it
+        if self._interval is not None:
+            until = (self._last_arrival + self._interval - now) / 1000000
+            if until > 0:
+                delay = min(delay, max(self.min_delay, until))
+            elif -until * 1000000 < self._interval:
+                delay = self.min_delay  # Frame is due; poll tightly until it lands
+        return delay
+
+    def _note_arrival(self, now):
+        last = self._last_arrival
+        self._last_arrival = now
+        if last is None:
+            return
+        gap = now - last
+        if gap < self.max_delay * 1000000:
+            return  # Part of a burst, not the stream's period
+        if self._interval is None or gap > 4 * self._interval:
+            self._interval = gap
+        else:
+            self._interval += (gap - self._interval) // 4
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100)
+
+    def __init__(self, buckets=None):
+        """Initialize an empty histogram.
+
+        Parameters:
+            buckets (tuple, optional): Ascending upper bucket edges in ms.
+                Values above the last edge land in an overflow bucket.
+        """
+        self.buckets = tuple(buckets or self.BUCKETS_MS)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms):
+        """Add one latency sample in milliseconds."""
+        index = 0
+        for edge in self.buckets:
+            if latency_ms <= edge:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def percentile(self, pct):
+        """Return the upper bucket edge below which pct percent of samples fall.
+
+        Samples in the overflow bucket report ``max_ms``.
+        """
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= target and n:
+                return self.buckets[index] if index < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def snapshot(self):
+        """Return the histogram as a dict suitable for JSON telemetry."""
+        return {
+            "buckets_ms": list(self.buckets),
+            "counts": list(self.counts),
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms,
+        }
+
+    def reset(self):
+        """Clear all samples."""
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def format(self):
+        """Return a one-line text rendering of the bucket counts."""
+        parts = []
+        for index, n in enumerate(self.counts):
+            label = f"<={self.buckets[index]}" if index < len(self.buckets) else f">{self.buckets[-1]}"
+            parts.append(f"{label}:{n}")
+        return " ".join(parts)
@@ -34,6 +34,7 @@ CMD_LEDRAINBOW = "LEDRAINBOW"
 CMD_LEDGLITCH = "LEDGLITCH"
 CMD_LEDPROG = "LEDPROG"
 CMD_LEDVU = "LEDVU"
+CMD_LEDBATCH = "LEDBATCH"
 
 # Display Commands
 CMD_DSP = "DSP"
@@ -52,6 +53,7 @@ CMD_GLOBAL_RAIN = "GLOBALRAIN"
 CMD_FILE_START = "FILE_START"
 CMD_FILE_CHUNK = "FILE_CHUNK"
 CMD_FILE_END = "FILE_END"
+CMD_FILE_STATUS = "FILE_STATUS"
 
 # Firmware Update Handshake Commands
 CMD_VERSION_CHECK = "VERSION_CHECK"
@@ -85,6 +87,7 @@ COMMAND_MAP = {
     "LEDGLITCH": 0x16,
     "LEDPROG": 0x17,
     "LEDVU": 0x18,
+    "LEDBATCH": 0x19,
 
     # Display commands
     "DSP": 0x20,
@@ -103,6 +106,7 @@ COMMAND_MAP = {
     CMD_FILE_START: 0x40,
     CMD_FILE_CHUNK: 0x41,
     CMD_FILE_END: 0x42,
+    CMD_FILE_STATUS: 0x43,
 
     # Firmware update handshake commands
     CMD_VERSION_CHECK: 0x50,
@@ -127,7 +131,7 @@ DEST_MAP = {
 # or explicitly list them if you want strict control.
 LED_COMMANDS = {k for k in COMMAND_MAP if k.startswith("LED")}
 DSP_COMMANDS = {k for k in COMMAND_MAP if k.startswith("DSP")}
-FILE_COMMANDS = {CMD_FILE_START, CMD_FILE_CHUNK, CMD_FILE_END}
+FILE_COMMANDS = {CMD_FILE_START, CMD_FILE_CHUNK, CMD_FILE_END, CMD_FILE_STATUS}
 UPDATE_COMMANDS = {CMD_VERSION_CHECK, CMD_UPDATE_START, CMD_UPDATE_WAIT}
 GLOBAL_ANIMATION_COMMANDS = {CMD_GLOBAL_RAINBOW, CMD_GLOBAL_RAIN}
 
@@ -141,6 +145,9 @@ SYSTEM_COMMANDS = {
     CMD_MODE,
 }
 
+# Destinations that every satellite on the chain processes (and relays)
+BROADCAST_DESTINATIONS = {"ALL", "SAT"}
+
 # Reverse mapping for decoding
 COMMAND_REVERSE_MAP = {v: k for k, v in COMMAND_MAP.items()}
 DEST_REVERSE_MAP = {v: k for k, v in DEST_MAP.items()}
@@ -167,6 +174,8 @@ PAYLOAD_SCHEMAS = {
     # Core commands
     CMD_HELLO: {'type': ENCODING_RAW_TEXT, 'desc': 'Hello message with optional text'},
     CMD_MODE: {'type': ENCODING_RAW_TEXT, 'desc': 'Operating mode: IDLE, ACTIVE, or SLEEP'},
+    CMD_ACK: {'type': ENCODING_RAW_TEXT, 'desc': 'Optional detail, e.g. cumulative file offset or "window,chunk_size"'},
+    CMD_NACK: {'type': ENCODING_RAW_TEXT, 'desc': 'Optional detail, e.g. missing file offset to retransmit'},
     "ID_ASSIGN": {'type': ENCODING_RAW_TEXT, 'desc': 'Device ID string like "0100"'},
     "NEW_SAT": {'type': ENCODING_RAW_TEXT, 'desc': 'Satellite type ID like "01"'},
     "ERROR": {'type': ENCODING_RAW_TEXT, 'desc': 'Error description text'},
@@ -184,6 +193,7 @@ PAYLOAD_SCHEMAS = {
     "LEDGLITCH": {'type': ENCODING_NUMERIC_BYTES, 'desc': 'colon-separated palette indices (e.g. "0:1:2:3"),duration,speed'},
     "LEDPROG": {'type': ENCODING_NUMERIC_BYTES, 'desc': 'percentage,palette_index,background_palette_index,priority'},
     "LEDVU": {'type': ENCODING_NUMERIC_BYTES, 'desc': 'percentage,low_palette_index,mid_palette_index,high_palette_index,priority'},
+    "LEDBATCH": {'type': ENCODING_RAW_BYTES, 'desc': '6-byte records of led_index,palette_index,duration (u16 LE, 0.1 s),brightness (0-255),priority'},
 
     # Display commands
     "DSP": {'type': ENCODING_RAW_TEXT, 'desc': 'Display message text'},
@@ -192,7 +202,7 @@ PAYLOAD_SCHEMAS = {
 
     # Power and status - use floats for voltage/current measurements
     "POWER": {'type': ENCODING_FLOATS, 'desc': 'voltage1,voltage2,current'},
-    "STATUS": {'type': ENCODING_NUMERIC_BYTES, 'desc': 'status bytes (variable length)'},
+    "STATUS": {'type': ENCODING_NUMERIC_BYTES, 'desc': 'binary HID status packet (full or delta), or legacy ASCII status bytes'},
 
     # Encoder
     "SETENC": {'type': ENCODING_NUMERIC_WORDS, 'desc': 'encoder position'},
@@ -203,12 +213,13 @@ PAYLOAD_SCHEMAS = {
     CMD_GLOBAL_RAIN: {'type': ENCODING_FLOATS, 'desc': 'speed (sec/step), density (0.0-1.0)'},
 
     # File Transfer
-    CMD_FILE_START: {'type': ENCODING_RAW_TEXT, 'desc': 'filename,total_size e.g. "firmware.bin,4096"'},
+    CMD_FILE_START: {'type': ENCODING_RAW_TEXT, 'desc': 'filename,total_size[,window,chunk_size[,codec]] e.g. "firmware.bin,4096,8,128,lz"'},
     CMD_FILE_CHUNK: {'type': ENCODING_RAW_BYTES, 'desc': 'raw binary chunk data'},
     CMD_FILE_END: {'type': ENCODING_RAW_TEXT, 'desc': 'SHA256 hex digest of the complete file'},
+    CMD_FILE_STATUS: {'type': ENCODING_RAW_BYTES, 'desc': 'empty request, or reply bitmap of received chunks (bit i = chunk i)'},
 
     # Firmware Update Handshake
-    CMD_VERSION_CHECK: {'type': ENCODING_RAW_TEXT, 'desc': 'Firmware version string e.g. "0.4.0"'},
+    CMD_VERSION_CHECK: {'type': ENCODING_RAW_TEXT, 'desc': 'version[,file fingerprints] e.g. "0.4.0" or "0.4.0,1a2b3c4d5e6f7a8b"'},
     CMD_UPDATE_START: {'type': ENCODING_RAW_TEXT, 'desc': 'file_count,total_bytes e.g. "5,12800"'},
     CMD_UPDATE_WAIT: {'type': ENCODING_RAW_TEXT, 'desc': 'Update in progress; retry version check later'},
 }
@@ -2,9 +2,10 @@
 
 import asyncio
 import struct
-from utilities import cobs_encode, cobs_decode, calculate_crc8
-from .message import Message
+from utilities import cobs_encode, cobs_encode_into, cobs_decode_into, calculate_crc8, calculate_crc8_range
+from .message import Message, MessagePool
 from .base_transport import BaseTransport
+from .polling import AdaptivePoller, LatencyHistogram, monotonic_us
 
 #region --- Helper Functions for Encoding/Decoding ---
 def _encode_destination(dest_str, dest_map):
@@ -33,7 +34,7 @@ def _encode_destination(dest_str, dest_map):
         f"Expected 4-digit numeric ID (e.g., '0101') or mapped destination string (e.g., 'ALL', 'SAT')."
     )
 
-def _decode_destination(data, offset, dest_reverse_map, max_index_value):
+def _decode_destination(data, offset, dest_reverse_map, max_index_value, end=None):
     """Decode destination from bytes.
 
     Parameters:
@@ -41,11 +42,15 @@ def _decode_destination(data, offset, dest_reverse_map, max_index_value):
         offset (int): Starting offset for destination
         dest_reverse_map (dict): Reverse mapping of byte values to destination strings
         max_index_value (int): Maximum value for single-byte index
+        end (int, optional): End of the packet content within data. Defaults to len(data),
+            letting callers parse in place inside a larger scratch buffer.
 
     Returns:
         tuple: (dest_str, bytes_consumed)
     """
-    if offset >= len(data):
+    if end is None:
+        end = len(data)
+    if offset >= end:
         raise ValueError("Insufficient data for destination")
 
     dest_byte = data[offset]
@@ -55,7 +60,7 @@ def _decode_destination(data, offset, dest_reverse_map, max_index_value):
         return dest_reverse_map[dest_byte], 1
 
     # Check if next byte is part of ID (indices are typically < MAX_INDEX_VALUE)
-    if offset + 1 < len(data) and data[offset + 1] < max_index_value:
+    if offset + 1 < end and data[offset + 1] < max_index_value:
         # Two-byte ID: type + index
         type_id = dest_byte
         index = data[offset + 1]
@@ -94,44 +99,23 @@ def _decode_command(cmd_byte, command_reverse_map):
 
     raise ValueError(f"Unknown command byte: 0x{cmd_byte:02X}")
 
-def _encode_payload(payload_str, cmd_schema=None, encoding_constants=None):
-    """Encode payload string/list/tuple/bytes to bytes with explicit type handling.
-
-    This function eliminates the fragility of "magic" type guessing by using
-    command-specific schemas that explicitly define expected data types.
-
-    Parameters:
-        payload_str (str, list, tuple, or bytes): Payload to encode. Can be:
-            - str: Comma-separated values or text
-            - list/tuple: Direct numeric values (avoids string parsing overhead)
-            - bytes: Already encoded payload (returned as-is)
-        cmd_schema (dict, optional): Schema defining payload structure
-        encoding_constants (dict, optional): Dictionary with ENCODING_* constants
+_WORD_FORMATS = {}
+_FLOAT_FORMATS = {}
 
-    Returns:
-        bytes: Encoded payload
-    """
-    if not payload_str:
-        return b''
-    if isinstance(payload_str, (bytes, bytearray)):
-        return bytes(payload_str)
+def _struct_format(cache, code, count):
+    """Return the cached little-endian struct format for count values of code."""
+    fmt = cache.get(count)
+    if fmt is None:
+        fmt = f'<{count}{code}'
+        cache[count] = fmt
+    return fmt
 
+def _encode_heuristic(payload):
+    """Encode a payload without a schema by guessing from its Python type."""
     # Efficient list/tuple packing
-    if isinstance(payload_str, (list, tuple)):
-        if cmd_schema and encoding_constants:
-            etype = cmd_schema.get('type')
-            if etype == encoding_constants.get('ENCODING_NUMERIC_BYTES'):
-                return bytes([int(x) for x in payload_str])
-            elif etype == encoding_constants.get('ENCODING_NUMERIC_WORDS'):
-                return b''.join([struct.pack('<h', int(x)) for x in payload_str])
-            elif etype == encoding_constants.get('ENCODING_FLOATS'):
-                return b''.join([struct.pack('<f', float(x)) for x in payload_str])
-            elif etype == encoding_constants.get('ENCODING_RAW_BYTES'):
-                return bytes(payload_str)
-
-        # Heuristic fallback
+    if isinstance(payload, (list, tuple)):
         out = bytearray()
-        for v in payload_str:
+        for v in payload:
             if isinstance(v, float):
                 out.extend(struct.pack('<f', v))
             elif isinstance(v, int):
@@ -141,43 +125,11 @@ def _encode_payload(payload_str, cmd_schema=None, encoding_constants=None):
             else: out.extend(struct.pack('<f', float(v)))
         return bytes(out)
 
-    if cmd_schema and encoding_constants:
-        etype = cmd_schema.get('type')
-        if etype == encoding_constants.get('ENCODING_RAW_TEXT'):
-            return payload_str.encode('utf-8')
-        elif etype == encoding_constants.get('ENCODING_NUMERIC_BYTES'):
-            # Parse comma-separated integers as bytes
-            if ',' in payload_str:
-                values = [int(x.strip()) for x in payload_str.split(',')]
-                return bytes(values)
-            else:
-                return bytes([int(payload_str)])
-        elif etype == encoding_constants.get('ENCODING_NUMERIC_WORDS'):
-            # Parse comma-separated integers as 16-bit words
-            if ',' in payload_str:
-                values = [int(x.strip()) for x in payload_str.split(',')]
-            else:
-                values = [int(payload_str)]
-            # Validate signed 16-bit range
-            if not all(-32768 <= v <= 32767 for v in values):
-                raise ValueError(f'Word values must be in range -32768 to 32767')
-            return b''.join([struct.pack('<h', v) for v in values])
-        elif etype == encoding_constants.get('ENCODING_FLOATS'):
-            # Parse comma-separated floats
-            try:
-                if ',' in payload_str:
-                    values = [float(x.strip()) for x in payload_str.split(',')]
-                else:
-                    values = [float(payload_str)]
-                return b''.join([struct.pack('<f', v) for v in values])
-            except ValueError as e:
-                raise ValueError(f'Invalid float format: {e}')
-
     # Fallback for comma-separated strings
     # Try to parse as comma-separated numeric values (backward compatibility)
-    if ',' in payload_str:
+    if ',' in payload:
         try:
-            parts = payload_str.split(',')
+            parts = payload.split(',')
             # Try to parse as integers
             values = [int(p.strip()) for p in parts]
             # Pack as bytes if all values fit in byte range
@@ -188,7 +140,135 @@ def _encode_payload(payload_str, cmd_schema=None, encoding_constants=None):
             pass  # Not numeric, treat as text
 
     # Default to text encoding
-    return payload_str.encode('utf-8')
+    return payload.encode('utf-8')
+
+def _encode_text(payload):
+    """ENCODING_RAW_TEXT encoder."""
+    if isinstance(payload, str):
+        return payload.encode('utf-8')
+    return _encode_heuristic(payload)
+
+def _encode_numeric_bytes(payload):
+    """ENCODING_NUMERIC_BYTES encoder."""
+    if isinstance(payload, str):
+        # Parse comma-separated integers as bytes
+        if ',' in payload:
+            return bytes([int(x.strip()) for x in payload.split(',')])
+        return bytes([int(payload)])
+    return bytes([int(x) for x in payload])
+
+def _encode_numeric_words(payload):
+    """ENCODING_NUMERIC_WORDS encoder."""
+    if isinstance(payload, str):
+        # Parse comma-separated integers as 16-bit words
+        values = [int(x.strip()) for x in payload.split(',')]
+        # Validate signed 16-bit range
+        if not all(-32768 <= v <= 32767 for v in values):
+            raise ValueError(f'Word values must be in range -32768 to 32767')
+    else:
+        values = [int(x) for x in payload]
+    return struct.pack(_struct_format(_WORD_FORMATS, 'h', len(values)), *values)
+
+def _encode_floats(payload):
+    """ENCODING_FLOATS encoder."""
+    if isinstance(payload, str):
+        # Parse comma-separated floats
+        try:
+            values = [float(x.strip()) for x in payload.split(',')]
+        except ValueError as e:
+            raise ValueError(f'Invalid float format: {e}')
+    else:
+        values = [float(x) for x in payload]
+    return struct.pack(_struct_format(_FLOAT_FORMATS, 'f', len(values)), *values)
+
+def _encode_raw_bytes(payload):
+    """ENCODING_RAW_BYTES encoder."""
+    if isinstance(payload, str):
+        return _encode_heuristic(payload)
+    return bytes(payload)
+
+def _decode_heuristic(payload):
+    """Decode a payload without a schema: printable UTF-8 as str, else bytes."""
+    if isinstance(payload, memoryview):
+        payload = bytes(payload)
+    try:
+        decoded = payload.decode('utf-8')
+        if all(32 <= ord(c) <= 126 or c in '\n\r\t' for c in decoded):
+            return decoded
+    except UnicodeDecodeError:
+        # Fallback: return raw bytes if payload is not valid UTF-8
+        return payload
+
+def _decode_text(payload):
+    """ENCODING_RAW_TEXT decoder."""
+    return str(payload, 'utf-8')
+
+def _decode_numeric_bytes(payload):
+    """ENCODING_NUMERIC_BYTES decoder."""
+    return tuple(payload)
+
+def _decode_numeric_words(payload):
+    """ENCODING_NUMERIC_WORDS decoder."""
+    return struct.unpack(_struct_format(_WORD_FORMATS, 'h', len(payload) // 2), payload)
+
+def _decode_floats(payload):
+    """ENCODING_FLOATS decoder."""
+    return struct.unpack(_struct_format(_FLOAT_FORMATS, 'f', len(payload) // 4), payload)
+
+def _decode_raw_bytes(payload):
+    """ENCODING_RAW_BYTES decoder."""
+    return bytes(payload)
+
+# Payload codecs by ENCODING_* constant name
+_PAYLOAD_ENCODERS = {
+    'ENCODING_RAW_TEXT': _encode_text,
+    'ENCODING_NUMERIC_BYTES': _encode_numeric_bytes,
+    'ENCODING_NUMERIC_WORDS': _encode_numeric_words,
+    'ENCODING_FLOATS': _encode_floats,
+    'ENCODING_RAW_BYTES': _encode_raw_bytes,
+}
+_PAYLOAD_DECODERS = {
+    'ENCODING_RAW_TEXT': _decode_text,
+    'ENCODING_NUMERIC_BYTES': _decode_numeric_bytes,
+    'ENCODING_NUMERIC_WORDS': _decode_numeric_words,
+    'ENCODING_FLOATS': _decode_floats,
+    'ENCODING_RAW_BYTES': _decode_raw_bytes,
+}
+
+def _lookup_codec(codecs, cmd_schema, encoding_constants, default):
+    """Return the codec in codecs for the schema's encoding type, or default."""
+    if cmd_schema and encoding_constants:
+        etype = cmd_schema.get('type')
+        for name, codec in codecs.items():
+            if etype == encoding_constants.get(name):
+                return codec
+    return default
+
+def _encode_payload(payload_str, cmd_schema=None, encoding_constants=None):
+    """Encode payload string/list/tuple/bytes to bytes with explicit type handling.
+
+    This function eliminates the fragility of "magic" type guessing by using
+    command-specific schemas that explicitly define expected data types.
+    UARTTransport resolves the encoder once per command when it is
+    constructed; this function resolves it on every call.
+
+    Parameters:
+        payload_str (str, list, tuple, or bytes): Payload to encode. Can be:
+            - str: Comma-separated values or text
+            - list/tuple: Direct numeric values (avoids string parsing overhead)
+            - bytes: Already encoded payload (returned as-is)
+        cmd_schema (dict, optional): Schema defining payload structure
+        encoding_constants (dict, optional): Dictionary with ENCODING_* constants
+
+    Returns:
+        bytes: Encoded payload
+    """
+    if not payload_str:
+        return b''
+    if isinstance(payload_str, (bytes, bytearray)):
+        return bytes(payload_str)
+    encoder = _lookup_codec(_PAYLOAD_ENCODERS, cmd_schema, encoding_constants, _encode_heuristic)
+    return encoder(payload_str)
 
 def _decode_payload(payload_bytes, cmd_schema=None, encoding_constants=None):
     """Decode payload bytes to appropriate type with explicit type handling.
@@ -198,7 +278,8 @@ def _decode_payload(payload_bytes, cmd_schema=None, encoding_constants=None):
     to reduce string allocations and GC pressure.
 
     Parameters:
-        payload_bytes (bytes): Raw binary payload data
+        payload_bytes (bytes or memoryview): Raw binary payload data. A memoryview
+            into the RX scratch buffer is copied exactly once, into the result.
         cmd_schema (dict, optional): Schema defining payload structure
         encoding_constants (dict, optional): Dictionary with ENCODING_* constants
 
@@ -210,28 +291,8 @@ def _decode_payload(payload_bytes, cmd_schema=None, encoding_constants=None):
     """
     if not payload_bytes:
         return ""
-    if cmd_schema and encoding_constants:
-        etype = cmd_schema.get('type')
-        if etype == encoding_constants.get('ENCODING_RAW_TEXT'):
-            return payload_bytes.decode('utf-8')
-        if etype == encoding_constants.get('ENCODING_NUMERIC_BYTES'):
-            return tuple(payload_bytes)
-        if etype == encoding_constants.get('ENCODING_NUMERIC_WORDS'):
-            count = len(payload_bytes) // 2
-            return struct.unpack(f'<{count}h', payload_bytes)
-        if etype == encoding_constants.get('ENCODING_FLOATS'):
-            count = len(payload_bytes) // 4
-            return struct.unpack(f'<{count}f', payload_bytes)
-        if etype == encoding_constants.get('ENCODING_RAW_BYTES'):
-            return bytes(payload_bytes)
-
-    try:
-        decoded = payload_bytes.decode('utf-8')
-        if all(32 <= ord(c) <= 126 or c in '\n\r\t' for c in decoded):
-            return decoded
-    except UnicodeDecodeError:
-        # Fallback: return raw bytes if payload is not valid UTF-8
-        return payload_bytes
+    decoder = _lookup_codec(_PAYLOAD_DECODERS, cmd_schema, encoding_constants, _decode_heuristic)
+    return decoder(payload_bytes)
 #endregion
 
 class _SimpleAsyncQueue:
@@ -280,8 +341,12 @@ class UARTTransport(BaseTransport):
     MAX_PACKET_SIZE = 512    # Maximum packet size for scanning and scratchpad
     BATCH_LIMIT = 32         # Max messages to process per loop iteration
     MAX_TX_CHUNK = 256        # Max bytes to transmit per iteration to prevent event loop blocking
+    MESSAGE_POOL_SIZE = 16   # Idle Message objects kept for reuse by the RX path
+    DEST_CACHE_SIZE = 64     # Max cached destination encodings in each direction
+    RELAY_MAX_DELAY = 0.005  # Longest relay idle sleep; bounds first-packet latency down the chain
 
-    def __init__(self, uart_hw, command_map=None, dest_map=None, max_index_value=100, payload_schemas=None):
+    def __init__(self, uart_hw, command_map=None, dest_map=None, max_index_value=100, payload_schemas=None,
+                 baudrate=None):
         """Initialize UART transport.
 
         Parameters:
@@ -308,6 +373,8 @@ class UARTTransport(BaseTransport):
                 Defaults to 100.
             payload_schemas (dict, optional): Command-specific payload schemas defining
                 encoding/decoding types. If None, uses heuristic encoding.
+            baudrate (int, optional): Line rate used for RX polling and latency
+                estimates. Defaults to ``uart_hw.baudrate`` when available.
         """
         self.uart = uart_hw
 
@@ -328,6 +395,23 @@ class UARTTransport(BaseTransport):
             'ENCODING_RAW_BYTES': 'raw_bytes',
         }
 
+        # Per-command codec tables compiled once, so the hot path dispatches
+        # with a single lookup instead of comparing encoding names.
+        #   _tx_codecs: command string -> (command byte, payload encoder)
+        #   _rx_codecs: command byte   -> (command string, payload decoder)
+        self._tx_codecs = {}
+        self._rx_codecs = [None] * 256
+        for cmd_str, cmd_byte in self.command_map.items():
+            schema = self.payload_schemas.get(cmd_str)
+            encoder = _lookup_codec(_PAYLOAD_ENCODERS, schema, self.encoding_constants, _encode_heuristic)
+            decoder = _lookup_codec(_PAYLOAD_DECODERS, schema, self.encoding_constants, _decode_heuristic)
+            self._tx_codecs[cmd_str] = (cmd_byte, encoder)
+            self._rx_codecs[cmd_byte] = (cmd_str, decoder)
+
+        # Destination caches: ID string -> encoded bytes, and packed ID -> string
+        self._dest_encode_cache = {}
+        self._dest_decode_cache = {}
+
         # RX Queue implemented as zero-allocation ring buffer
         self._rx_buf_size = self.RING_BUFFER_SIZE
         self._rx_buffer = bytearray(self._rx_buf_size)
@@ -336,11 +420,26 @@ class UARTTransport(BaseTransport):
         self._rx_tail = 0
         self._rx_queue = _SimpleAsyncQueue()
         self._rx_task = None
+        # Delimiter scan resume point: bytes past _rx_scan_tail already known to be non-zero
+        self._rx_scan_tail = 0
+        self._rx_scan_pos = 0
 
         # Linear Scratchpad for Packet Unwrapping
         self._packet_rx_buf = bytearray(self.MAX_PACKET_SIZE)
         self._packet_rx_mv = memoryview(self._packet_rx_buf)
 
+        # Scratchpads for COBS decode (RX) and encode (TX)
+        self._packet_dec_buf = bytearray(self.MAX_PACKET_SIZE)
+        self._packet_dec_mv = memoryview(self._packet_dec_buf)
+        self._packet_tx_buf = bytearray(self.MAX_PACKET_SIZE + self.MAX_PACKET_SIZE // 254 + 2)
+        self._packet_tx_mv = memoryview(self._packet_tx_buf)
+
+        # Unframed TX scratchpad: SRC + DEST + CMD + PAYLOAD + CRC
+        self._frame_tx_buf = bytearray(self.MAX_PACKET_SIZE)
+
+        # Recycled Message objects for decoded packets (see release())
+        self.message_pool = MessagePool(self.MESSAGE_POOL_SIZE)
+
         # TX Queue implemented as zero-allocation ring buffer
         self._tx_buffer_size = self.RING_BUFFER_SIZE
         self._tx_buffer = bytearray(self._tx_buffer_size)
@@ -352,6 +451,16 @@ class UARTTransport(BaseTransport):
 
         # Relay task
         self._relay_task = None
+        self._relay_poller = None
+
+        # Adaptive RX polling and arrival-to-dispatch latency
+        if baudrate is None:
+            baudrate = getattr(uart_hw, "baudrate", None)
+        self.baudrate = baudrate if isinstance(baudrate, int) and baudrate > 0 else None
+        self._byte_time_us = 10000000 // self.baudrate if self.baudrate else 0  # 8N1
+        self.rx_poller = AdaptivePoller(self.baudrate)
+        self.rx_latency = LatencyHistogram()
+        self._rx_arrival_us = None  # Estimated arrival of the byte at the RX tail
 
         # Error tracking
         self._rx_error_count = 0
@@ -400,6 +509,40 @@ class UARTTransport(BaseTransport):
 
         self._tx_event.set()  # Signal TX worker that new data is available
 
+    def _frame_to_tx_buffer(self, length):
+        """COBS-encode the frame in the TX scratchpad into the TX ring buffer.
+
+        When the worst-case encoded packet fits contiguously before the end of
+        the ring buffer it is encoded in place there. Otherwise it is encoded
+        into the linear TX scratchpad and copied with wrap-around handling.
+
+        Parameters:
+            length (int): Number of frame bytes in the TX scratchpad.
+
+        Raises:
+            BufferError: If there is not enough space in the TX buffer.
+        """
+        worst = length + length // 254 + 2  # Encoded data + delimiter
+        head = self._tx_head
+        tail = self._tx_tail
+        size = self._tx_buffer_size
+
+        if tail > head:
+            free_space = tail - head - 1
+        else:
+            free_space = (size - head) + tail - 1
+
+        if worst <= free_space and head + worst <= size:
+            written = cobs_encode_into(self._frame_tx_buf, self._tx_mv[head : head + worst - 1], length)
+            self._tx_buffer[head + written] = 0x00
+            self._tx_head = (head + written + 1) % size
+            self._tx_event.set()  # Signal TX worker that new data is available
+            return
+
+        written = cobs_encode_into(self._frame_tx_buf, self._packet_tx_buf, length)
+        self._packet_tx_buf[written] = 0x00
+        self._write_to_tx_buffer(self._packet_tx_mv[:written + 1])
+
     def read_raw_into(self, buf):
         """Read available raw bytes into a buffer.
 
@@ -463,6 +606,9 @@ class UARTTransport(BaseTransport):
         try:
             count = self.uart.readinto(self._rx_mv[self._rx_head : self._rx_head + space])
             if count and count > 0:
+                if self._rx_head == self._rx_tail:
+                    # New frame: its first byte was on the wire at least `count` byte times ago
+                    self._rx_arrival_us = monotonic_us() - count * self._byte_time_us
                 self._rx_head = (self._rx_head + count) % self._rx_buf_size
         except Exception as e:
             self._rx_error_count += 1
@@ -471,6 +617,104 @@ class UARTTransport(BaseTransport):
             if self._rx_error_count == 1 or (self._rx_error_count % 100) == 0:
                 print(f"RX Hardware Error (count={self._rx_error_count}): {e}")
 
+    def _encode_dest(self, dest_str):
+        """Encode a destination string, caching the result for repeat sends."""
+        encoded = self._dest_encode_cache.get(dest_str)
+        if encoded is None:
+            encoded = _encode_destination(dest_str, self.dest_map)
+            if len(self._dest_encode_cache) < self.DEST_CACHE_SIZE:
+                self._dest_encode_cache[dest_str] = encoded
+        return encoded
+
+    def _decode_dest(self, data, offset, end):
+        """Decode a destination in place, reusing cached ID strings.
+
+        Same rules as _decode_destination().
+
+        Returns:
+            tuple: (dest_str, bytes_consumed)
+        """
+        if offset >= end:
+            raise ValueError("Insufficient data for destination")
+
+        dest_byte = data[offset]
+
+        # Check for special destinations
+        name = self.dest_reverse_map.get(dest_byte)
+        if name is not None:
+            return name, 1
+
+        # Two-byte ID (type + index) keys as type << 8 | index, type-only as 0x10000 | type
+        if offset + 1 < end and data[offset + 1] < self.max_index_value:
+            key = (dest_byte << 8) | data[offset + 1]
+            consumed = 2
+        else:
+            key = 0x10000 | dest_byte
+            consumed = 1
+
+        name = self._dest_decode_cache.get(key)
+        if name is None:
+            name = _decode_destination(data, offset, self.dest_reverse_map, self.max_index_value, end)[0]
+            if len(self._dest_decode_cache) < self.DEST_CACHE_SIZE:
+                self._dest_decode_cache[key] = name
+        return name, consumed
+
+    def _find_delimiter(self, start, stop):
+        """Find the first 0x00 between offsets start and stop past the RX tail.
+
+        The range is searched with bytearray.find on at most two contiguous
+        segments of the ring buffer (before and after the wrap point).
+
+        Parameters:
+            start (int): First offset from the tail to search.
+            stop (int): Offset from the tail to stop searching at.
+
+        Returns:
+            int: Offset of the delimiter from the tail, or -1 if not found.
+        """
+        buf = self._rx_buffer
+        size = self._rx_buf_size
+        tail = self._rx_tail
+        first = tail + start
+        last = tail + stop
+
+        if first < size:
+            idx = buf.find(b'\x00', first, min(last, size))
+            if idx >= 0:
+                return idx - tail
+            first = size
+
+        if last > size:
+            idx = buf.find(b'\x00', first - size, last - size)
+            if idx >= 0:
+                return idx + size - tail
+
+        return -1
+
+    def _record_rx_latency(self, frame_len):
+        """Record arrival-to-dispatch latency for a frame just taken off the ring.
+
+        The frame's last byte is estimated to have arrived frame_len byte
+        times after the byte at the previous tail.
+        """
+        arrival = self._rx_arrival_us
+        if arrival is None:
+            return
+        now = monotonic_us()
+        arrival += frame_len * self._byte_time_us
+        if arrival > now:
+            arrival = now
+        self.rx_latency.record((now - arrival) / 1000)
+        self._rx_arrival_us = arrival if self._rx_head != self._rx_tail else None
+
+    def get_rx_telemetry(self):
+        """Return RX latency histogram, current poll delay and hardware error count."""
+        return {
+            "rx_latency": self.rx_latency.snapshot(),
+            "poll_delay_ms": self.rx_poller.delay * 1000,
+            "rx_errors": self._rx_error_count,
+        }
+
     def _try_decode_one(self):
         """Receive a message from UART if available.
 
@@ -494,29 +738,31 @@ class UARTTransport(BaseTransport):
         # Limit scan to MAX_PACKET_SIZE to prevent hanging on massive garbage data
         scan_limit = min(bytes_available, self.MAX_PACKET_SIZE)
 
-        packet_len = 0
-        found_delimiter = False
-
-        for i in range(scan_limit):
-            idx = (self._rx_tail + i) % self._rx_buf_size
-            if self._rx_buffer[idx] == 0x00:
-                found_delimiter = True
-                packet_len = i
-                break
+        # Resume after the bytes a previous pass already scanned for this packet
+        scan_start = self._rx_scan_pos if self._rx_scan_tail == self._rx_tail else 0
+        packet_len = self._find_delimiter(min(scan_start, scan_limit), scan_limit)
 
-        if not found_delimiter:
+        if packet_len < 0:
             # No delimiter found
+            self._rx_scan_tail = self._rx_tail
+            self._rx_scan_pos = scan_limit
             # SAFETY: If buffer is nearly full and no delimiter, clear the buffer to prevent deadlock
             # This is aggressive but necessary when flooded with garbage data
             if bytes_available > self._rx_buf_size - self.MAX_PACKET_SIZE:
                 # Buffer is critically full - reset it
                 self._rx_head = 0
                 self._rx_tail = 0
+                self._rx_scan_pos = 0
+                self._rx_arrival_us = None
             elif bytes_available >= self.MAX_PACKET_SIZE:
                 # Advance tail by a larger chunk to clear garbage faster
                 self._rx_tail = (self._rx_tail + 100) % self._rx_buf_size
+                self._rx_scan_tail = self._rx_tail
+                self._rx_scan_pos = scan_limit - 100
             return None
 
+        self._rx_scan_pos = 0
+
         # Unwrap packet from ring buffer into linear scratchpad
         # This uses fast memoryview slice assignment instead of Python loops
 
@@ -542,53 +788,49 @@ class UARTTransport(BaseTransport):
 
         # Advance tail past packet and delimiter
         self._rx_tail = (self._rx_tail + packet_len + 1) % self._rx_buf_size
+        self._record_rx_latency(packet_len + 1)
 
-        # Decode packet using linear scratchpad
+        # Decode packet from the linear scratchpad into the decode scratchpad.
+        # Everything up to the payload is parsed in place; the payload object
+        # is the only copy of the packet data.
         try:
-            decoded = cobs_decode(self._packet_rx_mv[:packet_len])
+            content_len = cobs_decode_into(self._packet_rx_mv[:packet_len], self._packet_dec_mv) - 1
             # Minimum length is now 4: SRC(1) + DEST(1) + CMD(1) + CRC(1)
-            if len(decoded) < 4:
+            if content_len < 3:
                 return None
 
-            crc_rx = decoded[-1]
-            content = decoded[:-1]
-
-            if calculate_crc8(content) != crc_rx:
+            content = self._packet_dec_buf
+            if calculate_crc8_range(content, 0, content_len) != content[content_len]:
                 return None  # CRC fail
 
             # 1. Parse Source ID (1 or 2 bytes)
-            src_str, src_offset = _decode_destination(
-                content,
-                0,
-                self.dest_reverse_map,
-                self.max_index_value
-            )
-            if src_offset >= len(content):
+            src_str, src_offset = self._decode_dest(content, 0, content_len)
+            if src_offset >= content_len:
                 return None
 
             # 2. Parse Destination ID (1 or 2 bytes), starting AFTER source
-            dest_str, dest_offset = _decode_destination(
-                content,
-                src_offset,
-                self.dest_reverse_map,
-                self.max_index_value
-            )
+            dest_str, dest_offset = self._decode_dest(content, src_offset, content_len)
 
             # 3. Calculate offset for the Command byte
             offset = src_offset + dest_offset
-            if offset >= len(content):
+            if offset >= content_len:
                 return None
 
             # 4. Parse Command
-            cmd_str = _decode_command(content[offset], self.command_reverse_map)
+            codec = self._rx_codecs[content[offset]]
+            if codec is None:
+                raise ValueError(f"Unknown command byte: 0x{content[offset]:02X}")
+            cmd_str, decoder = codec
             offset += 1
 
             # 5. Parse Payload
-            schema = self.payload_schemas.get(cmd_str)
-            payload = _decode_payload(content[offset:], schema, self.encoding_constants)
+            if offset < content_len:
+                payload = decoder(self._packet_dec_mv[offset:content_len])
+            else:
+                payload = ""
 
             # Return the correctly structured Message!
-            return Message(src_str, dest_str, cmd_str, payload)
+            return self.message_pool.acquire(src_str, dest_str, cmd_str, payload)
 
         except (ValueError, IndexError) as e:
             print(f"Protocol Error: {e}")
@@ -605,6 +847,9 @@ class UARTTransport(BaseTransport):
         """
         if self._relay_task:
             self._relay_task.cancel()
+        self._relay_poller = AdaptivePoller(
+            getattr(source_transport, "baudrate", None), max_delay=self.RELAY_MAX_DELAY
+        )
         self._relay_task = asyncio.create_task(self._relay_worker(source_transport, heartbeat_callback))
 
     def clear_buffer(self):
@@ -612,6 +857,8 @@ class UARTTransport(BaseTransport):
         self.uart.reset_input_buffer()
         self._rx_head = 0
         self._rx_tail = 0
+        self._rx_scan_pos = 0
+        self._rx_arrival_us = None
 #endregion
 
 #region --- Background Worker Tasks ---
@@ -642,10 +889,11 @@ class UARTTransport(BaseTransport):
             if count and count > 0:
                 self._tx_head = (head + count) % size
                 self._tx_event.set()  # Wake up TX worker if waiting
+                self._relay_poller.next_delay(True)
                 await asyncio.sleep(0)  # Yield to event loop
             else:
-                # Sleep briefly when idle to reduce CPU usage
-                await asyncio.sleep(0.005)
+                # Back off while the downstream link is idle
+                await asyncio.sleep(self._relay_poller.next_delay(False))
 
     async def _rx_worker(self):
         """
@@ -671,10 +919,16 @@ class UARTTransport(BaseTransport):
                 else:
                     break
 
-            if self.uart.in_waiting > 0 or packets_processed >= self.BATCH_LIMIT:
-                await asyncio.sleep(0.005) # Sleep briefly when data waiting or batch ongoing
+            if packets_processed >= self.BATCH_LIMIT:
+                await asyncio.sleep(0)  # Batch ongoing: just yield
             else:
-                await asyncio.sleep(0.02)  # Longer sleep when no data is available
+                # Poll again immediately if bytes wait, soon if a frame is partial,
+                # and back off while the link is idle
+                await asyncio.sleep(self.rx_poller.next_delay(
+                    packets_processed > 0,
+                    self.uart.in_waiting,
+                    self._rx_head != self._rx_tail,
+                ))
 
     async def _tx_worker(self):
         """Dedicated task to drain the TX queue to hardware.
@@ -735,24 +989,55 @@ class UARTTransport(BaseTransport):
             message (Message): The message to send.
         """
         # Encoding Logic
-        src = _encode_destination(message.source, self.dest_map)
-        dest = _encode_destination(message.destination, self.dest_map)
-        cmd = bytes([_encode_command(message.command, self.command_map)])
-        schema = self.payload_schemas.get(message.command)
-        payload = _encode_payload(message.payload, schema, self.encoding_constants)
-
-        # Packet Construction
-        raw = src + dest + cmd + payload
-        crc = bytes([calculate_crc8(raw)])
-        packet = cobs_encode(raw + crc) + b'\x00'
+        src = self._encode_dest(message.source)
+        dest = self._encode_dest(message.destination)
+        codec = self._tx_codecs.get(message.command)
+        if codec is None:
+            raise ValueError(f"Unknown command: {message.command}")
+        cmd, encoder = codec
+        payload = message.payload
+        if not payload:
+            payload = b''
+        elif not isinstance(payload, (bytes, bytearray)):
+            payload = encoder(payload)
 
         try:
-            self._write_to_tx_buffer(packet)
+            # Frame Construction (SRC + DEST + CMD + PAYLOAD + CRC)
+            frame = self._frame_tx_buf
+            length = len(src) + len(dest) + 1 + len(payload)
+            if length >= len(frame):
+                # Larger than the scratchpad: build the packet on the heap
+                raw = src + dest + bytes([cmd]) + payload
+                raw += bytes([calculate_crc8(raw)])
+                self._write_to_tx_buffer(cobs_encode(raw) + b'\x00')
+                return True
+
+            offset = len(src)
+            frame[:offset] = src
+            frame[offset:offset + len(dest)] = dest
+            offset += len(dest)
+            frame[offset] = cmd
+            offset += 1
+            frame[offset:length] = payload
+            frame[length] = calculate_crc8_range(frame, 0, length)
+
+            self._frame_to_tx_buffer(length + 1)
             return True
         except BufferError as e:
             print(f"TX Buffer Error: {e}")
             return False
 
+    def release(self, message):
+        """Return a received message to the message pool.
+
+        Call once the message's fields are no longer needed; the object is
+        reused for a later packet.
+
+        Parameters:
+            message (Message): A message previously returned by receive().
+        """
+        self.message_pool.release(message)
+
     async def receive(self):
         """Asynchronously receive a message from the RX queue.
 
@@ -1,7 +1,10 @@
 # File: src/utilities/__init__.py
 """Utility modules for JEB."""
 
-from .cobs import cobs_encode, cobs_decode
-from .crc import calculate_crc8
+from .cobs import cobs_encode, cobs_decode, cobs_encode_into, cobs_decode_into
+from .crc import calculate_crc8, calculate_crc8_range
 
-__all__ = ['cobs_encode', 'cobs_decode', 'calculate_crc8']
+__all__ = [
+    'cobs_encode', 'cobs_decode', 'cobs_encode_into', 'cobs_decode_into',
+    'calculate_crc8', 'calculate_crc8_range',
+]
@@ -0,0 +1,109 @@
+# File: src/utilities/boot_timeline.py
+"""Boot-phase timeline: named spans from power-on to the first menu frame.
+
+``code.py`` imports this first, so offsets are measured from (nearly) the
+start of the VM. Spans nest, which lets the report show, for example,
+``init:audio`` inside ``init:core_manager``. The shared ``BOOT`` instance is
+finished once, when the main menu draws its first frame; the report then
+goes to the console and/or a file on the SD card depending on config
+``boot_report`` ("console", "sd", "both" or off).
+"""
+
+import time
+
+
+def _now_us():
+    if hasattr(time, "monotonic_ns"):
+        return time.monotonic_ns() // 1000
+    return int(time.monotonic() * 1000000)
+
+
+class _Span:
+    """Context manager closing one timeline entry."""
+
+    def __init__(self, timeline, name):
+        self.timeline = timeline
+        self.name = name
+        self.index = None
+
+    def __enter__(self):
+        self.index = self.timeline.begin(self.name)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timeline.end(self.index)
+        return False
+
+
+class BootTimeline:
+    """Records named spans and marks, then prints or saves a report."""
+
+    REPORT_FILE = "boot_timeline.txt"
+
+    def __init__(self):
+        self._t0 = _now_us()
+        self.entries = []  # [name, start_us, duration_us or None, depth]
+        self._depth = 0
+        self.finished = False
+        self.report_to = None  # None, "console", "sd" or "both"
+        self.report_dir = "/"
+
+    def begin(self, name):
+        """Open a span; returns its index for end()."""
+        self.entries.append([name, _now_us() - self._t0, None, self._depth])
+        self._depth += 1
+        return len(self.entries) - 1
+
+    def end(self, index):
+        """Close the span opened by begin()."""
+        entry = self.entries[index]
+        entry[2] = _now_us() - self._t0 - entry[1]
+        self._depth = entry[3]
+
+    def span(self, name):
+        """``with BOOT.span("init:audio"):`` records the block as one span."""
+        return _Span(self, name)
+
+    def mark(self, name):
+        """Record an instant (e.g. "first_menu_frame")."""
+        self.entries.append([name, _now_us() - self._t0, 0, self._depth])
+
+    def elapsed_ms(self):
+        """Milliseconds since the timeline started."""
+        return (_now_us() - self._t0) // 1000
+
+    def durations(self):
+        """Return {name: duration_ms} for closed spans (last one wins on repeats)."""
+        return {name: dur / 1000 for name, _, dur, _ in self.entries if dur is not None}
+
+    def report(self):
+        """Return the timeline as a list of text lines."""
+        lines = ["BOOT TIMELINE (start ms / duration ms)"]
+        for name, start, dur, depth in self.entries:
+            duration = "   open" if dur is None else f"{dur / 1000:7.1f}"
+            lines.append(f"{start / 1000:8.1f} {duration}  {'  ' * depth}{name}")
+        return lines
+
+    def finish(self, mark_name="first_menu_frame"):
+        """Mark the end of boot and emit the report once, as configured."""
+        if self.finished:
+            return
+        self.finished = True
+        self.mark(mark_name)
+        target = self.report_to
+        if not target:
+            return
+        lines = self.report()
+        if target in ("console", "both"):
+            for line in lines:
+                print(line)
+        if target in ("sd", "both"):
+            try:
+                with open(self.report_dir + self.REPORT_FILE, "w") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                from utilities.logger import JEBLogger
+                JEBLogger.warning("BOOT", f"Boot timeline not saved: {e}")
+
+
+BOOT = BootTimeline()
@@ -14,9 +14,68 @@ Benefits:
 References:
 - Original paper: Cheshire and Baker (1997)
 - Wikipedia: https://en.wikipedia.org/wiki/Consistent_Overhead_Byte_Stuffing
+
+The ``*_into`` variants write into caller-owned buffers and copy each run
+between zero bytes with a single slice assignment, so the UART hot path can
+frame and unframe packets in preallocated scratch buffers.
 """
 
 
+def cobs_encode_into(data, out, length=None):
+    """Encode data using COBS into a preallocated buffer.
+
+    Runs of non-zero bytes are located with ``find`` and copied with one
+    slice assignment each, instead of appending byte by byte.
+
+    Parameters:
+        data (bytes or bytearray): Raw data to encode (may contain 0x00 bytes).
+        out (bytearray or memoryview): Destination buffer. Must hold at least
+            ``length + length // 254 + 1`` bytes.
+        length (int, optional): Encode only ``data[:length]``, for frames
+            assembled in a larger scratch buffer. Defaults to len(data).
+
+    Returns:
+        int: Number of encoded bytes written to the start of *out*.
+
+    Raises:
+        ValueError: If *out* is too small for the encoded data.
+    """
+    size = len(data) if length is None else length
+    limit = len(out)
+    if limit < size + size // 254 + 1:
+        raise ValueError("COBS output buffer too small")
+
+    src = memoryview(data)
+    pos = 0
+    code_idx = 0
+    written = 1
+
+    while True:
+        zero = data.find(b'\x00', pos, size)
+        stop = size if zero < 0 else zero
+
+        # Split long non-zero runs into maximal 254-byte blocks
+        while stop - pos >= 254:
+            out[written:written + 254] = src[pos:pos + 254]
+            out[code_idx] = 0xFF
+            pos += 254
+            code_idx = written + 254
+            written = code_idx + 1
+
+        run = stop - pos
+        if run:
+            out[written:written + run] = src[pos:stop]
+        written += run
+        out[code_idx] = run + 1
+
+        if zero < 0:
+            return written
+
+        pos = zero + 1
+        code_idx = written
+        written += 1
+
+
 def cobs_encode(data):
     """Encode data using COBS algorithm.
     
@@ -41,36 +100,65 @@ def cobs_encode(data):
     """
     if not data:
         return b'\x01'
-    
-    output = bytearray()
-    code_idx = 0
-    code = 0x01
-    
-    output.append(0)  # Placeholder for first code byte
-    
-    for byte in data:
-        if byte == 0x00:
-            # Found a zero - write the distance code and reset
-            output[code_idx] = code
-            code_idx = len(output)
-            output.append(0)  # Placeholder for next code byte
-            code = 0x01
-        else:
-            # Non-zero byte - add it and increment code
-            output.append(byte)
-            code += 1
-            
-            # If we've run 254 bytes without a zero, need to insert a code
-            if code == 0xFF:
-                output[code_idx] = code
-                code_idx = len(output)
-                output.append(0)
-                code = 0x01
-    
-    # Write final code byte
-    output[code_idx] = code
-    
-    return bytes(output)
+
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+    out = bytearray(len(data) + len(data) // 254 + 1)
+    return bytes(memoryview(out)[:cobs_encode_into(data, out)])
+
+
+def cobs_decode_into(data, out):
+    """Decode COBS-encoded data into a preallocated buffer.
+
+    Each block is copied with a single slice assignment. Only code bytes
+    are checked for 0x00; callers framing on 0x00 delimiters never pass
+    zeros inside a block.
+
+    Parameters:
+        data (bytes, bytearray or memoryview): COBS-encoded data (no 0x00 bytes).
+        out (bytearray or memoryview): Destination buffer. Decoded data is
+            always shorter than the encoded data, so ``len(data)`` is enough.
+
+    Returns:
+        int: Number of decoded bytes written to the start of *out*.
+
+    Raises:
+        ValueError: If data is empty, malformed, or does not fit in *out*.
+    """
+    size = len(data)
+    if not size:
+        raise ValueError("Cannot decode empty data")
+
+    src = data if isinstance(data, memoryview) else memoryview(data)
+    limit = len(out)
+    idx = 0
+    written = 0
+
+    while idx < size:
+        code = src[idx]
+        if code == 0:
+            raise ValueError(f"Invalid COBS encoding: found 0x00 at position {idx}")
+        idx += 1
+
+        run = code - 1
+        end = idx + run
+        if end > size:
+            raise ValueError("Invalid COBS encoding: unexpected end of data")
+        if written + run > limit:
+            raise ValueError("COBS output buffer too small")
+        if run:
+            out[written:written + run] = src[idx:end]
+        written += run
+        idx = end
+
+        # Add a zero if this wasn't the last block
+        if code < 0xFF and idx < size:
+            if written >= limit:
+                raise ValueError("COBS output buffer too small")
+            out[written] = 0x00
+            written += 1
+
+    return written
 
 
 def cobs_decode(data):
@@ -98,31 +186,14 @@ def cobs_decode(data):
     """
     if not data:
         raise ValueError("Cannot decode empty data")
-    
+
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+
     # Check for any 0x00 bytes in encoded data (invalid)
-    if b'\x00' in data:
-        idx = data.index(b'\x00')
+    idx = data.find(b'\x00')
+    if idx >= 0:
         raise ValueError(f"Invalid COBS encoding: found 0x00 at position {idx}")
-    
-    if data == b'\x01':
-        return b''
-    
-    output = bytearray()
-    idx = 0
-    
-    while idx < len(data):
-        code = data[idx]
-        idx += 1
-        
-        # Copy the next (code-1) bytes
-        for _ in range(code - 1):
-            if idx >= len(data):
-                raise ValueError("Invalid COBS encoding: unexpected end of data")
-            output.append(data[idx])
-            idx += 1
-        
-        # Add a zero if this wasn't the last block
-        if code < 0xFF and idx < len(data):
-            output.append(0x00)
-    
-    return bytes(output)
+
+    out = bytearray(len(data))
+    return bytes(memoryview(out)[:cobs_decode_into(data, out)])
@@ -56,6 +56,29 @@ def calculate_crc8(data):
     return crc
 
 
+def calculate_crc8_range(buf, start=0, end=None):
+    """Calculate CRC-8 over ``buf[start:end]`` without slicing.
+
+    Indexes the buffer in place so checking a packet inside a scratch
+    buffer or memoryview allocates nothing.
+
+    Parameters:
+        buf (bytes, bytearray or memoryview): Buffer containing the data.
+        start (int): Index of the first byte to include.
+        end (int, optional): Index one past the last byte. Defaults to len(buf).
+
+    Returns:
+        int: CRC-8 value as integer, identical to calculate_crc8(buf[start:end]).
+    """
+    if end is None:
+        end = len(buf)
+    table = _CRC_TABLE
+    crc = 0x00
+    for i in range(start, end):
+        crc = table[crc ^ buf[i]]
+    return crc
+
+
 def verify_crc8(packet):
     """Verify CRC-8 checksum of a received packet.
     
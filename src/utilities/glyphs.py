@@ -0,0 +1,123 @@
+# File: src/utilities/glyphs.py
+"""Column-bitmap glyph cache for scrolling text on LED matrices.
+
+Glyphs use the same layout as adafruit_framebuf's ``font5x8.bin``: one byte
+per column, bit 0 at the top row. A message is rendered once into a single
+strip of column bytes, so scrolling it is just moving a window along the
+strip.
+"""
+
+from utilities.logger import JEBLogger
+
+# Printable ASCII (0x20-0x7E) of the classic 5x8 GLCD font, 5 columns per glyph.
+# Used when font5x8.bin is not present on the filesystem.
+_BUILTIN_FIRST = 0x20
+_BUILTIN_FONT = bytes([
+    0x00, 0x00, 0x00, 0x00, 0x00,  0x00, 0x00, 0x5F, 0x00, 0x00,  # space !
+    0x00, 0x07, 0x00, 0x07, 0x00,  0x14, 0x7F, 0x14, 0x7F, 0x14,  # " #
+    0x24, 0x2A, 0x7F, 0x2A, 0x12,  0x23, 0x13, 0x08, 0x64, 0x62,  # $ %
+    0x36, 0x49, 0x56, 0x20, 0x50,  0x00, 0x08, 0x07, 0x03, 0x00,  # & '
+    0x00, 0x1C, 0x22, 0x41, 0x00,  0x00, 0x41, 0x22, 0x1C, 0x00,  # ( )
+    0x2A, 0x1C, 0x7F, 0x1C, 0x2A,  0x08, 0x08, 0x3E, 0x08, 0x08,  # * +
+    0x00, 0x80, 0x70, 0x30, 0x00,  0x08, 0x08, 0x08, 0x08, 0x08,  # , -
+    0x00, 0x00, 0x60, 0x60, 0x00,  0x20, 0x10, 0x08, 0x04, 0x02,  # . /
+    0x3E, 0x51, 0x49, 0x45, 0x3E,  0x00, 0x42, 0x7F, 0x40, 0x00,  # 0 1
+    0x72, 0x49, 0x49, 0x49, 0x46,  0x21, 0x41, 0x49, 0x4D, 0x33,  # 2 3
+    0x18, 0x14, 0x12, 0x7F, 0x10,  0x27, 0x45, 0x45, 0x45, 0x39,  # 4 5
+    0x3C, 0x4A, 0x49, 0x49, 0x31,  0x41, 0x21, 0x11, 0x09, 0x07,  # 6 7
+    0x36, 0x49, 0x49, 0x49, 0x36,  0x46, 0x49, 0x49, 0x29, 0x1E,  # 8 9
+    0x00, 0x00, 0x14, 0x00, 0x00,  0x00, 0x40, 0x34, 0x00, 0x00,  # : ;
+    0x00, 0x08, 0x14, 0x22, 0x41,  0x14, 0x14, 0x14, 0x14, 0x14,  # < =
+    0x00, 0x41, 0x22, 0x14, 0x08,  0x02, 0x01, 0x59, 0x09, 0x06,  # > ?
+    0x3E, 0x41, 0x5D, 0x59, 0x4E,  0x7C, 0x12, 0x11, 0x12, 0x7C,  # @ A
+    0x7F, 0x49, 0x49, 0x49, 0x36,  0x3E, 0x41, 0x41, 0x41, 0x22,  # B C
+    0x7F, 0x41, 0x41, 0x41, 0x3E,  0x7F, 0x49, 0x49, 0x49, 0x41,  # D E
+    0x7F, 0x09, 0x09, 0x09, 0x01,  0x3E, 0x41, 0x41, 0x51, 0x73,  # F G
+    0x7F, 0x08, 0x08, 0x08, 0x7F,  0x00, 0x41, 0x7F, 0x41, 0x00,  # H I
+    0x20, 0x40, 0x41, 0x3F, 0x01,  0x7F, 0x08, 0x14, 0x22, 0x41,  # J K
+    0x7F, 0x40, 0x40, 0x40, 0x40,  0x7F, 0x02, 0x1C, 0x02, 0x7F,  # L M
+    0x7F, 0x04, 0x08, 0x10, 0x7F,  0x3E, 0x41, 0x41, 0x41, 0x3E,  # N O
+    0x7F, 0x09, 0x09, 0x09, 0x06,  0x3E, 0x41, 0x51, 0x21, 0x5E,  # P Q
+    0x7F, 0x09, 0x19, 0x29, 0x46,  0x26, 0x49, 0x49, 0x49, 0x32,  # R S
+    0x03, 0x01, 0x7F, 0x01, 0x03,  0x3F, 0x40, 0x40, 0x40, 0x3F,  # T U
+    0x1F, 0x20, 0x40, 0x20, 0x1F,  0x3F, 0x40, 0x38, 0x40, 0x3F,  # V W
+    0x63, 0x14, 0x08, 0x14, 0x63,  0x03, 0x04, 0x78, 0x04, 0x03,  # X Y
+    0x61, 0x59, 0x49, 0x4D, 0x43,  0x00, 0x7F, 0x41, 0x41, 0x41,  # Z [
+    0x02, 0x04, 0x08, 0x10, 0x20,  0x00, 0x41, 0x41, 0x41, 0x7F,  # \ ]
+    0x04, 0x02, 0x01, 0x02, 0x04,  0x40, 0x40, 0x40, 0x40, 0x40,  # ^ _
+    0x00, 0x03, 0x07, 0x08, 0x00,  0x20, 0x54, 0x54, 0x78, 0x40,  # ` a
+    0x7F, 0x28, 0x44, 0x44, 0x38,  0x38, 0x44, 0x44, 0x44, 0x28,  # b c
+    0x38, 0x44, 0x44, 0x28, 0x7F,  0x38, 0x54, 0x54, 0x54, 0x18,  # d e
+    0x00, 0x08, 0x7E, 0x09, 0x02,  0x18, 0xA4, 0xA4, 0x9C, 0x78,  # f g
+    0x7F, 0x08, 0x04, 0x04, 0x78,  0x00, 0x44, 0x7D, 0x40, 0x00,  # h i
+    0x20, 0x40, 0x40, 0x3D, 0x00,  0x7F, 0x10, 0x28, 0x44, 0x00,  # j k
+    0x00, 0x41, 0x7F, 0x40, 0x00,  0x7C, 0x04, 0x78, 0x04, 0x78,  # l m
+    0x7C, 0x08, 0x04, 0x04, 0x78,  0x38, 0x44, 0x44, 0x44, 0x38,  # n o
+    0xFC, 0x18, 0x24, 0x24, 0x18,  0x18, 0x24, 0x24, 0x18, 0xFC,  # p q
+    0x7C, 0x08, 0x04, 0x04, 0x08,  0x48, 0x54, 0x54, 0x54, 0x24,  # r s
+    0x04, 0x04, 0x3F, 0x44, 0x24,  0x3C, 0x40, 0x40, 0x20, 0x7C,  # t u
+    0x1C, 0x20, 0x40, 0x20, 0x1C,  0x3C, 0x40, 0x30, 0x40, 0x3C,  # v w
+    0x44, 0x28, 0x10, 0x28, 0x44,  0x4C, 0x90, 0x90, 0x90, 0x7C,  # x y
+    0x44, 0x64, 0x54, 0x4C, 0x44,  0x00, 0x08, 0x36, 0x41, 0x00,  # z {
+    0x00, 0x00, 0x77, 0x00, 0x00,  0x00, 0x41, 0x36, 0x08, 0x00,  # | }
+    0x02, 0x01, 0x02, 0x04, 0x02,                                 # ~
+])
+
+# Column byte -> 8 row bytes (0 or 1), top row first. Entry b starts at b * 8.
+COLUMN_BITS = bytes((b >> row) & 1 for b in range(256) for row in range(8))
+
+
+class GlyphCache:
+    """Rasterises characters once and renders strings to column strips.
+
+    Glyph data comes from ``font5x8.bin`` when it exists (about 1.3 KB, read
+    once); otherwise the built-in printable ASCII font is used. Characters
+    the font lacks render as a blank glyph.
+    """
+    DEFAULT_FONT = "font5x8.bin"
+
+    def __init__(self, font_path=DEFAULT_FONT, spacing=1):
+        self.font_path = font_path
+        self.spacing = spacing
+        self.width = 5
+        self.height = 8
+        self._glyphs = {}  # char -> bytes of column bitmaps
+        self._font = _BUILTIN_FONT
+        self._first = _BUILTIN_FIRST
+
+        try:
+            with open(font_path, "rb") as f:
+                header = f.read(2)
+                data = f.read()
+            if len(header) == 2 and header[0]:
+                self.width, self.height = header[0], header[1]
+                self._font = data
+                self._first = 0
+        except OSError:
+            JEBLogger.debug("GLYP", f"{font_path} not found, using built-in font")
+
+    def glyph(self, char):
+        """Return the column bytes for one character (cached)."""
+        cols = self._glyphs.get(char)
+        if cols is not None:
+            return cols
+
+        width = self.width
+        offset = (ord(char) - self._first) * width
+        if 0 <= offset and offset + width <= len(self._font):
+            cols = bytes(self._font[offset:offset + width])
+        else:
+            cols = bytes(width)
+
+        self._glyphs[char] = cols
+        return cols
+
+    def render(self, text):
+        """Render text into one column strip (1 byte per column, bit 0 = top row)."""
+        advance = self.width + self.spacing
+        strip = bytearray(len(text) * advance)
+        pos = 0
+        for char in text:
+            strip[pos:pos + self.width] = self.glyph(char)
+            pos += advance
+        return strip
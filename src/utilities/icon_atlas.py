@@ -0,0 +1,117 @@
+# File: src/utilities/icon_atlas.py
+"""Binary icon atlas: every icon in one file behind a header index.
+
+Layout (all integers little-endian)::
+
+    header   "JICA" | version u8 | reserved u8 | count u16 | index_size u32
+    index    count entries of:
+                 kind u8 | name_len u8 | timing_count u8 | reserved u8 |
+                 offset u32 | length u32 | name bytes | timing u16 * timing_count
+    data     raw palette-index bytes; ``offset`` is absolute from file start
+
+``kind`` is KIND_STATIC for single frames and KIND_ANIM for concatenated
+animation frames (whose timing table lives in the index). Identical blobs
+are stored once and shared by several entries.
+
+Reading only parses the index; each icon is then one seek() + readinto()
+into a buffer of exactly its length. ``pack_atlas`` is the offline writer
+used by ``scripts/icon_batch_convert_bin.py``.
+"""
+
+import struct
+
+MAGIC = b"JICA"
+VERSION = 1
+KIND_STATIC = 0
+KIND_ANIM = 1
+
+_HEADER = "<4sBBHI"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+_ENTRY = "<BBBBII"
+_ENTRY_SIZE = struct.calcsize(_ENTRY)
+
+
+def pack_atlas(icons, anims=None):
+    """Build atlas file contents.
+
+    Args:
+        icons: Dict of name -> bytes for static icons.
+        anims: Optional dict of name -> (bytes, timing tuple) for animations.
+
+    Returns:
+        bytes: The complete atlas file.
+    """
+    entries = [(KIND_STATIC, name, data, ()) for name, data in icons.items()]
+    for name, (data, timing) in (anims or {}).items():
+        if isinstance(timing, int):
+            timing = (timing,)
+        entries.append((KIND_ANIM, name, data, tuple(timing)))
+
+    index_size = 0
+    for _, name, _, timing in entries:
+        encoded = name.encode("utf-8")
+        if len(encoded) > 255 or len(timing) > 255:
+            raise ValueError(f"Atlas entry too large: {name}")
+        index_size += _ENTRY_SIZE + len(encoded) + 2 * len(timing)
+
+    index = bytearray()
+    blob = bytearray()
+    offsets = {}
+    data_start = _HEADER_SIZE + index_size
+    for kind, name, data, timing in entries:
+        data = bytes(data)
+        offset = offsets.get(data)
+        if offset is None:
+            offset = data_start + len(blob)
+            offsets[data] = offset
+            blob += data
+        encoded = name.encode("utf-8")
+        index += struct.pack(_ENTRY, kind, len(encoded), len(timing), 0, offset, len(data))
+        index += encoded
+        index += struct.pack(f"<{len(timing)}H", *timing)
+
+    header = struct.pack(_HEADER, MAGIC, VERSION, 0, len(entries), index_size)
+    return bytes(header + index + blob)
+
+
+class IconAtlas:
+    """Reader for an atlas file; parses the index once and reads entries on demand."""
+
+    def __init__(self, path):
+        self.path = path
+        self.icons = {}   # name -> (offset, length)
+        self.anims = {}   # name -> (offset, length, timing tuple)
+        self._load_index()
+
+    def _load_index(self):
+        """Read the header and index. Raises OSError/ValueError if unusable."""
+        with open(self.path, "rb") as f:
+            header = f.read(_HEADER_SIZE)
+            if len(header) != _HEADER_SIZE:
+                raise ValueError("Truncated icon atlas")
+            magic, version, _, count, index_size = struct.unpack(_HEADER, header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Not a v1 icon atlas")
+            index = f.read(index_size)
+
+        pos = 0
+        for _ in range(count):
+            kind, name_len, timing_count, _, offset, length = struct.unpack_from(_ENTRY, index, pos)
+            pos += _ENTRY_SIZE
+            name = str(index[pos:pos + name_len], "utf-8")
+            pos += name_len
+            if kind == KIND_ANIM:
+                timing = struct.unpack_from(f"<{timing_count}H", index, pos)
+                pos += 2 * timing_count
+                self.anims[name] = (offset, length, timing)
+            else:
+                pos += 2 * timing_count
+                self.icons[name] = (offset, length)
+
+    def read(self, offset, length):
+        """Return a new bytearray holding length bytes from offset."""
+        buf = bytearray(length)
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            f.readinto(buf)
+        return buf
@@ -0,0 +1,1536 @@
+# File: src/utilities/icon_library.py
+"""Source table of the built-in 16x16 matrix icons.
+
+Nothing imports this module on the boot path: ``scripts/icon_batch_convert_bin.py
+--atlas`` packs it into ``/sd/icons/atlas.bin`` and ``utilities.icons`` only
+falls back to it when no atlas is present.
+"""
+
+class IconLibrary:
+    """
+    Asset library for 16x16 Matrix Icons.
+
+    The Palette Library
+    LIBRARY = {
+        0: OFF, 1: CHARCOAL, 2: GRAY, 3: SILVER, 4: WHITE,
+        10: MAROON, 11: RED, 12: TOMATO, 13: PINK, 14: LASER,
+        20: BROWN, 21: ORANGE, 22: GOLD, 23: PEACH, 24: EXPLODE,
+        30: MUD, 31: YELLOW, 32: CREAM, 33: WHEAT, 34: SOLAR,
+        40: FOREST, 41: GREEN, 42: LIME, 43: MINT, 44: TOXIC,
+        50: TEAL, 51: CYAN, 52: AQUA, 53: AZURE, 54: FROST,
+        60: NAVY, 61: BLUE, 62: SKY, 63: PERIWINKLE, 64: PLASMA,
+        70: INDIGO, 71: MAGENTA, 72: VIOLET, 73: LAVENDER, 74: HYPER
+    }
+    """
+
+    BLANK = bytes([
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    ])
+
+    DEFAULT = bytes([
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0,41,41,41,41,41,41,41,41, 0, 0, 0, 4,
+        4, 0, 0, 0,42,42,42,42,42,42,42,42, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0,41,42, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0,41,42, 0, 0, 0, 0,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0, 0,41,41,41,41,41,41,42, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0,42,42,42,42,42, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 4,
+        4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4, 4,
+    ])
+
+    SIMON = bytes([
+        64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64,
+        64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64,
+        64, 0, 0, 0,40,40,40,40,10,10,10,10, 0, 0, 0, 64,
+        64, 0, 0,40,41,41,41,42,12,11,11,11,10, 0, 0, 64,
+        64, 0,40,41,41,41,41,42,12,11,11,11,11,10, 0, 64,
+        64, 0,40,41,41,41,41,42,12,11,11,11,11,10, 0, 64,
+        64, 0,40,41,41,41,41,42,12,11,11,11,11,10, 0, 64,
+        64, 0,40,42,42,42,42,42,12,12,12,12,12,10, 0, 64,
+        64, 0,30,32,32,32,32,32,62,62,62,62,62,60, 0, 64,
+        64, 0,30,31,31,31,31,32,62,61,61,61,61,60, 0, 64,
+        64, 0,30,31,31,31,31,32,62,61,61,61,61,60, 0, 64,
+        64, 0,30,31,31,31,31,32,62,61,61,61,61,60, 0, 64,
+        64, 0, 0,30,31,31,31,32,62,61,61,61,60, 0, 0, 64,
+        64, 0, 0, 0,30,30,30,30,60,60,60,60, 0, 0, 0, 64,
+        64, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 64,
+        64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64, 64,
+    ])
+
+    SAFE = bytes([
+        20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,
+        20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,20,
+        20, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0,20,
+        20, 0,12,12,12, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0,20,
+        20, 0,12, 2, 2, 2, 1, 1, 1, 1, 2, 2, 2, 2, 0,20,
+        20, 0, 2, 2, 2, 1, 0, 0, 0, 0, 1, 2, 2, 2, 0,20,
+        20, 0, 2, 2, 1, 0, 0, 0, 0, 0, 0, 1, 2, 2, 0,20,
+        20, 0, 2, 2, 1, 0, 0,34, 0, 0, 0, 1, 2, 2, 0,20,
+        20, 0, 2, 2, 1, 0, 0, 0,34,34, 0, 1, 2, 2, 0,20,
+        20, 0, 2, 2, 1, 0, 0, 0, 0, 0,34, 1, 2, 2, 0,20,
+        20, 0, 2, 2, 2, 1, 0, 0, 0, 0, 1, 2, 2, 2, 0,20,
+        20, 0,12, 2, 2, 2, 1, 1, 1, 1, 2, 2, 2, 2, 0,20,
+        20, 0,12,12,12, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0,20,
+        20, 0, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 2, 0,20,
+        20, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,20,
+        20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20
+    ])
+
+    JEBRIS = bytes([
+        22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+        22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 71,71, 71,71, 71,71, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 71,71, 71,71, 71,71, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 0, 0, 71,71, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 0, 0, 71,71, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 0, 21,21, 0, 0, 41,41, 41,41, 31,31, 31,31, 0, 22,
+        22, 0, 21,21, 0, 0, 41,41, 41,41, 31,31, 31,31, 0, 22,
+        22, 0, 21,21, 41,41, 41,41, 0, 0, 31,31, 31,31, 0, 22,
+        22, 0, 21,21, 41,41, 41,41, 0, 0, 31,31, 31,31, 0, 22,
+        22, 0, 21,21, 21,21, 51,51, 51,51, 51,51, 51,51, 0, 22,
+        22, 0, 21,21, 21,21, 51,51, 51,51, 51,51, 51,51, 0, 22,
+        22, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 22,
+        22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22
+    ])
+
+    IND = bytes([
+        11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,
+        11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,11,
+        11, 0,31,31,31,31,31,31,31,31,31,31,31,31, 0,11,
+        11, 0,31, 1,31,31,31,31, 0, 0,31,31, 1,31, 0,11, # Top Rivets (1), Bolt Start
+        11, 0,31,31,31,31,31, 0, 0, 0,31,31,31,31, 0,11,
+        11, 0,31,31,31,31, 0, 0, 0, 0,31,31,31,31, 0,11,
+        11, 0,31,31,31, 0, 0, 0,31,31,31,31,31,31, 0,11,
+        11, 0,31,31, 0, 0, 0, 0, 0, 0, 0,31,31,31, 0,11, # The Zag!
+        11, 0,31,31,31,31, 0, 0, 0, 0,31,31,31,31, 0,11,
+        11, 0,31,31,31,31,31, 0, 0, 0,31,31,31,31, 0,11,
+        11, 0,31,31,31,31,31,31, 0, 0,31,31,31,31, 0,11,
+        11, 0,31, 1,31,31,31,31,31, 0,31,31, 1,31, 0,11, # Bottom Rivets (1), Bolt Tip
+        11, 0,31,31,31,31,31,31,31,31,31,31,31,31, 0,11,
+        11, 0,31,31,31,31,31,31,31,31,31,31,31,31, 0,11,
+        11, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,11,
+        11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11
+    ])
+
+    PONG = bytes([
+        61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 0, 4, 4, 0, 0, 1, 0, 0, 4, 0, 4, 0, 0,61, # Score: 1 vs 4
+        61, 0, 0, 0, 4, 0, 0, 1, 0, 0, 4, 4, 4, 0, 0,61,
+        61, 0, 0, 4, 4, 4, 0, 1, 0, 0, 0, 0, 4, 0, 0,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 4, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61, # Left Paddle
+        61, 0, 4, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 4, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 3, 0, 4, 0, 0,61, # Right Paddle
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 4, 0, 0,61, # Ball incoming!
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 4, 0, 0,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0,61,
+        61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61
+    ])
+
+    ASTRO_BREAKER = bytes([
+        41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0,10,10,11, 0,70,71,71,70, 0,11,10,10, 0,41,
+        41, 0,10,10,11, 0,70,71,71,70, 0,11,10,10, 0,41,
+        41, 0,11,11,11, 0,70,70,70,70, 0,11,11,11, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0,50,52,50, 0,50,52,52,50, 0,50,52,50, 0,41,
+        41, 0,50,51,50, 0, 0, 0,51,50, 0,50,51,50, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 0, 0,24, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 3, 3, 3, 3, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,
+        41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41
+    ])
+
+    DATA_FLOW = bytes([
+        61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61,
+        61,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0, 11, 13, 13, 13, 13,  6,  0, 61,  # Upper '/' mirror, beam right, target
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,  # Beam going up
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0, 12,  0,  0,  0, 61,  # Beam up, spare '\' mirror
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,  0,  0, 61,
+        61,  4,  4, 13, 13, 13, 13, 13, 11,  0,  0,  0,  0,  0,  0, 61,  # Source (green), beam, lower '/' mirror
+        61,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 61,
+        61,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 61,
+        61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61
+    ])
+
+    FOLDER = bytes([
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0,30,30,30,30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, # Tab (Dark MUD/30)
+        0, 0,30,31,31,30, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, # Tab Highlight (YELLOW/31)
+        0, 0,30,31,31,30,30,30,30,30,30,30,30,30, 0, 0, # Back folder top
+        0, 0,30,31,31,31,31,31,31,31,31,31,31,30, 0, 0,
+        0, 0,30, 4, 4, 4, 4, 4, 4, 4, 4, 4,31,30, 0, 0, # Paper peeking out (WHITE/4)
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0, # Front flap light (CREAM/32)
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,32,32,32,32,32,32,32,32,32,32,30, 0, 0,
+        0, 0,30,30,30,30,30,30,30,30,30,30,30,30, 0, 0, # Bottom Shadow
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0
+    ])
+
+    # 16x16 icon for NEON BEATS rhythm game.
+    # Four falling-note lanes (cols 2, 6, 10, 14) with staggered cyan notes
+    # and a white hit-zone line at the bottom row.
+    RHYTHM = bytes([
+        # Row 0
+        0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 1
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,
+        # Row 2
+        0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 3
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,
+        # Row 4
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,
+        # Row 5 – chord: lanes 0 + 1
+        0,  0, 51,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 6
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 7
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,
+        # Row 8
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 9 – chord: lanes 0 + 3
+        0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,
+        # Row 10
+        0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 11
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 12 – chord: lanes 2 + 3
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0, 51,  0,
+        # Row 13
+        0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 14 – lane guide markers (dim charcoal at each lane column)
+        0,  0,  1,  0,  0,  0,  1,  0,  0,  0,  1,  0,  0,  0,  1,  0,
+        # Row 15 – white hit zone
+        4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,
+    ])
+
+    # 16x16 icon for EMOJI REVEAL game mode.
+    # A stylised eye / magnifier to represent "reveal".
+    EMOJI_REVEAL = bytes([
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0, 62, 62, 62, 62, 62, 62, 62, 62,  0,  0,  0,  0,
+        0,  0,  0, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62,  0,  0,  0,
+        0,  0, 62, 62, 62,  4,  4,  4,  4,  4,  4, 62, 62, 62,  0,  0,
+        0,  0, 62,  4,  4, 61, 61, 61, 61, 61, 61,  4,  4, 62,  0,  0,
+        0,  0, 62,  4, 61, 61,  4,  4,  4,  4, 61, 61,  4, 62,  0,  0,
+        0,  0, 62,  4, 61,  4,  4,  4,  4,  4,  4, 61,  4, 62,  0,  0,
+        0,  0, 62,  4, 61,  4,  4,  4,  4,  4,  4, 61,  4, 62,  0,  0,
+        0,  0, 62,  4, 61,  4,  4,  4,  4,  4,  4, 61,  4, 62,  0,  0,
+        0,  0, 62,  4, 61, 61,  4,  4,  4,  4, 61, 61,  4, 62,  0,  0,
+        0,  0, 62,  4,  4, 61, 61, 61, 61, 61, 61,  4,  4, 62,  0,  0,
+        0,  0, 62, 62, 62,  4,  4,  4,  4,  4,  4, 62, 62, 62,  0,  0,
+        0,  0,  0, 62, 62, 62, 62, 62, 62, 62, 62, 62, 62,  0,  0,  0,
+        0,  0,  0,  0, 62, 62, 62, 62, 62, 62, 62, 62,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 14x14 Skull icon (white skull with dark eye sockets).
+    # Intentionally 14x14 so that show_icon(border_color=...) adds a 1px frame
+    # and the total footprint fills a 16x16 matrix.
+    SKULL = bytes([
+        0,  0,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  0,  0,
+        0,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  0,
+        4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,
+        4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,
+        4,  4,  0,  0,  0,  4,  4,  4,  0,  0,  0,  4,  4,  4,
+        4,  4,  0,  0,  0,  4,  4,  4,  0,  0,  0,  4,  4,  4,
+        4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,
+        0,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  0,
+        0,  4,  0,  4,  0,  4,  4,  0,  4,  0,  4,  4,  4,  0,
+        0,  4,  0,  4,  0,  4,  4,  0,  4,  0,  4,  4,  4,  0,
+        0,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  0,
+        0,  0,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  0,  0,
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 14x14 Ghost icon (frost-blue ghost shape with white eyes).
+    # Intentionally 14x14 to accommodate a 1px border on a 16x16 matrix.
+    GHOST = bytes([
+        0,  0,  0, 54, 54, 54, 54, 54, 54, 54, 54,  0,  0,  0,
+        0,  0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54,  4,  4, 54, 54, 54, 54,  4,  4, 54, 54,  0,
+        0, 54, 54,  4,  4, 54, 54, 54, 54,  4,  4, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54, 54,  0,
+        0, 54, 54,  0, 54, 54,  0,  0, 54, 54,  0, 54, 54,  0,
+        0,  0, 54, 54,  0, 54, 54, 54,  0, 54, 54,  0,  0,  0,
+        0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 14x14 Sword icon (silver blade, gold guard and handle).
+    # Intentionally 14x14 to accommodate a 1px border on a 16x16 matrix.
+    SWORD = bytes([
+        0,  0,  0,  0,  0,  4,  4,  4,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+       22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,
+        0,  0,  0,  0,  0, 22, 22,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0, 22, 22,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0, 22, 22,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0, 22, 22,  0,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0, 22, 22, 22, 22,  0,  0,  0,  0,  0,  0,
+        0,  0,  0,  0, 22, 22, 22, 22,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 14x14 Shield icon (blue body, gold trim).
+    # Intentionally 14x14 to accommodate a 1px border on a 16x16 matrix.
+    SHIELD = bytes([
+        0,  0, 22, 22, 22, 22, 22, 22, 22, 22, 22, 22,  0,  0,
+        0, 22, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 22,  0,
+        0, 22, 61, 61, 61, 61, 61, 61, 61, 61, 61, 61, 22,  0,
+        0, 22, 61, 22, 22, 61, 61, 22, 22, 61, 61, 61, 22,  0,
+        0, 22, 61, 22, 22, 61, 61, 22, 22, 61, 61, 61, 22,  0,
+        0, 22, 61, 61, 61, 22, 22, 61, 61, 61, 61, 61, 22,  0,
+        0, 22, 61, 61, 61, 22, 22, 61, 61, 61, 61, 61, 22,  0,
+        0,  0, 22, 61, 61, 61, 61, 61, 61, 61, 61, 22,  0,  0,
+        0,  0, 22, 61, 61, 61, 61, 61, 61, 61, 61, 22,  0,  0,
+        0,  0,  0, 22, 61, 61, 61, 61, 61, 61, 22,  0,  0,  0,
+        0,  0,  0, 22, 61, 61, 61, 61, 61, 61, 22,  0,  0,  0,
+        0,  0,  0,  0, 22, 61, 61, 61, 61, 22,  0,  0,  0,  0,
+        0,  0,  0,  0,  0, 22, 22, 22, 22,  0,  0,  0,  0,  0,
+        0,  0,  0,  0,  0,  0, 22, 22,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Frequency Hunter mode icon: concentric radar rings with a hot centre pip
+    # Uses CYAN (51) for outer ring, BLUE (61) for mid ring, FROST (54) for centre
+    FREQ_HUNTER = bytes([
+        51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0,61, 0, 0, 0, 0, 0, 0, 0, 0,61, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0,52, 0, 0, 0, 0,52, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0,54,54, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0,54,54, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0,52, 0, 0, 0, 0,52, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0,61, 0, 0, 0, 0, 0, 0, 0, 0,61, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,51,
+        51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,
+    ])
+
+    # 16x16 icon for the Zero Player menu entry.
+    # Shows two classic Conway gliders (green and lime) on a navy background.
+    ZERO_PLAYER = bytes([
+        60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0,41, 0, 0, 0, 0, 0,41, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0,41, 0, 0, 0, 0, 0,41, 0, 0,60,
+        60, 0, 0, 0,41,41,41, 0, 0, 0,41,41,41, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0,42, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0,42, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0,42,42,42, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,60,
+        60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,
+    ])
+
+    # 16x16 icon for Conway's Game of Life mode.
+    # Shows a glider (top-left), a still-life 2x2 block (mid-right),
+    # and a blinker oscillator (centre-bottom) on a forest-green background.
+    CONWAYS_LIFE = bytes([
+        40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0,41, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0,41, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0,41,41,41, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,41, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0,41,41, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0,42,42,42, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,40,
+        40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,
+    ])
+
+    # 16x16 icon for Langton's Ant mode.
+    # Shows the characteristic early-stage diamond trail pattern with a
+    # white ant marker at the centre, on a black background.
+    # 51=CYAN (trail cells), 4=WHITE (ant marker), 0=black background.
+    LANGTONS_ANT = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 51,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,  0,
+         0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,
+         0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,
+         0, 51, 51,  0,  0,  0,  0,  4,  0,  0,  0,  0, 51, 51,  0,  0,
+         0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,
+         0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,
+         0,  0,  0,  0, 51,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 16x16 icon for Wolfram 1D Cellular Automata mode.
+    # Shows the first seven rows of a Rule 90 Sierpiński triangle growing from
+    # a single center pixel at the top, on an indigo background.
+    # 70=INDIGO (background), 51=CYAN (alive cells).
+    WOLFRAM_AUTOMATA = bytes([
+        70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,  # border
+        70, 0, 0, 0, 0, 0, 0, 0,51, 0, 0, 0, 0, 0, 0,70,  # step 0
+        70, 0, 0, 0, 0, 0, 0,51, 0,51, 0, 0, 0, 0, 0,70,  # step 1
+        70, 0, 0, 0, 0, 0,51, 0, 0, 0,51, 0, 0, 0, 0,70,  # step 2
+        70, 0, 0, 0, 0,51, 0,51, 0,51, 0,51, 0, 0, 0,70,  # step 3
+        70, 0, 0, 0,51, 0, 0, 0, 0, 0, 0, 0,51, 0, 0,70,  # step 4
+        70, 0, 0,51, 0,51, 0, 0, 0, 0, 0,51, 0,51, 0,70,  # step 5
+        70, 0,51, 0, 0, 0,51, 0, 0, 0,51, 0, 0, 0,51,70,  # step 6
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,70,
+        70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,  # border
+    ])
+
+    # 16x16 icon for the Lissajous Curve Generator mode.
+    # Shows a 1:2 Lissajous figure-8 curve on a navy background.
+    # 60=NAVY (background), 74=HYPER (neon magenta curve).
+    LISSAJOUS = bytes([
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+        60,  0, 74, 74, 74,  0,  0,  0,  0,  0,  0, 74, 74, 74,  0, 60,
+        60,  0, 74,  0, 74, 74,  0,  0,  0,  0, 74, 74,  0, 74,  0, 60,
+        60, 74, 74,  0,  0, 74,  0,  0,  0,  0, 74,  0,  0, 74, 74, 60,
+        60, 74,  0,  0,  0, 74, 74,  0,  0, 74, 74,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0, 74,  0,  0, 74,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0,  0, 74, 74,  0,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0,  0, 74, 74,  0,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0,  0, 74, 74,  0,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0,  0, 74, 74,  0,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0,  0, 74,  0,  0, 74,  0,  0,  0,  0, 74, 60,
+        60, 74,  0,  0,  0, 74, 74,  0,  0, 74, 74,  0,  0,  0, 74, 60,
+        60, 74, 74,  0,  0, 74,  0,  0,  0,  0, 74,  0,  0, 74, 74, 60,
+        60,  0, 74,  0, 74, 74,  0,  0,  0,  0, 74, 74,  0, 74,  0, 60,
+        60,  0, 74, 74, 74,  0,  0,  0,  0,  0,  0, 74, 74, 74,  0, 60,
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+    ])
+
+    # 16x16 icon for the Boids Flocking Simulation mode.
+    # Shows a loose flock of dots (cyan boids) in a natural cluster on a
+    # black background, suggesting emergent schooling behaviour.
+    # 0=black (background), 51=CYAN (boids).
+    BOIDS = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 51,  0, 51,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 51,  0, 51,  0, 51,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0, 51,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0, 51,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 16x16 icon for the Falling Sand particle simulation mode.
+    # Shows sand (yellow=31) falling through a gap in a wood (brown=20)
+    # platform, water (blue=61) pooling on the right, and fire (red=14)
+    # flickering on the left – all on a black background.
+    FALLING_SAND = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 31, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 31, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0, 20, 20,  0,  0, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,  0,
+         0,  0,  0, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 31, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 31, 31, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,  0,
+         0, 14, 14,  0,  0,  0,  0,  0,  0, 61, 61, 61, 61, 61, 61,  0,
+         0, 14,  0,  0,  0,  0,  0,  0,  0, 61, 61, 61, 61, 61, 61,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0, 61, 61, 61, 61, 61, 61,  0,
+         0, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20, 20,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Plasma: demoscene plasma visualizer – concentric colour rings radiating
+    # from the centre using cyan (51), plasma-blue (64), magenta (71),
+    # periwinkle (63) and blue (61) on a black (0) background.
+    PLASMA = bytes([
+        63, 63, 63, 63, 71, 71, 71, 71, 71, 71, 71, 71, 63, 63, 63, 63,
+        63, 63, 63, 71, 64, 64, 51, 51, 51, 51, 64, 64, 71, 63, 63, 63,
+        63, 63, 71, 64, 51, 51, 51, 51, 51, 51, 51, 51, 64, 71, 63, 63,
+        63, 71, 64, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 64, 71, 63,
+        71, 64, 51, 51, 51, 51, 64, 71, 71, 64, 51, 51, 51, 51, 64, 71,
+        71, 64, 51, 51, 51, 71, 63, 63, 63, 63, 71, 51, 51, 51, 64, 71,
+        71, 51, 51, 51, 64, 63, 61, 61, 61, 61, 63, 64, 51, 51, 51, 71,
+        71, 51, 51, 51, 71, 63, 61, 61, 61, 61, 63, 71, 51, 51, 51, 71,
+        71, 51, 51, 51, 71, 63, 61, 61, 61, 61, 63, 71, 51, 51, 51, 71,
+        71, 51, 51, 51, 64, 63, 61, 61, 61, 61, 63, 64, 51, 51, 51, 71,
+        71, 64, 51, 51, 51, 71, 63, 63, 63, 63, 71, 51, 51, 51, 64, 71,
+        71, 64, 51, 51, 51, 51, 64, 71, 71, 64, 51, 51, 51, 51, 64, 71,
+        63, 71, 64, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 64, 71, 63,
+        63, 63, 71, 64, 51, 51, 51, 51, 51, 51, 51, 51, 64, 71, 63, 63,
+        63, 63, 63, 71, 64, 64, 51, 51, 51, 51, 64, 64, 71, 63, 63, 63,
+        63, 63, 63, 63, 71, 71, 71, 71, 71, 71, 71, 71, 63, 63, 63, 63,
+    ])
+
+    # Wireworld: copper loop (21=ORANGE) with electron head (61=BLUE) and
+    # electron tail (51=CYAN) on a black background.  Mirrors Pattern 1.
+    WIREWORLD = bytes([
+          0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+          0, 51, 61, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 21,  0,
+          0, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21, 21,  0,
+          0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Orbital Strike: tactical fire-control reticle
+    # Dark background (0), red target dot (11), green crosshair arms (41),
+    # hollow centre (0), cyan outer ring marks (51), orange corner brackets (21).
+    ORBITAL_STRIKE = bytes([
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0, 21,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0, 21,  0,  0,
+         0,  0, 21,  0,  0,  0,  0, 41,  0,  0,  0,  0, 21,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        41, 41, 41, 41, 41,  0,  0,  0,  0,  0, 41, 41, 41, 41, 41, 41,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 51,  0,  0,  0, 51,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0, 21,  0,  0,  0,  0, 41,  0,  0,  0,  0, 21,  0,  0,  0,
+         0, 21,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0, 21,  0,  0,
+        11,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Iron Canopy: tactical radar display
+    # Dark navy background, green sweep line (NW diagonal), outer ring in cyan,
+    # inner ring in teal, white base center, red bogey contacts.
+    # Color key: 60=NAVY bg, 51=CYAN ring, 50=TEAL ring, 41=GREEN sweep,
+    #            4=WHITE center, 11=RED bogeys
+    IRON_CANOPY = bytes([
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+        60, 60, 60, 60, 60, 51, 51, 51, 51, 51, 51, 60, 60, 60, 60, 60,
+        60, 60, 60, 51, 51, 60, 60, 60, 60, 60, 60, 51, 51, 60, 60, 60,
+        60, 60, 51, 60, 60, 60, 50, 50, 50, 50, 60, 60, 60, 51, 60, 60,
+        60, 60, 51, 60, 60, 50, 60, 60, 60, 60, 50, 60, 60, 51, 60, 60,
+        60, 51, 60, 60, 50, 60, 60, 60, 60, 60, 60, 50, 60, 60, 51, 60,
+        60, 51, 60, 50, 60, 60, 60,  4,  4, 60, 60, 60, 50, 60, 51, 60,
+        60, 51, 60, 50, 60, 60,  4,  4,  4,  4, 60, 60, 50, 60, 51, 60,
+        60, 41, 41, 41, 41, 60,  4,  4,  4,  4, 60, 60, 50, 60, 51, 60,
+        60, 51, 60, 41, 50, 60, 60,  4,  4, 60, 60, 60, 50, 60, 51, 60,
+        60, 51, 60, 60, 41, 50, 60, 60, 60, 60, 60, 50, 60, 60, 51, 60,
+        60, 51, 11, 60, 60, 41, 50, 60, 60, 60, 50, 60, 60, 60, 51, 60,
+        60, 60, 51, 60, 60, 60, 41, 50, 50, 50, 60, 60, 60, 51, 60, 60,
+        60, 60, 51, 60, 60, 60, 60, 41, 60, 60, 11, 60, 51, 60, 60, 60,
+        60, 60, 60, 51, 51, 60, 60, 60, 41, 60, 60, 51, 51, 60, 60, 60,
+        60, 60, 60, 60, 60, 51, 51, 51, 51, 51, 51, 60, 60, 60, 60, 60,
+    ])
+
+    # Abyssal Ping – sonar display with submarine silhouette.
+    # Top half (rows 0-7): navy water (60) background with a side-profile
+    # submarine: conning tower (2/GRAY), hull body (3/SILVER outline 2/GRAY).
+    # Bottom half (rows 8-15): black background showing a V-shaped sonar
+    # sweep cone (41/GREEN) expanding from below the hull, outer sonar rings
+    # (51/CYAN), and a detected target ping (11/RED) at the centre-bottom.
+    ABYSSAL_PING = bytes([
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+        60, 60, 60, 60, 60, 60, 60,  2, 60, 60, 60, 60, 60, 60, 60, 60,
+        60, 60, 60, 60, 60, 60,  2,  2,  2, 60, 60, 60, 60, 60, 60, 60,
+        60, 60, 60,  2,  2,  2,  2,  2,  2,  2,  2,  2,  2, 60, 60, 60,
+        60, 60,  2,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  2, 60,
+        60, 60,  2,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  2, 60,
+        60, 60, 60,  2,  2,  2,  2,  2,  2,  2,  2,  2,  2, 60, 60, 60,
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+         0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 41,  0, 41,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 41,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 41,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,
+         0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,  0,
+         0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Abyssal Rover – top-down dark maze with a 5×5 spotlight centered on rover.
+    # Background: black (0) with faint charcoal (1) corridor glimpses.
+    # Viewport halo: teal (50) 5×5 square centered at (7,7).
+    # Rover at (7,7): cyan (51) body with navy (60) cockpit dot.
+    # Exit marker at bottom-right corner: gold (22).
+    # Visible corridor: slim charcoal lines above and below viewport.
+    ABYSSAL_ROVER = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0  corridor glimpse north
+         0,   1,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   1,   0,  # Row  1  dim walls
+         0,   0,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  2
+         0,   0,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  3  corridor to viewport top
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  4  gap before viewport
+         0,   0,   0,   0,   0,  50,  50,  50,  50,  50,   0,   0,   0,   0,   0,   0,  # Row  5  viewport top edge (teal)
+         0,   0,   0,   0,   0,  50,  51,  51,  51,  50,   0,   0,   0,   0,   0,   0,  # Row  6  rover top half
+         0,   0,   0,   0,   0,  50,  51,  60,  51,  50,   0,   0,   0,   0,   0,   0,  # Row  7  rover core (navy cockpit)
+         0,   0,   0,   0,   0,  50,  51,  51,  51,  50,   0,   0,   0,   0,   0,   0,  # Row  8  rover bottom half
+         0,   0,   0,   0,   0,  50,  50,  50,  50,  50,   0,   0,   0,   0,   0,   0,  # Row  9  viewport bottom edge (teal)
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 10  gap after viewport
+         0,   0,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 11  corridor south of viewport
+         0,   1,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   1,   0,  # Row 12  dim walls
+         0,   0,   0,   0,   0,   0,   0,   1,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 13
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  22,  22,   0,  # Row 14  exit marker (gold)
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  22,  22,   0,  # Row 15  exit marker (gold)
+    ])
+
+    # DEFCON Commander – 10-silo missile complex viewed from above
+    # Dark background with 10 small silo dots (Yellow) and a key symbol
+    DEFCON_COMMANDER = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  2,  2,  2,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  0,  0,  2,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  2,  0,  0,  2,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  2,  2,  2,  0, 22, 22,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  0,  0,  2,  0,  0, 22,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  2,  0,  0, 22, 22,  0,  0,
+         0, 31, 31,  0, 31, 31,  0, 11,  0,  2,  0,  0,  0, 22,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  0, 11,  2,  0,  0, 22, 22,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  2,  0,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  0,  0,  2,  0,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  2,  2,  2,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  2,  0,  0,  2,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  0,  0,  2,  0,  0,  0,  0,  0,
+         0, 31, 31,  0, 31, 31,  0,  2,  2,  2,  2,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Artillery Command – steampunk cannon side-view
+    # Barrel (gray/silver) points left with muzzle flash (orange);
+    # breech ring and wheel spokes in gold/brass; carriage in brown/wood.
+    # Colour key: 0=OFF, 2=GRAY, 3=SILVER, 20=BROWN, 21=ORANGE, 22=GOLD, 11=RED
+    ARTILLERY_COMMAND = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,  11,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0  target north
+         0,   0,   0,   0,   0,   0,   0,  11,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  1
+         0,   0,   0,   0,   0,   0,   0,  11,   0,   0,   0,  22,  22,  22,   0,   0,  # Row  2  breech ring top
+        21,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  3  muzzle flash hint
+        21,  21,   2,   2,   2,   2,   2,   2,   2,   2,   2,  22,   3,  22,   0,   0,  # Row  4  barrel top + breech
+        21,  21,   3,   3,   3,   3,   3,   3,   3,   3,   3,  22,   3,  22,   0,   0,  # Row  5  barrel bore
+         0,  21,   2,   2,   2,   2,   2,   2,   2,   2,   2,  22,   3,  22,   0,   0,  # Row  6  barrel bottom + breech
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  22,  22,  22,   0,   0,  # Row  7  breech ring bottom
+         0,   0,   0,   0,   0,   0,   0,  20,  20,  20,  20,  20,  20,  20,  20,   0,  # Row  8  carriage top beam
+         0,   0,   0,   0,   0,   0,  20,  20,  20,  20,  20,  20,  20,  20,  20,   0,  # Row  9  carriage body
+         0,   0,   0,   0,   0,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,   0,  # Row 10  carriage lower
+         0,  22,  22,   0,  20,   0,   0,   0,   0,   0,   0,  20,   0,  22,  22,   0,  # Row 11  wheel tops + carriage
+        22,   0,   0,  22,  20,   0,   0,   0,   0,   0,   0,  20,  22,   0,   0,  22,  # Row 12  wheel sides
+         0,  22,  22,   0,  20,  20,  20,  20,  20,  20,  20,  20,   0,  22,  22,   0,  # Row 13  wheel bottoms
+        20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  20,  # Row 14  ground line
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 15
+    ])
+
+    # -------------------------------------------------------------------------
+    # Enigma Byte icon (16x16)
+    # A padlock with 8 binary-bit dots on the body and a glowing keyhole.
+    # Colour key:
+    #   0=OFF  51=CYAN  64=NAVY  41=GREEN  31=YELLOW
+    # -------------------------------------------------------------------------
+    ENIGMA_BYTE = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0
+         0,   0,   0,   0,   0,  51,  51,  51,  51,  51,   0,   0,   0,   0,   0,   0,  # Row  1  arch top
+         0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  # Row  2  arch sides
+         0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  # Row  3  arch sides
+         0,   0,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,   0,   0,  # Row  4  lock body top
+         0,   0,  64,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  64,   0,   0,  # Row  5
+         0,   0,  64,   0,  51,   0,  51,   0,  51,   0,  51,   0,   0,  64,   0,   0,  # Row  6  8 bit dots (top)
+         0,   0,  64,   0,  51,   0,  51,   0,  51,   0,  51,   0,   0,  64,   0,   0,  # Row  7  8 bit dots (top)
+         0,   0,  64,   0,   0,   0,   0,  41,  41,   0,   0,   0,   0,  64,   0,   0,  # Row  8  keyhole top
+         0,   0,  64,   0,   0,   0,   0,  41,  41,   0,   0,   0,   0,  64,   0,   0,  # Row  9  keyhole mid
+         0,   0,  64,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  64,   0,   0,  # Row 10
+         0,   0,  64,   0,  51,   0,  51,   0,  51,   0,  51,   0,   0,  64,   0,   0,  # Row 11  8 bit dots (bot)
+         0,   0,  64,   0,  51,   0,  51,   0,  51,   0,  51,   0,   0,  64,   0,   0,  # Row 12  8 bit dots (bot)
+         0,   0,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,  64,   0,   0,  # Row 13  lock body bot
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 14
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 15
+    ])
+
+    # Orbital Docking: targeting crosshair with expanding docking ring
+    # Colour key: 0=OFF  21=ORANGE(docking port)  41=GREEN(crosshair arms)
+    #             51=CYAN(outer ring)  4=WHITE(centre dot)
+    ORBITAL_DOCKING = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0  top arm
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  1
+         0,  51,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,  51,   0,   0,  # Row  2  outer ring corners
+         0,   0,  51,   0,   0,   0,   0,  41,   0,   0,   0,   0,  51,   0,   0,   0,  # Row  3
+         0,   0,   0,  51,   0,   0,   0,  41,   0,   0,   0,  51,   0,   0,   0,   0,  # Row  4
+         0,   0,   0,   0,   0,  51,   0,  41,   0,  51,   0,   0,   0,   0,   0,   0,  # Row  5  inner ring
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  6
+        41,  41,  41,  41,  41,  41,  41,   4,  41,  41,  41,  41,  41,  41,  41,  41,  # Row  7  horizontal arm + centre
+         0,   0,   0,   0,   0,   0,   0,  21,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  8  docking port (orange)
+         0,   0,   0,   0,   0,  51,   0,  41,   0,  51,   0,   0,   0,   0,   0,   0,  # Row  9  inner ring
+         0,   0,   0,  51,   0,   0,   0,  41,   0,   0,   0,  51,   0,   0,   0,   0,  # Row 10
+         0,   0,  51,   0,   0,   0,   0,  41,   0,   0,   0,   0,  51,   0,   0,   0,  # Row 11
+         0,  51,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,  51,   0,   0,  # Row 12  outer ring corners
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 13
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 14
+         0,   0,   0,   0,   0,   0,   0,  41,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 15  bottom arm
+    ])
+
+    # -------------------------------------------------------------------------
+    # Vanguard Override – top-down vertical shooter splash.
+    # Colour key:
+    #   0=OFF  4=WHITE(stars)  11=RED(enemies)  21=ORANGE(enemy bullets)
+    #  31=YELLOW(player laser)  51=CYAN(player ship)  61=BLUE(ship wings)
+    # -------------------------------------------------------------------------
+    VANGUARD_OVERRIDE = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   4,   0,   0,   0,   0,   0,   0,   4,   0,   0,   0,   4,   0,  # Row  0  stars
+         0,   0,  11,  11,  11,   0,   0,   0,   0,   0,  11,  11,  11,   0,   0,   0,  # Row  1  enemies
+         0,   0,  11,   0,  11,   0,   0,   0,   0,   0,  11,   0,  11,   0,   0,   0,  # Row  2  enemies
+         0,   0,  11,  11,  11,   0,   0,   0,   0,   0,  11,  11,  11,   0,   0,   0,  # Row  3  enemies
+         0,   0,   0,  21,   0,   0,   0,   0,   0,   0,   0,  21,   0,   0,   0,   0,  # Row  4  enemy bullets
+         0,   0,   0,  21,   0,   0,   0,   0,   0,   0,   0,  21,   0,   0,   0,   0,  # Row  5  enemy bullets
+         0,   0,   0,   0,   0,   0,  11,  11,  11,   0,   0,   0,   0,   0,   0,   0,  # Row  6  centre enemy
+         0,   0,   0,   0,   0,   0,  11,   0,  11,   0,   0,   0,   0,   0,   0,   0,  # Row  7  centre enemy
+         0,   0,   0,   0,   0,   0,   0,  21,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  8  enemy bullet
+         0,   0,   0,   0,   0,   0,   0,  31,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  9  player laser
+         0,   0,   0,   0,   0,   0,   0,  31,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 10  player laser
+         0,   4,   0,   0,   0,   0,   0,  31,   0,   0,   0,   0,   0,   0,   0,   4,  # Row 11  stars + laser
+         0,   0,   0,   0,   0,   0,   0,  31,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 12  player laser
+         0,   0,   0,   0,   0,  61,   0,   0,   0,  61,   0,   0,   0,   0,   0,   0,  # Row 13  ship wings
+         0,   0,   0,   0,  61,  51,  51,  51,  51,  51,  61,   0,   0,   0,   0,   0,  # Row 14  ship body
+         0,   0,   0,   0,   0,  51,   0,  51,   0,  51,   0,   0,   0,   0,   0,   0,  # Row 15  ship engines
+    ])
+
+    # Magnetic Containment: plasma ball enclosed in a magnetic field coil.
+    # Colour key:
+    #   0=OFF  51=CYAN (field lines)  61=BLUE (coil ring)  71=MAGENTA (plasma core)
+    # -------------------------------------------------------------------------
+    MAGNETIC_CONTAINMENT = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0
+         0,   0,   0,   0,   0,  51,   0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  # Row  1  NW/NE field dots
+         0,   0,   0,  51,   0,   0,   0,   0,   0,   0,   0,   0,  51,   0,   0,   0,  # Row  2  diagonal field dots
+         0,   0,  51,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  51,   0,   0,  # Row  3  corner field dots
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  4
+         0,  51,   0,   0,   0,   0,  61,  61,  61,  61,   0,   0,   0,   0,  51,   0,  # Row  5  coil top arc
+         0,   0,   0,   0,   0,  61,   0,   0,   0,   0,  61,   0,   0,   0,   0,   0,  # Row  6  coil sides
+         0,   0,   0,   0,   0,  61,   0,  71,  71,   0,  61,   0,   0,   0,   0,   0,  # Row  7  plasma core
+         0,   0,   0,   0,   0,  61,   0,  71,  71,   0,  61,   0,   0,   0,   0,   0,  # Row  8  plasma core
+         0,   0,   0,   0,   0,  61,   0,   0,   0,   0,  61,   0,   0,   0,   0,   0,  # Row  9  coil sides
+         0,  51,   0,   0,   0,   0,  61,  61,  61,  61,   0,   0,   0,   0,  51,   0,  # Row 10  coil bottom arc
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 11
+         0,   0,  51,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  51,   0,   0,  # Row 12  corner field dots
+         0,   0,   0,  51,   0,   0,   0,   0,   0,   0,   0,   0,  51,   0,   0,   0,  # Row 13  diagonal field dots
+         0,   0,   0,   0,   0,  51,   0,   0,   0,   0,  51,   0,   0,   0,   0,   0,  # Row 14  SW/SE field dots
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 15
+    ])
+
+    # Bunker Defuse icon (16x16)
+    # A classic round bomb with a lit fuse and toggle-switch silhouettes.
+    # Colour key:
+    #   0=OFF  1=CHARCOAL  4=WHITE  11=RED  21=ORANGE  22=GOLD  31=YELLOW  51=CYAN
+    # -------------------------------------------------------------------------
+    BUNKER_DEFUSE = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  22,  22,   0,   0,   0,   0,  # Row  0  fuse top
+         0,   0,   0,   0,   0,   0,   0,   0,   0,  22,   0,   0,  31,   0,   0,   0,  # Row  1  fuse bend + spark
+         0,   0,   0,   0,   0,   0,   0,   0,  22,   0,   0,  21,  31,  21,   0,   0,  # Row  2  fuse + flame
+         0,   0,   0,   0,   0,   1,   1,   1,  22,  1,    1,   0,  31,   0,   0,   0,  # Row  3  fuse socket + bomb top
+         0,   0,   0,   1,   1,  11,  11,  11,  11,  11,  11,   1,   1,   0,   0,   0,  # Row  4  bomb upper body
+         0,   0,   1,  11,  11,  11,   4,  11,  11,  11,  11,  11,  11,   1,   0,   0,  # Row  5  highlight
+         0,   1,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,   1,   0,  # Row  6  bomb mid
+         0,   1,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,   1,   0,  # Row  7  bomb mid
+         0,   0,   1,  11,  11,  11,  11,  11,  11,  11,  11,  11,  11,   1,   0,   0,  # Row  8  bomb lower body
+         0,   0,   0,   1,   1,  11,  11,  11,  11,  11,  11,   1,   1,   0,   0,   0,  # Row  9  bomb bottom
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 10  gap
+         0,  51,   0,  51,   0,  51,   0,  51,   0,  51,   0,  51,   0,  51,   0,  51,  # Row 11  toggle dots (8 off)
+         0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,  # Row 12  toggle stems
+         0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,   0,   1,  # Row 13  toggle base
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 14
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row 15
+    ])
+
+    # -------------------------------------------------------------------------
+    # Maglev Express icon (16x16)
+    # Front-on view of a futuristic maglev train nose with headlights, track
+    # lines converging from the bottom corners, and a speed stripe.
+    # Colour key:
+    #   0=OFF  2=GRAY  3=SILVER  51=CYAN  41=GREEN  11=RED  31=YELLOW
+    # -------------------------------------------------------------------------
+    MAGLEV_EXPRESS = bytes([
+        #        0    1    2    3    4    5    6    7    8    9   10   11   12   13   14   15
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  0
+         0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  # Row  1
+         0,   0,   0,   2,   2,   2,   2,   2,   2,   2,   2,   2,   2,   0,   0,   0,  # Row  2  nose top
+         0,   0,   2,   3,   3,   3,   3,   3,   3,   3,   3,   3,   3,   2,   0,   0,  # Row  3  nose body
+         0,   2,   3,   3,   3,   3,   3,   3,   3,   3,   3,   3,   3,   3,   2,   0,  # Row  4  nose wide
+         0,   2,   3,  31,  31,   3,   3,   3,   3,   3,   3,  31,  31,   3,   2,   0,  # Row  5  headlights (yellow)
+         0,   2,   3,  51,  51,   3,   3,   2,   2,   3,   3,  51,  51,   3,   2,   0,  # Row  6  headlights (cyan) + centre stripe
+         0,   2,   3,   3,   3,   3,   2,   3,   3,   2,   3,   3,   3,   3,   2,   0,  # Row  7  windshield frame
+         0,   2,   3,   3,   3,  51,  51,  51,  51,  51,  51,   3,   3,   3,   2,   0,  # Row  8  windshield glass (cyan)
+         0,   2,   3,   3,   3,   3,   3,  51,  51,   3,   3,   3,   3,   3,   2,   0,  # Row  9  windshield lower
+         0,   0,   2,   2,   2,   2,   2,   2,   2,   2,   2,   2,   2,   2,   0,   0,  # Row 10  skirt top
+         0,   0,   0,   2,   2,   2,   2,   2,   2,   2,   2,   2,   2,   0,   0,   0,  # Row 11  skirt body
+         0,   0,   0,   0,   2,   0,   0,   0,   0,   0,   0,   2,   0,   0,   0,   0,  # Row 12  track suggestion
+        51,   0,   0,   0,   2,   0,   0,   0,   0,   0,   0,   2,   0,   0,   0,  51,  # Row 13  track rails diverge
+        51,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  51,  # Row 14  outer rails
+        51,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  51,  # Row 15  bottom rail hint
+    ])
+
+    # -------------------------------------------------------------------------
+    # Virtual Pet cat sprites (16x16)
+    # Colour key:
+    #   0=OFF  1=CHARCOAL  2=GRAY  3=SILVER  4=WHITE
+    #  11=RED  13=PINK     22=GOLD 31=YELLOW 61=BLUE
+    # -------------------------------------------------------------------------
+
+    # PIPELINE_OVERLOAD – pipe maze with descending fluid blob
+    # Navy(60) background, Teal(50) pipes, Cyan(51) junctions, Orange(21) fluid
+    PIPELINE_OVERLOAD = bytes([
+        # Row  0 – top border
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+        # Row  1 – pipe columns with fluid entry (orange) in section 1
+        60, 60, 21, 21, 60, 60, 50, 50, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  2
+        60, 60, 21, 21, 60, 60, 50, 50, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  3
+        60, 60, 21, 21, 60, 60, 50, 50, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  4 – junction: fluid bends right (orange connector)
+        60, 60, 21, 21, 21, 21, 51, 51, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  5 – fluid continues in section 2 (cols 4-5)
+        60, 60, 60, 60, 60, 60, 21, 21, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  6
+        60, 60, 60, 60, 60, 60, 21, 21, 60, 60, 50, 50, 60, 60, 50, 50,
+        # Row  7 – junction: fluid bends right (cols 6-9)
+        60, 60, 60, 60, 60, 60, 21, 21, 21, 21, 51, 51, 60, 60, 50, 50,
+        # Row  8 – fluid in section 4 (cols 8-9)
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21, 60, 60, 50, 50,
+        # Row  9
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21, 60, 60, 50, 50,
+        # Row 10
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21, 60, 60, 50, 50,
+        # Row 11 – junction: fluid bends right (cols 10-13)
+        60, 60, 60, 60, 60, 60, 60, 60, 51, 51, 21, 21, 21, 21, 51, 51,
+        # Row 12 – fluid at section 6 (cols 12-13) heading to exit
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21,
+        # Row 13
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21,
+        # Row 14 – fluid exits at bottom right
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 21, 21,
+        # Row 15 – bottom border
+        60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60,
+    ])
+
+    # VIRTUAL_PET – mode menu / idle face: cute cat with happy open eyes
+    VIRTUAL_PET = bytes([
+        # Row  0
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – ear tips
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+        # Row  2 – ears
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+        # Row  3 – inner ear / top head
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+        # Row  4 – upper face
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row  5 – eyes (blue)
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+        # Row  6 – pupils (charcoal)
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+        # Row  7 – lower eye area
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  8 – nose (pink) + whisker roots (gray)
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+        # Row  9 – whiskers
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0,
+        # Row 10 – mouth corners (red)
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+        # Row 11 – mouth centre
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0,
+        # Row 12 – chin
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,  0,
+        # Row 13 – neck
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  0,  0,  0,  0,
+        # Row 14
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 15
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # CAT_IDLE – same as VIRTUAL_PET (used with PULSE animation for idle state)
+    CAT_IDLE = VIRTUAL_PET
+
+    # CAT_EAT – wide eyes + open mouth + gold food dot at chin
+    CAT_EAT = bytes([
+        # Row  0
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – ear tips
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+        # Row  2 – ears
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+        # Row  3 – inner ear / top head
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+        # Row  4 – upper face
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row  5 – eyes wide open (excited)
+         0,  0,  3,  4, 61, 61, 61,  4,  4, 61, 61, 61,  4,  3,  0,  0,
+        # Row  6 – pupils wide
+         0,  0,  3,  4,  1,  1,  1,  4,  4,  1,  1,  1,  4,  3,  0,  0,
+        # Row  7 – lower eye area
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  8 – nose + whiskers
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+        # Row  9 – mouth open top edge
+         0,  0,  3,  4,  4, 11,  4,  4,  4,  4, 11,  4,  4,  3,  0,  0,
+        # Row 10 – open mouth interior
+         0,  0,  3,  4,  4,  4, 11,  1,  1, 11,  4,  4,  4,  3,  0,  0,
+        # Row 11 – mouth bottom edge
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0,
+        # Row 12 – chin with gold food dot
+         0,  0,  0,  3,  4,  4,  4, 22, 22,  4,  4,  4,  3,  0,  0,  0,
+        # Row 13 – neck
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  0,  0,  0,  0,
+        # Row 14
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 15
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # CAT_SLEEP – closed eyes + flat mouth + yellow ZZZ in top-left
+    CAT_SLEEP = bytes([
+        # Row  0 – Z (top bar)
+        31, 31, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – Z (diagonal) + right ear tip
+         0,  0, 31,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+        # Row  2 – Z (bottom bar) + ears
+        31, 31, 31,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+        # Row  3 – top head
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+        # Row  4 – upper face
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row  5 – above closed eyes
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  6 – closed eyes (horizontal charcoal lines)
+         0,  0,  3,  4,  4,  1,  1,  1,  4,  1,  1,  1,  4,  3,  0,  0,
+        # Row  7 – below closed eyes
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  8 – nose + whiskers
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+        # Row  9 – whiskers
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0,
+        # Row 10 – relaxed flat mouth
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0,
+        # Row 11 – no lower mouth detail
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row 12 – chin
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,  0,
+        # Row 13 – neck
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  0,  0,  0,  0,
+        # Row 14
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row 15
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # -------------------------------------------------------------------------
+    # CAT_IDLE_ANIMATED - 4 Frames (1024 bytes)
+    # A subtle tail flick loop: Frame 0 (Rest) -> 1 (Lift) -> 2 (Peak) -> 3 (Lower)
+    # -------------------------------------------------------------------------
+    CAT_IDLE_ANIMATED = bytes([
+        # ==========================================
+        # FRAME 0: Tail Curled Under (Resting)
+        # ==========================================
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, # Row 0
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0, # Row 1
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0, # Row 2
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0, # Row 3
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0, # Row 4
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0, # Row 5
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0, # Row 6
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0, # Row 7
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0, # Row 8
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0, # Row 9
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0, # Row 10
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0, # Row 11
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,  0, # Row 12 (Chin)
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  3,  0,  0,  0, # Row 13 (Neck + Tail Base)
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  4,  3,  0,  0, # Row 14 (Tail Curve)
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  4,  3,  0,  0,  0, # Row 15 (Tail Tip Under)
+
+        # ==========================================
+        # FRAME 1: Tail Lifting
+        # ==========================================
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0,
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,  0,
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  3,  3,  0,  0, # Tail lifts right
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  4,  3,  0, # Tail straightens
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  0,  0, # Tip lifts off ground
+
+        # ==========================================
+        # FRAME 2: Peak Flick (Tail swoops up)
+        # ==========================================
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  3,  0, # Tail tip reaches mouth height
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  4,  3,  0, # Tail body moves up
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  3,  4,  3,  0, # Base pulls up
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  0,  0, # Bottom rounded off
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+        # ==========================================
+        # FRAME 3: Tail Lowering (Same as Frame 1)
+        # ==========================================
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  2,  4,  4,  4,  4,  4,  4,  2,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+         0,  0,  3,  4,  4,  4,  4, 11, 11,  4,  4,  4,  4,  3,  0,  0,
+         0,  0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,  0,
+         0,  0,  0,  0,  3,  3,  3,  4,  4,  3,  3,  3,  3,  3,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  4,  3,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  0,  0,
+    ])
+
+    CAT_IDLE_TIMING = (2000, 150, 150, 150)
+
+    # =========================================================================
+    # Multi-frame sprite sheet: CAT_WALK  (2 frames × 256 bytes = 512 bytes)
+    # =========================================================================
+    # A simple 2-frame walking cycle for the virtual pet PLAYING state.
+    # Colour key (same as cat face sprites above):
+    #   0=OFF  1=CHARCOAL  2=GRAY  3=SILVER  4=WHITE
+    #  11=RED  13=PINK     22=GOLD 31=YELLOW 61=BLUE 41=GREEN
+    #
+    # Frame layout (each frame is 16 rows × 16 cols = 256 bytes, row-major):
+    #   Frame 0 (bytes   0–255): Right paw forward
+    #   Frame 1 (bytes 256–511): Left  paw forward
+    # =========================================================================
+    CAT_WALK = bytes([
+        # ---- Frame 0: right paw forward ----
+        # Row  0
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – ear tips
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+        # Row  2 – ears
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+        # Row  3 – inner ear / top head
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+        # Row  4 – upper face
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row  5 – eyes
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+        # Row  6 – pupils
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+        # Row  7 – lower eye area
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  8 – nose + whiskers
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+        # Row  9 – smile
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+        # Row 10 – body
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row 11 – body mid
+         0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,
+        # Row 12 – belly
+         0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,
+        # Row 13 – legs: right paw forward (green tip), left paw straight
+         0,  3,  4,  4,  3,  4,  4,  4,  4,  4,  4,  3,  4,  4,  3,  0,
+        # Row 14 – paw tips
+         0,  3, 41,  3,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,  0,
+        # Row 15
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+        # ---- Frame 1: left paw forward ----
+        # Row  0
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – ear tips
+         0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,
+        # Row  2 – ears
+         0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,  0,  3,  3,  3,  0,
+        # Row  3 – inner ear / top head
+         0,  3, 13,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3, 13,  3,  0,
+        # Row  4 – upper face
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row  5 – eyes
+         0,  0,  3,  4,  4, 61, 61,  4,  4, 61, 61,  4,  4,  3,  0,  0,
+        # Row  6 – pupils
+         0,  0,  3,  4,  4,  1,  1,  4,  4,  1,  1,  4,  4,  3,  0,  0,
+        # Row  7 – lower eye area
+         0,  0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,  0,
+        # Row  8 – nose + whiskers
+         0,  0,  3,  4,  2,  4,  4, 13, 13,  4,  4,  2,  4,  3,  0,  0,
+        # Row  9 – smile
+         0,  0,  3,  4,  4,  4, 11,  4,  4, 11,  4,  4,  4,  3,  0,  0,
+        # Row 10 – body
+         0,  0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,  0,
+        # Row 11 – body mid
+         0,  3,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  3,  0,
+        # Row 12 – belly
+         0,  3,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  4,  3,  0,
+        # Row 13 – legs: left paw forward (green tip), right paw straight
+         0,  3,  4,  4,  3,  4,  4,  4,  4,  4,  4,  3,  4,  4,  3,  0,
+        # Row 14 – paw tips
+         0,  0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  3, 41,  3,  0,  0,
+        # Row 15
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    CAT_WALK_TIMING = (300, 300)  # Equal time for each frame
+
+    # 16x16 icon for the Bouncing Sprite (DVD-logo style) screensaver mode.
+    # Shows a tiny retro arcade spaceship (red=11, white cockpit=4) centred
+    # inside a silver (3) border that represents the bouncing arena walls.
+    BOUNCING_SPRITE = bytes([
+         3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0, 11,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0, 11,  4, 11,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0, 11,  0, 11,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,
+         3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,
+    ])
+
+    # Starfield / Warp Core – stars radiating from a bright centre point.
+    # Black background (0), dim distant stars (1=CHARCOAL), medium stars
+    # (3=SILVER), and bright close stars / warp-core centre (4=WHITE).
+    STARFIELD = bytes([
+         0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  3,  0,  0,  0,  0,  3,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  1,  0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  1,  0,
+         0,  0,  0,  0,  0,  0,  3,  4,  4,  3,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  3,  4,  4,  3,  0,  0,  0,  0,  0,  0,
+         0,  1,  0,  0,  0,  0,  0,  3,  3,  0,  0,  0,  0,  0,  1,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  3,  0,  0,  0,  0,  3,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Mecha Forge – 16×16 pixel-art robot icon
+    # Body: CYAN (51), Eyes: WHITE (4), Chest accents: GOLD (22)
+    MECHA_FORGE = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  # row  0
+         0,  0,  0,  0,  0,  0, 51, 51, 51,  0,  0,  0,  0,  0,  0,  0,  # row  1  antenna
+         0,  0,  0,  0,  0, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  0,  # row  2  head top
+         0,  0,  0,  0, 51, 51, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  # row  3  head
+         0,  0,  0,  0, 51,  4, 51, 51, 51,  4, 51,  0,  0,  0,  0,  0,  # row  4  eyes
+         0,  0,  0,  0, 51, 51, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  # row  5  face
+         0,  0,  0,  0,  0, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  0,  # row  6  chin
+         0,  0,  0,  0,  0,  0, 51, 51, 51,  0,  0,  0,  0,  0,  0,  0,  # row  7  neck
+         0,  0, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51, 51,  0,  0,  0,  # row  8  shoulder
+         0,  0,  0, 51, 51, 22, 51, 51, 51, 22, 51, 51,  0,  0,  0,  0,  # row  9  chest+accents
+         0,  0,  0, 51, 51, 51, 51, 51, 51, 51, 51, 51,  0,  0,  0,  0,  # row 10  chest
+         0,  0,  0,  0, 51, 51, 51, 51, 51, 51, 51,  0,  0,  0,  0,  0,  # row 11  waist
+         0,  0,  0,  0,  0, 51, 51,  0,  0, 51, 51,  0,  0,  0,  0,  0,  # row 12  upper legs
+         0,  0,  0,  0,  0, 51, 51,  0,  0, 51, 51,  0,  0,  0,  0,  0,  # row 13  lower legs
+         0,  0,  0,  0, 51, 51, 51,  0,  0, 51, 51, 51,  0,  0,  0,  0,  # row 14  feet
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  # row 15
+    ])
+
+    # Numbers Station – Cold War shortwave radio tower with signal waves.
+    # Antenna tip = WHITE (4), antenna mast = SILVER (3),
+    # signal waves = GOLD (22), radio body = GRAY (2),
+    # VFD screen = BLUE (61), indicator LEDs = ORANGE (21).
+    NUMBERS_STATION = bytes([
+        # Row  0 – antenna beacon (white)
+         0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  1 – inner signal wave (gold)
+         0,  0,  0,  0, 22,  0,  0,  3,  0,  0, 22,  0,  0,  0,  0,  0,
+        # Row  2 – outer signal wave
+         0,  0, 22,  0,  0,  0,  0,  3,  0,  0,  0,  0, 22,  0,  0,  0,
+        # Row  3 – antenna mast
+         0,  0,  0,  0,  0,  0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  4 – antenna mast
+         0,  0,  0,  0,  0,  0,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,
+        # Row  5 – antenna meets radio body
+         0,  0,  0,  0,  0,  0,  3,  3,  3,  0,  0,  0,  0,  0,  0,  0,
+        # Row  6 – radio top edge
+         0,  0,  0,  3,  3,  3,  3,  3,  3,  3,  3,  3,  3,  0,  0,  0,
+        # Row  7 – radio body top
+         0,  0,  0,  3,  2,  2,  2,  2,  2,  2,  2,  2,  3,  0,  0,  0,
+        # Row  8 – VFD display top
+         0,  0,  0,  3,  2, 61, 61, 61, 61, 61, 61,  2,  3,  0,  0,  0,
+        # Row  9 – VFD display centre (bright)
+         0,  0,  0,  3,  2, 61,  4,  4,  4,  4, 61,  2,  3,  0,  0,  0,
+        # Row 10 – VFD display bottom
+         0,  0,  0,  3,  2, 61, 61, 61, 61, 61, 61,  2,  3,  0,  0,  0,
+        # Row 11 – indicator lights (orange LEDs)
+         0,  0,  0,  3,  2,  2, 21,  2,  2, 21,  2,  2,  3,  0,  0,  0,
+        # Row 12 – tuning dial (gold)
+         0,  0,  0,  3,  3, 22, 22, 22, 22, 22,  3,  3,  3,  0,  0,  0,
+        # Row 13 – radio base top
+         0,  0,  0,  0,  3,  3,  3,  3,  3,  3,  3,  3,  0,  0,  0,  0,
+        # Row 14 – radio base bottom
+         0,  0,  0,  0,  0,  3,  3,  3,  3,  3,  3,  0,  0,  0,  0,  0,
+        # Row 15 – ground
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # 16×16 icon for the JEB-808 Groovebox sequencer mode.
+    # Each pair of rows represents one of the 8 instrument tracks; columns are
+    # time steps.  A handful of steps per track are lit in that track's colour
+    # to give the icon the feel of a real step-sequencer pattern.
+    #
+    # Palette indices used:
+    #   11 = RED    (KICK)    21 = ORANGE (SNARE)   31 = YELLOW (HIHAT)
+    #   41 = GREEN  (TOM)     51 = CYAN   (BASS)    71 = MAGENTA (LEAD)
+    #   61 = BLUE   (PAD)      4 = WHITE  (FX)
+    GROOVEBOX = bytes([
+        # Track 0 – KICK  (RED 11): steps 0, 4, 8, 12
+        11,  0,  0,  0, 11,  0,  0,  0, 11,  0,  0,  0, 11,  0,  0,  0,
+        11,  0,  0,  0, 11,  0,  0,  0, 11,  0,  0,  0, 11,  0,  0,  0,
+        # Track 1 – SNARE (ORANGE 21): steps 4, 12
+         0,  0,  0,  0, 21,  0,  0,  0,  0,  0,  0,  0, 21,  0,  0,  0,
+         0,  0,  0,  0, 21,  0,  0,  0,  0,  0,  0,  0, 21,  0,  0,  0,
+        # Track 2 – HIHAT (YELLOW 31): all even steps
+        31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0,
+        31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0, 31,  0,
+        # Track 3 – TOM   (GREEN 41): steps 6, 14
+         0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0, 41,  0,
+         0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0, 41,  0,
+        # Track 4 – BASS  (CYAN 51): steps 0, 3, 8, 11
+        51,  0,  0, 51,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,
+        51,  0,  0, 51,  0,  0,  0,  0, 51,  0,  0, 51,  0,  0,  0,  0,
+        # Track 5 – LEAD  (MAGENTA 71): steps 4, 7, 12, 15
+         0,  0,  0,  0, 71,  0,  0, 71,  0,  0,  0,  0, 71,  0,  0, 71,
+         0,  0,  0,  0, 71,  0,  0, 71,  0,  0,  0,  0, 71,  0,  0, 71,
+        # Track 6 – PAD   (BLUE 61): steps 0, 8
+        61,  0,  0,  0,  0,  0,  0,  0, 61,  0,  0,  0,  0,  0,  0,  0,
+        61,  0,  0,  0,  0,  0,  0,  0, 61,  0,  0,  0,  0,  0,  0,  0,
+        # Track 7 – FX    (WHITE 4): steps 2, 10
+         0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,
+         0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,
+    ])
+
+    # Lava Lamp (Metaballs) - Merging blobs in thermal colours
+    # Palette: 11=RED, 21=ORANGE, 31=YELLOW, 4=WHITE highlight
+    LAVA_LAMP = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 11, 11, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 11, 21, 21, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 11, 31, 21, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 11, 21, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 11, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 11, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0, 11, 21, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 11, 21, 31, 21, 11,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 11, 21, 31, 31, 21, 11,  0,  0,  0,  0,  0,  0,  0,
+         0,  0, 11, 21, 31,  4, 31, 21, 11,  0,  0,  0,  0,  0,  0,  0,
+         0,  0, 11, 21, 31, 31, 31, 21, 11,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 11, 21, 21, 21, 11,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 11, 11, 11,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Reaction Diffusion - Organic labyrinth coral patterns
+    # Palette: 50=TEAL, 51=CYAN
+    REACTION_DIFFUSION = bytes([
+        50, 50, 50,  0, 50, 50, 50, 50,  0, 50, 50, 50,  0,  0,  0,  0,
+        50, 51, 51, 50,  0, 51, 51, 51, 50,  0, 51, 51, 50,  0,  0,  0,
+        50, 51,  0,  0,  0, 51,  0,  0, 51,  0,  0, 51, 50,  0,  0,  0,
+        50, 51,  0, 50, 50, 51,  0, 50, 51, 51, 50, 51,  0,  0,  0,  0,
+        50, 51,  0, 51, 51, 51,  0, 51, 51, 51, 50, 51, 50, 50, 50,  0,
+        50, 51,  0, 51,  0,  0,  0,  0,  0, 51,  0, 51, 51, 51, 51, 50,
+        50, 51,  0, 51, 50, 50, 50, 50,  0, 51,  0,  0,  0,  0, 51, 50,
+        50, 51,  0, 51, 51, 51, 51, 51, 50, 51, 50, 50, 50,  0, 51, 50,
+         0, 50,  0,  0,  0,  0,  0, 51,  0, 51, 51, 51, 51,  0, 51, 50,
+         0, 50, 51, 51, 50, 50,  0, 51,  0,  0,  0,  0, 51,  0, 51, 50,
+         0,  0, 50, 51, 51, 51, 50, 51, 50, 50, 50,  0, 51,  0, 51, 50,
+         0,  0,  0, 50,  0, 51,  0, 51, 51, 51, 51,  0, 51, 50, 51, 50,
+         0,  0,  0, 50, 51, 51,  0,  0,  0,  0, 51,  0, 51,  0, 51, 50,
+         0,  0,  0,  0, 51,  0, 50, 50, 50,  0, 51,  0, 51, 50, 51, 50,
+         0,  0,  0,  0, 51, 50, 51, 51, 51, 50, 51,  0, 51, 51, 51, 50,
+         0,  0,  0,  0, 50,  0, 50, 50, 50,  0, 50,  0, 50, 50, 50,  0,
+    ])
+
+    # Lorenz Attractor - "Butterfly Effect" chaos lobes
+    # Palette: 71=MAGENTA, 13=PINK (bright foreground)
+    LORENZ_ATTRACTOR = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 71, 71, 71,  0,  0,  0, 71, 71, 71,  0,  0,  0,  0,
+         0,  0, 71, 13, 13, 71,  0,  0, 71, 13, 13, 71,  0,  0,  0,  0,
+         0, 71, 13, 71,  0, 71, 13, 13, 71,  0, 71, 13, 71,  0,  0,  0,
+         0, 71, 71,  0,  0,  0, 71, 71,  0,  0,  0, 71, 71,  0,  0,  0,
+         0,  0,  0,  0,  0, 71, 71, 71, 71,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 71, 13, 71, 71, 13, 71,  0,  0,  0,  0,  0,  0,
+         0,  0,  0, 71, 13, 71,  0,  0, 71, 13, 71,  0,  0,  0,  0,  0,
+         0,  0, 71, 13, 71,  0,  0,  0,  0, 71, 13, 71,  0,  0,  0,  0,
+         0, 71, 13, 71,  0,  0,  0,  0,  0,  0, 71, 13, 71,  0,  0,  0,
+         0, 71, 71,  0,  0,  0,  0,  0,  0,  0,  0, 71, 71,  0,  0,  0,
+         0,  0, 71, 71,  0,  0,  0,  0,  0,  0, 71, 71,  0,  0,  0,  0,
+         0,  0,  0, 71, 71, 71,  0,  0, 71, 71, 71,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Perlin Flow - Sweeping S-curves representing turbulent wind/water
+    # Palette: 51=CYAN, 61=BLUE
+    PERLIN_FLOW = bytes([
+         0,  0,  0, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0, 51, 61,  0,  0,  0,  0,  0, 51, 51,  0,  0,  0,  0,  0,
+         0, 51, 61,  0,  0,  0,  0, 51, 51, 61,  0, 51,  0,  0,  0,  0,
+         0, 51, 61,  0,  0,  0, 51, 61,  0,  0,  0,  0, 51,  0,  0,  0,
+         0,  0, 51, 61,  0, 51, 61,  0,  0,  0,  0,  0,  0, 51,  0,  0,
+         0,  0,  0, 51, 51, 61,  0,  0, 51, 51,  0,  0,  0, 51, 61,  0,
+         0,  0,  0,  0,  0,  0,  0, 51, 61,  0, 51,  0,  0, 51, 61,  0,
+         0,  0,  0,  0,  0,  0, 51, 61,  0,  0,  0, 51, 51, 61,  0,  0,
+         0, 51, 51,  0,  0, 51, 61,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+        51, 61,  0, 51, 51, 61,  0,  0,  0,  0,  0,  0, 51, 51,  0,  0,
+        51, 61,  0,  0,  0,  0,  0,  0, 51, 51, 51, 51, 61,  0, 51,  0,
+         0, 51, 61,  0,  0,  0,  0, 51, 61,  0,  0,  0,  0,  0,  0, 51,
+         0,  0, 51, 61,  0,  0, 51, 61,  0,  0,  0,  0,  0,  0,  0, 51,
+         0,  0,  0, 51, 51, 51, 61,  0,  0,  0,  0,  0,  0,  0, 51, 61,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51, 61,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51, 61,  0,  0,
+    ])
+
+    # Digital Rain - Matrix falling code columns
+    # Palette: 4=WHITE (head), 42=LIME, 41=GREEN, 40=FOREST (fading tail)
+    DIGITAL_RAIN = bytes([
+         0,  0, 40,  0,  0,  0,  0,  0,  0,  0,  0, 40,  0,  0,  0,  0,
+         0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,
+         0,  0, 42,  0,  0,  0, 40,  0,  0,  0,  0, 42,  0,  0,  0,  0,
+         0,  0,  4,  0,  0,  0, 41,  0,  0,  0,  0,  4,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0, 42,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0, 40,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0, 40,  0,  0,  0, 42,  0,  0,  0,
+        40,  0,  0,  0,  0,  0,  0,  0, 41,  0,  0,  0,  4,  0,  0,  0,
+        41,  0,  0,  0,  0,  0,  0,  0, 42,  0,  0,  0,  0,  0,  0,  0,
+        42,  0,  0,  0,  0,  0,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,
+         4,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 40,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0, 42,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+    ])
+
+    # Sorting Visualizer - Partially sorted columns with active swap highlights
+    # Palette: 51=CYAN (unsorted), 41=GREEN (sorted), 11=RED (active), 31=YELLOW (compare)
+    SORTING_VISUALIZER = bytes([
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0,  0,
+         0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 51,  0, 51,
+         0,  0,  0,  0,  0,  0,  0,  0,  0, 11,  0,  0,  0, 51,  0, 51,
+         0,  0,  0,  0,  0,  0,  0,  0,  0, 11,  0,  0, 51, 51,  0, 51,
+         0,  0,  0,  0,  0,  0,  0, 31,  0, 11,  0,  0, 51, 51,  0, 51,
+         0,  0,  0,  0,  0,  0,  0, 31,  0, 11,  0, 51, 51, 51,  0, 51,
+         0,  0,  0,  0,  0,  0,  0, 31,  0, 11,  0, 51, 51, 51, 51, 51,
+         0,  0,  0,  0,  0, 41,  0, 31,  0, 11,  0, 51, 51, 51, 51, 51,
+         0,  0,  0,  0, 41, 41,  0, 31, 51, 11,  0, 51, 51, 51, 51, 51,
+         0,  0,  0, 41, 41, 41,  0, 31, 51, 11,  0, 51, 51, 51, 51, 51,
+         0,  0, 41, 41, 41, 41,  0, 31, 51, 11, 51, 51, 51, 51, 51, 51,
+         0, 41, 41, 41, 41, 41,  0, 31, 51, 11, 51, 51, 51, 51, 51, 51,
+        41, 41, 41, 41, 41, 41,  0, 31, 51, 11, 51, 51, 51, 51, 51, 51,
+        41, 41, 41, 41, 41, 41, 31, 31, 51, 11, 51, 51, 51, 51, 51, 51,
+        41, 41, 41, 41, 41, 41, 31, 31, 51, 11, 51, 51, 51, 51, 51, 51,
+    ])
+
+    ICON_LIBRARY = {
+        "DEFAULT": DEFAULT,
+        "MENU": DEFAULT,
+        "JEB_LOGO_J": DEFAULT,
+        "SIMON": SIMON,
+        "SAFE": SAFE,
+        "JEBRIS": JEBRIS,
+        "PONG": PONG,
+        "IND": IND,
+        "SUCCESS": DEFAULT,
+        "FAILURE": DEFAULT,
+        "ASTRO_BREAKER": ASTRO_BREAKER,
+        "DATA_FLOW": DATA_FLOW,
+        "TRENCH_RUN": DEFAULT,
+        "LUNAR_SALVAGE": DEFAULT,
+        "SNAKE": DEFAULT,
+        "RHYTHM": RHYTHM,
+        "EMOJI_REVEAL": EMOJI_REVEAL,
+        "SKULL": SKULL,
+        "GHOST": GHOST,
+        "SWORD": SWORD,
+        "SHIELD": SHIELD,
+        "FREQ_HUNTER": FREQ_HUNTER,
+        "ZERO_PLAYER": ZERO_PLAYER,
+        "CONWAYS_LIFE": CONWAYS_LIFE,
+        "LANGTONS_ANT": LANGTONS_ANT,
+        "WOLFRAM_AUTOMATA": WOLFRAM_AUTOMATA,
+        "LISSAJOUS": LISSAJOUS,
+        "BOIDS": BOIDS,
+        "FALLING_SAND": FALLING_SAND,
+        "BOUNCING_SPRITE": BOUNCING_SPRITE,
+        "PLASMA": PLASMA,
+        "WIREWORLD": WIREWORLD,
+        "STARFIELD": STARFIELD,
+        "MECHA_FORGE": MECHA_FORGE,
+        "GROOVEBOX": GROOVEBOX,
+        "IRON_CANOPY": IRON_CANOPY,
+        "DEFCON_COMMANDER": DEFCON_COMMANDER,
+        "ABYSSAL_PING": ABYSSAL_PING,
+        "ABYSSAL_ROVER": ABYSSAL_ROVER,
+        "ORBITAL_STRIKE": ORBITAL_STRIKE,
+        "ARTILLERY_COMMAND": ARTILLERY_COMMAND,
+        "ENIGMA_BYTE": ENIGMA_BYTE,
+        "MAGLEV_EXPRESS": MAGLEV_EXPRESS,
+        "ORBITAL_DOCKING": ORBITAL_DOCKING,
+        "VANGUARD_OVERRIDE": VANGUARD_OVERRIDE,
+        "PIPELINE_OVERLOAD": PIPELINE_OVERLOAD,
+        "NUMBERS_STATION": NUMBERS_STATION,
+        "MAGNETIC_CONTAINMENT": MAGNETIC_CONTAINMENT,
+        "BUNKER_DEFUSE": BUNKER_DEFUSE,
+        "SEISMIC_STABILIZER": DEFAULT,
+        "VIRTUAL_PET": VIRTUAL_PET,
+        "LAVA_LAMP": LAVA_LAMP,
+        "REACTION_DIFFUSION": REACTION_DIFFUSION,
+        "LORENZ_ATTRACTOR": LORENZ_ATTRACTOR,
+        "PERLIN_FLOW": PERLIN_FLOW,
+        "DIGITAL_RAIN": DIGITAL_RAIN,
+        "SORTING_VISUALIZER": SORTING_VISUALIZER,
+        "CAT_IDLE": CAT_IDLE,
+        "CAT_EAT": CAT_EAT,
+        "CAT_SLEEP": CAT_SLEEP,
+        "CAT_WALK": CAT_WALK,
+        "0": DEFAULT,
+        "1": DEFAULT,
+        "2": DEFAULT,
+        "3": DEFAULT,
+        "4": DEFAULT,
+        "5": DEFAULT,
+        "6": DEFAULT,
+        "7": DEFAULT,
+        "8": DEFAULT,
+        "9": DEFAULT
+    }
+
+    ANIM_LIBRARY = {
+        "CAT_IDLE": (CAT_IDLE_ANIMATED, CAT_IDLE_TIMING),
+        "CAT_WALK": (CAT_WALK, CAT_WALK_TIMING),
+    }
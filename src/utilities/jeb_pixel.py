@@ -1,12 +1,102 @@
 # File: src/core/utilities/jeb_pixel.py
 """A wrapper to treat a segment of a NeoPixel strip as an independent object."""
 
+
+_IDENTITY_LUT = bytes(range(256))
+
+
+class PixelBuffer:
+    """A preallocated wire-order framebuffer in front of a NeoPixel strip.
+
+    JEBPixel segments created on a PixelBuffer write colour bytes straight
+    into one shared bytearray, laid out in the strip's byte order with its
+    brightness already applied. show() hands the whole buffer to the strip's
+    transmit routine in a single transfer.
+
+    Strips without a raw transmit hook (the emulator and test mocks) fall
+    back to copying pixels into the strip as (r, g, b) tuples on show().
+
+    The strip's brightness is re-read on every show(). A change rebuilds the
+    shared LUT and rescales the buffer once; tables from palette_table()
+    built before the change keep the old brightness until rebuilt.
+    """
+    def __init__(self, strip, pixel_order=None):
+        self.strip = strip
+        self.n = strip.n if hasattr(strip, "n") else len(strip)
+        self.pixel_order = pixel_order or getattr(strip, "byteorder", None) or "GRB"
+        if len(self.pixel_order) != 3:
+            raise ValueError(f"Unsupported pixel order: {self.pixel_order}")
+        self.offsets = (
+            self.pixel_order.index("R"),
+            self.pixel_order.index("G"),
+            self.pixel_order.index("B"),
+        )
+
+        self.buf = bytearray(self.n * 3)
+        self.mv = memoryview(self.buf)
+
+        # Raw transfer is only used when the strip exposes it. The buffer
+        # then holds post-brightness bytes; otherwise the strip applies its own.
+        # _transmit(buffer) is private to adafruit_pixelbuf (NeoPixel's base):
+        # it is what PixelBuf.show() calls with the brightness-scaled,
+        # wire-order buffer. If a library update renames it, getattr() finds
+        # nothing and show() takes the slower per-pixel path below instead.
+        self._transmit = getattr(strip, "_transmit", None)
+        self.brightness = 1.0
+        self.lut = bytearray(_IDENTITY_LUT)  # Shared with segments; updated in place
+        if self._transmit:
+            self._set_brightness(getattr(strip, "brightness", 1.0))
+
+    def __len__(self):
+        return self.n
+
+    def _set_brightness(self, brightness):
+        """Rebuild the LUT for a new brightness and rescale the buffered pixels."""
+        old = self.brightness
+        lut = self.lut
+        for i in range(256):
+            lut[i] = int(i * brightness)
+        self.brightness = brightness
+
+        # Undo the old scaling (approximately, as for reads) and apply the new
+        remap = bytes(
+            lut[min(255, round(v / old))] if old > 0 else 0 for v in range(256)
+        )
+        buf = self.buf
+        for i in range(len(buf)):
+            buf[i] = remap[buf[i]]
+
+    def show(self):
+        """Push the framebuffer to the strip."""
+        if self._transmit:
+            brightness = self.strip.brightness
+            if brightness != self.brightness:
+                self._set_brightness(brightness)
+            self._transmit(self.buf)
+            return
+
+        buf = self.buf
+        strip = self.strip
+        ro, go, bo = self.offsets
+        for i in range(self.n):
+            o = i * 3
+            strip[i] = (buf[o + ro], buf[o + go], buf[o + bo])
+        strip.show()
+
+
 class JEBPixel:
-    """A wrapper to treat a segment of a NeoPixel strip as an independent object."""
+    """A wrapper to treat a segment of a NeoPixel strip as an independent object.
+
+    The parent is either a NeoPixel-style strip, written one tuple per pixel,
+    or a PixelBuffer, in which case writes land directly in its shared
+    wire-order bytearray and the bulk helpers (fill, write_span, blit_row)
+    become slice copies.
+    """
     def __init__(self, parent, start_idx, num_pixels, pixel_order="GRB"):
         self.parent = parent    # The real, physical strip (68 pixels)
         self.start = start_idx  # Start index (e.g., 64)
         self.n = num_pixels          # Length (e.g., 4)
+        self.dirty = True       # Set on every write; cleared by the render loop after show()
         self.pixel_order = pixel_order
         if self.pixel_order == "RGB":
             self.custom_order = True
@@ -14,16 +104,58 @@ class JEBPixel:
         else:
             self.custom_order = False
 
+        # Byte offsets of R, G, B in the parent's wire order, and in this
+        # segment's (swapped for RGB segments on a GRB strip)
+        if isinstance(parent, PixelBuffer):
+            # Shared framebuffer mode
+            self._buf = parent.buf
+            self._mv = parent.mv
+            self._lut = parent.lut
+            self._parent_offsets = parent.offsets
+        else:
+            self._buf = None
+            self._mv = None
+            self._lut = _IDENTITY_LUT
+            order = getattr(parent, "byteorder", None)
+            if not isinstance(order, str) or len(order) != 3:
+                order = "GRB"
+            self._parent_offsets = (order.index("R"), order.index("G"), order.index("B"))
+        ro, go, bo = self._parent_offsets
+        self._offsets = (go, ro, bo) if self.custom_order else (ro, go, bo)
+
     def _reorder_color(self, color):
         """Reorders the color tuple based on the pixel order."""
         if self.custom_order:
             return tuple(color[i] for i in self.color_order)
         return color
 
+    def encode(self, color):
+        """Return the 3 wire-order bytes for color in this segment."""
+        if isinstance(color, int):
+            color = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+        ro, go, bo = self._offsets
+        lut = self._lut
+        out = bytearray(3)
+        out[ro] = lut[color[0]]
+        out[go] = lut[color[1]]
+        out[bo] = lut[color[2]]
+        return out
+
     def __setitem__(self, index, color):
         """Sets a specific pixel in the segment."""
         if 0 <= index < self.n:
-            if self.custom_order:
+            self.dirty = True
+            buf = self._buf
+            if buf is not None:
+                if isinstance(color, int):
+                    color = ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+                o = (self.start + index) * 3
+                ro, go, bo = self._offsets
+                lut = self._lut
+                buf[o + ro] = lut[color[0]]
+                buf[o + go] = lut[color[1]]
+                buf[o + bo] = lut[color[2]]
+            elif self.custom_order:
                 # Direct tuple unpacking avoids generator overhead
                 self.parent[self.start + index] = (
                     color[self.color_order[0]],
@@ -38,6 +170,21 @@ class JEBPixel:
         if index < 0 or index >= self.n:
             return (0, 0, 0)
 
+        buf = self._buf
+        if buf is not None:
+            o = (self.start + index) * 3
+            ro, go, bo = self._offsets
+            r, g, b = buf[o + ro], buf[o + go], buf[o + bo]
+            brightness = self.parent.brightness
+            if brightness < 1.0:
+                # Undo brightness scaling (approximate, as for NeoPixel reads)
+                return (
+                    min(255, round(r / brightness)) if r else 0,
+                    min(255, round(g / brightness)) if g else 0,
+                    min(255, round(b / brightness)) if b else 0
+                )
+            return (r, g, b)
+
         raw_color = self.parent[self.start + index]
         if self.custom_order:
             return (
@@ -53,6 +200,23 @@ class JEBPixel:
 
     def fill(self, color):
         """Fills the entire segment with a single color."""
+        self.dirty = True
+
+        if self._buf is not None:
+            # Write the first pixel, then double the filled span with slice copies
+            mv = self._mv
+            start = self.start * 3
+            end = start + self.n * 3
+            if start == end:
+                return
+            mv[start:start + 3] = self.encode(color)
+            filled = 3
+            while start + filled < end:
+                span = min(filled, end - start - filled)
+                mv[start + filled:start + filled + span] = mv[start:start + span]
+                filled += span
+            return
+
         # Calculate the color once to save time in the loop
         if self.custom_order:
             fill_color = (
@@ -66,6 +230,118 @@ class JEBPixel:
         for i in range(self.start, self.start + self.n):
             self.parent[i] = fill_color
 
+    def write_span(self, index, data):
+        """Copy wire-order bytes for consecutive pixels starting at index.
+
+        Args:
+            index: First segment pixel to write.
+            data: bytes, bytearray or memoryview holding 3 bytes per pixel in
+                this segment's wire order (as produced by encode() or
+                palette_table()). Pixels past the end of the segment are dropped.
+        """
+        count = min(len(data) // 3, self.n - index)
+        if index < 0 or count <= 0:
+            return
+        self.dirty = True
+
+        if self._buf is not None:
+            o = (self.start + index) * 3
+            self._mv[o:o + count * 3] = data[:count * 3]
+            return
+
+        # Strip fallback: decode back to strip tuples (brightness is applied by the strip)
+        ro, go, bo = self._parent_offsets
+        parent = self.parent
+        base = self.start + index
+        for i in range(count):
+            o = i * 3
+            parent[base + i] = (data[o + ro], data[o + go], data[o + bo])
+
+    def palette_table(self, colors):
+        """Precompute a blit table for a list of (r, g, b) palette colours.
+
+        The table is opaque: pass it to blit_row(). On a PixelBuffer it holds
+        3 wire-order bytes per entry with the current brightness applied, so
+        rebuild it after a brightness change; on a plain strip it is the list
+        of colour tuples.
+        """
+        if self._buf is None:
+            return [self._reorder_color(c) if c is not None else (0, 0, 0) for c in colors]
+        table = bytearray(len(colors) * 3)
+        for i, color in enumerate(colors):
+            if color is not None:
+                table[i * 3:i * 3 + 3] = self.encode(color)
+        return table
+
+    def blit_row(self, index, indices, table, transparent=None):
+        """Write palette-indexed pixels to consecutive positions from index.
+
+        Args:
+            index: First segment pixel to write.
+            indices: Iterable of palette indices (bytes, bytearray or list).
+            table: Table from palette_table().
+            transparent: Palette index that leaves the pixel untouched, or None.
+        """
+        if index < 0 or index >= self.n:
+            return
+        self.dirty = True
+        limit = self.n - index
+
+        if self._buf is not None:
+            buf = self._buf
+            o = (self.start + index) * 3
+            for count, p in enumerate(indices):
+                if count >= limit:
+                    break
+                if p != transparent:
+                    t = p * 3
+                    buf[o] = table[t]
+                    buf[o + 1] = table[t + 1]
+                    buf[o + 2] = table[t + 2]
+                o += 3
+            return
+
+        parent = self.parent
+        base = self.start + index
+        for count, p in enumerate(indices):
+            if count >= limit:
+                break
+            if p != transparent:
+                parent[base + count] = table[p]
+
+    def blit_mapped(self, indices, index_map, table, transparent=None):
+        """Write palette-indexed pixels through an index map.
+
+        Pixel i of indices lands on segment pixel index_map[i], which lets a
+        matrix push a logical frame through its coordinate LUT in one pass.
+
+        Args:
+            indices: Iterable of palette indices (bytes, bytearray, memoryview).
+            index_map: Sequence mapping logical position to segment pixel.
+                Entries are assumed to lie inside the segment.
+            table: Table from palette_table().
+            transparent: Palette index that leaves the pixel untouched, or None.
+        """
+        self.dirty = True
+
+        buf = self._buf
+        if buf is not None:
+            base = self.start * 3
+            for i, p in enumerate(indices):
+                if p != transparent:
+                    o = base + index_map[i] * 3
+                    t = p * 3
+                    buf[o] = table[t]
+                    buf[o + 1] = table[t + 1]
+                    buf[o + 2] = table[t + 2]
+            return
+
+        parent = self.parent
+        start = self.start
+        for i, p in enumerate(indices):
+            if p != transparent:
+                parent[start + index_map[i]] = table[p]
+
     def show(self):
         """Updates the segment's buffer memory only.
 
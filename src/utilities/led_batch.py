@@ -0,0 +1,99 @@
+# File: src/utilities/led_batch.py
+"""Packed multi-LED records for the LEDBATCH command.
+
+A LEDBATCH payload is a run of fixed 6-byte records, one per LED::
+
+    [index][palette_index][duration lo][duration hi][brightness][priority]
+
+``duration`` is a little-endian u16 in tenths of a second (0 = no timeout,
+max 6553.5 s) and ``brightness`` is scaled to 0-255. The core gathers a
+frame's worth of LED changes in an ``LEDBatch`` and sends them as one
+packet; the satellite walks the records with ``iter_led_batch`` and applies
+them in a single pass.
+"""
+
+from utilities.logger import JEBLogger
+
+RECORD_SIZE = 6
+MAX_DURATION = 6553.5  # Seconds representable in the u16 duration field
+
+
+def encode_duration(duration):
+    """Seconds (or None) -> duration in tenths of a second, clamped to the u16 field."""
+    if not duration or duration <= 0:
+        return 0
+    if duration > MAX_DURATION:
+        JEBLogger.warning("LEDB", f"LED duration {duration}s clamped to {MAX_DURATION}s")
+        return 0xFFFF
+    return int(duration * 10 + 0.5) or 1
+
+
+def encode_brightness(brightness):
+    """0.0-1.0 -> brightness byte, clamped."""
+    return max(0, min(255, int(brightness * 255 + 0.5)))
+
+
+def iter_led_batch(payload):
+    """Yield (index, palette_index, duration, brightness, priority) per record.
+
+    ``duration`` is returned in seconds (None when zero) and ``brightness``
+    as 0.0-1.0. A trailing partial record is ignored.
+    """
+    end = len(payload) - len(payload) % RECORD_SIZE
+    for off in range(0, end, RECORD_SIZE):
+        duration = payload[off + 2] | (payload[off + 3] << 8)
+        yield (
+            payload[off],
+            payload[off + 1],
+            duration / 10 if duration else None,
+            payload[off + 4] / 255,
+            payload[off + 5],
+        )
+
+
+class LEDBatch:
+    """Per-frame accumulator of LED records, packed in place.
+
+    Each LED index holds at most one record per batch. A later change to the
+    same index replaces the earlier one unless its priority is lower, which
+    gives the same end state as applying both in order on the satellite
+    (a lower priority never overrides a higher one).
+    """
+
+    def __init__(self, max_leds=32):
+        self._buf = bytearray(max_leds * RECORD_SIZE)
+        self._slots = {}  # LED index -> record offset in _buf
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, index, palette_index, duration=0.0, brightness=1.0, priority=2):
+        """Queue one LED change. Returns False if the batch is full."""
+        buf = self._buf
+        off = self._slots.get(index)
+        if off is None:
+            off = self.count * RECORD_SIZE
+            if off >= len(buf):
+                return False
+            self._slots[index] = off
+            self.count += 1
+        elif priority < buf[off + 5]:
+            return True
+        ticks = encode_duration(duration)
+        buf[off] = index
+        buf[off + 1] = palette_index
+        buf[off + 2] = ticks & 0xFF
+        buf[off + 3] = ticks >> 8
+        buf[off + 4] = encode_brightness(brightness)
+        buf[off + 5] = priority
+        return True
+
+    def payload(self):
+        """Return the queued records as bytes (a copy, safe to hold for retries)."""
+        return bytes(self._buf[:self.count * RECORD_SIZE])
+
+    def clear(self):
+        """Drop all queued records."""
+        self._slots.clear()
+        self.count = 0
@@ -0,0 +1,52 @@
+# File: src/utilities/lru.py
+"""Small least-recently-used cache for a handful of expensive entries."""
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Dict-backed cache that evicts the least recently used key when full.
+
+    Recency is tracked in a plain list, which keeps the class CircuitPython
+    friendly (no OrderedDict.move_to_end) and is cheap for the small sizes it
+    is meant for (tens of entries).
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = {}
+        self._order = []  # Keys, least recently used first
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        """Return the cached value for key and mark it most recently used."""
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        order = self._order
+        if order[-1] != key:
+            order.remove(key)
+            order.append(key)
+        return value
+
+    def put(self, key, value):
+        """Insert or replace key, evicting the least recently used entry if full."""
+        if key in self._data:
+            self._order.remove(key)
+        elif len(self._order) >= self.maxsize:
+            del self._data[self._order.pop(0)]
+        self._data[key] = value
+        self._order.append(key)
+
+    def clear(self):
+        """Drop every entry."""
+        self._data.clear()
+        self._order.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
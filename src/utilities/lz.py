@@ -0,0 +1,166 @@
+# File: src/utilities/lz.py
+"""Small LZ77 block compressor for UART file transfer.
+
+CircuitPython ships ``zlib.decompress`` but no compressor, and the Core has
+to compress firmware files on the fly before pushing them to satellites.
+This module implements a byte-oriented LZ77 variant (the LZ4 block layout)
+in pure Python so both ends can run it:
+
+- Compression uses a single-entry hash table of 4-byte prefixes, so each
+  input byte costs one dict lookup.
+- Decompression copies literal runs and non-overlapping matches with slice
+  operations instead of per-byte loops.
+
+Each block is self-contained, which lets the file-transfer layer compress
+every FILE_CHUNK independently and keep retransmissions idempotent.
+
+Block format
+------------
+A block is a sequence of::
+
+    [token] [literal length ext...] [literals] [offset lo] [offset hi] [match length ext...]
+
+- ``token`` high nibble: literal count (15 = more length bytes follow).
+- ``token`` low nibble: match length minus ``MIN_MATCH`` (15 = more
+  length bytes follow).
+- Length extension bytes are added to 15; a byte of 255 means another
+  extension byte follows.
+- ``offset`` is the little-endian distance back into the output (1..65535).
+
+The final sequence carries literals only and ends the block.
+"""
+
+MIN_MATCH = 4
+MAX_OFFSET = 0xFFFF
+
+
+def _put_length(out, length):
+    while length >= 255:
+        out.append(255)
+        length -= 255
+    out.append(length)
+
+
+def _get_length(src, pos, length):
+    while True:
+        extra = src[pos]
+        pos += 1
+        length += extra
+        if extra != 255:
+            return length, pos
+
+
+def _emit(out, data, start, end, offset, match_length):
+    literal_length = end - start
+    match_code = match_length - MIN_MATCH if offset else 0
+    out.append((min(literal_length, 15) << 4) | min(match_code, 15))
+    if literal_length >= 15:
+        _put_length(out, literal_length - 15)
+    out += data[start:end]
+    if offset:
+        out.append(offset & 0xFF)
+        out.append(offset >> 8)
+        if match_code >= 15:
+            _put_length(out, match_code - 15)
+
+
+def lz_compress(data):
+    """Compress *data* into a self-contained block.
+
+    Parameters:
+        data (bytes): Raw data to compress.
+
+    Returns:
+        bytes: Compressed block.  Incompressible input grows by roughly
+        one byte per 255 input bytes plus one token byte.
+
+    Example:
+        >>> lz_decompress(lz_compress(b'abcabcabcabc')) == b'abcabcabcabc'
+        True
+    """
+    data = bytes(data)
+    size = len(data)
+    out = bytearray()
+    table = {}
+    anchor = 0
+    i = 0
+    last = size - MIN_MATCH
+
+    while i <= last:
+        key = data[i:i + MIN_MATCH]
+        candidate = table.get(key)
+        table[key] = i
+        if candidate is None or i - candidate > MAX_OFFSET:
+            i += 1
+            continue
+
+        length = MIN_MATCH
+        while i + length < size and data[candidate + length] == data[i + length]:
+            length += 1
+
+        _emit(out, data, anchor, i, i - candidate, length)
+        i += length
+        anchor = i
+
+    _emit(out, data, anchor, size, 0, 0)
+    return bytes(out)
+
+
+def lz_decompress(src, max_size=None):
+    """Decompress a block produced by :func:`lz_compress`.
+
+    Parameters:
+        src (bytes): Compressed block.
+        max_size (int | None): Upper bound on the decompressed size.  Output
+            beyond this raises ``ValueError`` before more memory is used.
+
+    Returns:
+        bytearray: Decompressed data.
+
+    Raises:
+        ValueError: If the block is truncated, references data before the
+            start of the output, or exceeds *max_size*.
+    """
+    out = bytearray()
+    size = len(src)
+    pos = 0
+    try:
+        while pos < size:
+            token = src[pos]
+            pos += 1
+
+            literal_length = token >> 4
+            if literal_length == 15:
+                literal_length, pos = _get_length(src, pos, literal_length)
+            if pos + literal_length > size:
+                raise ValueError("Truncated literal run")
+            out += src[pos:pos + literal_length]
+            pos += literal_length
+            if pos >= size:
+                break
+
+            offset = src[pos] | (src[pos + 1] << 8)
+            pos += 2
+            match_length = token & 0x0F
+            if match_length == 15:
+                match_length, pos = _get_length(src, pos, match_length)
+            match_length += MIN_MATCH
+
+            start = len(out) - offset
+            if offset == 0 or start < 0:
+                raise ValueError("Invalid match offset")
+            if match_length <= offset:
+                out += out[start:start + match_length]
+            else:
+                # Overlapping match repeats the last `offset` bytes
+                for k in range(match_length):
+                    out.append(out[start + k])
+
+            if max_size is not None and len(out) > max_size:
+                raise ValueError("Decompressed data exceeds limit")
+    except IndexError:
+        raise ValueError("Truncated block")
+
+    if max_size is not None and len(out) > max_size:
+        raise ValueError("Decompressed data exceeds limit")
+    return out
@@ -260,7 +260,7 @@ def animate_radar_sweep(matrix_manager, sweep_angle, bogeys=None, interceptors=N
         print(f"Error in RADAR_SWEEP animation: {e}")
 
 
-async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), loop=True, color=None, brightness=1.0):
+async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), loop=True, color=None, brightness=1.0, cache_key=None):
     """
     Plays a multi-frame sprite animation from a 1D sprite-sheet bytearray.
 
@@ -271,15 +271,18 @@ async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), l
 
         frame_count = len(icon_data) // (width * height)
 
-    This approach avoids Python-list fragmentation and GC pauses on the Pico 2:
-    the entire animation lives in one contiguous heap allocation.  Frame slicing
-    uses a memoryview so there is no per-frame allocation.
+    When the manager supports it (get_sprite_deltas), the sheet is compiled
+    once into per-frame changed-pixel lists so each frame only writes the
+    pixels that differ from the previous one, including pixels that turn
+    off.  Otherwise every frame is pushed with show_frame(clear=False).
+
+    Between frames the task sleeps until the next frame deadline; time spent
+    late on one frame is taken off the next so the sequence does not drift.
 
     Designed to run as a background asyncio task.  Cancel the task to stop.
 
     Args:
-        matrix_manager: MatrixManager instance (needs draw_pixel, fill, palette,
-                        width, height).
+        matrix_manager: MatrixManager instance (needs show_frame, width, height).
         icon_data: bytes or bytearray containing all animation frames concatenated.
         timing_data: Tuple of frame durations in milliseconds or a
                         single duration for all frames.
@@ -287,6 +290,8 @@ async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), l
               it plays once and exits.
         color: Optional RGB tuple to override palette colors. If None, uses palette.
         brightness: Float from 0.0 to 1.0 for brightness adjustment.
+        cache_key: Stable name for icon_data (e.g. the icon name) so the
+              compiled deltas are reused across calls.
 
     Raises:
         asyncio.CancelledError: propagated to the caller for clean task teardown.
@@ -299,17 +304,27 @@ async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), l
     if frame_count < 1:
         return
 
-    # Wrap icon_data in a memoryview so frame slices are zero-copy
-    icon_mv = memoryview(icon_data)
+    compiled = None
+    if hasattr(matrix_manager, "get_sprite_deltas"):
+        compiled = matrix_manager.get_sprite_deltas(icon_data, color, brightness, key=cache_key)
+    else:
+        # Wrap icon_data in a memoryview so frame slices are zero-copy
+        icon_mv = memoryview(icon_data)
 
     try:
         frame_idx = 0
-        last_frame_time = ticks_ms()
-        dirty = True  # Force initial frame render
+        step = 0
+        lag = 0
         while True:
-            now = ticks_ms()
+            frame_start = ticks_ms()
+            if compiled is not None:
+                matrix_manager.show_sprite_delta(compiled, step)
+            else:
+                start = frame_idx * frame_size
+                frame = icon_mv[start : start + frame_size]
+                matrix_manager.show_frame(frame, clear=False, color=color, brightness=brightness)
 
-            # 1. Determine how long the current frame should stay on screen
+            # How long the current frame should stay on screen
             if isinstance(timing_data, tuple):
                 # Use the specific duration for this frame (safely modulo the length just in case)
                 current_duration = timing_data[frame_idx % len(timing_data)]
@@ -317,24 +332,20 @@ async def animate_sprite_sheet(matrix_manager, icon_data, timing_data=(1000,), l
                 # If timing_data is a single number, use it as a fixed frame delay
                 current_duration = timing_data
 
-            # 2. Check if it's time to advance to the next frame
-            if ticks_diff(now, last_frame_time) >= current_duration:
-                dirty = True
-                last_frame_time = now
-                frame_idx += 1
-                if frame_idx >= frame_count:
-                    if loop:
-                        frame_idx = 0
-                    else:
-                        break
-
-            if dirty:
-                start = frame_idx * frame_size
-                frame = icon_mv[start : start + frame_size]
-                matrix_manager.show_frame(frame, clear=False, color=color, brightness=brightness)
-                dirty = False
-
-            await asyncio.sleep(0.01)  # Small sleep to yield control and allow cancellation
+            # Sleep until the frame deadline, less any lateness carried over
+            wait = current_duration - lag - ticks_diff(ticks_ms(), frame_start)
+            await asyncio.sleep(wait / 1000 if wait > 0 else 0)
+            lag = max(0, ticks_diff(ticks_ms(), frame_start) - current_duration + lag)
+            if lag > current_duration:
+                lag = 0  # Too far behind (e.g. a long stall); resync rather than skip frames
+
+            frame_idx += 1
+            step = frame_idx
+            if frame_idx >= frame_count:
+                if not loop:
+                    break
+                frame_idx = 0
+                step = frame_count  # Wrap delta: last frame -> frame 0
 
     except asyncio.CancelledError:
         raise
@@ -146,6 +146,71 @@ class Palette:
         else:
             return (v, p, q)
 
+    # --- Fast colour math ---
+    # Hot render loops call these once per pixel per frame, so they avoid the
+    # float maths and branching of hsv_to_rgb: hues come from a precomputed
+    # wheel and scaling uses 8.8 fixed point (256 == 1.0).
+
+    HUE_STEPS = 360
+    _HUE_WHEEL = None
+
+    @staticmethod
+    def hue_wheel():
+        """Return the cached full-saturation, full-value hue wheel.
+
+        Returns:
+            tuple: HUE_STEPS (r, g, b) tuples, one per whole degree.
+        """
+        wheel = Palette._HUE_WHEEL
+        if wheel is None:
+            wheel = tuple(Palette.hsv_to_rgb(h, 1.0, 1.0) for h in range(Palette.HUE_STEPS))
+            Palette._HUE_WHEEL = wheel
+        return wheel
+
+    @staticmethod
+    def hue_to_rgb(h):
+        """Fully saturated, full brightness colour for hue h (degrees, any range)."""
+        return Palette.hue_wheel()[int(h) % 360]
+
+    @staticmethod
+    def hsv_fast(h, v=1.0):
+        """Fully saturated colour for hue h (degrees) scaled by value v [0.0, 1.0].
+
+        Table-driven replacement for hsv_to_rgb(h, 1.0, v); hue is truncated
+        to whole degrees.
+        """
+        r, g, b = Palette.hue_wheel()[int(h) % 360]
+        k = int(v * 256)
+        if k >= 256:
+            return (r, g, b)
+        if k <= 0:
+            return (0, 0, 0)
+        return ((r * k) >> 8, (g * k) >> 8, (b * k) >> 8)
+
+    @staticmethod
+    def scale_color(color, scale):
+        """Scale an (r, g, b) colour by scale [0.0, 1.0] using fixed-point maths."""
+        k = int(scale * 256)
+        if k >= 256:
+            return (color[0], color[1], color[2])
+        if k <= 0:
+            return (0, 0, 0)
+        return ((color[0] * k) >> 8, (color[1] * k) >> 8, (color[2] * k) >> 8)
+
+    @staticmethod
+    def lerp_color(a, b, t):
+        """Blend from colour a (t=0.0) to colour b (t=1.0) using fixed-point maths."""
+        k = int(t * 256)
+        if k >= 256:
+            return (b[0], b[1], b[2])
+        if k <= 0:
+            return (a[0], a[1], a[2])
+        return (
+            a[0] + (((b[0] - a[0]) * k) >> 8),
+            a[1] + (((b[1] - a[1]) * k) >> 8),
+            a[2] + (((b[2] - a[2]) * k) >> 8)
+        )
+
 
 class PicoPalette:
     """
@@ -0,0 +1,88 @@
+# File: src/utilities/render_profiler.py
+"""Per-stage frame timing for the RenderManager loop.
+
+Each stage (an animator's animate_loop, pixels.show, the sync step, the
+whole frame) keeps its last ``window`` durations in a fixed-size ring of
+microseconds, so recording never allocates. Percentiles are only computed
+when a snapshot is requested.
+"""
+
+import time
+from array import array
+
+
+def _monotonic_us():
+    """Monotonic microseconds; falls back to monotonic() on builds without _ns."""
+    if hasattr(time, "monotonic_ns"):
+        return time.monotonic_ns() // 1000
+    return int(time.monotonic() * 1000000)
+
+
+class RenderProfiler:
+    """Fixed-size ring buffers of stage timings plus event counters."""
+
+    DEFAULT_WINDOW = 120  # Samples kept per stage (2 s at 60 Hz)
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self.window = window
+        self._rings = {}    # stage -> array('L') of microseconds
+        self._counts = {}   # stage -> total samples recorded
+        self.events = {"lag": 0, "backoff": 0, "recover": 0}
+        self.frames = 0
+        self.now_us = _monotonic_us
+
+    def record(self, stage, elapsed_us):
+        """Store one duration for stage, overwriting the oldest sample."""
+        ring = self._rings.get(stage)
+        if ring is None:
+            ring = self._rings[stage] = array('L', [0]) * self.window
+            self._counts[stage] = 0
+        count = self._counts[stage]
+        ring[count % self.window] = elapsed_us if elapsed_us > 0 else 0
+        self._counts[stage] = count + 1
+
+    def count(self, event, n=1):
+        """Add n to an event counter (lag, backoff, recover, ...)."""
+        self.events[event] = self.events.get(event, 0) + n
+
+    def stage_stats(self, stage):
+        """Return p50/p95/max/mean in microseconds over the stage's window."""
+        ring = self._rings.get(stage)
+        if ring is None:
+            return None
+        total = self._counts[stage]
+        n = min(total, self.window)
+        samples = sorted(ring[:n])
+        return {
+            "samples": total,
+            "p50_us": samples[(n - 1) // 2],
+            "p95_us": samples[(n - 1) * 95 // 100],
+            "max_us": samples[-1],
+            "mean_us": sum(samples) // n,
+        }
+
+    def snapshot(self):
+        """Return all stages and counters as a dict suitable for JSON telemetry."""
+        return {
+            "window": self.window,
+            "frames": self.frames,
+            "events": dict(self.events),
+            "stages": {stage: self.stage_stats(stage) for stage in self._rings},
+        }
+
+    def reset(self):
+        """Drop all samples and counters."""
+        self._rings = {}
+        self._counts = {}
+        self.events = {"lag": 0, "backoff": 0, "recover": 0}
+        self.frames = 0
+
+    def format(self):
+        """Return a text table of the stage timings (one line per stage)."""
+        lines = [f"{'stage':<24} {'p50':>7} {'p95':>7} {'max':>7}  (us, last {self.window})"]
+        for stage in self._rings:
+            s = self.stage_stats(stage)
+            lines.append(f"{stage:<24} {s['p50_us']:>7} {s['p95_us']:>7} {s['max_us']:>7}")
+        events = " ".join(f"{k}:{v}" for k, v in self.events.items())
+        lines.append(f"frames:{self.frames} {events}")
+        return lines
@@ -0,0 +1,150 @@
+# File: src/utilities/sim_scheduler.py
+"""Fixed-timestep runner for simulation-style (zero player) modes.
+
+A mode supplies a step function, a render function and a step interval.
+The scheduler advances the simulation in whole intervals from an
+accumulator, so the step rate no longer depends on how often the loop
+wakes. Rendering is decoupled from stepping: after one or more steps the
+next render happens at most once per RenderManager frame. Between wakes the
+task sleeps until the nearest deadline (next step, next input poll or next
+render frame) instead of polling at a fixed 10 ms.
+"""
+
+import asyncio
+
+from adafruit_ticks import ticks_ms, ticks_diff
+
+from utilities.render_profiler import RenderProfiler
+
+
+class SimScheduler:
+    """Runs step() on a fixed timestep and render() at most once per frame.
+
+    Timing for the "step" and "render" stages is kept in a RenderProfiler,
+    along with "dropped" (steps skipped by the catch-up limit) and
+    "deferred" (renders held back to the next RenderManager frame) events.
+    """
+
+    DEFAULT_POLL_MS = 20     # Input poll cadence while waiting for the next step
+    DEFAULT_MAX_CATCHUP = 4  # Steps run per wake before late steps are dropped
+    DEFAULT_FRAME_MS = 16    # Render frame period when no renderer is attached
+
+    def __init__(self, step, render, interval_ms, poll=None, renderer=None,
+                 poll_ms=DEFAULT_POLL_MS, max_catchup=DEFAULT_MAX_CATCHUP):
+        """
+        Args:
+            step: Callable advancing the simulation by one interval.
+            render: Callable pushing the current state to the display.
+            interval_ms: Simulation step interval. May be changed while running
+                (e.g. from poll() when the speed dial moves).
+            poll: Optional callable run on every wake to handle input. Returning
+                anything other than None stops the scheduler with that value.
+            renderer: Optional RenderManager; renders are limited to one per
+                change of its frame_counter.
+            poll_ms: Longest time between poll() calls.
+            max_catchup: Most steps run in one wake after a stall; the rest of
+                the backlog is dropped rather than replayed.
+        """
+        self.step = step
+        self.render = render
+        self.interval_ms = interval_ms
+        self.poll = poll
+        self.renderer = renderer
+        self.poll_ms = poll_ms
+        self.max_catchup = max_catchup
+
+        self.profiler = RenderProfiler()
+        self.steps = 0
+        self.renders = 0
+        self._last_frame = None
+        self._render_pending = False
+        self._accum = 0
+
+    def request_render(self):
+        """Render on the next frame even if no step has run (e.g. after a reset)."""
+        self._render_pending = True
+
+    def get_stats(self):
+        """Return step/render counters and stage timings as a dict."""
+        stats = self.profiler.snapshot()
+        stats["steps"] = self.steps
+        stats["renders"] = self.renders
+        stats["interval_ms"] = self.interval_ms
+        return stats
+
+    def _frame_ms(self):
+        renderer = self.renderer
+        if renderer is None:
+            return self.DEFAULT_FRAME_MS
+        return max(1, int(1000 / renderer.target_frame_rate))
+
+    def _run_steps(self):
+        """Consume whole intervals from the accumulator, up to max_catchup.
+
+        Catch-up also stops once the steps run in this wake have taken a
+        whole interval: a step slower than its interval can never catch up,
+        and replaying the backlog back to back would only starve the other
+        tasks (render loop, HID, UART) that run between wakes.
+        """
+        interval = self.interval_ms
+        budget_us = interval * 1000
+        prof = self.profiler
+        ran = 0
+        spent = 0
+        while self._accum >= interval and ran < self.max_catchup and spent < budget_us:
+            t0 = prof.now_us()
+            self.step()
+            elapsed = prof.now_us() - t0
+            prof.record("step", elapsed)
+            spent += elapsed
+            self._accum -= interval
+            ran += 1
+        if self._accum >= interval:
+            dropped = self._accum // interval
+            self._accum -= dropped * interval
+            prof.count("dropped", dropped)
+        if ran:
+            self.steps += ran
+            self._render_pending = True
+
+    def _maybe_render(self):
+        """Render once if a step is pending and the renderer has moved on a frame."""
+        if not self._render_pending:
+            return
+        renderer = self.renderer
+        frame = renderer.frame_counter if renderer is not None else None
+        if frame is not None and frame == self._last_frame:
+            self.profiler.count("deferred")
+            return
+        prof = self.profiler
+        t0 = prof.now_us()
+        self.render()
+        prof.record("render", prof.now_us() - t0)
+        self._last_frame = frame
+        self._render_pending = False
+        self.renders += 1
+
+    async def run(self):
+        """Run until poll() returns a value; returns that value."""
+        last = ticks_ms()
+        self._accum = 0
+        while True:
+            if self.poll is not None:
+                result = self.poll()
+                if result is not None:
+                    return result
+
+            now = ticks_ms()
+            self._accum += ticks_diff(now, last)
+            last = now
+
+            self._run_steps()
+            self._maybe_render()
+
+            # Sleep until the nearest deadline
+            wait = self.interval_ms - self._accum
+            if self.poll is not None and self.poll_ms < wait:
+                wait = self.poll_ms
+            if self._render_pending:
+                wait = min(wait, self._frame_ms())
+            await asyncio.sleep(wait / 1000 if wait > 0 else 0)
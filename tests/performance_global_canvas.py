@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Performance of the dense GlobalAnimationController canvas.
+
+The controller used to keep the canvas as a dict keyed by ``(gx, gy)``
+plus a flat list of ``(gx, gy, manager, idx)`` tuples. It now stores
+per-slot arrays, a dense coordinate grid and a column index. This
+benchmarks a multi-satellite layout (a 16x16 core matrix, two 8x8
+satellite matrices and three LED strips, 448 pixels):
+
+  * set_pixel sweep: every coordinate once through set_pixel
+    (tuple-keyed dict lookup vs grid lookup). CPython's tuple hashing is
+    fast enough that the dict wins here; on CircuitPython the dict path
+    also heap-allocates a key tuple per call, which the grid avoids.
+  * rainbow frame: one global_rainbow_wave frame (one hue per pixel from
+    the tuple list vs one hue per column from the column index).
+"""
+
+import os
+import sys
+import time
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from unittest import mock
+for _mod in ('adafruit_ticks',):
+    sys.modules.setdefault(_mod, mock.MagicMock())
+
+import importlib.util
+spec = importlib.util.spec_from_file_location(
+    "global_animation_controller",
+    os.path.join(src_path, 'managers', 'global_animation_controller.py')
+)
+gac_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gac_module)
+
+GlobalAnimationController = gac_module.GlobalAnimationController
+Palette = gac_module.Palette
+
+
+class FakeManager:
+    """Matrix/strip stand-in recording the last colour per pixel."""
+
+    def __init__(self, n, width=None, height=None):
+        self.num_pixels = n
+        self.width = width
+        self.height = height
+        self.pixels = [(0, 0, 0)] * n
+
+    def _get_idx(self, x, y):
+        return y * self.width + x
+
+    def set_animation(self, idx, anim_type, color, priority=0):
+        self.pixels[idx] = color
+
+
+def build_layout():
+    """Return a controller spanning core + two satellites + strips."""
+    ctrl = GlobalAnimationController()
+    ctrl.register_matrix(FakeManager(256, 16, 16), offset_x=0, offset_y=0)
+    ctrl.register_matrix(FakeManager(64, 8, 8), offset_x=16, offset_y=0)
+    ctrl.register_matrix(FakeManager(64, 8, 8), offset_x=16, offset_y=8)
+    ctrl.register_led_strip(FakeManager(24), offset_x=0, offset_y=16, orientation='horizontal')
+    ctrl.register_led_strip(FakeManager(24), offset_x=0, offset_y=17, orientation='horizontal')
+    ctrl.register_led_strip(FakeManager(16), offset_x=24, offset_y=0, orientation='vertical')
+    return ctrl
+
+
+def legacy_set_pixel(pixel_map, gx, gy, color):
+    entry = pixel_map.get((gx, gy))
+    if entry is not None:
+        manager, idx = entry
+        manager.pixels[idx] = color
+
+
+def legacy_rainbow_frame(pixel_list, canvas_w, t, speed=30.0):
+    for gx, gy, manager, idx in pixel_list:
+        hue = (t * speed + gx * (360.0 / canvas_w)) % 360.0
+        manager.set_animation(idx, "SOLID", Palette.hue_to_rgb(hue), priority=1)
+
+
+def dense_rainbow_frame(ctrl, t, speed=30.0):
+    """Frame body of global_rainbow_wave."""
+    managers = ctrl._slot_managers
+    comps = ctrl._pix_comp
+    idxs = ctrl._pix_idx
+    x0 = ctrl._grid_x0
+    hue_step = 360.0 / ctrl.canvas_width
+    offset = t * speed
+    for col, slots in enumerate(ctrl._columns):
+        if not slots:
+            continue
+        color = Palette.hue_to_rgb((offset + (col + x0) * hue_step) % 360.0)
+        for slot in slots:
+            managers[comps[slot]].set_animation(idxs[slot], "SOLID", color, priority=1)
+
+
+def _time(fn, frames):
+    start = time.perf_counter()
+    for frame in range(frames):
+        fn(frame)
+    return (time.perf_counter() - start) * 1e6 / frames
+
+
+def bench(frames=200):
+    """Return {scenario: (legacy_us, dense_us)} per frame."""
+    ctrl = build_layout()
+    pixel_map = dict(ctrl._pixel_map)
+    pixel_list = list(ctrl._pixel_list)
+    coords = [(gx, gy) for gx, gy, _, _ in pixel_list]
+    canvas_w = ctrl.canvas_width
+
+    def legacy_sweep(frame):
+        for gx, gy in coords:
+            legacy_set_pixel(pixel_map, gx, gy, (frame & 0xFF, 0, 0))
+
+    def dense_sweep(frame):
+        for gx, gy in coords:
+            ctrl.set_pixel(gx, gy, (frame & 0xFF, 0, 0))
+
+    return {
+        "set_pixel": (_time(legacy_sweep, frames), _time(dense_sweep, frames)),
+        "rainbow": (
+            _time(lambda f: legacy_rainbow_frame(pixel_list, canvas_w, f / 60.0), frames),
+            _time(lambda f: dense_rainbow_frame(ctrl, f / 60.0), frames),
+        ),
+    }
+
+
+def test_dense_rainbow_matches_per_pixel():
+    """Test that the per-column rainbow writes the same colours as per-pixel hues."""
+    print("\nTesting column rainbow against per-pixel hues...")
+    legacy = build_layout()
+    dense = build_layout()
+    for t in (0.0, 0.7, 3.3):
+        legacy_rainbow_frame(legacy._pixel_list, legacy.canvas_width, t)
+        dense_rainbow_frame(dense, t)
+        for a, b in zip(legacy._slot_managers, dense._slot_managers):
+            assert a.pixels == b.pixels, f"Frame at t={t} differs"
+    print(f"ok {dense.pixel_count} pixels match")
+
+
+def benchmark_global_canvas(frames=200):
+    """Print per-frame costs for the multi-satellite layout."""
+    ctrl = build_layout()
+    print(f"\n  {ctrl.pixel_count} pixels on a {ctrl.canvas_width}x{ctrl.canvas_height} canvas ({frames} frames):")
+    print(f"    {'scenario':<10} {'dict us':>9} {'dense us':>9} {'speedup':>8}")
+    for name, (legacy, dense) in bench(frames).items():
+        print(f"    {name:<10} {legacy:>9.1f} {dense:>9.1f} {legacy / dense:>7.2f}x")
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Global Canvas Performance Benchmarks")
+    print("=" * 60)
+
+    test_dense_rainbow_matches_per_pixel()
+    benchmark_global_canvas()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Frames per second of the rainbow and plasma colour paths.
+
+Compares ``Palette.hsv_to_rgb`` (float maths and a six-way branch per
+call) against the cached hue wheel and fixed-point helpers:
+
+  * RAINBOW: BasePixelManager's rainbow group pass over a 16x16 matrix,
+    against the same pass calling hsv_to_rgb per pixel.
+  * Plasma: the four-wave plasma loop from PlasmaMode._compute_frame with
+    each colour lookup swapped between hsv_to_rgb and the wheel.
+  * Value-scaled: the fading tails used by LavaLamp, DigitalRain and
+    PerlinFlow, hsv_to_rgb(h, 1, v) against hsv_fast(h, v).
+
+The emulator runs the same modules under CPython, so these figures also
+stand for it; on hardware the float path is relatively more expensive.
+"""
+
+import math
+import os
+import sys
+import time
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import importlib.util
+spec = importlib.util.spec_from_file_location(
+    "base_pixel_manager",
+    os.path.join(src_path, 'managers', 'base_pixel_manager.py')
+)
+base_pixel_manager_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(base_pixel_manager_module)
+
+BasePixelManager = base_pixel_manager_module.BasePixelManager
+Palette = base_pixel_manager_module.Palette
+
+WIDTH = 16
+HEIGHT = 16
+PIXELS = WIDTH * HEIGHT
+
+
+class FakePixels:
+    """Minimal JEBPixel stand-in backed by a list."""
+
+    def __init__(self, n):
+        self.n = n
+        self.buf = [(0, 0, 0)] * n
+
+    def __setitem__(self, idx, color):
+        self.buf[idx] = color
+
+    def __getitem__(self, idx):
+        return self.buf[idx]
+
+    def fill(self, color):
+        self.buf = [color] * self.n
+
+
+def _rainbow_manager():
+    manager = BasePixelManager(FakePixels(PIXELS))
+    manager.fill_animation("RAINBOW", (0, 0, 0), speed=0.5)
+    return manager
+
+
+def _legacy_rainbow(manager, now):
+    """The rainbow pass as it was before the hue wheel."""
+    n = manager.num_pixels
+    starts = manager._anim_starts
+    speeds = manager._anim_speeds
+    pixels = manager.pixels
+    for idx in range(n):
+        offset = (now - starts[idx]) * speeds[idx] * 360
+        pixels[idx] = Palette.hsv_to_rgb((offset + (idx / n) * 360) % 360, 1.0, 1.0)
+
+
+def _plasma_frame(buf, t, hue_off, wheel):
+    """PlasmaMode._compute_frame's inner loop; wheel=None uses hsv_to_rgb."""
+    freq = 0.8
+    idx = 0
+    for y in range(HEIGHT):
+        for x in range(WIDTH):
+            v = (math.sin(x * freq + t)
+                 + math.cos(y * freq + t * 0.7)
+                 + math.sin((x + y) * freq * 0.5 + t * 1.3)
+                 + math.sin(math.sqrt(x * x + y * y) * freq + t * 0.9))
+            v = (v + 4.0) * 0.125
+            hue = (v * 360.0 + hue_off) % 360.0
+            if wheel is None:
+                r, g, b = Palette.hsv_to_rgb(hue, 1.0, 1.0)
+            else:
+                r, g, b = wheel[int(hue)]
+            cell = buf[idx]
+            cell[0] = r
+            cell[1] = g
+            cell[2] = b
+            idx += 1
+
+
+def _tail_frame(to_rgb):
+    """Value-scaled lookups for a frame of fading tails."""
+    out = None
+    for idx in range(PIXELS):
+        out = to_rgb((idx * 3) % 360, (idx % 16) / 16.0)
+    return out
+
+
+def _fps(fn, frames):
+    start = time.perf_counter()
+    for frame in range(frames):
+        fn(frame)
+    return frames / (time.perf_counter() - start)
+
+
+def bench(frames=120):
+    """Return {scenario: (hsv_to_rgb_fps, table_fps)}."""
+    manager = _rainbow_manager()
+    t0 = manager._anim_starts[0]
+    buf = [[0, 0, 0] for _ in range(PIXELS)]
+    wheel = Palette.hue_wheel()
+
+    return {
+        "rainbow": (
+            _fps(lambda f: _legacy_rainbow(manager, t0 + f / 60.0), frames),
+            _fps(lambda f: manager._render_frame(t0 + f / 60.0), frames),
+        ),
+        "plasma": (
+            _fps(lambda f: _plasma_frame(buf, f / 60.0, 0.0, None), frames),
+            _fps(lambda f: _plasma_frame(buf, f / 60.0, 0.0, wheel), frames),
+        ),
+        "value-scaled": (
+            _fps(lambda f: _tail_frame(lambda h, v: Palette.hsv_to_rgb(h, 1.0, v)), frames),
+            _fps(lambda f: _tail_frame(Palette.hsv_fast), frames),
+        ),
+    }
+
+
+def test_rainbow_table_matches_hsv():
+    """Test that the wheel-driven rainbow stays within one degree of hsv_to_rgb."""
+    print("\nTesting rainbow pass against hsv_to_rgb...")
+    manager = _rainbow_manager()
+    reference = _rainbow_manager()
+    t0 = manager._anim_starts[0]
+    for i in range(PIXELS):
+        reference._anim_starts[i] = manager._anim_starts[i]
+    for frame in (0, 13, 90):
+        manager._render_frame(t0 + frame / 60.0)
+        _legacy_rainbow(reference, t0 + frame / 60.0)
+        for a, b in zip(manager.pixels.buf, reference.pixels.buf):
+            # One degree of hue moves a channel by at most 255 / 60 levels
+            assert all(abs(x - y) <= 5 for x, y in zip(a, b)), f"{a} vs {b}"
+    print("ok Rainbow colours match within one hue step")
+
+
+def benchmark_colour_paths(frames=120):
+    """Print frames per second for each colour path."""
+    print(f"\n  {WIDTH}x{HEIGHT} frames ({frames} each):")
+    print(f"    {'path':<13} {'hsv fps':>9} {'table fps':>10} {'speedup':>8}")
+    for name, (slow, fast) in bench(frames).items():
+        print(f"    {name:<13} {slow:>9.0f} {fast:>10.0f} {fast / slow:>7.2f}x")
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Hue Table Performance Benchmarks")
+    print("=" * 60)
+
+    test_rainbow_table_matches_hsv()
+    benchmark_colour_paths()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Wire bytes and satellite CPU per frame: per-LED commands vs LEDBATCH.
+
+For a frame that changes N satellite LEDs this compares:
+
+  * before: N separate ``LED`` packets, each with the smallest payload the
+    command allows (five numeric bytes), decoded and applied one by one;
+  * after:  one ``LEDBATCH`` packet of N packed records, decoded once and
+    applied in a single pass by ``LEDManager.apply_command``.
+
+Wire bytes are the COBS-framed packets as written to the UART. Satellite
+CPU is the desktop time to decode the frame's packets from the RX buffer
+and apply them to an LEDManager; absolute numbers differ on the RP2040 but
+the ratio is what matters.
+"""
+
+import os
+import sys
+import time
+from unittest import mock
+
+for _name in ('adafruit_ticks', 'digitalio', 'busio', 'board', 'neopixel', 'microcontroller'):
+    sys.modules.setdefault(_name, mock.MagicMock())
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from managers.led_manager import LEDManager
+from transport import Message, UARTTransport
+from transport.protocol import COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+from utilities.led_batch import LEDBatch
+
+NUM_LEDS = 16
+FRAMES = 300
+
+
+class FakeUART:
+    """Non-blocking UART stub that hands out queued bytes on readinto()."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def readinto(self, buf):
+        count = min(len(buf), len(self.data))
+        buf[:count] = self.data[:count]
+        del self.data[:count]
+        return count
+
+    def write(self, data):
+        return len(data)
+
+    def reset_input_buffer(self):
+        self.data = bytearray()
+
+
+class MockJEBPixel:
+    """Minimal JEBPixel stand-in."""
+
+    def __init__(self, num_pixels):
+        self.n = num_pixels
+        self._pixels = [(0, 0, 0)] * num_pixels
+
+    def __setitem__(self, idx, color):
+        self._pixels[idx] = color
+
+    def __getitem__(self, idx):
+        return self._pixels[idx]
+
+    def fill(self, color):
+        self._pixels = [color] * self.n
+
+    def show(self):
+        pass
+
+
+def _transport():
+    return UARTTransport(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+
+
+def _frame(messages):
+    """Encode messages and return the bytes that would go on the wire."""
+    tx = _transport()
+    for message in messages:
+        tx.send(message)
+    return bytes(tx._tx_mv[tx._tx_tail:tx._tx_head])
+
+
+def per_led_frame(count, frame_no=0):
+    return _frame([
+        Message("CORE", "0101", "LED", bytes([i, (i + frame_no) % 20, 0, 1, 2]))
+        for i in range(count)
+    ])
+
+
+def batched_frame(count, frame_no=0):
+    batch = LEDBatch()
+    for i in range(count):
+        batch.add(i, (i + frame_no) % 20)
+    return _frame([Message("CORE", "0101", "LEDBATCH", batch.payload())])
+
+
+def satellite_cpu_us(build, count, frames=FRAMES):
+    """Mean microseconds per frame to decode and apply the frame's packets."""
+    wires = [build(count, f) for f in range(frames)]
+    rx = _transport()
+    leds = LEDManager(MockJEBPixel(NUM_LEDS))
+    applied = 0
+    start = time.perf_counter()
+    for wire in wires:
+        rx.uart.data += wire
+        rx._read_hw()
+        while True:
+            msg = rx._try_decode_one()
+            if msg is None:
+                break
+            leds.apply_command(msg.command, msg.payload)
+            rx.release(msg)
+            applied += 1
+    elapsed = time.perf_counter() - start
+    assert applied, "No packets decoded"
+    return elapsed / frames * 1e6
+
+
+def test_batch_uses_fewer_wire_bytes():
+    """Test that one LEDBATCH packet is smaller than the per-LED packets it replaces."""
+    print("\nTesting wire bytes per frame...")
+    for count in (2, 4, 8, NUM_LEDS):
+        before = len(per_led_frame(count))
+        after = len(batched_frame(count))
+        assert after < before, f"{count} LEDs: batch {after} B should beat {before} B"
+    print("ok Batched frames are smaller from 2 LEDs up")
+
+
+def benchmark(counts=(1, 4, 8, NUM_LEDS)):
+    """Print wire bytes and satellite CPU per frame for each LED count."""
+    print(f"\n  Per frame ({FRAMES} frames each):")
+    print(f"    {'LEDs':>4}  {'bytes old':>9} {'bytes new':>9} {'saved':>6}  "
+          f"{'cpu old us':>10} {'cpu new us':>10} {'speedup':>7}")
+    for count in counts:
+        before = len(per_led_frame(count))
+        after = len(batched_frame(count))
+        cpu_before = satellite_cpu_us(per_led_frame, count)
+        cpu_after = satellite_cpu_us(batched_frame, count)
+        print(
+            f"    {count:>4}  {before:>8}B {after:>8}B {1 - after / before:>6.0%}  "
+            f"{cpu_before:>10.1f} {cpu_after:>10.1f} {cpu_before / cpu_after:>6.2f}x"
+        )
+    print("  ok Benchmark complete")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("LED Batch Performance Benchmarks")
+    print("=" * 60)
+
+    test_batch_uses_fewer_wire_bytes()
+    benchmark()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Per-frame timing of BasePixelManager animation evaluation.
+
+Compares the type-grouped frame pass (``BasePixelManager._render_frame``)
+against the previous per-pixel loop, which copied ``_active_indices`` every
+frame and compared the slot's type string against each animation name in
+turn.  Frames are timed at 64, 256 and 1024 pixels for:
+
+  * one animation filled across every pixel (the common case), and
+  * a mix of every animation type set pixel by pixel.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+import importlib.util
+spec = importlib.util.spec_from_file_location(
+    "base_pixel_manager",
+    os.path.join(src_path, 'managers', 'base_pixel_manager.py')
+)
+base_pixel_manager_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(base_pixel_manager_module)
+
+BasePixelManager = base_pixel_manager_module.BasePixelManager
+Palette = base_pixel_manager_module.Palette
+
+SIZES = (64, 256, 1024)
+MIXED_TYPES = ("SOLID", "BLINK", "PULSE", "RAINBOW", "SCANNER", "CHASER", "DECAY")
+
+
+class FakePixels:
+    """Minimal JEBPixel stand-in backed by a list."""
+
+    def __init__(self, n):
+        self.n = n
+        self.buf = [(0, 0, 0)] * n
+
+    def __setitem__(self, idx, color):
+        self.buf[idx] = color
+
+    def __getitem__(self, idx):
+        return self.buf[idx]
+
+    def fill(self, color):
+        self.buf = [color] * self.n
+
+
+class LegacyPixelManager(BasePixelManager):
+    """BasePixelManager with the previous per-pixel string-dispatch frame loop."""
+
+    def _render_frame(self, now):
+        for idx in tuple(self._active_indices):
+            slot = self.active_animations[idx]
+            if not slot.active:
+                continue
+            if slot.duration:
+                elapsed = now - slot.start
+                if elapsed >= slot.duration:
+                    self.pixels[idx] = (0, 0, 0)
+                    slot.clear()
+                    self._active_count -= 1
+                    continue
+            elapsed = now - slot.start
+            if slot.type == "SOLID":
+                self.pixels[idx] = slot.color
+            elif slot.type == "BLINK":
+                period = 1.0 / slot.speed
+                phase = elapsed % period
+                self.pixels[idx] = slot.color if phase < (period / 2) else (0, 0, 0)
+            elif slot.type == "PULSE":
+                t = elapsed * slot.speed
+                factor = max(0.1, 0.5 + 0.5 * math.sin(t * 2 * math.pi))
+                base = slot.color
+                self.pixels[idx] = (int(base[0] * factor), int(base[1] * factor), int(base[2] * factor))
+            elif slot.type == "RAINBOW":
+                hue = (elapsed * slot.speed * 360 + (idx / self.num_pixels) * 360) % 360
+                self.pixels[idx] = Palette.hsv_to_rgb(hue, 1.0, 1.0)
+            elif slot.type == "GLITCH":
+                if random.random() > 0.9:
+                    self.pixels[idx] = (255, 255, 255) if random.random() > 0.5 else (0, 0, 0)
+                else:
+                    self.pixels[idx] = slot.color
+            elif slot.type == "SCANNER":
+                cycle = (elapsed * slot.speed) % 2.0
+                if cycle < 1.0:
+                    pos = cycle * (self.num_pixels - 1)
+                else:
+                    pos = (2.0 - cycle) * (self.num_pixels - 1)
+                brightness = max(0, 1.0 - abs(idx - pos))
+                base = slot.color
+                self.pixels[idx] = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+            elif slot.type == "CHASER":
+                pos = (elapsed * slot.speed * self.num_pixels) % self.num_pixels
+                dist = (idx - pos) % self.num_pixels
+                if dist > (self.num_pixels / 2):
+                    dist -= self.num_pixels
+                brightness = max(0, 1.0 - (abs(dist) / 2.0))
+                base = slot.color
+                self.pixels[idx] = (int(base[0] * brightness), int(base[1] * brightness), int(base[2] * brightness))
+            elif slot.type == "DECAY":
+                duration = 1.0 / slot.speed
+                if elapsed >= duration:
+                    self.pixels[idx] = (0, 0, 0)
+                    slot.clear()
+                    self._active_count -= 1
+                else:
+                    factor = 1.0 - (elapsed / duration)
+                    base = slot.color
+                    self.pixels[idx] = (int(base[0] * factor), int(base[1] * factor), int(base[2] * factor))
+
+
+def _setup_fill(cls, n, anim_type="PULSE"):
+    manager = cls(FakePixels(n))
+    manager.fill_animation(anim_type, (200, 120, 40), speed=0.5)
+    return manager
+
+
+def _setup_mixed(cls, n):
+    manager = cls(FakePixels(n))
+    for idx in range(n):
+        anim_type = MIXED_TYPES[idx % len(MIXED_TYPES)]
+        manager.set_animation(idx, anim_type, (200, 120, 40), speed=0.05 + (idx % 3) * 0.05)
+    return manager
+
+
+def time_frames(manager, frames):
+    """Return mean milliseconds per frame."""
+    t0 = manager.active_animations[0].start
+    start = time.perf_counter()
+    for frame in range(frames):
+        manager._render_frame(t0 + frame / 60.0)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+# The grouped RAINBOW pass looks hues up per whole degree (Palette.hue_to_rgb)
+# while the legacy loop converts the exact hue, so channels may differ slightly.
+HUE_TOLERANCE = 5
+
+
+def _assert_frame_matches(grouped, legacy, frame, n):
+    for idx in range(n):
+        got, want = grouped.pixels.buf[idx], legacy.pixels.buf[idx]
+        if legacy.active_animations[idx].type == "RAINBOW":
+            assert max(abs(g - w) for g, w in zip(got, want)) <= HUE_TOLERANCE, \
+                f"Frame {frame} pixel {idx} of {n}: {got} vs {want}"
+        else:
+            assert got == want, f"Frame {frame} pixel {idx} of {n}: {got} vs {want}"
+
+
+def test_grouped_frames_match_legacy():
+    """Test that the grouped frame pass writes the same colours as the legacy loop."""
+    print("\nTesting grouped frame output against the legacy loop...")
+    for n in SIZES:
+        for setup in (_setup_mixed, lambda cls, n: _setup_fill(cls, n, "SCANNER")):
+            legacy = setup(LegacyPixelManager, n)
+            grouped = setup(BasePixelManager, n)
+            for i in range(n):
+                grouped._anim_starts[i] = legacy.active_animations[i].start
+                grouped.active_animations[i].start = legacy.active_animations[i].start
+            t0 = legacy.active_animations[0].start
+            for frame in (0, 7, 33, 120, 400):
+                legacy._render_frame(t0 + frame / 60.0)
+                grouped._render_frame(t0 + frame / 60.0)
+                _assert_frame_matches(grouped, legacy, frame, n)
+            assert grouped._active_count == legacy._active_count
+    print("ok Grouped frames match legacy output")
+
+
+def benchmark_frame_time(frames=60):
+    """Print mean per-frame times for legacy and grouped evaluation."""
+    print(f"\n  Per-frame animation time ({frames} frames each):")
+    print(f"    {'pixels':>6}  {'scenario':<12} {'legacy ms':>10} {'grouped ms':>11} {'speedup':>8}")
+    for n in SIZES:
+        for label, setup in (("fill PULSE", _setup_fill), ("mixed types", _setup_mixed)):
+            legacy = time_frames(setup(LegacyPixelManager, n), frames)
+            grouped = time_frames(setup(BasePixelManager, n), frames)
+            print(f"    {n:>6}  {label:<12} {legacy:>10.3f} {grouped:>11.3f} {legacy / grouped:>7.2f}x")
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Pixel Animation Frame Benchmarks")
+    print("=" * 60)
+
+    test_grouped_frames_match_legacy()
+    benchmark_frame_time()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
+    print()
+    print("Summary of optimisations validated:")
+    print("  * Slots are evaluated in per-type groups from parallel arrays")
+    print("  * Phase, scanner and chaser positions are computed once per run")
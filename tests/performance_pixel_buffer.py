@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Performance comparison: NeoPixel tuple writes vs the shared PixelBuffer.
+
+The legacy path writes every pixel as ``parent[start + i] = (r, g, b)``
+into a NeoPixel object, which parses the tuple, applies brightness and
+stores the bytes in its own buffer.  With a ``PixelBuffer`` parent the
+segments write wire-order bytes directly, ``fill`` becomes a handful of
+slice copies and palette frames are blitted from a precomputed table.
+
+``PixelBufStrip`` below mimics the pure-Python adafruit_pixelbuf write
+path so both sides do comparable work on desktop Python.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utilities'))
+
+import jeb_pixel
+JEBPixel = jeb_pixel.JEBPixel
+PixelBuffer = jeb_pixel.PixelBuffer
+
+PIXELS = 260
+MATRIX_START = 4
+MATRIX_PIXELS = 256
+
+
+class PixelBufStrip:
+    """Python stand-in for a NeoPixel strip (GRB, brightness applied on write)."""
+
+    def __init__(self, n, brightness=0.3):
+        self.n = n
+        self.byteorder = "GRB"
+        self.brightness = brightness
+        self._buf = bytearray(n * 3)
+        self.sent = 0
+
+    def __setitem__(self, index, value):
+        r, g, b = value
+        o = index * 3
+        br = self.brightness
+        self._buf[o] = int(g * br)
+        self._buf[o + 1] = int(r * br)
+        self._buf[o + 2] = int(b * br)
+
+    def show(self):
+        self._transmit(self._buf)
+
+    def _transmit(self, buffer):
+        self.sent += len(buffer)
+
+
+def _segments(parent):
+    return JEBPixel(parent, 0, MATRIX_START), JEBPixel(parent, MATRIX_START, MATRIX_PIXELS)
+
+
+def _time(fn, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / frames
+
+
+def bench(frames=200):
+    """Return {scenario: (legacy_us, buffer_us)} per frame."""
+    palette = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255), (255, 255, 255)]
+    frame = bytes((i * 7) % len(palette) for i in range(MATRIX_PIXELS))
+
+    legacy_strip = PixelBufStrip(PIXELS)
+    _, legacy = _segments(legacy_strip)
+    buffer = PixelBuffer(PixelBufStrip(PIXELS))
+    _, fast = _segments(buffer)
+    table = fast.palette_table(palette)
+
+    def legacy_palette():
+        for i, p in enumerate(frame):
+            if p:
+                legacy[i] = palette[p]
+
+    def legacy_pixels():
+        for i in range(MATRIX_PIXELS):
+            legacy[i] = (i & 0xFF, 64, 200)
+
+    def fast_pixels():
+        for i in range(MATRIX_PIXELS):
+            fast[i] = (i & 0xFF, 64, 200)
+
+    results = {
+        "fill + show": (
+            _time(lambda: (legacy.fill((10, 200, 30)), legacy_strip.show()), frames),
+            _time(lambda: (fast.fill((10, 200, 30)), buffer.show()), frames),
+        ),
+        "palette frame": (
+            _time(legacy_palette, frames),
+            _time(lambda: fast.blit_row(0, frame, table, transparent=0), frames),
+        ),
+        "per-pixel set": (
+            _time(legacy_pixels, frames),
+            _time(fast_pixels, frames),
+        ),
+    }
+    return results
+
+
+def test_bulk_fill_faster_than_tuple_writes():
+    """Test that a PixelBuffer fill beats per-pixel tuple writes."""
+    print("\nTesting PixelBuffer fill against tuple writes...")
+    legacy, fast = bench(frames=50)["fill + show"]
+    assert fast < legacy, f"buffer fill {fast:.1f} us should beat tuple fill {legacy:.1f} us"
+    print(f"  ok tuple {legacy:.1f} us vs buffer {fast:.1f} us ({legacy / fast:.1f}x)")
+    print("ok Fill check passed")
+
+
+def benchmark_pixel_buffer(frames=200):
+    """Print per-frame costs for a 256-pixel matrix segment."""
+    print(f"\n  {MATRIX_PIXELS}-pixel segment on a {PIXELS}-pixel strip ({frames} frames):")
+    print(f"    {'scenario':<14} {'tuple us':>10} {'buffer us':>10} {'speedup':>8}")
+    for name, (legacy, fast) in bench(frames).items():
+        print(f"    {name:<14} {legacy:>10.1f} {fast:>10.1f} {legacy / fast:>7.2f}x")
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PixelBuffer Performance Benchmarks")
+    print("=" * 60)
+
+    test_bulk_fill_faster_than_tuple_writes()
+    benchmark_pixel_buffer()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Performance of MatrixManager text scrolling.
+
+display_text used to draw into an adafruit_pixel_framebuf PixelFramebuffer
+and each scroll step called ``scroll(-1, 0)`` then ``display()``, which
+shifts the whole framebuffer and rewrites every matrix pixel through the
+pixel adapter. The native renderer rasterises the message once into a
+column strip and a step only rebuilds the visible text window, pushed with
+one blit_mapped() through the matrix index map.
+
+``FramebufStandIn`` mimics the pure-Python framebuf scroll/display path so
+both sides do comparable work on desktop Python. Both run on a
+PixelBuffer-backed JEBPixel segment.
+"""
+
+import os
+import sys
+import time
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from unittest import mock
+for _mod in ('adafruit_ticks', 'digitalio', 'busio', 'board', 'analogio', 'microcontroller',
+             'audiobusio', 'audiocore', 'audiomixer', 'audiopwmio', 'synthio', 'ulab',
+             'neopixel', 'watchdog', 'adafruit_mcp230xx', 'adafruit_mcp230xx.mcp23017',
+             'adafruit_displayio_ssd1306', 'adafruit_display_text', 'adafruit_display_text.label',
+             'adafruit_ht16k33', 'adafruit_ht16k33.segments', 'displayio', 'terminalio'):
+    sys.modules.setdefault(_mod, mock.MagicMock())
+
+from managers.matrix_manager import MatrixManager
+from utilities.glyphs import GlyphCache
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
+
+MESSAGE = "JEB MARQUEE 0123456789 "
+
+
+class MockNeoPixel:
+    """NeoPixel stand-in with a raw transmit hook so PixelBuffer keeps bytes."""
+
+    def __init__(self, n):
+        self.n = n
+        self.byteorder = "GRB"
+        self.brightness = 1.0
+
+    def _transmit(self, buffer):
+        pass
+
+
+class FramebufStandIn:
+    """Pure-Python stand-in for PixelFramebuffer text/scroll/display."""
+
+    def __init__(self, matrix, color):
+        self.matrix = matrix
+        self.width = matrix.width
+        self.height = matrix.height
+        self.color = color
+        self.buf = [0] * (self.width * self.height)
+
+    def text(self, string, x, y):
+        for i, char in enumerate(string):
+            for cx, col in enumerate(GlyphCache().glyph(char)):
+                px = x + i * 6 + cx
+                if 0 <= px < self.width:
+                    for row in range(8):
+                        if col >> row & 1 and y + row < self.height:
+                            self.buf[(y + row) * self.width + px] = 1
+
+    def scroll(self, dx, dy):
+        width = self.width
+        buf = self.buf
+        for y in range(self.height):
+            row = y * width
+            for x in range(width - 1):
+                buf[row + x] = buf[row + x + 1]
+            buf[row + width - 1] = 0
+
+    def display(self):
+        pixels = self.matrix.pixels
+        idx_map = self.matrix._idx_map
+        on = self.color
+        for i, p in enumerate(self.buf):
+            pixels[idx_map[i]] = on if p else (0, 0, 0)
+
+
+def _make_matrix(size):
+    segment = JEBPixel(PixelBuffer(MockNeoPixel(size * size)), 0, size * size)
+    return MatrixManager(segment, width=size, height=size)
+
+
+def _time(fn, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - start) * 1e6 / frames
+
+
+def bench(size, frames=300):
+    """Return (framebuf_us, native_us) per scroll step on a size x size matrix."""
+    legacy = _make_matrix(size)
+    framebuf = FramebufStandIn(legacy, (255, 255, 255))
+    framebuf.text(MESSAGE, 0, 0)
+
+    def legacy_step():
+        framebuf.scroll(-1, 0)
+        framebuf.display()
+
+    native = _make_matrix(size)
+    native.display_text(MESSAGE * 20)
+    return _time(legacy_step, frames), _time(native._scroll_text, frames)
+
+
+def test_scroll_step_matches_framebuf():
+    """Test that the native window matches a framebuf text drawn at the same offset."""
+    print("\nTesting native scroll against framebuf text...")
+    native = _make_matrix(16)
+    native.display_text(MESSAGE)
+    for pos in (0, 7, 40):
+        while native._text_pos < pos:
+            native._scroll_text()
+        legacy = _make_matrix(16)
+        framebuf = FramebufStandIn(legacy, (255, 255, 255))
+        framebuf.text(MESSAGE, -pos, 0)
+        framebuf.display()
+        assert native.pixels._buf == legacy.pixels._buf, f"Window at pos {pos} differs"
+    print("ok windows match")
+
+
+def benchmark_text_scroll(frames=300):
+    """Print per-step scroll costs for common matrix sizes."""
+    print(f"\n  Scroll step cost ({frames} steps):")
+    print(f"    {'matrix':<8} {'framebuf us':>12} {'native us':>10} {'speedup':>8}")
+    for size in (8, 16):
+        legacy, native = bench(size, frames)
+        print(f"    {f'{size}x{size}':<8} {legacy:>12.1f} {native:>10.1f} {legacy / native:>7.2f}x")
+    strip = len(MESSAGE * 20) * 6
+    print(f"  Native strip for a {len(MESSAGE * 20)}-char marquee: {strip} bytes")
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Matrix Text Scroll Performance Benchmarks")
+    print("=" * 60)
+
+    test_scroll_step_matches_framebuf()
+    benchmark_text_scroll()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Performance benchmarks for UARTTransport packet decoding.
+
+Covers:
+  1. Decode throughput (packets/sec) of ``UARTTransport._try_decode_one`` for
+     one representative packet per distinct size in ``PAYLOAD_SCHEMAS``.
+  2. The ring-buffer delimiter scan: ``bytearray.find`` over the one or two
+     contiguous segments with a resume position, against the previous
+     per-byte ``(tail + i) % size`` loop that rescanned every partial packet
+     from the start.  Both are measured with whole packets already buffered
+     and with packets trickling in a few bytes per RX worker pass.
+"""
+
+import os
+import sys
+import time
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from transport import Message, UARTTransport
+from transport.protocol import (
+    COMMAND_MAP,
+    DEST_MAP,
+    ENCODING_FLOATS,
+    ENCODING_NUMERIC_BYTES,
+    ENCODING_NUMERIC_WORDS,
+    ENCODING_RAW_BYTES,
+    MAX_INDEX_VALUE,
+    PAYLOAD_SCHEMAS,
+)
+
+TRICKLE_BYTES = 16  # Bytes delivered per RX pass in trickle mode
+
+
+class FakeUART:
+    """Non-blocking UART stub that hands out queued bytes on readinto()."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.limit = None
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def readinto(self, buf):
+        count = min(len(buf), len(self.data))
+        if self.limit is not None:
+            count = min(count, self.limit)
+        buf[:count] = self.data[:count]
+        del self.data[:count]
+        return count
+
+    def write(self, data):
+        return len(data)
+
+    def reset_input_buffer(self):
+        self.data = bytearray()
+
+
+class LegacyScanTransport(UARTTransport):
+    """UARTTransport with the previous per-byte delimiter scan, for comparison."""
+
+    def _find_delimiter(self, start, stop):
+        for i in range(stop):
+            idx = (self._rx_tail + i) % self._rx_buf_size
+            if self._rx_buffer[idx] == 0x00:
+                return i
+        return -1
+
+
+def _make_transport(cls=UARTTransport):
+    return cls(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+
+
+def _sample_payload(cmd, schema):
+    """Build a payload sized like the fields described in the schema."""
+    fields = len(schema['desc'].split(','))
+    etype = schema['type']
+    if cmd == "FILE_CHUNK":
+        return bytes((i * 37 + 11) & 0xFF for i in range(128))
+    if etype == ENCODING_RAW_BYTES:
+        return bytes(range(1, 9))
+    if etype == ENCODING_NUMERIC_BYTES:
+        return bytes(range(1, fields + 1))
+    if etype == ENCODING_NUMERIC_WORDS:
+        return tuple(range(100, 100 + fields))
+    if etype == ENCODING_FLOATS:
+        return tuple(1.5 * (i + 1) for i in range(fields))
+    return "x" * 24
+
+
+def build_packets():
+    """Return [(cmd, framed packet)] with one entry per distinct packet size."""
+    encoder = _make_transport()
+    packets = []
+    seen = set()
+    for cmd, schema in PAYLOAD_SCHEMAS.items():
+        if cmd not in COMMAND_MAP:
+            continue
+        encoder.send(Message("0101", "CORE", cmd, _sample_payload(cmd, schema)))
+        packet = bytes(encoder._tx_mv[encoder._tx_tail:encoder._tx_head])
+        encoder._tx_tail = encoder._tx_head
+        if len(packet) not in seen:
+            seen.add(len(packet))
+            packets.append((cmd, packet))
+    packets.sort(key=lambda item: len(item[1]))
+    return packets
+
+
+def measure_decode(packet, cls=UARTTransport, trickle=None, count=2000):
+    """Decode *count* copies of *packet* and return packets/sec."""
+    transport = _make_transport(cls)
+    uart = transport.uart
+    uart.limit = trickle
+    decoded = 0
+    start = time.perf_counter()
+    for _ in range(count):
+        uart.data += packet
+        while uart.data or transport._rx_head != transport._rx_tail:
+            transport._read_hw()
+            if transport._try_decode_one() is not None:
+                decoded += 1
+    elapsed = time.perf_counter() - start
+    assert decoded == count, f"Decoded {decoded} of {count} packets"
+    return count / elapsed
+
+
+def test_find_scan_faster_for_trickled_chunks():
+    """Test that the find/resume scan beats the per-byte rescan on FILE_CHUNK packets."""
+    print("\nTesting delimiter scan on trickled FILE_CHUNK packets...")
+    packet = dict(build_packets())["FILE_CHUNK"]
+    legacy = measure_decode(packet, LegacyScanTransport, TRICKLE_BYTES, count=300)
+    current = measure_decode(packet, UARTTransport, TRICKLE_BYTES, count=300)
+    assert current > legacy, f"find scan {current:.0f} pkt/s should beat per-byte scan {legacy:.0f} pkt/s"
+    print(f"  ok per-byte {legacy:,.0f} pkt/s vs find {current:,.0f} pkt/s ({current / legacy:.2f}x)")
+    print("ok Delimiter scan check passed")
+
+
+def benchmark_decode_throughput(count=2000):
+    """Print packets/sec for every distinct packet size, whole and trickled."""
+    print(f"\n  Decode throughput ({count:,} packets each, trickle = {TRICKLE_BYTES} B per pass):")
+    print(f"    {'command':<12} {'wire':>5}  {'whole old':>10} {'whole new':>10}  "
+          f"{'trickle old':>11} {'trickle new':>11}  {'speedup':>7}")
+    for cmd, packet in build_packets():
+        whole_old = measure_decode(packet, LegacyScanTransport, None, count)
+        whole_new = measure_decode(packet, UARTTransport, None, count)
+        trickle_old = measure_decode(packet, LegacyScanTransport, TRICKLE_BYTES, count // 4)
+        trickle_new = measure_decode(packet, UARTTransport, TRICKLE_BYTES, count // 4)
+        print(
+            f"    {cmd:<12} {len(packet):>4}B  {whole_old:>10,.0f} {whole_new:>10,.0f}  "
+            f"{trickle_old:>11,.0f} {trickle_new:>11,.0f}  {trickle_new / trickle_old:>6.2f}x"
+        )
+    print("  ok Benchmark complete")
+
+
+# -------------------------------------------------------------------------
+# Main
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("UART Decode Performance Benchmarks")
+    print("=" * 60)
+
+    test_find_scan_faster_for_trickled_chunks()
+    benchmark_decode_throughput()
+
+    print("\n" + "=" * 60)
+    print("ALL BENCHMARKS PASSED")
+    print("=" * 60)
+    print()
+    print("Summary of optimisations validated:")
+    print("  * Delimiter search uses bytearray.find on contiguous ring segments")
+    print("  * Incomplete packets resume the scan where the last pass stopped")
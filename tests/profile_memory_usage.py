@@ -6,9 +6,21 @@ The key benefit is not necessarily total memory usage, but the reduction in:
 1. Temporary string object allocations
 2. String join operations
 3. String formatting (str(b) for each byte)
+
+It also measures a full UARTTransport message round trip (send + decode)
+before and after framing sends in the TX scratch buffer and recycling
+__slots__ Message objects through the transport's MessagePool.
 """
 
+import os
+import sys
 import time
+import tracemalloc
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
 def old_decode_bytes(payload_bytes):
     """Old implementation: creates comma-separated string."""
     return ','.join(str(b) for b in payload_bytes)
@@ -95,5 +107,147 @@ def main():
     print("\nResult: Fewer allocations = Less GC pressure = Better performance")
 
 
+class _DictMessage:
+    """Message as it was before __slots__: fields live in a per-instance dict."""
+
+    def __init__(self, source, destination, command, payload=""):
+        self.source = source
+        self.destination = destination
+        self.command = command
+        self.payload = payload
+
+
+class _NoPool:
+    """Stand-in for MessagePool that always allocates a dict-backed message."""
+
+    def acquire(self, source, destination, command, payload=""):
+        return _DictMessage(source, destination, command, payload)
+
+    def release(self, msg):
+        pass
+
+
+class _LoopbackUART:
+    """UART stub whose RX side reads the transport's own TX ring buffer."""
+
+    def __init__(self):
+        self.transport = None
+
+    @property
+    def in_waiting(self):
+        t = self.transport
+        return (t._tx_head - t._tx_tail) % t._tx_buffer_size
+
+    def readinto(self, buf):
+        t = self.transport
+        end = t._tx_head if t._tx_head >= t._tx_tail else t._tx_buffer_size
+        count = min(len(buf), end - t._tx_tail)
+        buf[:count] = t._tx_mv[t._tx_tail:t._tx_tail + count]
+        t._tx_tail = (t._tx_tail + count) % t._tx_buffer_size
+        return count
+
+    def write(self, data):
+        return len(data)
+
+    def reset_input_buffer(self):
+        pass
+
+
+def _make_loopback(legacy):
+    from transport import UARTTransport
+    from transport.protocol import COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+    from transport import uart_transport as ut
+
+    class LegacySendTransport(UARTTransport):
+        """send() as it was before the TX scratch buffer: heap-built frame."""
+
+        def send(self, message):
+            src = ut._encode_destination(message.source, self.dest_map)
+            dest = ut._encode_destination(message.destination, self.dest_map)
+            cmd = bytes([ut._encode_command(message.command, self.command_map)])
+            schema = self.payload_schemas.get(message.command)
+            payload = ut._encode_payload(message.payload, schema, self.encoding_constants)
+            raw = src + dest + cmd + payload
+            crc = bytes([ut.calculate_crc8(raw)])
+            packet = ut.cobs_encode(raw + crc) + b'\x00'
+            self._write_to_tx_buffer(packet)
+            return True
+
+    uart = _LoopbackUART()
+    cls = LegacySendTransport if legacy else UARTTransport
+    transport = cls(uart, COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    uart.transport = transport
+    if legacy:
+        transport.message_pool = _NoPool()
+    return transport
+
+
+def _receive(transport):
+    received = None
+    while received is None:
+        transport._read_hw()  # A packet that wraps the ring arrives in two reads
+        received = transport._try_decode_one()
+    return received
+
+
+def _round_trip(transport, message):
+    transport.send(message)
+    received = _receive(transport)
+    transport.release(received)
+    return received
+
+
+def measure_round_trip(legacy, message, iterations=2000):
+    """Return (peak transient bytes, bytes retained per queued message, us per round trip)."""
+    transport = _make_loopback(legacy)
+    for _ in range(50):
+        _round_trip(transport, message)  # Warm up pools and caches
+
+    tracemalloc.start()
+    peak = 0
+    for _ in range(200):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        _round_trip(transport, message)
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - base)
+
+    # Messages waiting in the RX queue are retained until consumed
+    base = tracemalloc.get_traced_memory()[0]
+    held = []
+    for _ in range(64):
+        transport.send(message)
+        held.append(_receive(transport))
+    retained = (tracemalloc.get_traced_memory()[0] - base) / len(held)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _round_trip(transport, message)
+    elapsed = time.perf_counter() - start
+    return peak, retained, elapsed / iterations * 1e6
+
+
+def round_trip_main():
+    from transport import Message
+
+    print("\n" + "=" * 70)
+    print("Message Round Trip: heap-built frames vs TX scratch + Message pool")
+    print("=" * 70)
+    cases = [
+        (Message("CORE", "0101", "LED", (255, 128, 64, 32, 2)), "LED (5 bytes)"),
+        (Message("0101", "CORE", "STATUS", bytes(range(1, 17))), "STATUS (16 bytes)"),
+        (Message("CORE", "0101", "FILE_CHUNK", bytes(range(1, 129))), "FILE_CHUNK (128 bytes)"),
+    ]
+    for message, description in cases:
+        old_peak, old_held, old_us = measure_round_trip(True, message)
+        new_peak, new_held, new_us = measure_round_trip(False, message)
+        print(f"\n{description}")
+        print("-" * 70)
+        print(f"Peak transient bytes per round trip: {old_peak:>6} -> {new_peak:>6}")
+        print(f"Bytes retained per queued message:   {old_held:>6.0f} -> {new_held:>6.0f}")
+        print(f"Time per round trip:                 {old_us:>6.1f}us -> {new_us:>6.1f}us")
+
+
 if __name__ == "__main__":
     main()
+    round_trip_main()
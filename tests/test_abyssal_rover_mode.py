@@ -35,7 +35,7 @@ _MODE_PATH = os.path.join(
     os.path.dirname(__file__), '..', 'src', 'modes', 'abyssal_rover.py'
 )
 _ICONS_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'src', 'utilities', 'icons.py'
+    os.path.dirname(__file__), '..', 'src', 'utilities', 'icon_library.py'
 )
 
 # ---------------------------------------------------------------------------
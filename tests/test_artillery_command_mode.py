@@ -25,7 +25,7 @@ _MODE_PATH = os.path.join(
     os.path.dirname(__file__), '..', 'src', 'modes', 'artillery_command.py'
 )
 _ICONS_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'src', 'utilities', 'icons.py'
+    os.path.dirname(__file__), '..', 'src', 'utilities', 'icon_library.py'
 )
 
 
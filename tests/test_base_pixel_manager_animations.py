@@ -362,6 +362,77 @@ def test_apply_brightness_performance():
     print("✓ _apply_brightness implementation test passed")
 
 
+def test_animation_groups_follow_type_changes():
+    """Test that pixels move between type groups as their animation changes."""
+    print("\nTesting animation type groups...")
+
+    manager = BasePixelManager(MockJEBPixel(6))
+    manager.fill_animation("SOLID", (10, 20, 30))
+    manager.set_animation(2, "PULSE", (255, 0, 0))
+    manager.set_animation(4, "SPARKLE", (0, 0, 255))  # Unknown type: kept, not rendered
+    manager._render_frame(manager.active_animations[0].start)
+
+    groups = manager._anim_groups
+    assert groups[base_pixel_manager_module.ANIM_SOLID] == [0, 1, 3, 5]
+    assert groups[base_pixel_manager_module.ANIM_PULSE] == [2]
+    assert groups[base_pixel_manager_module.ANIM_OTHER] == [4]
+    assert manager.pixels[0] == (10, 20, 30)
+    assert manager.pixels[4] == (0, 0, 0)
+
+    manager.clear_animation(0)
+    manager._render_frame(manager.active_animations[1].start)
+    assert groups[base_pixel_manager_module.ANIM_SOLID] == [1, 3, 5]
+    assert manager._active_count == 5
+
+    manager.clear()
+    assert all(not group for group in groups)
+    assert not manager._timed_indices
+
+    print("✓ Animation type groups test passed")
+
+
+def test_render_frame_expires_timed_animations():
+    """Test that duration expiry blanks the pixel and frees the slot."""
+    print("\nTesting timed animation expiry...")
+
+    manager = BasePixelManager(MockJEBPixel(4))
+    manager.fill_animation("SOLID", (50, 50, 50))
+    manager.set_animation(1, "BLINK", (255, 0, 0), speed=2.0, duration=1.0)
+    start = manager.active_animations[1].start
+
+    manager._render_frame(start + 0.1)
+    assert manager.pixels[1] == (255, 0, 0)
+    assert manager.pixels[0] == (50, 50, 50)
+
+    manager._render_frame(start + 1.0)
+    assert manager.pixels[1] == (0, 0, 0)
+    assert not manager.active_animations[1].active
+    assert 1 not in manager._active_indices
+    assert not manager._timed_indices
+    assert manager._active_count == 3
+
+    print("✓ Timed animation expiry test passed")
+
+
+def test_scanner_frame_values():
+    """Test scanner output at a fixed time: only pixels within one step of the head light up."""
+    print("\nTesting SCANNER frame values...")
+
+    manager = BasePixelManager(MockJEBPixel(5))
+    manager.cylon((200, 100, 0), speed=0.5)
+    start = manager.active_animations[0].start
+
+    # cycle = 0.5 * 0.5 = 0.25 -> head at pixel 1.0
+    manager._render_frame(start + 0.5)
+    assert manager.pixels._pixels == [(0, 0, 0), (200, 100, 0), (0, 0, 0), (0, 0, 0), (0, 0, 0)]
+
+    # Head between pixels 1 and 2 (pos 1.5)
+    manager._render_frame(start + 0.75)
+    assert manager.pixels._pixels == [(0, 0, 0), (100, 50, 0), (100, 50, 0), (0, 0, 0), (0, 0, 0)]
+
+    print("✓ SCANNER frame values test passed")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("BasePixelManager Common Animation Methods Test Suite")
@@ -382,6 +453,9 @@ if __name__ == "__main__":
         test_animation_methods_work_with_different_layouts()
         test_brightness_clamping()
         test_apply_brightness_performance()
+        test_animation_groups_follow_type_changes()
+        test_render_frame_expires_timed_animations()
+        test_scanner_frame_values()
         
         print("\n" + "=" * 60)
         print("ALL TESTS PASSED ✓")
@@ -4,6 +4,7 @@
 import sys
 import os
 import struct
+import time
 
 # Mock CircuitPython modules before any imports
 class MockModule:
@@ -310,6 +311,102 @@ def test_heap_efficiency():
     print("✓ Heap efficiency test passed")
 
 
+def _codec_samples(constants):
+    """One representative payload per command, with its schema-lookup encoding."""
+    from transport import uart_transport as ut
+    samples = []
+    for cmd, schema in PAYLOAD_SCHEMAS.items():
+        if cmd not in COMMAND_MAP:
+            continue
+        etype = schema['type']
+        if etype == 'bytes':
+            payload = (1, 2, 3, 4, 5)
+        elif etype == 'words':
+            payload = (120, -45)
+        elif etype == 'floats':
+            payload = (3.3, 5.0, 0.25)
+        elif etype == 'raw_bytes':
+            payload = bytes(range(1, 33))
+        else:
+            payload = "READY"
+        samples.append((cmd, schema, payload, ut._encode_payload(payload, schema, constants)))
+    return samples
+
+
+def test_codec_table_matches_schema_lookup():
+    """Test that the compiled per-command codecs match the schema-lookup codecs."""
+    print("\nTesting compiled codec table against schema lookup...")
+    from transport import uart_transport as ut
+
+    transport = UARTTransport(MockUARTManager(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    constants = transport.encoding_constants
+    for cmd, schema, payload, encoded in _codec_samples(constants):
+        cmd_byte, encoder = transport._tx_codecs[cmd]
+        assert cmd_byte == COMMAND_MAP[cmd]
+        assert encoder(payload) == encoded, f"{cmd}: encoder mismatch"
+        cmd_str, decoder = transport._rx_codecs[cmd_byte]
+        assert cmd_str == cmd
+        assert decoder(memoryview(encoded)) == ut._decode_payload(encoded, schema, constants), \
+            f"{cmd}: decoder mismatch"
+
+    # Destination caches return the same encodings and names as the parsers
+    for dest in ("ALL", "CORE", "0101", "0203"):
+        assert transport._encode_dest(dest) == ut._encode_destination(dest, DEST_MAP)
+        assert transport._encode_dest(dest) is transport._encode_dest(dest), "Encoding should be cached"
+        data = ut._encode_destination(dest, DEST_MAP)
+        assert transport._decode_dest(data, 0, len(data)) == \
+            ut._decode_destination(data, 0, transport.dest_reverse_map, MAX_INDEX_VALUE)
+
+    print("✓ Compiled codec table test passed")
+
+
+def benchmark_codec_dispatch(iterations=20000):
+    """Time per-message dispatch: schema lookup + string parsing vs compiled tables."""
+    from transport import uart_transport as ut
+
+    transport = UARTTransport(MockUARTManager(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    constants = transport.encoding_constants
+    samples = _codec_samples(constants)
+    dests = ("0101", "0102", "CORE", "ALL")
+
+    start = time.perf_counter()
+    for i in range(iterations):
+        cmd, schema, payload, encoded = samples[i % len(samples)]
+        ut._encode_destination(dests[i & 3], DEST_MAP)
+        ut._encode_command(cmd, COMMAND_MAP)
+        ut._encode_payload(payload, PAYLOAD_SCHEMAS.get(cmd), constants)
+        ut._decode_command(COMMAND_MAP[cmd], transport.command_reverse_map)
+        ut._decode_payload(encoded, PAYLOAD_SCHEMAS.get(cmd), constants)
+    lookup = time.perf_counter() - start
+
+    tx_codecs = transport._tx_codecs
+    rx_codecs = transport._rx_codecs
+    start = time.perf_counter()
+    for i in range(iterations):
+        cmd, schema, payload, encoded = samples[i % len(samples)]
+        transport._encode_dest(dests[i & 3])
+        cmd_byte, encoder = tx_codecs[cmd]
+        if not isinstance(payload, (bytes, bytearray)):
+            encoder(payload)
+        rx_codecs[cmd_byte][1](encoded)
+    compiled = time.perf_counter() - start
+
+    return lookup / iterations * 1e6, compiled / iterations * 1e6
+
+
+def test_codec_dispatch_benchmark():
+    """Micro-benchmark: compiled codec table is faster than per-message schema lookup."""
+    print("\nBenchmarking codec dispatch...")
+
+    lookup_us, compiled_us = benchmark_codec_dispatch()
+    print(f"  Schema lookup + string parsing: {lookup_us:.2f}us per message")
+    print(f"  Compiled codec table + cache:   {compiled_us:.2f}us per message")
+    print(f"  Speedup: {lookup_us / compiled_us:.2f}x")
+    assert compiled_us < lookup_us, "Compiled dispatch should beat per-message schema lookup"
+
+    print("✓ Codec dispatch benchmark passed")
+
+
 if __name__ == "__main__":
     print("=" * 70)
     print("Binary Payload Performance Test Suite (String Boomerang Fix)")
@@ -323,6 +420,8 @@ if __name__ == "__main__":
         test_unpack_bytes_function()
         test_no_string_boomerang()
         test_heap_efficiency()
+        test_codec_table_matches_schema_lookup()
+        test_codec_dispatch_benchmark()
 
         print("\n" + "=" * 70)
         print("ALL PERFORMANCE TESTS PASSED ✓")
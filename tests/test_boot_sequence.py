@@ -189,6 +189,13 @@ class TestSynthSwell:
         asyncio.run(seq._synth_swell())
         synth.play_sequence.assert_called_once_with(t.CONSOLE_BOOT_SWELL)
 
+    def test_swell_skipped_without_synth(self):
+        """A lazily built (None) synth skips the swell and play() still completes."""
+        buzzer = _make_buzzer()
+        seq = BootSequence(_make_matrix(), _make_display(), None, buzzer)
+        asyncio.run(seq.play("v0.8.0"))
+        buzzer.play_note.assert_called_once()
+
 
 class TestBuzzerPing:
     """_buzzer_ping() tests."""
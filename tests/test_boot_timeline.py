@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Unit tests for the boot-phase BootTimeline recorder."""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from utilities import boot_timeline
+from utilities.boot_timeline import BootTimeline
+
+
+class FakeClock:
+    """Microsecond clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def _timeline():
+    clock = FakeClock()
+    patcher = mock.patch.object(boot_timeline, "_now_us", clock)
+    patcher.start()
+    return BootTimeline(), clock, patcher
+
+
+def test_spans_nest_and_time():
+    """Nested spans record start offsets, durations and depth."""
+    print("Testing nested spans...")
+
+    timeline, clock, patcher = _timeline()
+    try:
+        clock.now = 1000
+        with timeline.span("init:core_manager"):
+            clock.now = 3000
+            with timeline.span("init:audio"):
+                clock.now = 7000
+            clock.now = 9000
+        timeline.mark("first_menu_frame")
+    finally:
+        patcher.stop()
+
+    outer, inner, mark = timeline.entries
+    assert outer == ["init:core_manager", 1000, 8000, 0]
+    assert inner == ["init:audio", 3000, 4000, 1]
+    assert mark == ["first_menu_frame", 9000, 0, 0]
+    assert timeline.durations()["init:audio"] == 4.0
+
+    lines = timeline.report()
+    assert lines[2].endswith("    init:audio"), lines[2]
+
+    print("✓ Nested span test passed")
+
+
+def test_span_closes_on_exception():
+    """A span still closes, and depth unwinds, when its block raises."""
+    print("\nTesting span on exception...")
+
+    timeline, clock, patcher = _timeline()
+    try:
+        try:
+            with timeline.span("init:broken"):
+                clock.now = 500
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        timeline.mark("after")
+    finally:
+        patcher.stop()
+
+    assert timeline.entries[0][2] == 500
+    assert timeline.entries[1][3] == 0
+
+    print("✓ Span exception test passed")
+
+
+def test_finish_writes_report_once():
+    """finish() marks the end of boot and writes the SD report only once."""
+    print("\nTesting report output...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timeline = BootTimeline()
+        timeline.report_to = "sd"
+        timeline.report_dir = tmp + "/"
+        with timeline.span("config"):
+            pass
+        timeline.finish()
+        timeline.finish()
+
+        with open(os.path.join(tmp, BootTimeline.REPORT_FILE)) as f:
+            text = f.read()
+    assert "config" in text and "first_menu_frame" in text
+    assert text.count("first_menu_frame") == 1
+
+    print("✓ Report output test passed")
+
+
+def test_unsaved_report_logs_warning():
+    """A report that cannot be written is logged as a warning, not raised."""
+    print("\nTesting unwritable report directory...")
+
+    from utilities.logger import JEBLogger
+
+    timeline = BootTimeline()
+    timeline.report_to = "sd"
+    timeline.report_dir = "/nonexistent/boot/"
+    with mock.patch.object(JEBLogger, "warning") as warning:
+        timeline.finish()
+    warning.assert_called_once()
+    assert warning.call_args[0][0] == "BOOT"
+
+    print("✓ Unwritable report test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Boot Timeline Test Suite")
+    print("=" * 60)
+
+    try:
+        test_spans_nest_and_time()
+        test_span_closes_on_exception()
+        test_finish_writes_report_once()
+        test_unsaved_report_logs_warning()
+
+        print("\n" + "=" * 60)
+        print("ALL BOOT TIMELINE TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -26,7 +26,7 @@ _MODE_PATH = os.path.join(
     os.path.dirname(__file__), '..', 'src', 'modes', 'bunker_defuse.py'
 )
 _ICONS_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'src', 'utilities', 'icons.py'
+    os.path.dirname(__file__), '..', 'src', 'utilities', 'icon_library.py'
 )
 
 
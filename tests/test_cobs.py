@@ -11,6 +11,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utiliti
 import cobs
 cobs_encode = cobs.cobs_encode
 cobs_decode = cobs.cobs_decode
+cobs_encode_into = cobs.cobs_encode_into
+cobs_decode_into = cobs.cobs_decode_into
 
 
 def test_cobs_encode_empty():
@@ -198,6 +200,61 @@ def test_cobs_overhead():
     print("✓ Overhead analysis test passed")
 
 
+def test_cobs_encode_into():
+    """Test COBS encoding into a preallocated buffer."""
+    print("\nTesting COBS encode into scratch buffer...")
+
+    test_cases = [
+        b'',
+        b'\x00',
+        b'\x11\x22\x00\x33',
+        bytes(range(1, 255)),
+        bytes([0x41] * 600),
+        b'\x00' * 5 + bytes(range(256)) * 2,
+    ]
+    for data in test_cases:
+        out = bytearray(len(data) + len(data) // 254 + 8)
+        length = cobs_encode_into(data, out)
+        assert bytes(out[:length]) == cobs_encode(data), f"Mismatch for {data[:16]!r}..."
+        assert b'\x00' not in out[:length]
+
+    try:
+        cobs_encode_into(bytes(300), bytearray(10))
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ COBS encode into test passed")
+
+
+def test_cobs_decode_into():
+    """Test COBS decoding from a memoryview into an oversized scratch buffer."""
+    print("\nTesting COBS decode into scratch buffer...")
+
+    scratch = bytearray(1024)
+    for data in [b'\x00', b'Hello\x00World', bytes([0x41] * 600), bytes(range(256))]:
+        encoded = bytearray(cobs_encode(data))
+        length = cobs_decode_into(memoryview(encoded), scratch)
+        assert bytes(scratch[:length]) == data, f"Roundtrip failed for {data[:16]!r}..."
+
+    # Decoding must never grow a bytearray destination
+    small = bytearray(4)
+    try:
+        cobs_decode_into(cobs_encode(b'Hello'), small)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        assert len(small) == 4
+
+    for invalid in (b'', b'\x05\x01', b'\x02\x01\x00\x01'):
+        try:
+            cobs_decode_into(invalid, scratch)
+            assert False, f"Should have raised ValueError for {invalid!r}"
+        except ValueError:
+            pass
+
+    print("✓ COBS decode into test passed")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("COBS Implementation Test Suite")
@@ -216,6 +273,8 @@ if __name__ == "__main__":
         test_cobs_binary_message()
         test_cobs_invalid_decode()
         test_cobs_overhead()
+        test_cobs_encode_into()
+        test_cobs_decode_into()
         
         print("\n" + "=" * 60)
         print("ALL COBS TESTS PASSED ✓")
@@ -963,6 +963,77 @@ async def test_live_debug_console_help():
     await cm.live_debug_console()
 
 
+@pytest.mark.asyncio
+async def test_live_debug_console_render_profiler():
+    """live_debug_console 'render' commands toggle and print the frame profiler."""
+    import asyncio as _asyncio
+    from managers.render_manager import RenderManager
+
+    class _Strip:
+        def show(self):
+            pass
+
+    app = MockApp()
+    app.renderer = RenderManager(_Strip())
+    cm = ConsoleManager("CORE", "00", app=app)
+    printed = []
+    cm._print = lambda msg="": printed.append(msg)
+
+    input_queue = ["render", "render on", "render", "render reset", "render off", "exit"]
+
+    async def fake_input(prompt):
+        if input_queue[0] == "render":
+            # Let one profiled frame run before printing
+            task = _asyncio.create_task(app.renderer.run())
+            await _asyncio.sleep(0.02)
+            task.cancel()
+            try:
+                await task
+            except _asyncio.CancelledError:
+                pass
+        return input_queue.pop(0) if input_queue else "exit"
+
+    cm.get_input = fake_input
+    await cm.live_debug_console()
+
+    assert any("Profiler off" in line for line in printed)
+    assert any(line.startswith("show") for line in printed)
+    assert app.renderer.profiler is None
+
+
+@pytest.mark.asyncio
+async def test_live_debug_console_uart_latency():
+    """live_debug_console 'uart' prints and clears the RX latency histogram."""
+    from transport import UARTTransport
+    from transport.protocol import COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+
+    class _UART:
+        baudrate = 921600
+        in_waiting = 0
+
+        def write(self, data):
+            return len(data)
+
+    app = MockApp()
+    app.transport = UARTTransport(_UART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    app.transport.rx_latency.record(1.5)
+    cm = ConsoleManager("CORE", "00", app=app)
+    printed = []
+    cm._print = lambda msg="": printed.append(msg)
+
+    input_queue = ["uart", "uart reset", "exit"]
+
+    async def fake_input(prompt):
+        return input_queue.pop(0) if input_queue else "exit"
+
+    cm.get_input = fake_input
+    await cm.live_debug_console()
+
+    assert any(line.startswith("RX 1 packets") for line in printed)
+    assert any("<=2:1" in line for line in printed)
+    assert app.transport.rx_latency.count == 0
+
+
 @pytest.mark.asyncio
 async def test_live_debug_console_enc_core():
     """live_debug_console adjusts core encoder position by the given delta."""
@@ -1326,6 +1397,8 @@ def run_all_tests():
     ]
 
     async_tests = [
+        test_live_debug_console_render_profiler,
+        test_live_debug_console_uart_latency,
         test_test_buzzer_play_tone,
         test_test_buzzer_play_scale,
         test_test_display_status,
@@ -341,6 +341,26 @@ def test_step_still_life_block():
     print("✓ step: 2×2 block still-life is unchanged after one generation")
 
 
+def test_encoder_changes_simulation_interval():
+    """Turning the encoder retimes the running SimScheduler; long press exits."""
+    from utilities.sim_scheduler import SimScheduler
+    life = _make_life(8, 8)
+    life.sim = SimScheduler(life._step, lambda: None, 300)
+    life._speed_idx = 2
+    life._last_enc = 2
+    life.core.hid.encoder_position.return_value = 3
+    life.core.hid.is_button_pressed.return_value = False
+    life.core.hid.is_encoder_button_pressed.return_value = False
+
+    assert life._handle_input() is None
+    assert life._speed_idx == 3
+    assert life.sim.interval_ms == 150, f"Expected 150 ms, got {life.sim.interval_ms}"
+
+    life.core.hid.is_encoder_button_pressed.return_value = True
+    assert life._handle_input() == "SUCCESS"
+    print("✓ input: encoder retimes the simulation and long press exits")
+
+
 # ===========================================================================
 # 3. MatrixManager.show_frame
 # ===========================================================================
@@ -609,6 +629,7 @@ if __name__ == "__main__":
         test_step_swaps_buffers,
         test_step_blinker_oscillator,
         test_step_still_life_block,
+        test_encoder_changes_simulation_interval,
         # show_frame
         test_show_frame_palette_index_maps_to_correct_rgb,
         test_show_frame_zero_bytes_leave_pixels_off,
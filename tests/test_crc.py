@@ -229,6 +229,24 @@ def test_bytes_input():
     print("✓ Bytes input handling tests passed")
 
 
+def test_crc8_range():
+    """Test that the in-place range CRC matches CRC over a slice."""
+    print("\nTesting CRC-8 over buffer ranges...")
+
+    import os
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utilities'))
+    import crc
+
+    buf = bytearray(b"\xff\xffALL|ID_ASSIGN|0100\x00\x00")
+    view = memoryview(buf)
+    assert crc.calculate_crc8_range(buf, 2, 20) == calculate_crc8(b"ALL|ID_ASSIGN|0100")
+    assert crc.calculate_crc8_range(view, 2, 20) == crc.calculate_crc8(bytes(buf[2:20]))
+    assert crc.calculate_crc8_range(b"abc") == crc.calculate_crc8(b"abc")
+    assert crc.calculate_crc8_range(buf, 5, 5) == 0
+
+    print("✓ CRC-8 range tests passed")
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("CRC-8 UART Integrity Test Suite")
@@ -240,6 +258,7 @@ if __name__ == "__main__":
         test_protocol_examples()
         test_error_detection()
         test_bytes_input()
+        test_crc8_range()
 
         print("\n" + "=" * 60)
         print("ALL TESTS PASSED ✓")
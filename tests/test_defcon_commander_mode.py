@@ -24,7 +24,7 @@ _TONES_PATH = os.path.join(
     os.path.dirname(__file__), '..', 'src', 'utilities', 'tones.py'
 )
 _ICONS_PATH = os.path.join(
-    os.path.dirname(__file__), '..', 'src', 'utilities', 'icons.py'
+    os.path.dirname(__file__), '..', 'src', 'utilities', 'icon_library.py'
 )
 
 
@@ -17,10 +17,16 @@ import pytest
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import transport.file_transfer as file_transfer
 from transport.file_transfer import (
     FileTransferReceiver,
     FileTransferSender,
+    HashCache,
+    ReplyQueue,
     calculate_sha256,
+    file_fingerprint,
+    format_version_check,
+    parse_version_check,
 )
 from transport.message import Message
 from transport.protocol import (
@@ -28,6 +34,7 @@ from transport.protocol import (
     CMD_FILE_CHUNK,
     CMD_FILE_END,
     CMD_FILE_START,
+    CMD_FILE_STATUS,
     CMD_NACK,
     FILE_COMMANDS,
 )
@@ -128,6 +135,124 @@ def test_calculate_sha256_empty_file():
     print("✓ calculate_sha256 empty file test passed")
 
 
+# ---------------------------------------------------------------------------
+# Hash cache / VERSION_CHECK fingerprint tests
+# ---------------------------------------------------------------------------
+
+def _counting_sha256(monkeypatch):
+    """Patch calculate_sha256 and return the list of paths it hashes."""
+    calls = []
+    real = file_transfer.calculate_sha256
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(file_transfer, "calculate_sha256", counting)
+    return calls
+
+
+def test_hash_cache_skips_unchanged_file(monkeypatch):
+    """A second lookup of an unchanged file must not re-read it."""
+    calls = _counting_sha256(monkeypatch)
+    path = make_temp_file(b"firmware")
+    try:
+        cache = HashCache()
+        assert cache.get(path) == hashlib.sha256(b"firmware").hexdigest()
+        assert cache.get(path) == hashlib.sha256(b"firmware").hexdigest()
+        assert calls == [path]
+    finally:
+        os.unlink(path)
+
+    print("✓ HashCache reuses digests of unchanged files")
+
+
+def test_hash_cache_rehashes_changed_file(monkeypatch):
+    """A size or mtime change must invalidate the cached digest."""
+    calls = _counting_sha256(monkeypatch)
+    path = make_temp_file(b"v1")
+    try:
+        cache = HashCache()
+        cache.get(path)
+        with open(path, "wb") as f:
+            f.write(b"version 2")
+        assert cache.get(path) == hashlib.sha256(b"version 2").hexdigest()
+        assert len(calls) == 2
+    finally:
+        os.unlink(path)
+
+    print("✓ HashCache re-hashes modified files")
+
+
+def test_hash_cache_persists_between_instances(monkeypatch):
+    """A saved cache must serve digests to a fresh instance (next boot)."""
+    path = make_temp_file(b"persist me")
+    cache_path = make_staging_path()
+    os.unlink(cache_path)
+    try:
+        first = HashCache(cache_path)
+        first.get(path)
+        first.save()
+
+        calls = _counting_sha256(monkeypatch)
+        second = HashCache(cache_path)
+        assert second.get(path) == hashlib.sha256(b"persist me").hexdigest()
+        assert calls == []
+    finally:
+        os.unlink(path)
+        if os.path.exists(cache_path):
+            os.unlink(cache_path)
+
+    print("✓ HashCache persists across instances")
+
+
+def test_hash_cache_missing_file():
+    """HashCache.get returns None for a missing file."""
+    assert HashCache().get("/nonexistent/path/file.bin") is None
+
+    print("✓ HashCache missing file returns None")
+
+
+def test_version_check_round_trip():
+    """Fingerprints appended to VERSION_CHECK must parse back to the same set."""
+    tags = [
+        file_fingerprint("code.mpy", "a" * 64),
+        file_fingerprint("managers/led_manager.mpy", "b" * 64),
+    ]
+    payload = format_version_check("0.4.0", tags)
+
+    version, parsed = parse_version_check(payload)
+    assert version == "0.4.0"
+    assert parsed == set(tags)
+
+    print("✓ VERSION_CHECK fingerprints round-trip")
+
+
+def test_version_check_legacy_payload():
+    """A plain version string (older firmware) carries no fingerprints."""
+    assert parse_version_check("0.3.1") == ("0.3.1", None)
+    assert parse_version_check(b"0.3.1\n") == ("0.3.1", None)
+    assert format_version_check("0.3.1", None) == "0.3.1"
+
+    print("✓ Legacy VERSION_CHECK parses without fingerprints")
+
+
+def test_version_check_drops_oversized_fingerprint_list():
+    """Too many fingerprints must fall back to a version-only payload."""
+    tags = ["0" * file_transfer.FINGERPRINT_LENGTH] * (file_transfer.MAX_FINGERPRINTS + 1)
+    assert format_version_check("0.4.0", tags) == "0.4.0"
+
+    print("✓ Oversized fingerprint list is dropped")
+
+
+def test_fingerprint_binds_path():
+    """Identical contents at different paths must get different fingerprints."""
+    digest = hashlib.sha256(b"").hexdigest()
+    assert file_fingerprint("a/__init__.py", digest) != file_fingerprint("b/__init__.py", digest)
+
+    print("✓ Fingerprints are bound to the file path")
+
+
 # ---------------------------------------------------------------------------
 # Protocol constant tests
 # ---------------------------------------------------------------------------
@@ -158,8 +283,8 @@ def test_file_commands_byte_range():
 
 
 def test_file_commands_set():
-    """FILE_COMMANDS set must contain exactly the three file-transfer commands."""
-    assert FILE_COMMANDS == {CMD_FILE_START, CMD_FILE_CHUNK, CMD_FILE_END}
+    """FILE_COMMANDS set must contain exactly the four file-transfer commands."""
+    assert FILE_COMMANDS == {CMD_FILE_START, CMD_FILE_CHUNK, CMD_FILE_END, CMD_FILE_STATUS}
     print("✓ FILE_COMMANDS set is correct")
 
 
@@ -914,6 +1039,636 @@ async def test_receiver_tick_no_effect_when_idle():
     print("✓ tick() is a no-op when receiver is IDLE")
 
 
+# ---------------------------------------------------------------------------
+# Windowed (pipelined) mode
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_windowed_sender_offers_window_in_file_start():
+    """A sender with window_size > 1 must append window,chunk_size to FILE_START."""
+    sender_t, receiver_t = make_pipe()
+
+    content = b"x" * 50
+    path = make_temp_file(content)
+    try:
+        sender = FileTransferSender(
+            sender_t, source_id="CORE", chunk_size=64, timeout=0.5, window_size=4
+        )
+
+        async def ack_loop():
+            while True:
+                msg = await receiver_t.receive()
+                if msg.command == CMD_FILE_START:
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, "4,64"))
+                elif msg.command == CMD_FILE_CHUNK:
+                    offset = struct.unpack("<I", msg.payload[:4])[0]
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, str(offset + len(msg.payload) - 4)))
+                else:
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, ""))
+                    break
+
+        task = asyncio.create_task(ack_loop())
+        result = await sender.send_file("0101", path)
+        await task
+
+        assert result is True
+        parts = sender_t.sent_messages[0].payload.split(",")
+        assert parts[1:] == ["50", "4", "64"]
+    finally:
+        os.unlink(path)
+
+    print("✓ Windowed sender offers window and chunk size in FILE_START")
+
+
+@pytest.mark.asyncio
+async def test_receiver_negotiates_window_within_limits():
+    """Receiver must clamp the offered window/chunk size and ACK the result."""
+    sender_t, receiver_t = make_pipe()
+    staging = make_staging_path()
+    receiver = FileTransferReceiver(
+        receiver_t, source_id="0101", staging_path=staging, max_window=4
+    )
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_START, "f.bin,10,8,512"))
+    reply = sender_t.receive_nowait()
+
+    assert reply.command == CMD_ACK
+    assert reply.payload == "4,256"
+    assert receiver._windowed is True
+
+    receiver._close_staging_file()
+    if os.path.exists(staging):
+        os.unlink(staging)
+
+    print("✓ Receiver clamps window negotiation to its limits")
+
+
+@pytest.mark.asyncio
+async def test_full_transfer_windowed_keeps_chunks_in_flight():
+    """Windowed transfer must pipeline chunks and still produce an exact copy."""
+    content = bytes(range(256)) * 4
+    source_path = make_temp_file(content)
+    staging_path = make_staging_path()
+
+    sender_t, receiver_t = make_pipe()
+    sender = FileTransferSender(
+        sender_t, source_id="CORE", chunk_size=64, timeout=1.0, window_size=4
+    )
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging_path)
+
+    async def receiver_loop():
+        while True:
+            msg = await receiver_t.receive()
+            await receiver.handle_message(msg)
+            if msg.command == CMD_FILE_END:
+                break
+
+    try:
+        recv_task = asyncio.create_task(receiver_loop())
+        result = await sender.send_file("0101", source_path)
+        await recv_task
+
+        assert result is True
+        with open(staging_path, "rb") as f:
+            assert f.read() == content
+
+        # FILE_START is followed by a full window of chunks before any reply
+        # could have been processed.
+        commands = [m.command for m in sender_t.sent_messages[1:5]]
+        assert commands == [CMD_FILE_CHUNK] * 4
+        chunk_msgs = [m for m in sender_t.sent_messages if m.command == CMD_FILE_CHUNK]
+        assert len(chunk_msgs) == len(content) // 64
+    finally:
+        os.unlink(source_path)
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
+
+    print("✓ Windowed transfer pipelines chunks end-to-end")
+
+
+@pytest.mark.asyncio
+async def test_windowed_sender_falls_back_for_legacy_receiver():
+    """A NACK to the windowed FILE_START must trigger a legacy stop-and-wait retry."""
+    sender_t, receiver_t = make_pipe()
+
+    content = b"legacy receiver" * 10
+    path = make_temp_file(content)
+    try:
+        sender = FileTransferSender(
+            sender_t, source_id="CORE", chunk_size=32, timeout=0.5, window_size=8
+        )
+
+        async def legacy_receiver():
+            # Mirrors the pre-windowing parser: "filename,size" only.
+            while True:
+                msg = await receiver_t.receive()
+                if msg.command == CMD_FILE_START:
+                    try:
+                        int(msg.payload.split(",", 1)[1])
+                    except ValueError:
+                        receiver_t.send(Message("0101", "CORE", CMD_NACK, ""))
+                        continue
+                receiver_t.send(Message("0101", "CORE", CMD_ACK, ""))
+                if msg.command == CMD_FILE_END:
+                    break
+
+        task = asyncio.create_task(legacy_receiver())
+        result = await sender.send_file("0101", path)
+        await task
+
+        assert result is True
+        starts = [m for m in sender_t.sent_messages if m.command == CMD_FILE_START]
+        assert len(starts) == 2
+        assert starts[1].payload.count(",") == 1, "Retry must use the legacy payload"
+
+        # Stop-and-wait: every chunk is sent exactly once, strictly in order.
+        chunk_offsets = [
+            struct.unpack("<I", m.payload[:4])[0]
+            for m in sender_t.sent_messages if m.command == CMD_FILE_CHUNK
+        ]
+        assert chunk_offsets == list(range(0, len(content), 32))
+    finally:
+        os.unlink(path)
+
+    print("✓ Windowed sender falls back to stop-and-wait for legacy receivers")
+
+
+@pytest.mark.asyncio
+async def test_windowed_selective_retransmit_of_lost_chunk():
+    """A lost chunk must be NACKed by offset and retransmitted alone."""
+    content = bytes(range(256)) * 2
+    source_path = make_temp_file(content)
+    staging_path = make_staging_path()
+
+    sender_t, receiver_t = make_pipe()
+    sender = FileTransferSender(
+        sender_t, source_id="CORE", chunk_size=64, timeout=1.0, window_size=4
+    )
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging_path)
+
+    dropped = {"done": False}
+
+    async def lossy_receiver_loop():
+        while True:
+            msg = await receiver_t.receive()
+            if msg.command == CMD_FILE_CHUNK and not dropped["done"]:
+                if struct.unpack("<I", msg.payload[:4])[0] == 64:
+                    dropped["done"] = True
+                    continue  # Lost on the wire
+            await receiver.handle_message(msg)
+            if msg.command == CMD_FILE_END:
+                break
+
+    try:
+        recv_task = asyncio.create_task(lossy_receiver_loop())
+        result = await sender.send_file("0101", source_path)
+        await recv_task
+
+        assert result is True
+        with open(staging_path, "rb") as f:
+            assert f.read() == content
+
+        nacks = [m for m in receiver_t.sent_messages if m.command == CMD_NACK]
+        assert nacks and all(m.payload == "64" for m in nacks)
+
+        chunk_offsets = [
+            struct.unpack("<I", m.payload[:4])[0]
+            for m in sender_t.sent_messages if m.command == CMD_FILE_CHUNK
+        ]
+        assert chunk_offsets.count(64) == 2, "Only the lost chunk is resent"
+        assert all(chunk_offsets.count(o) == 1 for o in chunk_offsets if o != 64)
+    finally:
+        os.unlink(source_path)
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
+
+    print("✓ Lost chunk is selectively retransmitted by offset")
+
+
+@pytest.mark.asyncio
+async def test_windowed_transfer_event_driven_acks():
+    """Windowed mode must work through ack_event/ack_payload_callback."""
+    content = bytes(range(200)) * 3
+    source_path = make_temp_file(content)
+    staging_path = make_staging_path()
+
+    sender_t, receiver_t = make_pipe()
+    state = {"status": False, "payload": ""}
+    ack_event = asyncio.Event()
+
+    sender = FileTransferSender(
+        sender_t, source_id="CORE", chunk_size=50, timeout=1.0, window_size=4,
+        ack_event=ack_event,
+        ack_status_callback=lambda: state["status"],
+        ack_payload_callback=lambda: state["payload"],
+    )
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging_path)
+
+    async def dispatch_loop():
+        # Single-slot delivery through ack_event and the status/payload callbacks
+        while True:
+            msg = await sender_t.receive()
+            state["status"] = msg.command == CMD_ACK
+            state["payload"] = msg.payload
+            ack_event.set()
+
+    async def receiver_loop():
+        while True:
+            msg = await receiver_t.receive()
+            await receiver.handle_message(msg)
+            if msg.command == CMD_FILE_END:
+                break
+
+    dispatch_task = asyncio.create_task(dispatch_loop())
+    try:
+        recv_task = asyncio.create_task(receiver_loop())
+        result = await sender.send_file("0101", source_path)
+        await recv_task
+
+        assert result is True
+        with open(staging_path, "rb") as f:
+            assert f.read() == content
+    finally:
+        dispatch_task.cancel()
+        os.unlink(source_path)
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
+
+    print("✓ Windowed transfer works with event-driven ACK delivery")
+
+
+@pytest.mark.asyncio
+async def test_reply_queue_keeps_nack_and_filters_source():
+    """A NACK followed by an ACK before the sender wakes must both be seen, in order."""
+    replies = ReplyQueue()
+    sender = FileTransferSender(PipeTransport(), source_id="CORE", timeout=0.2, replies=replies)
+
+    waiter = asyncio.create_task(sender._wait_for_reply("0101"))
+    await asyncio.sleep(0)
+    replies.put("0102", True, "512")  # Another satellite: must not complete the wait
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    replies.put("0101", False, "64")
+    replies.put("0101", True, "128")
+    assert await waiter == (False, "64")
+    assert await sender._wait_for_reply("0101") == (True, "128")
+    assert await sender._wait_for_reply("0101") == (None, None)
+
+    sender._expect_reply("0102")
+    assert replies.get("0102") is None, "Stale replies are dropped before a new request"
+
+    print("✓ Reply queue keeps NACKs and filters on the transfer target")
+
+
+@pytest.mark.asyncio
+async def test_sender_hash_cache_hashes_source_once(monkeypatch):
+    """A sender with a hash cache must hash a file once across transfers."""
+    calls = _counting_sha256(monkeypatch)
+    content = b"shared firmware" * 10
+    source_path = make_temp_file(content)
+    cache = HashCache()
+
+    try:
+        for _ in range(2):
+            sender_t, receiver_t = make_pipe()
+            staging = make_staging_path()
+            sender = FileTransferSender(sender_t, source_id="CORE", timeout=1.0, hash_cache=cache)
+            receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging)
+
+            async def receiver_loop():
+                while True:
+                    msg = await receiver_t.receive()
+                    await receiver.handle_message(msg)
+                    if msg.command == CMD_FILE_END:
+                        break
+
+            recv_task = asyncio.create_task(receiver_loop())
+            assert await sender.send_file("0101", source_path) is True
+            await recv_task
+            os.unlink(staging)
+
+        assert calls.count(source_path) == 1
+    finally:
+        os.unlink(source_path)
+
+    print("✓ Sender hash cache avoids re-hashing the source file")
+
+
+# ---------------------------------------------------------------------------
+# Compressed mode
+# ---------------------------------------------------------------------------
+
+SOURCE_TEXT = (
+    b"def update(self):\n"
+    b"    for i in range(self.num_pixels):\n"
+    b"        self.pixels[i] = self.palette[(i + self.offset) % len(self.palette)]\n"
+) * 12
+
+
+@pytest.mark.asyncio
+async def test_receiver_accepts_lz_codec():
+    """Receiver must echo a supported codec in the FILE_START ACK."""
+    sender_t, receiver_t = make_pipe()
+    staging = make_staging_path()
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging)
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_START, "f.py,10,4,128,lz"))
+    assert sender_t.receive_nowait().payload == "4,128,lz"
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_START, "f.py,10,4,128,zstd"))
+    assert sender_t.receive_nowait().payload == "4,128", "Unknown codecs must not be echoed"
+
+    receiver._close_staging_file()
+    os.unlink(staging)
+
+    print("✓ Receiver negotiates the LZ codec")
+
+
+@pytest.mark.parametrize("window", [1, 4])
+@pytest.mark.asyncio
+async def test_compressed_transfer_round_trip(window):
+    """A compressed transfer must reproduce the file and put fewer bytes on the wire."""
+    source_path = make_temp_file(SOURCE_TEXT)
+    staging_path = make_staging_path()
+
+    sender_t, receiver_t = make_pipe()
+    sender = FileTransferSender(
+        sender_t, source_id="CORE", chunk_size=128, timeout=1.0,
+        window_size=window, compress=True,
+    )
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging_path)
+
+    async def receiver_loop():
+        while True:
+            msg = await receiver_t.receive()
+            await receiver.handle_message(msg)
+            if msg.command == CMD_FILE_END:
+                break
+
+    try:
+        recv_task = asyncio.create_task(receiver_loop())
+        assert await sender.send_file("0101", source_path) is True
+        await recv_task
+
+        with open(staging_path, "rb") as f:
+            assert f.read() == SOURCE_TEXT
+
+        assert sender_t.sent_messages[0].payload.endswith(",lz")
+        chunks = [m for m in sender_t.sent_messages if m.command == CMD_FILE_CHUNK]
+        wire = sum(len(m.payload) for m in chunks)
+        raw_wire = len(SOURCE_TEXT) + 4 * len(chunks)
+        assert wire < raw_wire, f"Expected compressed chunks, sent {wire} of {raw_wire} bytes"
+    finally:
+        os.unlink(source_path)
+        if os.path.exists(staging_path):
+            os.unlink(staging_path)
+
+    print(f"✓ Compressed transfer round trip (window={window})")
+
+
+@pytest.mark.asyncio
+async def test_compressed_sender_sends_raw_without_codec_echo():
+    """Chunks must stay raw when the receiver does not echo the codec."""
+    sender_t, receiver_t = make_pipe()
+    content = SOURCE_TEXT[:200]
+    path = make_temp_file(content)
+    try:
+        sender = FileTransferSender(
+            sender_t, source_id="CORE", chunk_size=64, timeout=0.5, window_size=4, compress=True
+        )
+
+        async def pre_codec_receiver():
+            # Windowed receiver that ignores the fifth FILE_START field.
+            while True:
+                msg = await receiver_t.receive()
+                if msg.command == CMD_FILE_START:
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, "4,64"))
+                elif msg.command == CMD_FILE_CHUNK:
+                    offset = struct.unpack("<I", msg.payload[:4])[0]
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, str(offset + len(msg.payload) - 4)))
+                else:
+                    receiver_t.send(Message("0101", "CORE", CMD_ACK, ""))
+                    break
+
+        task = asyncio.create_task(pre_codec_receiver())
+        assert await sender.send_file("0101", path) is True
+        await task
+
+        chunks = b"".join(
+            m.payload[4:] for m in sender_t.sent_messages if m.command == CMD_FILE_CHUNK
+        )
+        assert chunks == content
+    finally:
+        os.unlink(path)
+
+    print("✓ Compressed sender falls back to raw chunks")
+
+
+@pytest.mark.asyncio
+async def test_receiver_nacks_corrupt_compressed_chunk():
+    """A chunk that fails to decompress must be NACKed and not written."""
+    sender_t, receiver_t = make_pipe()
+    staging = make_staging_path()
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging)
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_START, "f.py,100,1,64,lz"))
+    sender_t.receive_nowait()
+
+    bad = struct.pack("<I", 0) + bytes((1,)) + b"\x50ab"
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_CHUNK, bad))
+    assert sender_t.receive_nowait().command == CMD_NACK
+    assert receiver._bytes_received == 0
+
+    receiver._close_staging_file()
+    os.unlink(staging)
+
+    print("✓ Corrupt compressed chunk is NACKed")
+
+
+# ---------------------------------------------------------------------------
+# Broadcast mode
+# ---------------------------------------------------------------------------
+
+class BusTransport(PipeTransport):
+    """Core-side transport for a daisy chain of several receivers.
+
+    Broadcast messages ("SAT"/"ALL") reach every node; unicast messages
+    reach only the node with the matching ID.  Replies from any node land
+    in this transport's receive queue.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.nodes = {}
+
+    def add_node(self, sid):
+        node = PipeTransport()
+        node.peer = self
+        self.nodes[sid] = node
+        return node
+
+    def send(self, msg):
+        self.sent_messages.append(msg)
+        for sid, node in self.nodes.items():
+            if msg.destination in ("SAT", "ALL") or msg.destination == sid:
+                node._queue.put_nowait(msg)
+
+
+@pytest.mark.asyncio
+async def test_receiver_broadcast_session_is_silent_and_tracks_chunks():
+    """Broadcast FILE_START/FILE_CHUNK must be written without replies and reported by FILE_STATUS."""
+    sender_t, receiver_t = make_pipe()
+    staging = make_staging_path()
+    receiver = FileTransferReceiver(receiver_t, source_id="0101", staging_path=staging)
+
+    content = bytes(range(100))
+    await receiver.handle_message(Message("CORE", "SAT", CMD_FILE_START, "f.bin,100,1,32"))
+    for offset in (0, 64, 96):  # chunk at 32 lost
+        payload = struct.pack("<I", offset) + content[offset:offset + 32]
+        await receiver.handle_message(Message("CORE", "SAT", CMD_FILE_CHUNK, payload))
+
+    assert sender_t.receive_nowait() is None, "Broadcast messages must not be answered"
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_STATUS, ""))
+    reply = sender_t.receive_nowait()
+    assert reply.command == CMD_FILE_STATUS
+    assert reply.payload == bytes([0b1101])
+
+    receiver._close_staging_file()
+    if os.path.exists(staging):
+        os.unlink(staging)
+
+    print("✓ Broadcast session writes silently and reports a chunk bitmap")
+
+
+@pytest.mark.asyncio
+async def test_receiver_nacks_file_status_outside_broadcast():
+    """FILE_STATUS must be NACKed when no broadcast session is active."""
+    sender_t, receiver_t = make_pipe()
+    receiver = FileTransferReceiver(receiver_t, source_id="0101")
+
+    await receiver.handle_message(Message("CORE", "0101", CMD_FILE_STATUS, ""))
+    assert sender_t.receive_nowait().command == CMD_NACK
+
+    print("✓ FILE_STATUS outside a broadcast session is NACKed")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_file_repairs_each_receiver():
+    """One broadcast stream must reach all receivers, repairing losses per receiver."""
+    content = bytes(range(256)) * 3
+    source_path = make_temp_file(content)
+    chunk_size = 64
+
+    bus = BusTransport()
+    sender = FileTransferSender(
+        bus, source_id="CORE", chunk_size=chunk_size, timeout=0.5,
+        window_size=4, broadcast_interval=0,
+    )
+
+    sids = ["0101", "0102", "0103"]
+    staging = {sid: make_staging_path() for sid in sids}
+    receivers = {
+        sid: FileTransferReceiver(bus.add_node(sid), source_id=sid, staging_path=staging[sid])
+        for sid in sids
+    }
+
+    def drop(sid, msg):
+        # 0102 loses two broadcast chunks; 0103 misses the broadcast FILE_START.
+        if msg.destination != "SAT":
+            return False
+        if sid == "0102" and msg.command == CMD_FILE_CHUNK:
+            return struct.unpack("<I", msg.payload[:4])[0] in (128, 512)
+        return sid == "0103" and msg.command == CMD_FILE_START
+
+    async def node_loop(sid):
+        node = bus.nodes[sid]
+        while True:
+            msg = await node.receive()
+            if not drop(sid, msg):
+                await receivers[sid].handle_message(msg)
+
+    tasks = [asyncio.create_task(node_loop(sid)) for sid in sids]
+    try:
+        confirmed = await sender.broadcast_file(sids, source_path, remote_filename="code.mpy")
+
+        assert confirmed == sids
+        for sid in sids:
+            with open(staging[sid], "rb") as f:
+                assert f.read() == content, f"{sid} received corrupted data"
+
+        broadcast_chunks = [
+            m for m in bus.sent_messages
+            if m.command == CMD_FILE_CHUNK and m.destination == "SAT"
+        ]
+        assert len(broadcast_chunks) == len(content) // chunk_size
+
+        repair_offsets = [
+            struct.unpack("<I", m.payload[:4])[0]
+            for m in bus.sent_messages
+            if m.command == CMD_FILE_CHUNK and m.destination == "0102"
+        ]
+        assert sorted(repair_offsets) == [128, 512], "Only missing chunks are repaired"
+
+        # 0103 was served by a unicast fallback transfer
+        assert any(
+            m.command == CMD_FILE_START and m.destination == "0103"
+            for m in bus.sent_messages
+        )
+        # A clean receiver answers only the status query and FILE_END
+        replies = [m.command for m in bus.nodes["0101"].sent_messages]
+        assert replies == [CMD_FILE_STATUS, CMD_ACK]
+    finally:
+        for task in tasks:
+            task.cancel()
+        os.unlink(source_path)
+        for path in staging.values():
+            if os.path.exists(path):
+                os.unlink(path)
+
+    print("✓ Broadcast transfer reaches every receiver with per-receiver repair")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_file_compressed():
+    """A compressed broadcast must reach every receiver intact."""
+    source_path = make_temp_file(SOURCE_TEXT)
+    bus = BusTransport()
+    sender = FileTransferSender(
+        bus, source_id="CORE", chunk_size=128, timeout=0.5, broadcast_interval=0, compress=True,
+    )
+    sids = ["0101", "0102"]
+    staging = {sid: make_staging_path() for sid in sids}
+    receivers = {
+        sid: FileTransferReceiver(bus.add_node(sid), source_id=sid, staging_path=staging[sid])
+        for sid in sids
+    }
+
+    async def node_loop(sid):
+        node = bus.nodes[sid]
+        while True:
+            await receivers[sid].handle_message(await node.receive())
+
+    tasks = [asyncio.create_task(node_loop(sid)) for sid in sids]
+    try:
+        assert await sender.broadcast_file(sids, source_path) == sids
+        for sid in sids:
+            with open(staging[sid], "rb") as f:
+                assert f.read() == SOURCE_TEXT
+        start = next(m for m in bus.sent_messages if m.command == CMD_FILE_START)
+        assert start.payload.endswith(",lz")
+    finally:
+        for task in tasks:
+            task.cancel()
+        os.unlink(source_path)
+        for path in staging.values():
+            if os.path.exists(path):
+                os.unlink(path)
+
+    print("✓ Compressed broadcast reaches every receiver")
+
+
 def test_makedirs_single_level():
     """_makedirs must create a single-level directory."""
     from transport.file_transfer import _makedirs
@@ -978,6 +1733,11 @@ def run_sync_tests():
         test_calculate_sha256_known_value,
         test_calculate_sha256_missing_file,
         test_calculate_sha256_empty_file,
+        test_hash_cache_missing_file,
+        test_version_check_round_trip,
+        test_version_check_legacy_payload,
+        test_version_check_drops_oversized_fingerprint_list,
+        test_fingerprint_binds_path,
         test_file_commands_in_protocol,
         test_file_commands_byte_range,
         test_file_commands_set,
@@ -1016,6 +1776,22 @@ async def run_async_tests():
     await test_receiver_nacks_chunk_beyond_declared_size()
     await test_receiver_tick_expires_stale_transfer()
     await test_receiver_tick_no_effect_when_idle()
+    await test_windowed_sender_offers_window_in_file_start()
+    await test_receiver_negotiates_window_within_limits()
+    await test_full_transfer_windowed_keeps_chunks_in_flight()
+    await test_windowed_sender_falls_back_for_legacy_receiver()
+    await test_windowed_selective_retransmit_of_lost_chunk()
+    await test_windowed_transfer_event_driven_acks()
+    await test_reply_queue_keeps_nack_and_filters_source()
+    await test_receiver_broadcast_session_is_silent_and_tracks_chunks()
+    await test_receiver_nacks_file_status_outside_broadcast()
+    await test_broadcast_file_repairs_each_receiver()
+    await test_broadcast_file_compressed()
+    await test_receiver_accepts_lz_codec()
+    await test_compressed_transfer_round_trip(1)
+    await test_compressed_transfer_round_trip(4)
+    await test_compressed_sender_sends_raw_without_codec_echo()
+    await test_receiver_nacks_corrupt_compressed_chunk()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for applying a staged delta firmware update on a satellite."""
+
+import asyncio
+import json
+import os
+import sys
+from unittest import mock
+
+for _name in ('adafruit_ticks', 'busio', 'board', 'digitalio', 'microcontroller',
+              'watchdog', 'analogio', 'neopixel', 'supervisor'):
+    sys.modules.setdefault(_name, mock.MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from satellites.base_firmware import SatelliteFirmware
+
+
+class FakeFS:
+    """Flat path -> contents map standing in for the satellite's flash."""
+
+    def __init__(self, files):
+        self.files = dict(files)
+
+    def rename(self, src, dst):
+        if src not in self.files:
+            raise OSError(2, "No such file")
+        self.files[dst] = self.files.pop(src)
+
+    def remove(self, path):
+        if path not in self.files:
+            raise OSError(2, "No such file")
+        del self.files[path]
+
+    def open(self, path, mode='r'):
+        return mock.mock_open(read_data=self.files[path])()
+
+
+def _firmware(staged):
+    fw = object.__new__(SatelliteFirmware)
+    fw.id = "0101"
+    fw.sat_type_id = "01"
+    fw.transport_up = mock.MagicMock()
+    fw.watchdog = mock.MagicMock()
+    fw._update_staged = set(staged)
+    return fw
+
+
+def test_apply_installs_only_files_staged_this_session():
+    """A file left in /update by an aborted update is not installed by a later delta."""
+    print("Testing delta apply ignores stale staged files...")
+
+    manifest = json.dumps({"files": [{"path": "a.mpy"}, {"path": "b.mpy"}]})
+    fs = FakeFS({
+        "/update/manifest.json": manifest,
+        "/update/a.mpy": "stale",  # From an earlier, aborted update
+        "/update/b.mpy": "new",
+        "/a.mpy": "current",
+    })
+    fw = _firmware({"manifest.json", "b.mpy"})
+
+    with mock.patch("os.rename", fs.rename), mock.patch("os.remove", fs.remove), \
+            mock.patch("builtins.open", fs.open), \
+            mock.patch("transport.file_transfer._makedirs"):
+        asyncio.run(fw._apply_update_and_reboot())
+
+    assert fs.files["/a.mpy"] == "current", "Unchanged file must not be replaced"
+    assert fs.files["/b.mpy"] == "new"
+    assert fs.files["/manifest.json"] == manifest
+    fw.watchdog.force_reboot.assert_called_once()
+
+    print("✓ Stale staged file test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Firmware Update Apply Test Suite")
+    print("=" * 60)
+
+    try:
+        test_apply_installs_only_files_staged_this_session()
+
+        print("\n" + "=" * 60)
+        print("ALL FIRMWARE UPDATE APPLY TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -647,6 +647,68 @@ def test_pixel_count_uses_pixel_list():
     assert ctrl.pixel_count == 64
 
 
+# ---------------------------------------------------------------------------
+# Dense canvas array tests
+# ---------------------------------------------------------------------------
+
+def test_dense_arrays_match_pixel_map():
+    """Slot arrays hold the same coordinates and targets as the dict view."""
+    ctrl = GlobalAnimationController()
+    matrix = MatrixManager(MockJEBPixel(64), width=8, height=8)
+    led = LEDManager(MockJEBPixel(8))
+    ctrl.register_matrix(matrix, offset_x=0, offset_y=0)
+    ctrl.register_led_strip(led, offset_x=0, offset_y=8, orientation='horizontal')
+
+    assert len(ctrl._pix_x) == len(ctrl._pix_y) == len(ctrl._pix_comp) == 72
+    for slot in range(ctrl.pixel_count):
+        gx, gy = ctrl._pix_x[slot], ctrl._pix_y[slot]
+        mgr = ctrl._slot_managers[ctrl._pix_comp[slot]]
+        assert ctrl._pixel_map[(gx, gy)] == (mgr, ctrl._pix_idx[slot])
+        assert ctrl._slot_at(gx, gy) == slot
+
+
+def test_column_index_orders_slots_top_to_bottom():
+    """Each column lists its slots by ascending global Y."""
+    ctrl = GlobalAnimationController()
+    matrix = MatrixManager(MockJEBPixel(16), width=4, height=4)
+    led = LEDManager(MockJEBPixel(3))
+    ctrl.register_matrix(matrix, offset_x=0, offset_y=0)
+    ctrl.register_led_strip(led, offset_x=2, offset_y=5, orientation='vertical')
+
+    assert len(ctrl._columns) == ctrl.canvas_width == 4
+    ys = [ctrl._pix_y[slot] for slot in ctrl._columns[2]]
+    assert ys == [0, 1, 2, 3, 5, 6, 7]
+    assert [ctrl._pix_y[slot] for slot in ctrl._columns[0]] == [0, 1, 2, 3]
+
+
+def test_overlapping_coordinates_last_registration_wins():
+    """A coordinate mapped twice keeps one slot pointing at the later component."""
+    ctrl = GlobalAnimationController()
+    led1 = LEDManager(MockJEBPixel(4))
+    led2 = LEDManager(MockJEBPixel(2))
+    ctrl.register_led_strip(led1, offset_x=0, offset_y=0, orientation='horizontal')
+    ctrl.register_led_strip(led2, offset_x=1, offset_y=0, orientation='horizontal')
+
+    assert ctrl.pixel_count == 4
+    assert ctrl._pixel_map[(1, 0)] == (led2, 0)
+    assert ctrl._pixel_map[(3, 0)] == (led1, 3)
+    ctrl.set_pixel(2, 0, (9, 9, 9))
+    assert led2.pixels[1] == (9, 9, 9)
+    assert led1.pixels[2] == (0, 0, 0)
+
+
+def test_negative_discrete_coordinates_are_addressable():
+    """Coordinates left of or above the origin still resolve through the grid."""
+    ctrl = GlobalAnimationController()
+    led = LEDManager(MockJEBPixel(2))
+    ctrl.register_discrete_leds(led, [(-2, -1), (3, 4)])
+
+    assert ctrl.canvas_width == 4 and ctrl.canvas_height == 5
+    ctrl.set_pixel(-2, -1, (1, 2, 3))
+    assert led.pixels[0] == (1, 2, 3)
+    assert ctrl._slot_at(-3, 0) == -1
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("GlobalAnimationController Test Suite")
@@ -693,6 +755,10 @@ if __name__ == "__main__":
         test_pixel_list_rebuilt_on_each_registration,
         test_pixel_list_discrete_leds_consistent,
         test_pixel_count_uses_pixel_list,
+        test_dense_arrays_match_pixel_map,
+        test_column_index_orders_slots_top_to_bottom,
+        test_overlapping_coordinates_last_registration_wins,
+        test_negative_discrete_coordinates_are_addressable,
     ]
 
     passed = 0
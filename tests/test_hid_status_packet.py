@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Tests for the binary HIDManager STATUS packet.
+
+Verifies that get_status_packet() / apply_status_packet() round-trip every
+input type, that delta frames only carry changed fields, and that the
+legacy ASCII status format is still accepted by the Core.
+"""
+
+import sys
+import os
+from unittest import mock
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+# ---------------------------------------------------------------------------
+# CircuitPython stubs
+# ---------------------------------------------------------------------------
+_cp_mocks = ['digitalio', 'board', 'busio', 'keypad', 'rotaryio', 'adafruit_ticks']
+for _m in _cp_mocks:
+    if _m not in sys.modules:
+        sys.modules[_m] = mock.MagicMock()
+
+_tick_time = 0
+
+
+def _ticks_ms():
+    return _tick_time
+
+
+def _ticks_diff(new, old):
+    return new - old
+
+
+# ---------------------------------------------------------------------------
+# Helper
+# ---------------------------------------------------------------------------
+
+def _make_hid():
+    """Fresh monitor-only HIDManager with the Industrial satellite layout plus extras."""
+    sys.modules['adafruit_ticks'].ticks_ms = _ticks_ms
+    sys.modules['adafruit_ticks'].ticks_diff = _ticks_diff
+
+    if 'managers.hid_manager' in sys.modules:
+        del sys.modules['managers.hid_manager']
+    from managers.hid_manager import HIDManager
+    return HIDManager(
+        buttons=[0] * 2,
+        latching_toggles=[0] * 10,
+        momentary_toggles=[0] * 2,
+        encoders=[0, 0],
+        matrix_keypads=[(['1', '2', '3'], [], [])],
+        monitor_only=True,
+    )
+
+
+def _set_inputs(hid):
+    hid.buttons_values[1] = True
+    hid.latching_values[0] = True
+    hid.latching_values[9] = True
+    hid.momentary_values[1] = [False, True]
+    hid.matrix_keypads_queues[0].extend(['1', '3'])
+    hid.encoder_positions[0] = 70000
+    hid.encoder_positions[1] = -5
+    hid.encoder_buttons_values[0] = True
+    hid.estop_value = True
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+def test_full_packet_roundtrip():
+    """A full packet reproduces every input on the Core side."""
+    global _tick_time
+    _tick_time = 1000
+    sat = _make_hid()
+    core = _make_hid()
+    _set_inputs(sat)
+
+    packet = sat.get_status_packet(full=True)
+    assert packet[0] == sat.STATUS_FULL
+    assert packet[1] == 0x7F
+
+    # The transport decodes NUMERIC_BYTES payloads as a tuple of ints
+    assert core.apply_status_packet(tuple(packet)) is True
+    assert core.buttons_values == [False, True]
+    assert core.latching_values == [True] + [False] * 8 + [True]
+    assert core.momentary_values == [[False, False], [False, True]]
+    assert core.matrix_keypads_queues[0] == ['1', '3']
+    assert core.encoder_positions == [70000, -5]
+    assert core.encoder_buttons_values == [True, False]
+    assert core.estop_value is True
+
+    # Binary is far smaller than the ASCII format for the same state
+    assert len(packet) < len(sat.get_status_bytes())
+    print("✓ Full STATUS packet roundtrip passed")
+
+
+def test_delta_only_changed_fields():
+    """A delta frame carries only changed fields; an idle delta is just the header."""
+    sat = _make_hid()
+    _set_inputs(sat)
+    sat.get_status_packet(full=True, flush=True)
+
+    idle = sat.get_status_packet(full=False)
+    assert idle == bytes([sat.STATUS_DELTA, 0]), f"Expected empty delta, got {idle!r}"
+
+    sat.buttons_values[0] = True
+    packet = sat.get_status_packet(full=False)
+    assert packet[1] == sat.FIELD_BUTTONS
+    assert packet == bytes([sat.STATUS_DELTA, sat.FIELD_BUTTONS, 2, 0b11])
+    print("✓ Delta STATUS packet field selection passed")
+
+
+def test_delta_encoders_accumulate():
+    """Encoder deltas are relative and add up to the absolute position."""
+    sat = _make_hid()
+    core = _make_hid()
+    sat.encoder_positions[0] = 100
+    core.apply_status_packet(sat.get_status_packet(full=True))
+
+    sat.encoder_positions[0] = 103
+    sat.encoder_positions[1] = -2
+    packet = sat.get_status_packet(full=False)
+    assert packet[1] == sat.FIELD_ENCODERS
+    assert len(packet) == 2 + 1 + 2 * 2
+    core.apply_status_packet(packet)
+
+    # Jumps larger than int16 are split across successive deltas
+    sat.encoder_positions[0] = 103 + 40000
+    core.apply_status_packet(sat.get_status_packet(full=False))
+    assert core.encoder_positions[0] == 103 + 32767
+    core.apply_status_packet(sat.get_status_packet(full=False))
+    assert core.encoder_positions == [103 + 40000, -2]
+    print("✓ Delta encoder accumulation passed")
+
+
+def test_packet_tap_detection():
+    """Press/release via binary packets fires the same tap flags as the ASCII path."""
+    global _tick_time
+    sat = _make_hid()
+    core = _make_hid()
+
+    _tick_time = 2000
+    sat.buttons_values[0] = True
+    core.apply_status_packet(sat.get_status_packet(full=False))
+    assert core.buttons_tapped[0] is False
+
+    _tick_time = 2200
+    sat.buttons_values[0] = False
+    core.apply_status_packet(sat.get_status_packet(full=False))
+    assert core.buttons_tapped[0] is True
+    print("✓ STATUS packet tap detection passed")
+
+
+def test_invalid_packets():
+    """Unknown headers and truncated packets raise ValueError."""
+    core = _make_hid()
+    for data in (b'\x10\x00', bytes([core.STATUS_FULL, core.FIELD_ENCODERS, 2, 0x01])):
+        try:
+            core.apply_status_packet(data)
+            assert False, f"Should have raised ValueError for {data!r}"
+        except ValueError:
+            pass
+    print("✓ Invalid STATUS packets rejected")
+
+
+def test_driver_accepts_binary_and_ascii():
+    """The Industrial driver applies binary packets and still parses legacy ASCII."""
+    sat = _make_hid()
+    core = _make_hid()
+    sat.buttons_values[1] = True
+    sat.estop_value = True
+
+    driver = mock.MagicMock()
+    driver.hid = core
+    driver.sid = "0101"
+
+    with mock.patch.dict(sys.modules, {
+        'utilities.pins': mock.MagicMock(),
+        'satellites.base_driver': mock.MagicMock(SatelliteDriver=object),
+    }):
+        if 'satellites.sat_01_driver' in sys.modules:
+            del sys.modules['satellites.sat_01_driver']
+        from satellites import sat_01_driver
+        sat_01_driver.HIDManager = type(core)
+        update = sat_01_driver.IndustrialSatelliteDriver.update_from_packet
+
+    update(driver, tuple(sat.get_status_packet(full=True)))
+    assert core.buttons_values == [False, True]
+    assert core.estop_value is True
+
+    sat.buttons_values[:] = [True, False]
+    update(driver, sat.get_status_bytes())
+    assert core.buttons_values == [True, False]
+    print("✓ Driver binary and ASCII STATUS handling passed")
+
+
+if __name__ == "__main__":
+    test_full_packet_roundtrip()
+    test_delta_only_changed_fields()
+    test_delta_encoders_accumulate()
+    test_packet_tap_detection()
+    test_invalid_packets()
+    test_driver_accepts_binary_and_ascii()
+    print("\nAll STATUS packet tests passed")
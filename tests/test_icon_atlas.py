@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Unit tests for the SD icon atlas and the LRU-backed Icons store."""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from utilities.icon_atlas import IconAtlas, pack_atlas
+from utilities.icon_library import IconLibrary
+from utilities.icons import IconStore, Icons
+
+
+def _write_atlas(directory, icons, anims=None):
+    path = os.path.join(directory, "atlas.bin")
+    with open(path, "wb") as f:
+        f.write(pack_atlas(icons, anims))
+    return path
+
+
+def test_atlas_round_trip():
+    """Every packed icon, animation and timing table reads back unchanged."""
+    print("Testing atlas round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_atlas(tmp, IconLibrary.ICON_LIBRARY, IconLibrary.ANIM_LIBRARY)
+        atlas = IconAtlas(path)
+
+        assert set(atlas.icons) == set(IconLibrary.ICON_LIBRARY)
+        for name, data in IconLibrary.ICON_LIBRARY.items():
+            assert atlas.read(*atlas.icons[name]) == data, f"{name} differs"
+        for name, (data, timing) in IconLibrary.ANIM_LIBRARY.items():
+            offset, length, packed_timing = atlas.anims[name]
+            assert atlas.read(offset, length) == data
+            assert packed_timing == timing
+
+        # Aliases of DEFAULT share one copy of the data
+        assert atlas.icons["MENU"] == atlas.icons["DEFAULT"]
+
+    print("✓ Atlas round trip test passed")
+
+
+def test_store_serves_from_atlas_without_library():
+    """With an atlas present the literal library is never imported."""
+    print("\nTesting atlas-backed store...")
+
+    icon = bytes(range(256))
+    frames = bytes(512)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_atlas(tmp, {"DEFAULT": icon, "STAR": icon[::-1]},
+                            {"SPIN": (frames, (100, 2000))})
+        store = IconStore(atlas_path=path)
+
+        assert store.get("STAR") == icon[::-1]
+        assert store.get("STAR") is store.get("STAR"), "Second lookup should hit the cache"
+        assert store.get_anim("SPIN") == (frames, (100, 2000))
+        assert store._library is None
+
+    print("✓ Atlas-backed store test passed")
+
+
+def test_store_cache_is_bounded():
+    """The icon cache never grows past its size."""
+    print("\nTesting cache bound...")
+
+    icons = {f"ICON_{i}": bytes([i]) * 256 for i in range(10)}
+    icons["DEFAULT"] = bytes(256)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = IconStore(atlas_path=_write_atlas(tmp, icons), cache_size=3)
+        for name in icons:
+            assert store.get(name) == icons[name]
+        assert len(store.cache) == 3
+
+    print("✓ Cache bound test passed")
+
+
+def test_store_falls_back_without_atlas():
+    """Without an atlas the built-in library and DEFAULT fallback still apply."""
+    print("\nTesting fallback without atlas...")
+
+    store = IconStore(atlas_path="/nonexistent/atlas.bin")
+    assert store.get("SKULL") == IconLibrary.SKULL
+    assert store.get_anim("CAT_WALK") == IconLibrary.ANIM_LIBRARY["CAT_WALK"]
+    assert store.get("NOT_AN_ICON_XYZ") == IconLibrary.DEFAULT
+    assert store.get_anim("NOT_AN_ANIM_XYZ") == (IconLibrary.DEFAULT, (1000,))
+
+    # Library attributes stay reachable through the shared store
+    assert Icons.SKULL is IconLibrary.SKULL
+    assert "SKULL" in Icons.ICON_LIBRARY
+
+    print("✓ Fallback test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Icon Atlas Test Suite")
+    print("=" * 60)
+
+    try:
+        test_atlas_round_trip()
+        test_store_serves_from_atlas_without_library()
+        test_store_cache_is_bounded()
+        test_store_falls_back_without_atlas()
+
+        print("\n" + "=" * 60)
+        print("ALL ICON ATLAS TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
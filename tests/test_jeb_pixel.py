@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utiliti
 # Import JEBPixel module
 import jeb_pixel
 JEBPixel = jeb_pixel.JEBPixel
+PixelBuffer = jeb_pixel.PixelBuffer
 
 
 class MockNeoPixel:
@@ -235,6 +236,178 @@ def test_jeb_pixel_use_case_matrix_buttons():
     print("✓ Realistic use case test passed")
 
 
+def test_jeb_pixel_dirty_flag():
+    """Test that writes mark the segment dirty and out-of-range writes don't."""
+    print("\nTesting JEBPixel dirty flag...")
+
+    parent = MockNeoPixel(68)
+    jeb = JEBPixel(parent, start_idx=0, num_pixels=4)
+    assert jeb.dirty is True, "New segment should start dirty so the first frame is pushed"
+
+    jeb.dirty = False
+    jeb[10] = (255, 0, 0)  # Out of range: ignored
+    assert jeb.dirty is False, "Ignored write should not mark the segment dirty"
+
+    jeb[1] = (255, 0, 0)
+    assert jeb.dirty is True, "Pixel write should mark the segment dirty"
+
+    jeb.dirty = False
+    jeb.fill((0, 0, 0))
+    assert jeb.dirty is True, "Fill should mark the segment dirty"
+
+    jeb.dirty = False
+    _ = jeb[1]
+    jeb.show()
+    assert jeb.dirty is False, "Reads and show() should not mark the segment dirty"
+
+    print("✓ JEBPixel dirty flag test passed")
+
+
+class MockTransmitStrip(MockNeoPixel):
+    """Mock strip exposing the raw transfer hook used by adafruit_neopixel."""
+
+    def __init__(self, size, brightness=1.0):
+        super().__init__(size)
+        self.n = size
+        self.byteorder = "GRB"
+        self.brightness = brightness
+        self.transmitted = []
+
+    def _transmit(self, buffer):
+        self.transmitted.append(bytes(buffer))
+
+
+def test_pixel_buffer_wire_order_writes():
+    """Test that segments write GRB wire bytes into the shared buffer."""
+    print("\nTesting PixelBuffer wire-order writes...")
+
+    strip = MockTransmitStrip(8)
+    frame = PixelBuffer(strip)
+    leds = JEBPixel(frame, start_idx=0, num_pixels=2)
+    matrix = JEBPixel(frame, start_idx=2, num_pixels=6)
+
+    leds[1] = (10, 20, 30)
+    matrix[0] = 0x405060  # Packed ints are accepted like NeoPixel
+    assert frame.buf[3:6] == bytes([20, 10, 30]), f"Expected GRB bytes, got {list(frame.buf[3:6])}"
+    assert frame.buf[6:9] == bytes([0x50, 0x40, 0x60])
+    assert leds[1] == (10, 20, 30) and matrix[0] == (0x40, 0x50, 0x60)
+
+    frame.show()
+    assert strip.transmitted == [bytes(frame.buf)], "show() should send the buffer in one transfer"
+    assert strip.pixels[1] == (0, 0, 0), "Raw transfer should bypass per-pixel strip writes"
+
+    print("✓ PixelBuffer wire-order writes test passed")
+
+
+def test_pixel_buffer_rgb_segment_and_brightness():
+    """Test RGB segment reordering and brightness baked into the buffer."""
+    print("\nTesting PixelBuffer RGB segment and brightness...")
+
+    strip = MockTransmitStrip(4, brightness=0.5)
+    frame = PixelBuffer(strip)
+    seg = JEBPixel(frame, start_idx=0, num_pixels=4, pixel_order="RGB")
+
+    seg[0] = (200, 100, 50)
+    assert frame.buf[0:3] == bytes([100, 50, 25]), f"Expected R,G,B at half brightness, got {list(frame.buf[0:3])}"
+    assert seg[0] == (200, 100, 50), "Reads should undo brightness scaling"
+
+    # Same bytes on the wire as the old tuple path through a GRB strip
+    old_parent = MockNeoPixel(4)
+    JEBPixel(old_parent, start_idx=0, num_pixels=4, pixel_order="RGB")[0] = (200, 100, 50)
+    g, r, b = old_parent[0][1], old_parent[0][0], old_parent[0][2]
+    assert bytes([g // 2, r // 2, b // 2]) == bytes(frame.buf[0:3])
+
+    print("✓ PixelBuffer RGB segment and brightness test passed")
+
+
+def test_pixel_buffer_follows_strip_brightness():
+    """Test that show() picks up a brightness change made on the strip."""
+    print("\nTesting PixelBuffer brightness changes...")
+
+    strip = MockTransmitStrip(2, brightness=0.5)
+    frame = PixelBuffer(strip)
+    seg = JEBPixel(frame, start_idx=0, num_pixels=2)
+    seg[0] = (200, 100, 50)
+
+    strip.brightness = 1.0
+    frame.show()
+    assert strip.transmitted[-1][0:3] == bytes([100, 200, 50]), "Buffered pixels are rescaled"
+    seg[1] = (200, 100, 50)
+    assert frame.buf[3:6] == bytes([100, 200, 50]), "Later writes use the new brightness"
+    assert seg[1] == (200, 100, 50)
+
+    strip.brightness = 0.25
+    frame.show()
+    assert strip.transmitted[-1][3:6] == bytes([25, 50, 12])
+    assert seg[1] == (200, 100, 48), "Reads undo the new brightness"
+
+    print("✓ PixelBuffer brightness change test passed")
+
+
+def test_pixel_buffer_bulk_operations():
+    """Test fill, write_span and blit_row stay inside the segment."""
+    print("\nTesting PixelBuffer bulk operations...")
+
+    frame = PixelBuffer(MockTransmitStrip(12))
+    left = JEBPixel(frame, start_idx=0, num_pixels=2)
+    seg = JEBPixel(frame, start_idx=2, num_pixels=7)
+
+    left.fill((1, 1, 1))
+    seg.fill((0, 255, 0))
+    assert frame.buf[6:27] == bytes([255, 0, 0]) * 7
+    assert frame.buf[0:6] == bytes([1] * 6), "Fill must not spill into the previous segment"
+    assert frame.buf[27:] == bytes(9), "Fill must not spill past the segment"
+
+    seg.dirty = False
+    seg.write_span(5, seg.encode((9, 8, 7)) * 4)  # Only 2 pixels fit
+    assert seg.dirty
+    assert seg[5] == (9, 8, 7) and seg[6] == (9, 8, 7)
+    assert frame.buf[27:] == bytes(9)
+
+    table = seg.palette_table([None, (255, 0, 0), (0, 0, 255)])
+    seg.blit_row(0, bytes([1, 0, 2, 2]), table, transparent=0)
+    assert seg[0] == (255, 0, 0)
+    assert seg[1] == (0, 255, 0), "Transparent index should leave the pixel unchanged"
+    assert seg[2] == (0, 0, 255) and seg[3] == (0, 0, 255)
+
+    print("✓ PixelBuffer bulk operations test passed")
+
+
+def test_bulk_operations_on_plain_strip():
+    """Test bulk helpers fall back to tuple writes on a plain NeoPixel parent."""
+    print("\nTesting bulk operations on a plain strip...")
+
+    parent = MockNeoPixel(10)
+    seg = JEBPixel(parent, start_idx=4, num_pixels=4, pixel_order="RGB")
+
+    seg.write_span(0, seg.encode((10, 20, 30)))
+    assert seg[0] == (10, 20, 30)
+    assert parent[4] == (20, 10, 30), "RGB segment should still swap channels for the strip"
+
+    table = seg.palette_table([(0, 0, 0), (255, 128, 0)])
+    seg.blit_row(2, [1, 1, 1], table)
+    assert seg[2] == (255, 128, 0) and seg[3] == (255, 128, 0)
+    assert parent[8] == (0, 0, 0), "Blit must stop at the segment end"
+
+    print("✓ Bulk operations on plain strip test passed")
+
+
+def test_pixel_buffer_fallback_show():
+    """Test that strips without _transmit receive tuples on show()."""
+    print("\nTesting PixelBuffer fallback show...")
+
+    strip = MockNeoPixel(3)
+    strip.n = 3
+    frame = PixelBuffer(strip)
+    seg = JEBPixel(frame, start_idx=0, num_pixels=3)
+    seg[2] = (7, 8, 9)
+    frame.show()
+    assert strip.pixels[2] == (7, 8, 9)
+    assert strip.show_called
+
+    print("✓ PixelBuffer fallback show test passed")
+
+
 def run_all_tests():
     """Run all JEBPixel tests."""
     print("=" * 60)
@@ -251,6 +424,13 @@ def run_all_tests():
         test_jeb_pixel_show()
         test_jeb_pixel_multiple_segments()
         test_jeb_pixel_use_case_matrix_buttons()
+        test_jeb_pixel_dirty_flag()
+        test_pixel_buffer_wire_order_writes()
+        test_pixel_buffer_rgb_segment_and_brightness()
+        test_pixel_buffer_follows_strip_brightness()
+        test_pixel_buffer_bulk_operations()
+        test_bulk_operations_on_plain_strip()
+        test_pixel_buffer_fallback_show()
         
         print("\n" + "=" * 60)
         print("✓ All JEBPixel tests passed!")
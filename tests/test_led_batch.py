@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Unit tests for batched satellite LED updates (LEDBATCH)."""
+
+import os
+import sys
+from unittest import mock
+
+for _name in ('adafruit_ticks', 'digitalio', 'busio', 'board', 'neopixel', 'microcontroller'):
+    sys.modules.setdefault(_name, mock.MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from managers.led_manager import LEDManager
+from satellites.base_driver import SatelliteDriver
+from transport import Message, UARTTransport
+from transport.protocol import COMMAND_MAP, DEST_MAP, LED_COMMANDS, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+from utilities.led_batch import MAX_DURATION, RECORD_SIZE, LEDBatch, iter_led_batch
+from utilities.palette import Palette
+
+
+class MockJEBPixel:
+    """Minimal JEBPixel stand-in."""
+
+    def __init__(self, num_pixels):
+        self.n = num_pixels
+        self._pixels = [(0, 0, 0)] * num_pixels
+
+    def __setitem__(self, idx, color):
+        self._pixels[idx] = color
+
+    def __getitem__(self, idx):
+        return self._pixels[idx]
+
+    def fill(self, color):
+        self._pixels = [color] * self.n
+
+    def show(self):
+        pass
+
+
+class RecordingTransport:
+    """Transport stand-in that keeps every sent message."""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append((message.command, message.payload))
+        return True
+
+
+class FakeUART:
+    """Non-blocking UART stub for loopback encode/decode."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def readinto(self, buf):
+        count = min(len(buf), len(self.data))
+        buf[:count] = self.data[:count]
+        del self.data[:count]
+        return count
+
+    def write(self, data):
+        return len(data)
+
+    def reset_input_buffer(self):
+        self.data = bytearray()
+
+
+def _slots(leds):
+    return [(s.active, tuple(s.color) if s.active else None, s.priority) for s in leds.active_animations]
+
+
+def test_batch_packs_records_and_keeps_priority_order():
+    """Records are 6 bytes; a later lower-priority change to the same LED is dropped."""
+    print("Testing LEDBatch packing...")
+
+    batch = LEDBatch(max_leds=4)
+    batch.add(2, Palette.RED.index, duration=1.25, brightness=0.5, priority=5)
+    batch.add(7, Palette.GREEN.index)
+    batch.add(2, Palette.BLUE.index, priority=1)  # Lower priority: ignored
+    batch.add(7, Palette.CYAN.index, priority=2)  # Same priority: replaces
+
+    payload = batch.payload()
+    assert len(payload) == 2 * RECORD_SIZE
+    records = list(iter_led_batch(payload))
+    assert records[0] == (2, Palette.RED.index, 1.3, 128 / 255, 5)
+    assert records[1] == (7, Palette.CYAN.index, None, 1.0, 2)
+
+    for i in range(2, 4):
+        assert batch.add(10 + i, 0)
+    assert batch.add(99, 0) is False, "Batch is full"
+    batch.clear()
+    assert len(batch) == 0 and batch.payload() == b""
+
+    print("✓ LEDBatch packing test passed")
+
+
+def test_driver_gathers_led_sends_until_flush():
+    """Per-LED sends are held until flush_leds() and sent as one LEDBATCH."""
+    print("\nTesting driver batching...")
+
+    transport = RecordingTransport()
+    sat = SatelliteDriver("0101", "01", "INDUSTRIAL", transport)
+    for i in range(8):
+        sat.send("LED", f"{i},{Palette.GREEN.index},0.0,1.0,2")
+    sat.send("DSP", "HELLO")  # Non-LED traffic is not held back
+    assert transport.sent == [("DSP", "HELLO")]
+
+    assert sat.flush_leds() == 8
+    cmd, payload = transport.sent[-1]
+    assert cmd == "LEDBATCH" and len(payload) == 8 * RECORD_SIZE
+    assert sat.flush_leds() == 0, "Nothing queued after a flush"
+
+    print("✓ Driver batching test passed")
+
+
+def test_other_led_commands_flush_first():
+    """"ALL" and animated LED commands go out immediately, after pending changes."""
+    print("\nTesting ordering with unbatched LED commands...")
+
+    transport = RecordingTransport()
+    sat = SatelliteDriver("0101", "01", "INDUSTRIAL", transport)
+    sat.send("LED", "3,4,0.0,1.0,2")
+    sat.send("LED", f"ALL,{Palette.OFF.index}")
+    sat.send("LEDFLASH", "1,4,0.0,1.0,2,0.1")
+    assert [cmd for cmd, _ in transport.sent] == ["LEDBATCH", "LED", "LEDFLASH"]
+
+    sat.batch_leds = False
+    sat.send("LED", "3,4,0.0,1.0,2")
+    assert transport.sent[-1] == ("LED", "3,4,0.0,1.0,2")
+
+    print("✓ Ordering test passed")
+
+
+def test_ledbatch_round_trips_over_uart():
+    """LEDBATCH is an LED command and survives UART encode/decode unchanged."""
+    print("\nTesting LEDBATCH over UART...")
+
+    assert "LEDBATCH" in LED_COMMANDS
+    batch = LEDBatch()
+    for i in range(6):
+        batch.add(i, i + 1, brightness=0.25 * (i % 4))
+    payload = batch.payload()
+
+    tx = UARTTransport(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    assert tx.send(Message("CORE", "0101", "LEDBATCH", payload))
+    wire = bytes(tx._tx_mv[tx._tx_tail:tx._tx_head])
+
+    rx = UARTTransport(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    rx.uart.data += wire
+    rx._read_hw()
+    msg = rx._try_decode_one()
+    assert msg.command == "LEDBATCH"
+    assert bytes(msg.payload) == payload
+
+    print("✓ UART round trip test passed")
+
+
+def test_driver_long_durations_through_real_encoder():
+    """Float-field LED sends, long durations included, encode on a real UARTTransport."""
+    print("\nTesting long durations through the UART encoder...")
+
+    tx = UARTTransport(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    sat = SatelliteDriver("0101", "01", "INDUSTRIAL", tx)
+    sat.send("LED", "3,11,30.0,1.0,2")
+    sat.send("LED", "4,11,7200.0,0.5,2")  # Past the u16 field: clamped
+    assert sat.flush_leds() == 2
+    wire = bytes(tx._tx_mv[tx._tx_tail:tx._tx_head])
+
+    rx = UARTTransport(FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+    rx.uart.data += wire
+    rx._read_hw()
+    msg = rx._try_decode_one()
+    assert msg.command == "LEDBATCH"
+    records = list(iter_led_batch(msg.payload))
+    assert [r[2] for r in records] == [30.0, MAX_DURATION]
+
+    print("✓ Long duration encode test passed")
+
+
+def test_apply_batch_matches_sequential_led_commands():
+    """Applying a batch leaves the strip as the equivalent LED commands would."""
+    print("\nTesting LEDManager batch apply...")
+
+    changes = [
+        (0, Palette.RED.index, 0.0, 1.0, 2),
+        (3, Palette.GREEN.index, 0.0, 1.0, 5),
+        (3, Palette.BLUE.index, 0.0, 1.0, 1),  # Loses to priority 5
+        (5, Palette.CYAN.index, 2.0, 1.0, 2),
+    ]
+
+    sequential = LEDManager(MockJEBPixel(8))
+    for change in changes:
+        sequential.apply_command("LED", change)
+
+    batch = LEDBatch()
+    for index, palette_index, duration, brightness, priority in changes:
+        batch.add(index, palette_index, duration, brightness, priority)
+    batched = LEDManager(MockJEBPixel(8))
+    batched.apply_command("LEDBATCH", batch.payload())
+
+    assert _slots(batched) == _slots(sequential)
+    assert batched._anim_ends[5] is not None, "Duration carried through the batch"
+
+    print("✓ Batch apply test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("LED Batch Test Suite")
+    print("=" * 60)
+
+    try:
+        test_batch_packs_records_and_keeps_priority_order()
+        test_driver_gathers_led_sends_until_flush()
+        test_other_led_commands_flush_first()
+        test_ledbatch_round_trips_over_uart()
+        test_driver_long_durations_through_real_encoder()
+        test_apply_batch_matches_sequential_led_commands()
+
+        print("\n" + "=" * 60)
+        print("ALL LED BATCH TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Unit tests for the LZ block compressor used by compressed file transfer."""
+
+import sys
+import os
+
+# Add src/utilities to path for direct module import
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'utilities'))
+
+# Import LZ module directly to avoid __init__ hardware dependencies
+import lz
+lz_compress = lz.lz_compress
+lz_decompress = lz.lz_decompress
+
+
+def test_lz_empty():
+    """Test round trip of empty data."""
+    print("Testing LZ empty data...")
+
+    block = lz_compress(b'')
+    assert block == b'\x00', f"Expected a single empty token, got {block!r}"
+    assert lz_decompress(block) == b''
+
+    print("✓ LZ empty test passed")
+
+
+def test_lz_short_literal():
+    """Test data shorter than a match is stored as literals."""
+    print("\nTesting LZ short literal...")
+
+    assert lz_compress(b'abc') == b'\x30abc'
+    assert lz_decompress(b'\x30abc') == b'abc'
+
+    print("✓ LZ short literal test passed")
+
+
+def test_lz_repetitive_data_shrinks():
+    """Test that repeated content compresses well."""
+    print("\nTesting LZ repetitive data...")
+
+    data = b'self.pixels[i] = color\n' * 20
+    block = lz_compress(data)
+    assert len(block) < len(data) // 4, f"Expected strong compression, got {len(block)} bytes"
+    assert lz_decompress(block) == data
+
+    print("✓ LZ repetitive data test passed")
+
+
+def test_lz_overlapping_match():
+    """Test a run that is copied from an overlapping back-reference."""
+    print("\nTesting LZ overlapping match...")
+
+    data = b'A' * 300
+    block = lz_compress(data)
+    assert len(block) < 10
+    assert lz_decompress(block) == data
+
+    print("✓ LZ overlapping match test passed")
+
+
+def test_lz_roundtrip():
+    """Test round trip over varied content including long literal runs."""
+    print("\nTesting LZ roundtrip...")
+
+    x = 0x1234
+    noise = bytearray()
+    for _ in range(600):
+        x = (x * 1103515245 + 12345) & 0x7FFFFFFF
+        noise.append((x >> 16) & 0xFF)
+
+    test_cases = [
+        b'\x00',
+        bytes(range(256)),
+        bytes(noise),
+        bytes(noise[:100]) * 3,
+        b'{"version": "0.4.0", "files": []}' * 4,
+    ]
+    for data in test_cases:
+        assert lz_decompress(lz_compress(data)) == data, f"Roundtrip failed for {data[:16]!r}..."
+
+    print("✓ LZ roundtrip test passed")
+
+
+def test_lz_invalid_decode():
+    """Test that corrupt blocks raise ValueError."""
+    print("\nTesting LZ invalid decode...")
+
+    invalid_blocks = [
+        b'\x50ab',               # Literal run longer than the block
+        b'\x10a\x05\x00',        # Offset reaches before the output start
+        b'\x10a\x00\x00',        # Zero offset
+        b'\x10a\x01',            # Truncated offset
+    ]
+    for block in invalid_blocks:
+        try:
+            lz_decompress(block)
+            assert False, f"Should have raised ValueError for {block!r}"
+        except ValueError:
+            pass
+
+    print("✓ LZ invalid decode test passed")
+
+
+def test_lz_max_size():
+    """Test that output beyond max_size is rejected."""
+    print("\nTesting LZ max_size limit...")
+
+    block = lz_compress(b'B' * 500)
+    assert lz_decompress(block, 500) == b'B' * 500
+    try:
+        lz_decompress(block, 256)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    print("✓ LZ max_size test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("LZ Compression Test Suite")
+    print("=" * 60)
+
+    try:
+        test_lz_empty()
+        test_lz_short_literal()
+        test_lz_repetitive_data_shrinks()
+        test_lz_overlapping_match()
+        test_lz_roundtrip()
+        test_lz_invalid_decode()
+        test_lz_max_size()
+
+        print("\n" + "=" * 60)
+        print("ALL LZ TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
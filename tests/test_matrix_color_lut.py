@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Unit tests for the MatrixManager palette-to-wire colour LUT and icon cache."""
+
+import asyncio
+import os
+import sys
+from unittest import mock
+
+# Mock CircuitPython modules BEFORE any imports
+class MockModule:
+    """Generic mock module."""
+    def __getattr__(self, name):
+        return MockModule()
+
+    def __call__(self, *args, **kwargs):
+        return MockModule()
+
+sys.modules['digitalio'] = MockModule()
+sys.modules['busio'] = MockModule()
+sys.modules['board'] = MockModule()
+sys.modules['analogio'] = MockModule()
+sys.modules['microcontroller'] = MockModule()
+sys.modules['watchdog'] = MockModule()
+sys.modules['neopixel'] = MockModule()
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from managers.matrix_manager import MatrixManager
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
+from utilities.lru import LRUCache
+from utilities.palette import Palette
+
+
+class MockNeoPixel:
+    """Mock NeoPixel strip backed by a list of tuples."""
+
+    def __init__(self, n):
+        self.n = n
+        self.buf = [(0, 0, 0)] * n
+
+    def __setitem__(self, index, value):
+        self.buf[index] = value
+
+    def __getitem__(self, index):
+        return self.buf[index]
+
+    def show(self):
+        pass
+
+
+def _make_matrix(buffered=True, size=16):
+    strip = MockNeoPixel(size * size)
+    parent = PixelBuffer(strip) if buffered else strip
+    segment = JEBPixel(parent, start_idx=0, num_pixels=size * size)
+    return MatrixManager(segment, width=size, height=size, panel_width=8, panel_height=8), segment
+
+
+def _frame(size=16):
+    return bytes((i * 5) % 7 for i in range(size * size))
+
+
+def test_lru_cache_evicts_least_recently_used():
+    """LRUCache keeps recently read keys and drops the oldest on overflow."""
+    print("Testing LRU eviction order...")
+
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.get("b", "missing") == "missing"
+    cache.put("a", 10)  # Replacing keeps the size bounded
+    assert len(cache) == 2 and cache.get("a") == 10
+    assert cache.hits == 2 and cache.misses == 1
+    cache.clear()
+    assert len(cache) == 0
+
+    print("✓ LRU eviction test passed")
+
+
+def test_color_lut_is_cached_per_palette_colour_and_brightness():
+    """get_color_lut compiles once per key and misses when the key changes."""
+    print("\nTesting colour LUT caching...")
+
+    matrix, _ = _make_matrix()
+    colors, table = matrix.get_color_lut()
+    assert colors[0] is None
+    assert colors[1] == Palette.LIBRARY[1]
+    assert colors[255] == Palette.LIBRARY.get(255, Palette.OFF)
+    assert len(table) == 256 * 3
+
+    assert matrix.get_color_lut() is matrix.get_color_lut()
+    dim, _ = matrix.get_color_lut(brightness=0.5)
+    assert dim[1] == matrix._apply_brightness(Palette.LIBRARY[1], 0.5)
+
+    override, _ = matrix.get_color_lut(color=(0, 200, 0))
+    assert all(c == (0, 200, 0) for c in override[1:])
+
+    for b in (0.1, 0.2, 0.3, 0.4, 0.6):
+        matrix.get_color_lut(brightness=b)
+    assert len(matrix._color_luts) == matrix.COLOR_LUT_CACHE_SIZE
+
+    print("✓ Colour LUT caching test passed")
+
+
+def test_show_frame_matches_palette_lookup():
+    """LUT-driven show_frame writes the same pixels as a direct palette lookup."""
+    print("\nTesting show_frame through the LUT...")
+
+    frame = _frame()
+    for buffered in (True, False):
+        matrix, segment = _make_matrix(buffered)
+        matrix.show_frame(frame)
+        for idx, p in enumerate(frame):
+            expected = tuple(Palette.LIBRARY.get(p, Palette.OFF)) if p else (0, 0, 0)
+            assert tuple(segment[matrix._idx_map[idx]]) == expected, f"Pixel {idx} wrong (buffered={buffered})"
+
+    # color/brightness are honoured, and clear=False keeps index-0 pixels
+    matrix, segment = _make_matrix()
+    segment.fill((1, 2, 3))
+    matrix.show_frame(frame, clear=False, color=(200, 100, 0), brightness=0.5)
+    for idx, p in enumerate(frame):
+        expected = (100, 50, 0) if p else (1, 2, 3)
+        assert segment[matrix._idx_map[idx]] == expected
+
+    print("✓ show_frame LUT test passed")
+
+
+def test_gamma_applies_to_palette_frames():
+    """A non-linear gamma darkens mid-tones and compiles a separate LUT."""
+    print("\nTesting gamma correction...")
+
+    matrix, segment = _make_matrix()
+    frame = bytes([1]) + bytes(255)
+    matrix.show_frame(frame, color=(128, 255, 0))
+    linear = segment[matrix._idx_map[0]]
+
+    matrix.gamma = 2.2
+    matrix.show_frame(frame, color=(128, 255, 0))
+    corrected = segment[matrix._idx_map[0]]
+    assert linear == (128, 255, 0)
+    assert corrected[0] < 128 and corrected[1] == 255 and corrected[2] == 0
+    assert len(matrix._color_luts) == 2
+
+    print("✓ Gamma correction test passed")
+
+
+def test_static_icon_cache_matches_slot_rendering():
+    """The cached wire-order icon renders exactly like the slot-based path."""
+    print("\nTesting static icon cache...")
+
+    for kwargs in ({}, {"brightness": 0.4}, {"color": (0, 0, 255)}, {"border_color": (0, 200, 0)}):
+        cached, cached_segment = _make_matrix()
+        cached.show_icon("SKULL", **kwargs)
+
+        slotted, slotted_segment = _make_matrix()
+        slotted.show_icon("SKULL", clear=False, **kwargs)
+        asyncio.run(slotted.animate_loop(step=True))
+
+        for i in range(cached.num_pixels):
+            assert cached_segment[i] == slotted_segment[i], f"Pixel {i} differs for {kwargs}"
+        assert cached._active_count == 0
+
+    matrix, _ = _make_matrix()
+    matrix.show_icon("SKULL")
+    first = matrix._icon_frames.get(("SKULL", None, 1.0, None, id(matrix.palette), 1.0))
+    matrix.show_icon("SKULL")
+    assert len(matrix._icon_frames) == 1 and first is not None
+
+    print("✓ Static icon cache test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Matrix Colour LUT Test Suite")
+    print("=" * 60)
+
+    try:
+        test_lru_cache_evicts_least_recently_used()
+        test_color_lut_is_cached_per_palette_colour_and_brightness()
+        test_show_frame_matches_palette_lookup()
+        test_gamma_applies_to_palette_frames()
+        test_static_icon_cache_matches_slot_rendering()
+
+        print("\n" + "=" * 60)
+        print("ALL MATRIX COLOUR LUT TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Unit tests for MatrixManager sprite-sheet delta compilation and playback."""
+
+import asyncio
+import os
+import sys
+import time
+from unittest import mock
+
+# Mock CircuitPython modules BEFORE any imports
+class MockModule:
+    """Generic mock module."""
+    def __getattr__(self, name):
+        return MockModule()
+
+    def __call__(self, *args, **kwargs):
+        return MockModule()
+
+sys.modules['digitalio'] = MockModule()
+sys.modules['busio'] = MockModule()
+sys.modules['board'] = MockModule()
+sys.modules['analogio'] = MockModule()
+sys.modules['microcontroller'] = MockModule()
+sys.modules['watchdog'] = MockModule()
+sys.modules['neopixel'] = MockModule()
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from managers.matrix_manager import MatrixManager
+from utilities import matrix_animations
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
+from utilities.palette import Palette
+
+
+class MockNeoPixel:
+    """Mock NeoPixel strip backed by a list of tuples."""
+
+    def __init__(self, n):
+        self.n = n
+        self.buf = [(0, 0, 0)] * n
+
+    def __setitem__(self, index, value):
+        self.buf[index] = value
+
+    def __getitem__(self, index):
+        return self.buf[index]
+
+    def show(self):
+        pass
+
+
+def _make_matrix(buffered=True, size=8):
+    strip = MockNeoPixel(size * size)
+    parent = PixelBuffer(strip) if buffered else strip
+    segment = JEBPixel(parent, start_idx=0, num_pixels=size * size)
+    return MatrixManager(segment, width=size, height=size), segment
+
+
+def _sprite(size=8, frames=3):
+    """Frames that move a lit block, change colours and leave pixels dark."""
+    n = size * size
+    sheet = bytearray()
+    for f in range(frames):
+        sheet += bytes((i * 3 + f) % 5 if (i + f) % 4 else 0 for i in range(n))
+    return bytes(sheet)
+
+
+def _expected(frame, colors):
+    return [tuple(colors[p]) if p else (0, 0, 0) for p in frame]
+
+
+def _snapshot(matrix, segment):
+    return [tuple(segment[matrix._idx_map[i]]) for i in range(matrix.num_pixels)]
+
+
+def test_deltas_replay_every_frame():
+    """Applying deltas in order reproduces each full frame, including the wrap."""
+    print("Testing delta replay...")
+
+    sprite = _sprite()
+    for buffered in (True, False):
+        matrix, segment = _make_matrix(buffered)
+        compiled = matrix.get_sprite_deltas(sprite, key="TEST")
+        deltas, colors, _ = compiled
+        frame_size = matrix.num_pixels
+        frame_count = len(sprite) // frame_size
+        assert len(deltas) == frame_count + 1
+
+        for step in range(frame_count):
+            matrix.show_sprite_delta(compiled, step)
+            frame = sprite[step * frame_size:(step + 1) * frame_size]
+            assert _snapshot(matrix, segment) == _expected(frame, colors), f"Frame {step} wrong (buffered={buffered})"
+
+        matrix.show_sprite_delta(compiled, frame_count)
+        assert _snapshot(matrix, segment) == _expected(sprite[:frame_size], colors), "Wrap delta wrong"
+
+    print("✓ Delta replay test passed")
+
+
+def test_deltas_only_hold_changed_pixels():
+    """A delta lists exactly the pixels whose resolved colour changed."""
+    print("\nTesting delta contents...")
+
+    matrix, _ = _make_matrix()
+    n = matrix.num_pixels
+    frame0 = bytes([1] * 4) + bytes(n - 4)
+    frame1 = bytes([1, 2, 0, 1]) + bytes(n - 4)
+    deltas, _, _ = matrix.get_sprite_deltas(frame0 + frame1)
+
+    assert list(deltas[0][0]) == [matrix._idx_map[i] for i in range(4)]
+    assert list(deltas[1][0]) == [matrix._idx_map[1], matrix._idx_map[2]]
+    assert deltas[1][1] == bytes([2, 0]), "Pixel turning off must be written"
+
+    # With a colour override, palette changes between lit pixels are invisible
+    deltas, _, _ = matrix.get_sprite_deltas(frame0 + frame1, color=(0, 255, 0))
+    assert list(deltas[1][0]) == [matrix._idx_map[2]]
+
+    print("✓ Delta contents test passed")
+
+
+def test_sprite_deltas_are_cached_and_bounded():
+    """Compiled deltas are reused per key and the cache stays bounded."""
+    print("\nTesting sprite delta cache...")
+
+    matrix, _ = _make_matrix()
+    sprite = _sprite()
+    first = matrix.get_sprite_deltas(sprite, key="CAT")
+    assert matrix.get_sprite_deltas(sprite, key="CAT") is first
+    assert matrix.get_sprite_deltas(sprite, brightness=0.5, key="CAT") is not first
+
+    for name in ("A", "B", "C"):
+        matrix.get_sprite_deltas(sprite, key=name)
+    assert len(matrix._sprite_deltas) == matrix.SPRITE_CACHE_SIZE
+
+    matrix._sprite_deltas.clear()
+    matrix.get_sprite_deltas(sprite)
+    assert len(matrix._sprite_deltas) == 0, "Unnamed sprites are not cached"
+
+    print("✓ Sprite delta cache test passed")
+
+
+def test_animate_sprite_sheet_plays_deltas():
+    """animate_sprite_sheet plays deltas (no show_frame) and ends on the last frame."""
+    print("\nTesting delta playback...")
+
+    matrix, segment = _make_matrix()
+    sprite = _sprite()
+    frame_size = matrix.num_pixels
+
+    ticks = lambda: int(time.monotonic() * 1000)
+    with mock.patch.object(matrix_animations, "ticks_ms", ticks), \
+         mock.patch.object(matrix_animations, "ticks_diff", lambda a, b: a - b), \
+         mock.patch.object(matrix, "show_frame") as show_frame:
+        asyncio.run(matrix_animations.animate_sprite_sheet(
+            matrix, sprite, timing_data=(1,), loop=False, cache_key="PLAY"
+        ))
+
+    assert show_frame.call_count == 0
+    colors = matrix.get_color_lut()[0]
+    assert _snapshot(matrix, segment) == _expected(sprite[-frame_size:], colors)
+
+    print("✓ Delta playback test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Matrix Sprite Delta Test Suite")
+    print("=" * 60)
+
+    try:
+        test_deltas_replay_every_frame()
+        test_deltas_only_hold_changed_pixels()
+        test_sprite_deltas_are_cached_and_bounded()
+        test_animate_sprite_sheet_plays_deltas()
+
+        print("\n" + "=" * 60)
+        print("ALL MATRIX SPRITE DELTA TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -45,6 +45,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 
 # Import production MatrixManager
 from managers.matrix_manager import MatrixManager
+from utilities.glyphs import GlyphCache
+from utilities.jeb_pixel import JEBPixel, PixelBuffer
 
 
 # Mock JEBPixel and neopixel for testing
@@ -89,229 +91,288 @@ class MockJEBPixel:
         self._pixels.show()
 
 
-class MockPixelFramebuffer:
-    """Mock for adafruit_pixel_framebuf.PixelFramebuffer."""
-    def __init__(self, pixels, width, height, alternating=False, **kwargs):
-        self.pixels = pixels
-        self.width = width
-        self.height = height
-        self.alternating = alternating
-        self._scroll_x = 0
-        self._scroll_y = 0
-        self.text_calls = []
-        self.display_call_count = 0
-        self.scroll_calls = []
-        self.fill_calls = []
-
-    def text(self, string, x, y, color, font_name="font5x8.bin"):
-        """Mock text rendering method."""
-        self.text_calls.append({
-            'string': string,
-            'x': x,
-            'y': y,
-            'color': color,
-            'font_name': font_name
-        })
-
-    def display(self):
-        """Mock display update method."""
-        self.display_call_count += 1
-
-    def scroll(self, dx, dy):
-        """Mock scroll method."""
-        self._scroll_x += dx
-        self._scroll_y += dy
-        self.scroll_calls.append((dx, dy))
-
-    def fill(self, value):
-        """Mock fill method."""
-        self.fill_calls.append(value)
-
-
-def create_matrix_with_framebuf(width=8, height=8):
-    """Helper to create a MatrixManager with mocked framebuf."""
+def create_matrix(width=8, height=8):
+    """Helper to create a MatrixManager on a plain mock strip."""
     mock_pixel = MockJEBPixel(width * height)
-    matrix = MatrixManager(mock_pixel, width=width, height=height)
-    
-    # Inject mock framebuffer
-    mock_framebuf = MockPixelFramebuffer(matrix.pixels, width, height)
-    matrix._framebuf = mock_framebuf
-    
-    return matrix, mock_framebuf
+    return MatrixManager(mock_pixel, width=width, height=height)
 
 
-@pytest.mark.asyncio
-async def test_display_text_activates_text_mode():
+def create_buffered_matrix(width=8, height=8):
+    """Helper to create a MatrixManager on a PixelBuffer-backed JEBPixel."""
+    strip = MockNeoPixel(width * height)
+    segment = JEBPixel(PixelBuffer(strip), 0, width * height)
+    return MatrixManager(segment, width=width, height=height)
+
+
+def lit_coords(matrix):
+    """Return the set of (x, y) coordinates that are not black."""
+    lit = set()
+    for y in range(matrix.height):
+        for x in range(matrix.width):
+            if tuple(matrix.pixels[matrix._get_idx(x, y)]) != (0, 0, 0):
+                lit.add((x, y))
+    return lit
+
+
+def expected_coords(matrix, text, pos, y_offset=0):
+    """Coordinates a column strip of text should light with column pos at x=0."""
+    strip = GlyphCache().render(text)
+    lit = set()
+    for x in range(matrix.width):
+        c = pos + x
+        if 0 <= c < len(strip):
+            for row in range(min(8, matrix.height - y_offset)):
+                if strip[c] >> row & 1:
+                    lit.add((x, y_offset + row))
+    return lit
+
+
+def scroll_to(matrix, pos):
+    """Scroll text mode until strip column pos is at x=0."""
+    while matrix._text_pos < pos:
+        matrix._scroll_text()
+
+
+def test_display_text_activates_text_mode():
     """Test that calling display_text() activates text mode."""
     print("Testing display_text activates text mode...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Initially text mode should be inactive
     assert matrix._text_mode_active is False, "Text mode should start inactive"
-    
+
     # Call display_text
     matrix.display_text("HELLO")
-    
+
     # Text mode should now be active
     assert matrix._text_mode_active is True, "Text mode should be active after display_text()"
-    
+    assert matrix.is_animating() is True, "is_animating() should report text mode"
+
     print("  ✓ Text mode activated")
 
 
-@pytest.mark.asyncio
-async def test_display_text_no_framebuf_is_noop():
-    """Test that display_text() with no framebuf returns without error."""
-    print("\nTesting display_text with no framebuf is a noop...")
-    
-    # Create matrix without framebuf
-    mock_pixel = MockJEBPixel(64)
-    matrix = MatrixManager(mock_pixel)
-    
-    # Ensure framebuf is None
-    assert matrix._framebuf is None, "Framebuf should be None by default"
-    
-    # Initially text mode should be inactive
-    assert matrix._text_mode_active is False, "Text mode should start inactive"
-    
-    # Call display_text - should not raise error
+def test_glyph_cache_renders_column_strip():
+    """Test that GlyphCache renders 5 glyph columns plus 1 spacing column per character."""
+    print("\nTesting GlyphCache column strip...")
+
+    cache = GlyphCache(font_path="/nonexistent/font5x8.bin")
+    strip = cache.render("HI")
+
+    assert len(strip) == 12, f"Expected 12 columns, got {len(strip)}"
+    assert bytes(strip[0:5]) == bytes([0x7F, 0x08, 0x08, 0x08, 0x7F]), "H glyph columns"
+    assert strip[5] == 0 and strip[11] == 0, "Spacing columns should be blank"
+    assert cache.glyph("H") is cache.glyph("H"), "Glyphs should be cached"
+    assert cache.glyph("\u00e9") == bytes(5), "Unknown characters render blank"
+
+    print("  ✓ Column strip rendered")
+
+
+def test_glyph_cache_reads_font_file(tmp_path):
+    """Test that GlyphCache uses font5x8.bin when present."""
+    print("\nTesting GlyphCache font file...")
+
+    font = tmp_path / "font5x8.bin"
+    data = bytearray(256 * 5)
+    data[ord("A") * 5:ord("A") * 5 + 5] = b"\x01\x02\x03\x04\x05"
+    font.write_bytes(bytes([5, 8]) + bytes(data))
+
+    cache = GlyphCache(font_path=str(font))
+    assert cache.glyph("A") == b"\x01\x02\x03\x04\x05", "Glyph should come from the font file"
+
+    print("  ✓ Font file glyphs used")
+
+
+def test_display_text_enters_from_right_edge():
+    """Test that text starts just off the right edge and the matrix starts blank."""
+    print("\nTesting display_text starts off the right edge...")
+
+    matrix = create_matrix(width=16, height=16)
     matrix.display_text("HELLO")
-    
-    # Text mode should remain inactive
-    assert matrix._text_mode_active is False, "Text mode should stay inactive when framebuf is None"
-    
-    print("  ✓ display_text() safely handles missing framebuf")
 
+    assert matrix._text_pos == -matrix.width, f"Expected pos {-matrix.width}, got {matrix._text_pos}"
+    assert lit_coords(matrix) == set(), "Matrix should be blank before the first scroll"
 
-@pytest.mark.asyncio
-async def test_display_text_string_with_newline():
-    """Test that display_text() with newline calls text() twice."""
+    print("  ✓ Text positioned at right edge for scrolling")
+
+
+def test_scroll_window_matches_strip():
+    """Test that each scroll step shows the strip columns under the window."""
+    print("\nTesting scroll window contents...")
+
+    matrix = create_matrix()
+    matrix.display_text("HI", color=(255, 0, 0))
+
+    for pos in (-3, 0, 4, 9):
+        scroll_to(matrix, pos)
+        assert lit_coords(matrix) == expected_coords(matrix, "HI", pos), f"Window at pos {pos} differs"
+
+    idx = matrix._get_idx(0, 0)
+    scroll_to(matrix, 0)
+    assert matrix.pixels[idx] == (255, 0, 0), f"Expected text colour, got {matrix.pixels[idx]}"
+
+    print("  ✓ Window follows the strip")
+
+
+def test_scroll_window_on_pixel_buffer():
+    """Test that the PixelBuffer blit path lights the same pixels as the fallback."""
+    print("\nTesting scroll window on PixelBuffer...")
+
+    plain = create_matrix(width=16, height=16)
+    buffered = create_buffered_matrix(width=16, height=16)
+    for matrix in (plain, buffered):
+        matrix.display_text("JEB\nOK")
+        scroll_to(matrix, 2)
+
+    assert lit_coords(buffered) == lit_coords(plain), "Blit path should match the fallback"
+    assert lit_coords(plain) == (
+        expected_coords(plain, "JEB", 2) | expected_coords(plain, "OK", 2, y_offset=8)
+    )
+
+    print("  ✓ PixelBuffer path matches")
+
+
+def test_display_text_string_with_newline():
+    """Test that display_text() with newline renders two lines 8 rows apart."""
     print("\nTesting display_text with newline string...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf(width=16, height=16)
-    
+
+    matrix = create_matrix(width=16, height=16)
+
     # Call display_text with newline
     matrix.display_text("LINE1\nLINE2")
-    
-    # Should have two text calls
-    assert len(mock_framebuf.text_calls) == 2, f"Expected 2 text calls, got {len(mock_framebuf.text_calls)}"
-    
-    # Verify first line
-    first_call = mock_framebuf.text_calls[0]
-    assert first_call['string'] == "LINE1", f"First line should be 'LINE1', got '{first_call['string']}'"
-    assert first_call['y'] == 0, f"First line y should be 0, got {first_call['y']}"
-    
-    # Verify second line
-    second_call = mock_framebuf.text_calls[1]
-    assert second_call['string'] == "LINE2", f"Second line should be 'LINE2', got '{second_call['string']}'"
-    assert second_call['y'] == 8, f"Second line y should be 8, got {second_call['y']}"
-    
+
+    assert len(matrix._text_lines) == 2, f"Expected 2 lines, got {len(matrix._text_lines)}"
+    assert [y for y, _ in matrix._text_lines] == [0, 8], "Lines should be offset by 8 rows"
+    assert matrix._text_lines[0][1] == GlyphCache().render("LINE1")
+    assert matrix._text_lines[1][1] == GlyphCache().render("LINE2")
+
     print("  ✓ Newline text split into two lines correctly")
 
 
-@pytest.mark.asyncio
-async def test_display_text_list_input():
-    """Test that display_text() with list input calls text() for each item."""
+def test_display_text_list_input():
+    """Test that display_text() with list input renders each item."""
     print("\nTesting display_text with list input...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf(width=16, height=16)
-    
+
+    matrix = create_matrix(width=16, height=16)
+
     # Call display_text with list
     matrix.display_text(["LINE1", "LINE2"])
-    
-    # Should have two text calls
-    assert len(mock_framebuf.text_calls) == 2, f"Expected 2 text calls, got {len(mock_framebuf.text_calls)}"
-    
-    # Verify first line
-    first_call = mock_framebuf.text_calls[0]
-    assert first_call['string'] == "LINE1", f"First line should be 'LINE1', got '{first_call['string']}'"
-    assert first_call['y'] == 0, f"First line y should be 0, got {first_call['y']}"
-    
-    # Verify second line
-    second_call = mock_framebuf.text_calls[1]
-    assert second_call['string'] == "LINE2", f"Second line should be 'LINE2', got '{second_call['string']}'"
-    assert second_call['y'] == 8, f"Second line y should be 8, got {second_call['y']}"
-    
+
+    assert len(matrix._text_lines) == 2, f"Expected 2 lines, got {len(matrix._text_lines)}"
+    assert matrix._text_lines[1][1] == GlyphCache().render("LINE2")
+
     print("  ✓ List text rendered correctly")
 
 
-@pytest.mark.asyncio
-async def test_stop_text_deactivates_text_mode():
+def test_display_text_limits_to_two_lines():
+    """Test that display_text limits output to 2 lines maximum."""
+    print("\nTesting display_text limits to 2 lines...")
+
+    matrix = create_matrix(width=16, height=16)
+
+    # Call with 3+ lines
+    matrix.display_text(["LINE1", "LINE2", "LINE3", "LINE4"])
+
+    assert len(matrix._text_lines) == 2, f"Expected 2 lines (max), got {len(matrix._text_lines)}"
+
+    # Second line on an 8-row matrix has nowhere to go
+    small = create_matrix()
+    small.display_text("LINE1\nLINE2")
+    assert len(small._text_lines) == 1, "Only one line fits an 8-row matrix"
+
+    print("  ✓ Text limited to 2 lines correctly")
+
+
+def test_marquee_longer_than_matrix():
+    """Test that long marquees keep only the column strip and wrap when looping."""
+    print("\nTesting long marquee...")
+
+    matrix = create_matrix()
+    message = "JEB " * 200
+    matrix.display_text(message)
+
+    assert matrix._text_len == len(message) * 6, "Strip should hold 6 columns per character"
+    assert len(matrix._text_window) == matrix.width * 8, "Window should stay matrix-sized"
+
+    matrix._text_pos = matrix._text_len
+    matrix._scroll_text()
+    assert matrix._text_pos == -matrix.width + 1, "Looping text should re-enter from the right"
+
+    print("  ✓ Long marquee wraps")
+
+
+def test_no_loop_stops_blank():
+    """Test that loop=False leaves the matrix blank once the text has passed."""
+    print("\nTesting loop=False...")
+
+    matrix = create_matrix()
+    matrix.display_text("HI", loop=False)
+    scroll_to(matrix, matrix._text_len)
+    pos = matrix._text_pos
+    matrix._scroll_text()
+
+    assert matrix._text_pos == pos, "Position should not advance past the end"
+    assert lit_coords(matrix) == set(), "Matrix should be blank after the text has passed"
+
+    print("  ✓ Non-looping text ends blank")
+
+
+def test_stop_text_deactivates_text_mode():
     """Test that stop_text() deactivates text mode."""
     print("\nTesting stop_text deactivates text mode...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Activate text mode
     matrix.display_text("HELLO")
     assert matrix._text_mode_active is True, "Text mode should be active"
-    
+
     # Stop text mode
     matrix.stop_text()
-    
+
     # Text mode should be inactive
     assert matrix._text_mode_active is False, "Text mode should be inactive after stop_text()"
-    
+
     print("  ✓ Text mode deactivated")
 
 
-@pytest.mark.asyncio
-async def test_stop_text_clears_framebuf():
-    """Test that stop_text() clears the framebuffer."""
-    print("\nTesting stop_text clears framebuf...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
-    # Activate text mode
+def test_stop_text_clears_matrix():
+    """Test that stop_text() blanks the matrix."""
+    print("\nTesting stop_text clears the matrix...")
+
+    matrix = create_matrix()
     matrix.display_text("HELLO")
-    
-    # Clear call history
-    mock_framebuf.fill_calls = []
-    mock_framebuf.display_call_count = 0
-    
-    # Stop text mode
+    scroll_to(matrix, 0)
+    assert lit_coords(matrix), "Text should be visible before stop_text()"
+
     matrix.stop_text()
-    
-    # Verify fill(0) was called
-    assert len(mock_framebuf.fill_calls) == 1, f"Expected 1 fill call, got {len(mock_framebuf.fill_calls)}"
-    assert mock_framebuf.fill_calls[0] == 0, f"Fill should be called with 0, got {mock_framebuf.fill_calls[0]}"
-    
-    # Verify display() was called
-    assert mock_framebuf.display_call_count == 1, f"Expected 1 display call, got {mock_framebuf.display_call_count}"
-    
-    print("  ✓ Framebuffer cleared and displayed")
+
+    assert lit_coords(matrix) == set(), "Matrix should be blank after stop_text()"
+    assert matrix._text_lines == [], "Strips should be released"
+
+    print("  ✓ Matrix cleared")
 
 
 @pytest.mark.asyncio
 async def test_animate_loop_text_mode_scrolls():
     """Test that animate_loop scrolls when in text mode."""
     print("\nTesting animate_loop in text mode scrolls...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Activate text mode
     matrix.display_text("HELLO", scroll_speed=0.01)
-    
-    # Clear scroll history
-    mock_framebuf.scroll_calls = []
-    mock_framebuf.display_call_count = 0
-    
+    start = matrix._text_pos
+
     # Wait a bit to ensure scroll delay has passed
     await asyncio.sleep(0.02)
-    
+
     # Run one step of animate_loop
     await matrix.animate_loop(step=True)
-    
-    # Verify scroll was called
-    assert len(mock_framebuf.scroll_calls) >= 1, f"Expected at least 1 scroll call, got {len(mock_framebuf.scroll_calls)}"
-    
-    # Verify scroll direction (left = -1, 0)
-    first_scroll = mock_framebuf.scroll_calls[0]
-    assert first_scroll == (-1, 0), f"Expected scroll(-1, 0), got scroll{first_scroll}"
-    
-    # Verify display was called
-    assert mock_framebuf.display_call_count >= 1, f"Expected at least 1 display call, got {mock_framebuf.display_call_count}"
-    
+
+    # Text should have moved one column left
+    assert matrix._text_pos == start + 1, f"Expected pos {start + 1}, got {matrix._text_pos}"
+
     print("  ✓ Text mode scrolling works")
 
 
@@ -319,155 +380,82 @@ async def test_animate_loop_text_mode_scrolls():
 async def test_animate_loop_standard_mode_delegates():
     """Test that animate_loop delegates to base class when not in text mode."""
     print("\nTesting animate_loop in standard mode delegates...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Ensure text mode is not active
     assert matrix._text_mode_active is False, "Text mode should be inactive"
-    
-    # Clear scroll history
-    mock_framebuf.scroll_calls = []
-    
-    # Run one step of animate_loop
-    await matrix.animate_loop(step=True)
-    
+
+    with mock.patch.object(matrix, "_scroll_text") as scroll:
+        # Run one step of animate_loop
+        await matrix.animate_loop(step=True)
+
     # In standard mode, scroll should NOT be called
-    assert len(mock_framebuf.scroll_calls) == 0, f"Expected 0 scroll calls in standard mode, got {len(mock_framebuf.scroll_calls)}"
-    
+    assert scroll.call_count == 0, f"Expected 0 scroll calls in standard mode, got {scroll.call_count}"
+
     print("  ✓ Standard mode delegates to base class")
 
 
-@pytest.mark.asyncio
-async def test_display_text_scroll_speed_stored():
+def test_display_text_scroll_speed_stored():
     """Test that scroll_speed parameter is stored correctly."""
     print("\nTesting display_text scroll_speed parameter...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Call with custom scroll speed
     custom_speed = 0.1
     matrix.display_text("HELLO", scroll_speed=custom_speed)
-    
+
     # Verify scroll speed was stored
     assert matrix._text_scroll_delay == custom_speed, \
         f"Expected scroll delay {custom_speed}, got {matrix._text_scroll_delay}"
-    
-    print("  ✓ Scroll speed stored correctly")
 
-
-@pytest.mark.asyncio
-async def test_display_text_color_parameter():
-    """Test that color parameter is passed to framebuf.text()."""
-    print("\nTesting display_text color parameter...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
-    # Call with custom color
-    custom_color = (255, 0, 0)  # Red
-    matrix.display_text("HELLO", color=custom_color)
-    
-    # Verify color was passed to text()
-    assert len(mock_framebuf.text_calls) == 1, f"Expected 1 text call, got {len(mock_framebuf.text_calls)}"
-    text_call = mock_framebuf.text_calls[0]
-    assert text_call['color'] == custom_color, \
-        f"Expected color {custom_color}, got {text_call['color']}"
-    
-    print("  ✓ Color parameter passed correctly")
-
-
-@pytest.mark.asyncio
-async def test_display_text_limits_to_two_lines():
-    """Test that display_text limits output to 2 lines maximum."""
-    print("\nTesting display_text limits to 2 lines...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf(width=16, height=16)
-    
-    # Call with 3+ lines
-    matrix.display_text(["LINE1", "LINE2", "LINE3", "LINE4"])
-    
-    # Should only render first 2 lines
-    assert len(mock_framebuf.text_calls) == 2, \
-        f"Expected 2 text calls (max), got {len(mock_framebuf.text_calls)}"
-    
-    # Verify only first two lines were rendered
-    assert mock_framebuf.text_calls[0]['string'] == "LINE1"
-    assert mock_framebuf.text_calls[1]['string'] == "LINE2"
-    
-    print("  ✓ Text limited to 2 lines correctly")
-
-
-@pytest.mark.asyncio
-async def test_display_text_x_position():
-    """Test that text is positioned at the right edge (width) for scrolling."""
-    print("\nTesting display_text x position...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf(width=16, height=16)
-    
-    # Call display_text
-    matrix.display_text("HELLO")
-    
-    # Verify text x position equals matrix width (for scroll-in effect)
-    assert len(mock_framebuf.text_calls) == 1
-    text_call = mock_framebuf.text_calls[0]
-    assert text_call['x'] == matrix.width, \
-        f"Expected x={matrix.width}, got x={text_call['x']}"
-    
-    print("  ✓ Text positioned at right edge for scrolling")
+    print("  ✓ Scroll speed stored correctly")
 
 
 @pytest.mark.asyncio
 async def test_text_mode_scroll_timing():
     """Test that text scrolling respects the scroll delay timing."""
     print("\nTesting text scroll timing...")
-    
-    matrix, mock_framebuf = create_matrix_with_framebuf()
-    
+
+    matrix = create_matrix()
+
     # Activate text mode with very slow scroll
     matrix.display_text("HELLO", scroll_speed=1.0)  # 1 second delay
-    
-    # Clear scroll history
-    mock_framebuf.scroll_calls = []
-    
+    start = matrix._text_pos
+
     # Run animate_loop immediately (should not scroll yet)
     await matrix.animate_loop(step=True)
-    
+
     # Should not have scrolled yet (timing not met)
-    assert len(mock_framebuf.scroll_calls) == 0, \
-        f"Expected 0 scroll calls (timing not met), got {len(mock_framebuf.scroll_calls)}"
-    
+    assert matrix._text_pos == start, "Text should not scroll before the delay"
+
     # Now with a very fast scroll speed
     matrix._text_scroll_delay = 0.001  # 1ms
     matrix._text_last_scroll = time.monotonic() - 0.01  # Force timing to be met
-    
+
     # Run animate_loop again
     await matrix.animate_loop(step=True)
-    
+
     # Should have scrolled now
-    assert len(mock_framebuf.scroll_calls) >= 1, \
-        f"Expected at least 1 scroll call (timing met), got {len(mock_framebuf.scroll_calls)}"
-    
+    assert matrix._text_pos == start + 1, "Text should scroll once the delay has passed"
+
     print("  ✓ Scroll timing respected")
 
 
-@pytest.mark.asyncio
-async def test_stop_text_without_framebuf():
-    """Test that stop_text() safely handles missing framebuf."""
-    print("\nTesting stop_text without framebuf...")
-    
-    # Create matrix without framebuf
-    mock_pixel = MockJEBPixel(64)
-    matrix = MatrixManager(mock_pixel)
-    
-    # Manually activate text mode (shouldn't happen in practice, but test safety)
-    matrix._text_mode_active = True
-    
+def test_stop_text_when_inactive():
+    """Test that stop_text() is safe when text mode was never started."""
+    print("\nTesting stop_text when inactive...")
+
+    matrix = create_matrix()
+
     # Call stop_text - should not raise error
     matrix.stop_text()
-    
+
     # Text mode should be deactivated
     assert matrix._text_mode_active is False, "Text mode should be deactivated"
-    
-    print("  ✓ stop_text() safely handles missing framebuf")
+
+    print("  ✓ stop_text() safely handles inactive text mode")
 
 
 async def run_async_tests():
@@ -477,20 +465,23 @@ async def run_async_tests():
     print("=" * 60)
 
     try:
-        await test_display_text_activates_text_mode()
-        await test_display_text_no_framebuf_is_noop()
-        await test_display_text_string_with_newline()
-        await test_display_text_list_input()
-        await test_stop_text_deactivates_text_mode()
-        await test_stop_text_clears_framebuf()
+        test_display_text_activates_text_mode()
+        test_display_text_enters_from_right_edge()
+        test_scroll_window_matches_strip()
+        test_scroll_window_on_pixel_buffer()
+        test_display_text_string_with_newline()
+        test_display_text_list_input()
+        test_display_text_limits_to_two_lines()
+        test_marquee_longer_than_matrix()
+        test_no_loop_stops_blank()
+        test_stop_text_deactivates_text_mode()
+        test_stop_text_clears_matrix()
         await test_animate_loop_text_mode_scrolls()
         await test_animate_loop_standard_mode_delegates()
-        await test_display_text_scroll_speed_stored()
-        await test_display_text_color_parameter()
-        await test_display_text_limits_to_two_lines()
-        await test_display_text_x_position()
+        test_display_text_scroll_speed_stored()
         await test_text_mode_scroll_timing()
-        await test_stop_text_without_framebuf()
+        test_stop_text_when_inactive()
+        test_glyph_cache_renders_column_strip()
 
         print("\n" + "=" * 60)
         print("✓ All text mode tests passed!")
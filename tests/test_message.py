@@ -10,6 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'transpo
 # Import Message class
 import message
 Message = message.Message
+MessagePool = message.MessagePool
 
 
 def test_message_creation_with_string_payload():
@@ -209,6 +210,47 @@ def test_message_empty_payload():
     print("✓ Message with empty payload test passed")
 
 
+def test_message_slots():
+    """Test that Message instances have no per-instance dict."""
+    print("\nTesting message __slots__...")
+
+    msg = Message("CORE", "0101", "PING", "")
+    assert not hasattr(msg, "__dict__"), "Message should use __slots__"
+    try:
+        msg.extra = 1
+        assert False, "Should not allow arbitrary attributes"
+    except AttributeError:
+        pass
+
+    print("✓ Message __slots__ test passed")
+
+
+def test_message_pool_reuse():
+    """Test that released messages are reused and bounded by the pool size."""
+    print("\nTesting message pool reuse...")
+
+    pool = MessagePool(size=2)
+    first = pool.acquire("0101", "CORE", "STATUS", (1, 2))
+    pool.release(first)
+    assert first.payload is None, "Released message should drop its payload"
+
+    second = pool.acquire("0102", "CORE", "POWER", (3.3,))
+    assert second is first, "Pool should hand back the released object"
+    assert second == Message("0102", "CORE", "POWER", (3.3,))
+
+    extras = [pool.acquire("CORE", "ALL", "PING") for _ in range(3)]
+    for msg in extras:
+        pool.release(msg)
+    assert len(pool._free) == 2, "Pool should keep at most `size` idle messages"
+
+    disabled = MessagePool(size=0)
+    msg = disabled.acquire("CORE", "ALL", "PING")
+    disabled.release(msg)
+    assert disabled.acquire("CORE", "ALL", "PING") is not msg
+
+    print("✓ Message pool reuse test passed")
+
+
 def run_all_tests():
     """Run all Message tests."""
     print("=" * 60)
@@ -229,6 +271,8 @@ def run_all_tests():
         test_message_equality_non_message()
         test_message_common_commands()
         test_message_empty_payload()
+        test_message_slots()
+        test_message_pool_reuse()
         
         print("\n" + "=" * 60)
         print("✓ All Message tests passed!")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Unit tests for the memory-aware ModeCache used by CoreManager."""
+
+import os
+import sys
+import types
+from unittest import mock
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core import mode_cache
+from core.mode_cache import ModeCache
+
+
+MODULE_COST = 40 * 1024
+
+
+class FakeHeap:
+    """gc stand-in: every imported fake mode module holds MODULE_COST bytes."""
+
+    def __init__(self, total):
+        self.total = total
+        self.other = 0  # Heap held by anything else
+
+    def mem_free(self):
+        modules = sum(1 for name in sys.modules if name.startswith("fake_modes."))
+        return self.total - self.other - modules * MODULE_COST
+
+    def collect(self):
+        pass
+
+
+def _registry(*mode_ids, shared=None):
+    registry = {}
+    for mode_id in mode_ids:
+        module = shared.get(mode_id) if shared else None
+        registry[mode_id] = {
+            "id": mode_id,
+            "module_path": module or f"fake_modes.{mode_id.lower()}",
+            "class_name": "Mode",
+        }
+    return registry
+
+
+def _fake_importer():
+    """Return an __import__ that creates fake mode modules on first import."""
+    for name in [n for n in sys.modules if n.startswith("fake_modes.")]:
+        del sys.modules[name]
+    real_import = __import__
+
+    def fake_import(name, *args, **kwargs):
+        if not name.startswith("fake_modes."):
+            return real_import(name, *args, **kwargs)
+        if name not in sys.modules:
+            sys.modules[name] = types.SimpleNamespace(Mode=type("Mode", (), {"path": name}))
+        return sys.modules[name]
+
+    return fake_import
+
+
+class _Env:
+    """Patch the heap, clock and importer seen by core.mode_cache."""
+
+    def __init__(self, heap):
+        self._patches = (
+            mock.patch.object(mode_cache, "gc", heap),
+            mock.patch.object(mode_cache, "ticks_ms", lambda: 0),
+            mock.patch.object(mode_cache, "ticks_diff", lambda a, b: a - b),
+            mock.patch("builtins.__import__", _fake_importer()),
+        )
+
+    def __enter__(self):
+        for p in self._patches:
+            p.start()
+
+    def __exit__(self, *exc):
+        for p in self._patches:
+            p.stop()
+
+
+def test_modes_stay_resident_above_watermark():
+    """With plenty of heap, a mode is imported once and reused after release."""
+    print("Testing residency above watermark...")
+
+    registry = _registry("MAINMENU", "ARTILLERY")
+    heap = FakeHeap(400 * 1024)
+    cache = ModeCache(registry, min_free_kb=64)
+    with _Env(heap):
+        first = cache.load("ARTILLERY")
+        cache.release("ARTILLERY")
+        cache.load("MAINMENU")
+        cache.release("MAINMENU")
+        assert cache.load("ARTILLERY") is first
+
+    stats = cache.stats["ARTILLERY"]
+    assert stats["imports"] == 1 and stats["hits"] == 1
+    assert stats["cost"] == MODULE_COST
+    assert "fake_modes.artillery" in sys.modules
+
+    print("✓ Residency test passed")
+
+
+def test_low_heap_evicts_lru_but_not_pinned():
+    """Below the watermark the least recently used unpinned mode is evicted."""
+    print("\nTesting LRU eviction...")
+
+    registry = _registry("MAINMENU", "GAME_A", "GAME_B")
+    heap = FakeHeap(200 * 1024)
+    cache = ModeCache(registry, min_free_kb=100, pinned=("MAINMENU",))
+    with _Env(heap):
+        cache.load("MAINMENU")
+        cache.load("GAME_A")
+        cache.release("GAME_A")
+        assert "GAME_A" in cache.classes, "Still above the watermark"
+
+        # GAME_B pushes free heap below the watermark; GAME_A goes, the menu stays
+        cache.load("GAME_B")
+        cache.release("GAME_B")
+
+    assert "GAME_A" not in cache.classes
+    assert "MAINMENU" in cache.classes
+    assert "fake_modes.game_a" not in sys.modules
+    assert cache.stats["GAME_A"]["evictions"] == 1
+
+    print("✓ LRU eviction test passed")
+
+
+def test_known_cost_makes_room_before_import():
+    """A mode with a measured import cost triggers eviction before re-import."""
+    print("\nTesting pre-import trim...")
+
+    registry = _registry("GAME_A", "GAME_B")
+    heap = FakeHeap(180 * 1024)
+    cache = ModeCache(registry, min_free_kb=100, pinned=())
+    with _Env(heap):
+        cache.load("GAME_A")
+        cache.evict("GAME_A")
+        cache.load("GAME_B")
+        # 130 KB free; importing GAME_A again (40 KB) would leave 90 KB
+        heap.other = 10 * 1024
+        with mock.patch.object(cache, "evict", wraps=cache.evict) as evict:
+            cache.load("GAME_A")
+        evict.assert_called_once_with("GAME_B")
+
+    print("✓ Pre-import trim test passed")
+
+
+def test_shared_module_kept_while_alias_resident():
+    """MAINMENU and DASHBOARD share a module; evicting one keeps it imported."""
+    print("\nTesting shared module eviction...")
+
+    registry = _registry("MAINMENU", "DASHBOARD",
+                         shared={"MAINMENU": "fake_modes.menu", "DASHBOARD": "fake_modes.menu"})
+    heap = FakeHeap(400 * 1024)
+    cache = ModeCache(registry)
+    with _Env(heap):
+        cache.load("MAINMENU")
+        cache.load("DASHBOARD")
+        cache.evict("MAINMENU")
+        assert "fake_modes.menu" in sys.modules
+        cache.evict("DASHBOARD")
+        assert "fake_modes.menu" not in sys.modules
+
+    print("✓ Shared module test passed")
+
+
+def test_no_mem_free_keeps_everything():
+    """Ports without gc.mem_free (CPython) never evict by policy."""
+    print("\nTesting without mem_free...")
+
+    registry = _registry("GAME_A")
+    heap = FakeHeap(1024)
+    cache = ModeCache(registry, min_free_kb=1000, pinned=())
+    with _Env(heap), mock.patch.object(ModeCache, "mem_free", staticmethod(lambda: None)):
+        cache.load("GAME_A")
+        cache.release("GAME_A")
+        assert cache.trim() == 0
+    assert "GAME_A" in cache.classes
+    assert cache.stats["GAME_A"]["cost"] is None
+
+    print("✓ No mem_free test passed")
+
+
+def test_unknown_mode_raises_key_error():
+    """Loading a mode that is not registered raises KeyError."""
+    print("\nTesting unknown mode...")
+
+    cache = ModeCache(_registry("GAME_A"))
+    try:
+        cache.load("NOPE")
+    except KeyError as e:
+        assert "GAME_A" in str(e)
+    else:
+        raise AssertionError("Expected KeyError")
+
+    print("✓ Unknown mode test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ModeCache Test Suite")
+    print("=" * 60)
+
+    try:
+        test_modes_stay_resident_above_watermark()
+        test_low_heap_evicts_lru_but_not_pinned()
+        test_known_cost_makes_room_before_import()
+        test_shared_module_kept_while_alias_resident()
+        test_no_mem_free_keeps_everything()
+        test_unknown_mode_raises_key_error()
+
+        print("\n" + "=" * 60)
+        print("ALL MODE CACHE TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Unit tests for the menu's predictive ModePrefetcher."""
+
+import os
+import sys
+from unittest import mock
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from core import mode_prefetch
+from core.mode_prefetch import ModePrefetcher
+
+
+class FakeCache:
+    """ModeCache stand-in that records loads."""
+
+    def __init__(self, free=400 * 1024):
+        self.registry = {
+            "MAINMENU": {"icon": "DEFAULT"},
+            "SAFE": {"icon": "SAFE", "preload": ["audio/safe/sfx/crash.wav"]},
+            "PONG": {"icon": "PONG"},
+        }
+        self.classes = {}
+        self.stats = {}
+        self.pinned = {"MAINMENU"}
+        self.min_free = 96 * 1024
+        self.free = free
+        self.loads = []
+
+    def mem_free(self):
+        return self.free
+
+    def load(self, mode_id):
+        self.loads.append(mode_id)
+        self.classes[mode_id] = object
+        return object
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def ticks_ms(self):
+        return self.now
+
+
+def _prefetcher(cache, audio=None):
+    clock = Clock()
+    icons = mock.MagicMock()
+    patches = [
+        mock.patch.object(mode_prefetch, "ticks_ms", clock.ticks_ms),
+        mock.patch.object(mode_prefetch, "ticks_diff", lambda a, b: a - b),
+        mock.patch.object(mode_prefetch, "Icons", icons),
+    ]
+    for p in patches:
+        p.start()
+    return ModePrefetcher(cache, audio=audio, idle_ms=300), clock, icons, patches
+
+
+def _stop(patches):
+    for p in patches:
+        p.stop()
+
+
+def test_prefetch_runs_stages_after_idle():
+    """After the idle delay, icon, module and audio are warmed one stage per poll."""
+    print("Testing staged prefetch...")
+
+    cache = FakeCache()
+    audio = mock.MagicMock()
+    pf, clock, icons, patches = _prefetcher(cache, audio)
+    try:
+        pf.highlight("SAFE")
+        assert pf.poll() is False, "Nothing before the idle delay"
+
+        clock.now = 300
+        assert pf.poll()
+        icons.get.assert_called_once_with("SAFE")
+        assert cache.loads == []
+
+        assert pf.poll()
+        assert cache.loads == ["SAFE"]
+
+        assert pf.poll()
+        audio.preload.assert_called_once_with(["audio/safe/sfx/crash.wav"])
+        assert pf.poll() is False, "All stages done"
+    finally:
+        _stop(patches)
+
+    print("✓ Staged prefetch test passed")
+
+
+def test_scroll_cancels_remaining_stages():
+    """Moving the highlight mid-prefetch cancels it and restarts the idle timer."""
+    print("\nTesting cancellation on scroll...")
+
+    cache = FakeCache()
+    pf, clock, _, patches = _prefetcher(cache)
+    try:
+        pf.highlight("SAFE")
+        clock.now = 300
+        pf.poll()  # Icon stage only
+
+        pf.highlight("PONG")
+        assert pf.cancelled == 1
+        assert pf.poll() is False, "New highlight must wait out the idle delay"
+        clock.now = 600
+        pf.poll()
+        pf.poll()
+        assert cache.loads == ["PONG"]
+    finally:
+        _stop(patches)
+
+    print("✓ Cancellation test passed")
+
+
+def test_low_heap_skips_module_import():
+    """Module and audio stages are skipped when they would cut into the headroom."""
+    print("\nTesting heap headroom...")
+
+    cache = FakeCache(free=140 * 1024)
+    cache.stats["SAFE"] = {"cost": 20 * 1024}
+    audio = mock.MagicMock()
+    pf, clock, _, patches = _prefetcher(cache, audio)
+    try:
+        pf.highlight("SAFE")
+        clock.now = 300
+        pf.poll()
+        pf.poll()
+        assert cache.loads == []
+        assert pf.skipped == 1
+        pf.poll()
+        audio.preload.assert_not_called()
+        assert pf.skipped == 2
+    finally:
+        _stop(patches)
+
+    print("✓ Heap headroom test passed")
+
+
+def test_launch_metrics():
+    """Prefetched launches are hits, cold imports are misses, TTFF is recorded."""
+    print("\nTesting launch metrics...")
+
+    cache = FakeCache()
+    pf, clock, _, patches = _prefetcher(cache)
+    try:
+        pf.highlight("SAFE")
+        clock.now = 300
+        pf.poll()
+        pf.poll()
+
+        clock.now = 1000
+        pf.note_launch("SAFE")
+        clock.now = 1040
+        pf.note_ready()
+
+        pf.note_launch("PONG")  # Cold: not resident, not prefetched
+        pf.note_launch("MAINMENU")  # Pinned menus never count
+
+        stats = pf.get_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["modes"]["SAFE"]["ttff_ms"] == 40
+        assert stats["modes"]["SAFE"]["hits"] == 1
+    finally:
+        _stop(patches)
+
+    print("✓ Launch metrics test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("ModePrefetcher Test Suite")
+    print("=" * 60)
+
+    try:
+        test_prefetch_runs_stages_after_idle()
+        test_scroll_cancels_remaining_stages()
+        test_low_heap_skips_module_import()
+        test_launch_metrics()
+
+        print("\n" + "=" * 60)
+        print("ALL MODE PREFETCH TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -216,6 +216,55 @@ def test_hsv_to_rgb_value():
     print("✓ HSV to RGB value test passed")
 
 
+def test_hue_wheel_matches_hsv_to_rgb():
+    """Test that the cached hue wheel matches hsv_to_rgb at whole degrees."""
+    print("\nTesting hue wheel table...")
+
+    wheel = Palette.hue_wheel()
+    assert len(wheel) == Palette.HUE_STEPS
+    assert Palette.hue_wheel() is wheel, "Wheel should be built once and cached"
+    for h in range(0, 360, 7):
+        assert wheel[h] == Palette.hsv_to_rgb(h, 1.0, 1.0)
+
+    assert Palette.hue_to_rgb(120.9) == wheel[120]
+    assert Palette.hue_to_rgb(480) == wheel[120], "Hues should wrap around"
+    assert Palette.hue_to_rgb(-60) == wheel[300]
+
+    print("✓ Hue wheel table test passed")
+
+
+def test_hsv_fast_value_scaling():
+    """Test that hsv_fast stays within one step of hsv_to_rgb across values."""
+    print("\nTesting hsv_fast value-scaled lookup...")
+
+    assert Palette.hsv_fast(0, 1.0) == (255, 0, 0)
+    assert Palette.hsv_fast(0, 0.0) == (0, 0, 0)
+    assert Palette.hsv_fast(0, 1.5) == (255, 0, 0)
+    for h in (0, 45, 200, 359):
+        for v in (0.1, 0.33, 0.5, 0.9):
+            fast = Palette.hsv_fast(h, v)
+            exact = Palette.hsv_to_rgb(h, 1.0, v)
+            assert all(abs(a - b) <= 2 for a, b in zip(fast, exact)), f"h={h} v={v}: {fast} vs {exact}"
+
+    print("✓ hsv_fast value scaling test passed")
+
+
+def test_fixed_point_scale_and_lerp():
+    """Test fixed-point scale_color and lerp_color."""
+    print("\nTesting scale_color and lerp_color...")
+
+    assert Palette.scale_color((200, 100, 50), 1.0) == (200, 100, 50)
+    assert Palette.scale_color((200, 100, 50), 0.5) == (100, 50, 25)
+    assert Palette.scale_color(Palette.RED, 0.0) == (0, 0, 0)
+
+    a, b = (0, 100, 255), (255, 0, 55)
+    assert Palette.lerp_color(a, b, 0.0) == a
+    assert Palette.lerp_color(a, b, 1.0) == b
+    assert Palette.lerp_color(a, b, 0.5) == (127, 50, 155)
+
+    print("✓ Fixed-point scale and lerp test passed")
+
+
 def run_all_tests():
     """Run all palette tests."""
     print("=" * 60)
@@ -235,6 +284,9 @@ def run_all_tests():
         test_hsv_to_rgb_hue_ranges()
         test_hsv_to_rgb_saturation()
         test_hsv_to_rgb_value()
+        test_hue_wheel_matches_hsv_to_rgb()
+        test_hsv_fast_value_scaling()
+        test_fixed_point_scale_and_lerp()
 
         print("\n" + "=" * 60)
         print("✓ All palette tests passed!")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Unit tests for RenderManager frame-dirty tracking and idle ticking."""
+
+import asyncio
+import os
+import sys
+from unittest import mock
+
+# Mock CircuitPython modules BEFORE any imports
+class MockModule:
+    """Generic mock module."""
+    def __getattr__(self, name):
+        return MockModule()
+
+    def __call__(self, *args, **kwargs):
+        return MockModule()
+
+sys.modules['digitalio'] = MockModule()
+sys.modules['busio'] = MockModule()
+sys.modules['board'] = MockModule()
+sys.modules['analogio'] = MockModule()
+sys.modules['microcontroller'] = MockModule()
+sys.modules['watchdog'] = MockModule()
+sys.modules['neopixel'] = MockModule()
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from managers.render_manager import RenderManager
+from utilities.jeb_pixel import JEBPixel
+
+
+class MockNeoPixel:
+    """Mock NeoPixel strip that counts hardware writes."""
+
+    def __init__(self, size):
+        self.buf = [(0, 0, 0)] * size
+        self.show_count = 0
+
+    def __setitem__(self, index, value):
+        self.buf[index] = value
+
+    def __getitem__(self, index):
+        return self.buf[index]
+
+    def show(self):
+        self.show_count += 1
+
+
+class StaticAnimator:
+    """Animator stand-in that writes only when told to."""
+
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.animating = False
+        self.pending = []
+
+    def is_animating(self):
+        return self.animating
+
+    async def animate_loop(self, step=True):
+        while self.pending:
+            idx, color = self.pending.pop()
+            self.pixels[idx] = color
+
+
+def _make_renderer(keepalive_interval=None):
+    root = MockNeoPixel(8)
+    renderer = RenderManager(root, keepalive_interval=keepalive_interval)
+    animator = StaticAnimator(JEBPixel(root, start_idx=0, num_pixels=8))
+    renderer.add_animator(animator)
+    return renderer, animator, root
+
+
+async def _run_for(renderer, seconds):
+    task = asyncio.create_task(renderer.run())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def test_unchanged_frames_are_skipped():
+    """Only the first frame and frames after a write reach pixels.show()."""
+    print("Testing unchanged frame skipping...")
+
+    renderer, animator, root = _make_renderer()
+    renderer.target_frame_rate = 200
+
+    async def scenario():
+        task = asyncio.create_task(renderer.run())
+        await asyncio.sleep(0.05)
+        assert root.show_count == 1, f"Only the initial frame should be pushed, got {root.show_count}"
+        animator.pending.append((3, (255, 0, 0)))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(scenario())
+
+    assert root.show_count == 2, f"Expected one more push after the write, got {root.show_count}"
+    stats = renderer.get_frame_stats()
+    assert stats["pushed"] == 2
+    assert stats["skipped"] > 0
+    assert 0.0 < stats["skip_ratio"] < 1.0
+
+    print("✓ Unchanged frame skipping test passed")
+
+
+def test_keepalive_pushes_unchanged_frames():
+    """A keep-alive interval pushes a clean frame once it has elapsed."""
+    print("\nTesting keep-alive refresh...")
+
+    renderer, _, root = _make_renderer(keepalive_interval=0.02)
+    renderer.target_frame_rate = 200
+    asyncio.run(_run_for(renderer, 0.12))
+
+    assert root.show_count >= 3, f"Keep-alive should have pushed several frames, got {root.show_count}"
+    assert renderer.frames_skipped > 0
+
+    print("✓ Keep-alive refresh test passed")
+
+
+def test_mark_dirty_and_untracked_animators():
+    """mark_dirty() forces a push; animators without dirty tracking always push."""
+    print("\nTesting mark_dirty and untracked animators...")
+
+    renderer, _, _ = _make_renderer()
+    assert renderer._frame_dirty() is True  # New segment starts dirty
+    assert renderer._frame_dirty() is False
+    renderer.mark_dirty()
+    assert renderer._frame_dirty() is True
+
+    class Untracked:
+        pixels = [(0, 0, 0)] * 4
+
+    renderer.add_animator(Untracked())
+    assert renderer._frame_dirty() is True
+    assert renderer._frame_dirty() is True
+    assert renderer._is_animating() is True  # No is_animating(): assume busy
+
+    print("✓ mark_dirty and untracked animators test passed")
+
+
+def test_idle_ticks_keep_frame_counter_on_schedule():
+    """Idle frames tick slowly but still advance the counter by whole frames."""
+    print("\nTesting idle tick rate...")
+
+    class FrameCapture:
+        def __init__(self):
+            self.frames = []
+
+        def sync_frame(self, frame):
+            self.frames.append(frame)
+
+    renderer, animator, _ = _make_renderer()
+    renderer.IDLE_AFTER_FRAMES = 3
+    capture = FrameCapture()
+    renderer.add_global_animation_controller(capture)
+
+    asyncio.run(_run_for(renderer, 0.3))
+
+    step = int(renderer.target_frame_rate / renderer.IDLE_FRAME_RATE)
+    steps = [b - a for a, b in zip(capture.frames, capture.frames[1:])]
+    assert steps[:2] == [1, 1], f"Early frames should tick one at a time, got {steps[:2]}"
+    assert step in steps, f"Idle frames should advance {step} at a time, got {steps}"
+    assert len(capture.frames) < 0.3 * renderer.target_frame_rate / 2, "Idle loop should run fewer iterations"
+    assert renderer.get_frame_stats()["idle"] is True
+
+    # Animating managers keep the full rate even when nothing changed
+    renderer, animator, _ = _make_renderer()
+    renderer.IDLE_AFTER_FRAMES = 3
+    animator.animating = True
+    capture = FrameCapture()
+    renderer.add_global_animation_controller(capture)
+    asyncio.run(_run_for(renderer, 0.15))
+    assert all(b - a == 1 for a, b in zip(capture.frames, capture.frames[1:]))
+
+    print("✓ Idle tick rate test passed")
+
+
+def test_static_solid_slots_leave_frame_clean():
+    """A screen of SOLID slots is written once, so later frames stay clean."""
+    print("\nTesting static SOLID frames...")
+
+    from managers.base_pixel_manager import BasePixelManager
+
+    root = MockNeoPixel(8)
+    segment = JEBPixel(root, start_idx=0, num_pixels=8)
+    manager = BasePixelManager(segment)
+    manager.fill_animation("SOLID", (10, 20, 30))
+
+    asyncio.run(manager.animate_loop(step=True))
+    assert root.buf[0] == (10, 20, 30)
+    segment.dirty = False
+
+    asyncio.run(manager.animate_loop(step=True))
+    assert segment.dirty is False, "Unchanged SOLID slots should not be rewritten"
+
+    manager.set_animation(2, "SOLID", (1, 2, 3))
+    asyncio.run(manager.animate_loop(step=True))
+    assert segment.dirty is True and root.buf[2] == (1, 2, 3)
+
+    print("✓ Static SOLID frame test passed")
+
+
+def test_direct_writes_do_not_override_solid_slots():
+    """A write outside the slot path is replaced by the SOLID slot on the next frame."""
+    print("\nTesting SOLID re-assert after direct writes...")
+
+    from managers.base_pixel_manager import BasePixelManager
+
+    root = MockNeoPixel(8)
+    segment = JEBPixel(root, start_idx=0, num_pixels=8)
+    manager = BasePixelManager(segment)
+    manager.set_animation(0, "SOLID", (10, 20, 30))
+    asyncio.run(manager.animate_loop(step=True))
+    segment.dirty = False  # Render loop pushed the frame
+
+    # e.g. GlobalAnimationController.global_rain writing manager.pixels
+    segment[0] = (200, 0, 0)
+    segment.fill((0, 0, 5))
+    asyncio.run(manager.animate_loop(step=True))
+    assert root.buf[0] == (10, 20, 30), "SOLID slot must win over a direct write"
+
+    segment.dirty = False
+    asyncio.run(manager.animate_loop(step=True))
+    assert segment.dirty is False, "Clean frames stay clean after the re-assert"
+
+    print("✓ SOLID re-assert test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Render Dirty Tracking Test Suite")
+    print("=" * 60)
+
+    try:
+        test_unchanged_frames_are_skipped()
+        test_keepalive_pushes_unchanged_frames()
+        test_mark_dirty_and_untracked_animators()
+        test_idle_ticks_keep_frame_counter_on_schedule()
+        test_static_solid_slots_leave_frame_clean()
+        test_direct_writes_do_not_override_solid_slots()
+
+        print("\n" + "=" * 60)
+        print("ALL RENDER DIRTY TRACKING TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Unit tests for the RenderManager per-stage frame profiler."""
+
+import asyncio
+import os
+import sys
+import time
+from unittest import mock
+
+# Mock CircuitPython modules BEFORE any imports
+class MockModule:
+    """Generic mock module."""
+    def __getattr__(self, name):
+        return MockModule()
+
+    def __call__(self, *args, **kwargs):
+        return MockModule()
+
+sys.modules['digitalio'] = MockModule()
+sys.modules['busio'] = MockModule()
+sys.modules['board'] = MockModule()
+sys.modules['analogio'] = MockModule()
+sys.modules['microcontroller'] = MockModule()
+sys.modules['watchdog'] = MockModule()
+sys.modules['neopixel'] = MockModule()
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from managers.render_manager import RenderManager
+from utilities.render_profiler import RenderProfiler
+
+
+class MockNeoPixel:
+    """Mock NeoPixel strip that counts hardware writes."""
+
+    def __init__(self, size):
+        self.buf = [(0, 0, 0)] * size
+        self.show_count = 0
+
+    def __setitem__(self, index, value):
+        self.buf[index] = value
+
+    def __getitem__(self, index):
+        return self.buf[index]
+
+    def show(self):
+        self.show_count += 1
+
+
+class BusyAnimator:
+    """Animator whose animate_loop burns a fixed amount of wall time."""
+
+    def __init__(self, busy=0.0):
+        self.busy = busy
+        self.pixels = [(0, 0, 0)] * 4
+
+    async def animate_loop(self, step=True):
+        if self.busy:
+            end = time.monotonic() + self.busy
+            while time.monotonic() < end:
+                pass
+
+
+async def _run_for(renderer, seconds):
+    task = asyncio.create_task(renderer.run())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def test_ring_buffer_percentiles():
+    """Stage stats cover only the last window samples."""
+    print("Testing profiler ring buffer...")
+
+    prof = RenderProfiler(window=10)
+    for us in range(1, 101):
+        prof.record("show", us)
+    stats = prof.stage_stats("show")
+    assert stats["samples"] == 100
+    assert stats["max_us"] == 100
+    assert stats["p50_us"] == 95  # Window holds 91..100
+    assert stats["p95_us"] == 99
+    assert prof.stage_stats("missing") is None
+
+    prof.count("backoff")
+    prof.count("backoff")
+    snap = prof.snapshot()
+    assert snap["events"]["backoff"] == 2
+    assert "show" in snap["stages"]
+    assert len(prof.format()) == 3
+
+    prof.reset()
+    assert prof.snapshot()["stages"] == {} and prof.events["backoff"] == 0
+
+    print("✓ Profiler ring buffer test passed")
+
+
+def test_disabled_profiler_records_nothing():
+    """The render loop runs without a profiler unless one is enabled."""
+    print("\nTesting disabled profiler...")
+
+    renderer = RenderManager(MockNeoPixel(4))
+    renderer.add_animator(BusyAnimator())
+    asyncio.run(_run_for(renderer, 0.05))
+
+    assert renderer.profiler is None
+    assert renderer.get_render_telemetry()["profiler"] is None
+
+    print("✓ Disabled profiler test passed")
+
+
+def test_profiler_records_each_stage():
+    """Enabled profiling times every animator, show, sync and the whole frame."""
+    print("\nTesting per-stage timings...")
+
+    renderer = RenderManager(MockNeoPixel(4), keepalive_interval=None)
+    renderer.add_animator(BusyAnimator(busy=0.002))
+    renderer.add_animator(BusyAnimator())
+    prof = renderer.enable_profiler(window=30)
+    assert renderer.enable_profiler() is prof
+
+    asyncio.run(_run_for(renderer, 0.1))
+
+    telemetry = renderer.get_render_telemetry()
+    stages = telemetry["profiler"]["stages"]
+    assert set(stages) == {"anim:BusyAnimator", "anim:BusyAnimator#1", "show", "sync", "frame"}
+    assert stages["anim:BusyAnimator"]["p50_us"] >= 1500
+    assert stages["anim:BusyAnimator#1"]["p50_us"] < stages["anim:BusyAnimator"]["p50_us"]
+    assert stages["frame"]["max_us"] >= stages["anim:BusyAnimator"]["max_us"]
+    assert telemetry["profiler"]["frames"] > 0
+
+    renderer.disable_profiler()
+    assert renderer.profiler is None
+
+    print("✓ Per-stage timing test passed")
+
+
+def test_backoff_events_are_counted():
+    """Frames that overrun are counted as lag and back-off events."""
+    print("\nTesting back-off counting...")
+
+    renderer = RenderManager(MockNeoPixel(4))
+    renderer.add_animator(BusyAnimator(busy=0.03))  # Slower than a 60 Hz frame
+    renderer.enable_profiler()
+
+    asyncio.run(_run_for(renderer, 0.4))
+
+    events = renderer.profiler.events
+    assert events["lag"] >= renderer.BACKOFF_THRESHOLD
+    assert events["backoff"] >= 1
+    assert renderer.target_frame_rate < renderer.DEFAULT_FRAME_RATE
+
+    print("✓ Back-off counting test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Render Profiler Test Suite")
+    print("=" * 60)
+
+    try:
+        test_ring_buffer_percentiles()
+        test_disabled_profiler_records_nothing()
+        test_profiler_records_each_stage()
+        test_backoff_events_are_counted()
+
+        print("\n" + "=" * 60)
+        print("ALL RENDER PROFILER TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -297,6 +297,39 @@ def test_handle_power_command_uvlo_triggers_display_and_audio(power_cmd_body):
     print("✓ _handle_power_command UVLO display and audio trigger test passed")
 
 
+def test_firmware_update_sends_only_changed_files(content):
+    """Test that satellite updates are filtered by the reported file fingerprints."""
+    print("\nTesting delta firmware update wiring...")
+
+    assert 'parse_version_check(val)' in content, \
+        "_handle_version_check_command should parse fingerprints from VERSION_CHECK"
+    assert 'def _select_update_files(self, files, targets)' in content, \
+        "SatelliteNetworkManager should define _select_update_files()"
+    assert re.search(r'files = self\._select_update_files\(', content), \
+        "_initiate_satellite_update should transfer only the selected files"
+    print("  ✓ VERSION_CHECK fingerprints select the files to send")
+
+    assert 'hash_cache=self._hash_cache' in content, \
+        "FileTransferSender should reuse the manager's HashCache"
+    assert 'HashCache(_cfg.get("hash_cache_path"' in content, \
+        "The Core's HashCache should be persisted to a configurable path"
+    assert 'self._hash_cache.save()' in content, \
+        "The hash cache should be saved after each update session"
+    print("  ✓ Source file digests come from the shared hash cache")
+
+    assert 'replies=self.transfer_replies' in content, \
+        "FileTransferSender should take replies from the per-satellite ReplyQueue"
+    assert 'if sid in self._update_targets:' in content, \
+        "Transfer replies from satellites outside the update session should be ignored"
+    print("  ✓ Transfer replies are queued per satellite")
+
+    assert re.search(r'while \(self\._update_peers_pending\(sat_type_id\)', content), \
+        "The update collect window should only run while a same-type satellite may still join"
+    print("  ✓ Collect window is skipped when no other satellite can join")
+
+    print("✓ Delta firmware update test passed")
+
+
 if __name__ == "__main__":
     # Run tests with pytest when executed as a script
     import subprocess
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Unit tests for the fixed-timestep SimScheduler."""
+
+import asyncio
+import os
+import sys
+import types
+from unittest import mock
+
+if 'adafruit_ticks' not in sys.modules:
+    sys.modules['adafruit_ticks'] = mock.MagicMock()
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from utilities import sim_scheduler
+from utilities.sim_scheduler import SimScheduler
+
+
+class FakeClock:
+    """Millisecond clock advanced only by the scheduler's sleeps."""
+
+    def __init__(self):
+        self.now = 0
+        self.sleeps = []
+        self.on_sleep = None
+
+    def ticks_ms(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        ms = round(seconds * 1000)
+        self.sleeps.append(ms)
+        self.now += ms
+        if self.on_sleep:
+            self.on_sleep(self)
+
+
+class FakeRenderer:
+    """RenderManager stand-in with a frame counter and frame rate."""
+
+    def __init__(self, frame_rate=60):
+        self.frame_counter = 0
+        self.target_frame_rate = frame_rate
+
+
+def _run(sched, clock):
+    fake_asyncio = types.SimpleNamespace(sleep=clock.sleep)
+    with mock.patch.object(sim_scheduler, "ticks_ms", clock.ticks_ms), \
+         mock.patch.object(sim_scheduler, "ticks_diff", lambda a, b: a - b), \
+         mock.patch.object(sim_scheduler, "asyncio", fake_asyncio):
+        return asyncio.run(sched.run())
+
+
+def _stop_after(clock, ms):
+    return lambda: "DONE" if clock.now >= ms else None
+
+
+def test_steps_on_fixed_interval_and_sleeps_to_deadline():
+    """Steps run once per interval and the loop sleeps straight to each deadline."""
+    print("Testing fixed timestep...")
+
+    clock = FakeClock()
+    steps = []
+    sched = SimScheduler(lambda: steps.append(clock.now), lambda: None, 100,
+                         poll=_stop_after(clock, 1000), poll_ms=1000)
+    assert _run(sched, clock) == "DONE"
+
+    assert steps == [100 * i for i in range(1, 10)], f"Unexpected step times {steps}"
+    assert sched.steps == 9
+    assert all(ms == 100 for ms in clock.sleeps[1:]), f"Expected 100 ms sleeps, got {clock.sleeps}"
+
+    print("✓ Fixed timestep test passed")
+
+
+def test_poll_cadence_caps_sleep():
+    """With a poll handler, the loop wakes at least every poll_ms."""
+    print("\nTesting poll cadence...")
+
+    clock = FakeClock()
+    sched = SimScheduler(lambda: None, lambda: None, 800, poll=_stop_after(clock, 850), poll_ms=50)
+    _run(sched, clock)
+
+    assert max(clock.sleeps) == 50
+    assert sched.steps == 1
+
+    print("✓ Poll cadence test passed")
+
+
+def test_catchup_limit_drops_backlog():
+    """A long stall runs at most max_catchup steps and drops the rest."""
+    print("\nTesting catch-up limit...")
+
+    clock = FakeClock()
+    stalled = []
+
+    def stall(c):
+        if not stalled:
+            stalled.append(True)
+            c.now += 1000  # Ten intervals late
+
+    clock.on_sleep = stall
+    sched = SimScheduler(lambda: None, lambda: None, 100, poll=_stop_after(clock, 1150),
+                         poll_ms=1000, max_catchup=3)
+    _run(sched, clock)
+
+    assert sched.get_stats()["events"]["dropped"] == 8
+    assert sched.steps == 3
+
+    print("✓ Catch-up limit test passed")
+
+
+def test_slow_step_runs_once_per_wake():
+    """A step slower than its interval is not replayed back to back within one wake."""
+    print("\nTesting slow step catch-up...")
+
+    clock = FakeClock()
+    wakes = []
+
+    def slow_step():
+        clock.now += 50  # Longer than the 33 ms interval
+
+    def poll():
+        wakes.append(sched.steps)
+        return "DONE" if clock.now >= 1000 else None
+
+    sched = SimScheduler(slow_step, lambda: None, 33, poll=poll, poll_ms=1000)
+    sched.profiler.now_us = lambda: clock.now * 1000
+    _run(sched, clock)
+
+    per_wake = [b - a for a, b in zip(wakes, wakes[1:])]
+    assert sched.steps > 5
+    assert max(per_wake) == 1, f"Expected one step per wake, got {per_wake}"
+    assert sched.get_stats()["events"]["dropped"] > 0
+
+    print("✓ Slow step catch-up test passed")
+
+
+def test_render_at_most_once_per_render_frame():
+    """Several steps within one RenderManager frame produce a single render."""
+    print("\nTesting render decoupling...")
+
+    clock = FakeClock()
+    renderer = FakeRenderer()
+    renders = []
+
+    def advance_frame(c):
+        if c.now % 40 == 0:
+            renderer.frame_counter += 1
+
+    clock.on_sleep = advance_frame
+    sched = SimScheduler(lambda: None, lambda: renders.append(renderer.frame_counter), 10,
+                         poll=_stop_after(clock, 400), renderer=renderer, poll_ms=1000)
+    _run(sched, clock)
+
+    assert sched.steps == 39
+    assert len(renders) == len(set(renders)), f"Rendered twice in one frame: {renders}"
+    assert sched.get_stats()["events"]["deferred"] > 0
+    stats = sched.get_stats()
+    assert stats["renders"] == len(renders)
+    assert stats["stages"]["step"]["samples"] == 39
+
+    print("✓ Render decoupling test passed")
+
+
+def test_interval_change_applies_to_next_step():
+    """Changing interval_ms from poll() changes the step rate."""
+    print("\nTesting interval change...")
+
+    clock = FakeClock()
+    steps = []
+
+    def poll():
+        if clock.now >= 300:
+            sched.interval_ms = 50
+        return "DONE" if clock.now >= 500 else None
+
+    sched = SimScheduler(lambda: steps.append(clock.now), lambda: None, 100, poll=poll, poll_ms=1000)
+    _run(sched, clock)
+
+    # The 100 ms already accumulated at t=300 is two 50 ms steps
+    assert steps == [100, 200, 300, 300, 350, 400, 450], f"Unexpected step times {steps}"
+
+    print("✓ Interval change test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SimScheduler Test Suite")
+    print("=" * 60)
+
+    try:
+        test_steps_on_fixed_interval_and_sleeps_to_deadline()
+        test_poll_cadence_caps_sleep()
+        test_catchup_limit_drops_backlog()
+        test_slow_step_runs_once_per_wake()
+        test_render_at_most_once_per_render_frame()
+        test_interval_change_applies_to_next_step()
+
+        print("\n" + "=" * 60)
+        print("ALL SIM SCHEDULER TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for satellite STATUS keyframes under continuous input."""
+
+import asyncio
+import os
+import sys
+from unittest import mock
+
+for _name in ('adafruit_ticks', 'busio', 'board', 'digitalio', 'microcontroller',
+              'watchdog', 'analogio', 'neopixel', 'supervisor'):
+    sys.modules.setdefault(_name, mock.MagicMock())
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import satellites.base_firmware as base_firmware
+from satellites.base_firmware import SatelliteFirmware
+
+
+class _Stop(Exception):
+    """Raised by the patched sleep to end the TX loop after one pass."""
+
+
+async def _stop_sleep(_delay):
+    raise _Stop()
+
+
+def _firmware():
+    fw = object.__new__(SatelliteFirmware)
+    fw.id = "0101"
+    fw.sat_type_id = "01"
+    fw.config = {}
+    fw.operating_mode = "ACTIVE"
+    fw.watchdog = mock.MagicMock()
+    fw.transport_up = mock.MagicMock()
+    fw.transport_up.send.return_value = True
+    fw._version_confirmed = True
+    fw._update_mode = False
+    fw._status_event = asyncio.Event()
+    fw._status_resync = False
+    fw.last_tx = 0
+    fw.last_keyframe = 0
+    fw.kinds = []
+    fw._get_status_bytes = lambda flush=False, full=True: fw.kinds.append(full) or b""
+    return fw
+
+
+def _tx_pass(fw, now):
+    """Run one pass of the TX loop at time `now` with input pending."""
+    fw._status_event.set()
+    with mock.patch.object(base_firmware.time, "monotonic", lambda: now), \
+            mock.patch.object(base_firmware.asyncio, "sleep", _stop_sleep):
+        try:
+            asyncio.run(fw._task_tx_upstream())
+        except _Stop:
+            pass
+
+
+def test_keyframe_forced_under_continuous_input():
+    """Deltas go out while input keeps arriving, but a keyframe still follows every 3 s."""
+    print("Testing keyframes under continuous input...")
+
+    fw = _firmware()
+    fw.last_keyframe = 1.0
+    for t in (1.5, 2.0, 3.0, 3.9):
+        _tx_pass(fw, t)
+    assert fw.kinds == [False, False, False, False], "Input within 3 s of a keyframe sends deltas"
+
+    _tx_pass(fw, 4.2)
+    assert fw.kinds[-1] is True, "Keyframe due despite constant input"
+    assert fw.last_keyframe == 4.2
+
+    _tx_pass(fw, 4.5)
+    assert fw.kinds[-1] is False
+
+    print("✓ Keyframe test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("STATUS Keyframe Test Suite")
+    print("=" * 60)
+
+    try:
+        test_keyframe_forced_under_continuous_input()
+
+        print("\n" + "=" * 60)
+        print("ALL STATUS KEYFRAME TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Unit tests for adaptive RX polling and the transport latency histogram."""
+
+import asyncio
+import os
+import sys
+
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from transport import Message, UARTTransport
+from transport.polling import AdaptivePoller, LatencyHistogram
+from transport.protocol import COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+
+
+class FakeUART:
+    """Non-blocking UART stub with a baudrate attribute like busio.UART."""
+
+    def __init__(self, baudrate=115200):
+        self.baudrate = baudrate
+        self.data = bytearray()
+        self.written = bytearray()
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def readinto(self, buf):
+        count = min(len(buf), len(self.data))
+        buf[:count] = self.data[:count]
+        del self.data[:count]
+        return count
+
+    def write(self, data):
+        self.written += data
+        return len(data)
+
+    def reset_input_buffer(self):
+        self.data = bytearray()
+
+
+def _make_transport(uart=None, **kwargs):
+    return UARTTransport(uart or FakeUART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS, **kwargs)
+
+
+def _frame(message):
+    """Return the wire bytes UARTTransport produces for message."""
+    encoder = _make_transport()
+    encoder.send(message)
+    return bytes(encoder._tx_mv[encoder._tx_tail:encoder._tx_head])
+
+
+def test_poller_reads_immediately_when_bytes_wait():
+    """Waiting bytes mean no sleep at all."""
+    print("Testing poller with bytes waiting...")
+
+    poller = AdaptivePoller(115200)
+    assert poller.next_delay(False, in_waiting=12, now=0) == 0
+    assert poller.next_delay(True, in_waiting=1, now=1000) == 0
+
+    print("✓ Poller immediate read test passed")
+
+
+def test_poller_partial_frame_uses_baud_rate():
+    """A partial frame is polled at the wire time of the next few bytes."""
+    print("\nTesting poller partial-frame delay...")
+
+    slow = AdaptivePoller(9600, min_delay=0.001, max_delay=0.02)
+    delay = slow.next_delay(False, partial=True, now=0)
+    assert abs(delay - 10.0 / 9600 * AdaptivePoller.PARTIAL_FRAME_BYTES) < 1e-9
+
+    # Fast links are clamped to min_delay, unknown baud rates use it directly
+    assert AdaptivePoller(1000000).next_delay(False, partial=True, now=0) == 0.001
+    assert AdaptivePoller(None).next_delay(False, partial=True, now=0) == 0.001
+
+    # Very slow links never sleep longer than max_delay
+    assert AdaptivePoller(300).next_delay(False, partial=True, now=0) == 0.02
+
+    print("✓ Poller partial-frame test passed")
+
+
+def test_poller_idle_backoff():
+    """Idle polls back off exponentially to max_delay and snap back on traffic."""
+    print("\nTesting poller idle backoff...")
+
+    poller = AdaptivePoller(115200, min_delay=0.001, max_delay=0.02, backoff=2)
+    delays = [poller.next_delay(False, now=0) for _ in range(7)]
+    assert delays == [0.002, 0.004, 0.008, 0.016, 0.02, 0.02, 0.02], delays
+
+    assert poller.next_delay(True, now=0) == 0.001
+    assert poller.next_delay(False, now=0) == 0.002
+
+    print("✓ Poller idle backoff test passed")
+
+
+def test_poller_wakes_for_periodic_frames():
+    """A steady frame period caps the idle sleep at the predicted next arrival."""
+    print("\nTesting poller periodic wake-up...")
+
+    poller = AdaptivePoller(115200, min_delay=0.001, max_delay=0.02)
+    for arrival in (0, 50000, 100000, 150000):
+        poller.next_delay(True, now=arrival)
+    assert poller._interval == 50000
+
+    # Backed off to max_delay, but the next frame is due in 5 ms
+    for now in (151000, 152000, 153000, 154000):
+        poller.next_delay(False, now=now)
+    assert abs(poller.next_delay(False, now=195000) - 0.005) < 1e-9
+
+    # Overdue frame: poll tightly until it lands
+    assert poller.next_delay(False, now=201000) == 0.001
+
+    # Frames within a burst do not shrink the learned period
+    poller.next_delay(True, now=200000)
+    poller.next_delay(True, now=201000)
+    assert poller._interval == 50000
+
+    print("✓ Poller periodic wake-up test passed")
+
+
+def test_latency_histogram_buckets_and_percentiles():
+    """Samples land in the right bucket and percentiles report bucket edges."""
+    print("\nTesting latency histogram...")
+
+    hist = LatencyHistogram(buckets=(1, 5, 20))
+    for sample in (0.2, 0.8, 3.0, 4.0, 10.0, 45.0):
+        hist.record(sample)
+
+    assert hist.counts == [2, 2, 1, 1]
+    assert hist.count == 6
+    assert hist.max_ms == 45.0
+    assert hist.percentile(30) == 1
+    assert hist.percentile(50) == 5
+    assert hist.percentile(80) == 20
+    assert hist.percentile(100) == 45.0
+
+    snap = hist.snapshot()
+    assert snap["counts"] == [2, 2, 1, 1]
+    assert abs(snap["mean_ms"] - 63.0 / 6) < 1e-9
+    assert hist.format() == "<=1:2 <=5:2 <=20:1 >20:1"
+
+    hist.reset()
+    assert hist.count == 0 and hist.percentile(99) == 0.0
+
+    print("✓ Latency histogram test passed")
+
+
+def test_transport_baudrate_from_hardware():
+    """The transport picks up the UART's baud rate unless one is given."""
+    print("\nTesting transport baud rate detection...")
+
+    assert _make_transport(FakeUART(57600)).baudrate == 57600
+    assert _make_transport(FakeUART(57600), baudrate=9600).baudrate == 9600
+    assert _make_transport(FakeUART(None)).baudrate is None
+
+    print("✓ Transport baud rate detection test passed")
+
+
+def test_transport_records_rx_latency():
+    """Each decoded frame adds one arrival-to-dispatch sample."""
+    print("\nTesting transport RX latency recording...")
+
+    transport = _make_transport()
+    packet = _frame(Message("SAT", "CORE", "PING", ""))
+    transport.uart.data += packet * 3
+
+    transport._read_hw()
+    received = [transport._try_decode_one() for _ in range(3)]
+    assert all(msg is not None for msg in received)
+    assert transport.rx_latency.count == 3
+    assert transport.rx_latency.max_ms < 100
+    assert transport._rx_arrival_us is None  # Ring drained
+
+    stats = transport.get_rx_telemetry()
+    assert stats["rx_latency"]["count"] == 3
+    assert stats["rx_errors"] == 0
+
+    print("✓ Transport RX latency recording test passed")
+
+
+def test_rx_worker_dispatches_after_idle():
+    """The RX worker picks up a frame promptly after backing off on an idle link."""
+    print("\nTesting RX worker wake-up after idle...")
+
+    async def run():
+        transport = _make_transport()
+        transport.start()
+        try:
+            await asyncio.sleep(0.1)  # Let the worker back off to max_delay
+            transport.uart.data += _frame(Message("SAT", "CORE", "PING", ""))
+            message = await asyncio.wait_for(transport.receive(), 0.5)
+            assert message.command == "PING"
+            assert transport.rx_latency.count == 1
+            assert transport.rx_latency.max_ms <= transport.rx_poller.max_delay * 1000 + 20
+        finally:
+            transport._rx_task.cancel()
+            transport._tx_task.cancel()
+
+    asyncio.run(run())
+
+    print("✓ RX worker wake-up test passed")
+
+
+def test_relay_poller_idle_delay_capped():
+    """The daisy-chain relay never idles longer than the previous fixed 5 ms poll."""
+    print("\nTesting relay poller cap...")
+
+    async def run():
+        upstream = _make_transport()
+        downstream = _make_transport()
+        downstream.enable_relay_from(upstream)
+        try:
+            poller = downstream._relay_poller
+            assert poller.max_delay == UARTTransport.RELAY_MAX_DELAY == 0.005
+            delays = [poller.next_delay(False, now=0) for _ in range(6)]
+            assert max(delays) == 0.005, delays
+        finally:
+            downstream._relay_task.cancel()
+
+    asyncio.run(run())
+
+    print("✓ Relay poller cap test passed")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Transport Polling Test Suite")
+    print("=" * 60)
+
+    try:
+        test_poller_reads_immediately_when_bytes_wait()
+        test_poller_partial_frame_uses_baud_rate()
+        test_poller_idle_backoff()
+        test_poller_wakes_for_periodic_frames()
+        test_latency_histogram_buckets_and_percentiles()
+        test_transport_baudrate_from_hardware()
+        test_transport_records_rx_latency()
+        test_rx_worker_dispatches_after_idle()
+        test_relay_poller_idle_delay_capped()
+
+        print("\n" + "=" * 60)
+        print("ALL TRANSPORT POLLING TESTS PASSED ✓")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ TEST FAILED: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n✗ UNEXPECTED ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -566,6 +566,120 @@ def test_mode_settings_update():
     print("  ✓ Mode settings update test passed")
 
 
+def test_render_telemetry_route():
+    """Test GET /api/telemetry/render reports frame stats and toggles the profiler."""
+    print("\nTesting GET /api/telemetry/render...")
+
+    from unittest import mock
+    sys.modules.setdefault('adafruit_ticks', type('obj', (object,), {
+        'ticks_ms': staticmethod(lambda: 0),
+        'ticks_diff': staticmethod(lambda a, b: a - b),
+        'ticks_add': staticmethod(lambda a, b: a + b),
+    })())
+    # managers/__init__ pulls in the hardware managers
+    for name in ('digitalio', 'busio', 'board', 'analogio', 'microcontroller', 'watchdog'):
+        sys.modules.setdefault(name, mock.MagicMock())
+    from managers.render_manager import RenderManager
+
+    class _Strip:
+        def show(self):
+            pass
+
+    class MockApp:
+        def __init__(self):
+            self.renderer = RenderManager(_Strip())
+
+    config = {"wifi_ssid": "TestNetwork", "wifi_password": "TestPassword123", "web_server_enabled": True}
+    mock_app = MockApp()
+    manager = WebServerManager(config, MockWiFiManager(), app=mock_app, testing=True)
+    manager.server = MockServer(None, "/static")
+    manager.setup_routes()
+
+    route = None
+    for path, method, func in manager.server.routes:
+        if path == "/api/telemetry/render":
+            route = func
+            break
+    assert route is not None, "Render telemetry route not found"
+
+    response = route(MockRequest())
+    assert response.status == 200
+    data = json.loads(response.body)
+    assert data["profiler"] is None
+    assert data["target_frame_rate"] == RenderManager.DEFAULT_FRAME_RATE
+
+    request = MockRequest()
+    request.query_params = {"profile": "1"}
+    data = json.loads(route(request).body)
+    assert data["profiler"] is not None and data["profiler"]["frames"] == 0
+    assert mock_app.renderer.profiler is not None
+
+    request.query_params = {"profile": "0"}
+    route(request)
+    assert mock_app.renderer.profiler is None
+
+    no_app = WebServerManager(config, MockWiFiManager(), testing=True)
+    no_app.server = MockServer(None, "/static")
+    no_app.setup_routes()
+    for path, method, func in no_app.server.routes:
+        if path == "/api/telemetry/render":
+            assert func(MockRequest()).status == 503
+
+    print("  ✓ Render telemetry route test passed")
+
+
+def test_uart_telemetry_route():
+    """Test GET /api/telemetry/uart reports and resets the RX latency histogram."""
+    print("\nTesting GET /api/telemetry/uart...")
+
+    from transport import UARTTransport
+    from transport.protocol import COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS
+
+    class _UART:
+        baudrate = 921600
+        in_waiting = 0
+
+        def write(self, data):
+            return len(data)
+
+    class MockApp:
+        def __init__(self):
+            self.transport = UARTTransport(_UART(), COMMAND_MAP, DEST_MAP, MAX_INDEX_VALUE, PAYLOAD_SCHEMAS)
+
+    config = {"wifi_ssid": "TestNetwork", "wifi_password": "TestPassword123", "web_server_enabled": True}
+    mock_app = MockApp()
+    mock_app.transport.rx_latency.record(3.0)
+    manager = WebServerManager(config, MockWiFiManager(), app=mock_app, testing=True)
+    manager.server = MockServer(None, "/static")
+    manager.setup_routes()
+
+    route = None
+    for path, method, func in manager.server.routes:
+        if path == "/api/telemetry/uart":
+            route = func
+            break
+    assert route is not None, "UART telemetry route not found"
+
+    response = route(MockRequest())
+    assert response.status == 200
+    data = json.loads(response.body)
+    assert data["rx_latency"]["count"] == 1 and data["rx_latency"]["max_ms"] == 3.0
+    assert data["rx_errors"] == 0 and "poll_delay_ms" in data
+
+    request = MockRequest()
+    request.query_params = {"reset": "1"}
+    assert json.loads(route(request).body)["rx_latency"]["count"] == 0
+
+    no_app = WebServerManager(config, MockWiFiManager(), testing=True)
+    no_app.server = MockServer(None, "/static")
+    no_app.setup_routes()
+    for path, method, func in no_app.server.routes:
+        if path == "/api/telemetry/uart":
+            assert func(MockRequest()).status == 503
+
+    print("  ✓ UART telemetry route test passed")
+
+
 def test_mode_settings_get():
     """Test GET /api/config/modes reads current values from DataManager."""
     print("\nTesting GET /api/config/modes with DataManager...")
@@ -2991,6 +3105,8 @@ def run_all_tests():
         test_download_file_chunked_reading,
         test_config_update_with_invalid_types,
         test_mode_settings_update,
+        test_render_telemetry_route,
+        test_uart_telemetry_route,
         test_mode_settings_get,
         test_ota_update_trigger,
         test_debug_mode_toggle,